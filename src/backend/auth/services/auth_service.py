@@ -11,8 +11,9 @@ from ...config.logging import get_logger
 from ..schemas.auth_requests import SignupRequest, LoginRequest
 from ..schemas.auth_responses import TokenResponse, UserResponse, AuthResponse
 from ...models.user_model import UserModel, UserCreateModel
-from ..utils.password_handler import get_password_handler
+from ..utils.password_handler import PasswordHashingOverloadedError, get_password_handler
 from ..utils.jwt_handler import get_jwt_handler
+from ..utils.token_cache import get_token_cache
 from .database_service import get_database_service
 
 logger = get_logger(__name__)
@@ -30,6 +31,7 @@ class AuthService:
         self.password_handler = get_password_handler()
         self.jwt_handler = get_jwt_handler()
         self.db_service = get_database_service()
+        self.token_cache = get_token_cache()
     
     async def register_user(self, signup_data: SignupRequest) -> Dict[str, Any]:
         """
@@ -90,7 +92,7 @@ class AuthService:
                 )
             
             # Hash password
-            hashed_password = self.password_handler.hash_password(signup_data.password)
+            hashed_password = await self.password_handler.hash_password_async(signup_data.password)
             
             # Create user in database
             user_create = UserCreateModel(
@@ -143,6 +145,21 @@ class AuthService:
             # Re-raise HTTP exceptions
             raise
             
+        except PasswordHashingOverloadedError as e:
+            logger.warning(
+                f"Registration rejected - password hashing overloaded: {signup_data.email}",
+                extra={
+                    "email": signup_data.email,
+                    "queue_depth": e.queue_depth,
+                }
+            )
+            
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please retry shortly",
+                headers={"Retry-After": "1"}
+            )
+            
         except Exception as e:
             logger.error(
                 f"User registration failed: {signup_data.email} - {str(e)}",
@@ -208,7 +225,7 @@ class AuthService:
                 )
             
             # Verify password
-            if not self.password_handler.verify_password(
+            if not await self.password_handler.verify_password_async(
                 login_data.password, 
                 user_model.hashed_password
             ):
@@ -280,6 +297,21 @@ class AuthService:
             # Re-raise HTTP exceptions
             raise
             
+        except PasswordHashingOverloadedError as e:
+            logger.warning(
+                f"Authentication rejected - password hashing overloaded: {login_data.email}",
+                extra={
+                    "email": login_data.email,
+                    "queue_depth": e.queue_depth,
+                }
+            )
+            
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, please retry shortly",
+                headers={"Retry-After": "1"}
+            )
+            
         except Exception as e:
             logger.error(
                 f"User authentication failed: {login_data.email} - {str(e)}",
@@ -306,6 +338,11 @@ class AuthService:
             User model if token is valid, None otherwise
         """
         try:
+            # Tokens verified recently skip decoding and the user lookup
+            cached_user = self.token_cache.get(token)
+            if cached_user is not None:
+                return cached_user
+            
             # Verify token
             payload = self.jwt_handler.verify_token(token)
             
@@ -349,6 +386,8 @@ class AuthService:
                 }
             )
             
+            self.token_cache.put(token, payload, user_model)
+            
             return user_model
             
         except Exception as e:
@@ -373,8 +412,8 @@ class AuthService:
             db_health = await self.db_service.health_check()
             
             # Test password hashing
-            test_hash = self.password_handler.hash_password("test123")
-            hash_verify = self.password_handler.verify_password("test123", test_hash)
+            test_hash = await self.password_handler.hash_password_async("test123")
+            hash_verify = await self.password_handler.verify_password_async("test123", test_hash)
             
             # Test JWT operations
             test_token = self.jwt_handler.generate_token("test_user", "test@example.com")
@@ -390,7 +429,9 @@ class AuthService:
                 "status": auth_status,
                 "database": db_health,
                 "password_hashing": "healthy" if hash_verify else "unhealthy",
+                "password_hashing_executor": self.password_handler.executor.get_metrics(),
                 "jwt_operations": "healthy" if token_verify else "unhealthy",
+                "token_cache": self.token_cache.get_stats(),
             }
             
         except Exception as e:
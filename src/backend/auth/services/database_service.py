@@ -12,6 +12,7 @@ from bson import ObjectId
 from ...config.env import get_settings
 from ...config.logging import get_logger
 from ...models.user_model import UserModel, UserCreateModel
+from ..utils.token_cache import get_token_cache
 
 logger = get_logger(__name__)
 
@@ -387,6 +388,9 @@ class DatabaseService:
             success = result.modified_count > 0
             
             if success:
+                # Cached tokens hold the previous login info
+                get_token_cache().invalidate_user(user_id)
+                
                 logger.info(
                     f"User login info updated: {user_id}",
                     extra={
@@ -412,6 +416,68 @@ class DatabaseService:
             )
             raise Exception(f"Login info update failed: {str(e)}")
     
+    async def set_user_active_status(self, user_id: str, is_active: bool) -> bool:
+        """
+        Activate or deactivate a user.
+        
+        Args:
+            user_id: User unique identifier
+            is_active: New active status
+            
+        Returns:
+            True if update successful, False otherwise
+            
+        Raises:
+            Exception: If database operation fails
+        """
+        try:
+            if not self._connected:
+                await self.connect()
+            
+            try:
+                object_id = ObjectId(user_id)
+            except Exception:
+                logger.warning(
+                    f"Invalid user ID format for status update: {user_id}",
+                    extra={"user_id": user_id}
+                )
+                return False
+            
+            result = await self.users_collection.update_one(
+                {"_id": object_id},
+                {
+                    "$set": {
+                        "is_active": is_active,
+                        "updated_at": datetime.utcnow(),
+                    }
+                }
+            )
+            
+            # Deactivated users must not keep authenticating from the token cache
+            get_token_cache().invalidate_user(user_id)
+            
+            success = result.matched_count > 0
+            
+            logger.info(
+                f"User active status {'updated' if success else 'not updated'}: {user_id}",
+                extra={
+                    "user_id": user_id,
+                    "is_active": is_active,
+                }
+            )
+            
+            return success
+            
+        except Exception as e:
+            logger.error(
+                f"Failed to update active status for user {user_id}: {str(e)}",
+                extra={
+                    "user_id": user_id,
+                    "error": str(e),
+                }
+            )
+            raise Exception(f"User status update failed: {str(e)}")
+    
     async def health_check(self) -> Dict[str, Any]:
         """
         Perform database health check.
@@ -4,11 +4,21 @@ Provides secure password operations and JWT token management.
 """
 
 from .jwt_handler import JWTHandler, get_jwt_handler
-from .password_handler import PasswordHandler, get_password_handler
+from .password_handler import (
+    PasswordHandler,
+    PasswordHashingExecutor,
+    PasswordHashingOverloadedError,
+    get_password_handler,
+)
+from .token_cache import VerifiedTokenCache, get_token_cache
 
 __all__ = [
     "JWTHandler",
     "get_jwt_handler",
     "PasswordHandler", 
+    "PasswordHashingExecutor",
+    "PasswordHashingOverloadedError",
     "get_password_handler",
+    "VerifiedTokenCache",
+    "get_token_cache",
 ] 
\ No newline at end of file
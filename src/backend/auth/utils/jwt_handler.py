@@ -3,6 +3,7 @@ JWT token handler for authentication system.
 Provides JWT token generation, validation, and parsing functionality.
 """
 
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, Union
 from jose import jwt, JWTError
@@ -61,6 +62,7 @@ class JWTHandler:
                 "iat": now,  # Issued at
                 "exp": expires_at,  # Expires at
                 "type": "access",  # Token type
+                "jti": uuid.uuid4().hex,  # Token ID
             }
             
             # Add additional claims if provided
@@ -1,17 +1,133 @@
 """
 Password handler for secure password operations.
 Provides bcrypt password hashing and strength validation functionality.
+Hashing and verification can be run on a bounded thread pool so bcrypt
+does not block the event loop.
 """
 
+import asyncio
+import os
 import re
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 from passlib.context import CryptContext
 
+from ...config.env import get_settings
 from ...config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+class PasswordHashingOverloadedError(Exception):
+    """Raised when the password hashing queue is full."""
+    
+    def __init__(self, queue_depth: int, max_queue_depth: int):
+        self.queue_depth = queue_depth
+        self.max_queue_depth = max_queue_depth
+        super().__init__(
+            f"Password hashing queue is full ({queue_depth}/{max_queue_depth} waiting)"
+        )
+
+
+class PasswordHashingExecutor:
+    """
+    Bounded thread pool for bcrypt operations.
+    
+    bcrypt releases the GIL while hashing, so worker threads run in parallel
+    while the event loop stays free. Concurrency is capped at max_workers and
+    at most max_queue_depth operations may wait for a worker; beyond that new
+    operations are rejected instead of queueing without bound.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, max_queue_depth: int = 256):
+        """
+        Initialize hashing executor.
+        
+        Args:
+            max_workers: Concurrent bcrypt operations (default: CPU count, at most 4)
+            max_queue_depth: Operations allowed to wait for a worker
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_queue_depth = max_queue_depth
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="password-hash"
+        )
+        self._lock = threading.Lock()
+        
+        # Metrics
+        self._in_flight = 0
+        self._active = 0
+        self._peak_queue_depth = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_wait_seconds = 0.0
+        self._total_run_seconds = 0.0
+    
+    @property
+    def queue_depth(self) -> int:
+        """Operations submitted but not yet picked up by a worker."""
+        with self._lock:
+            return self._in_flight - self._active
+    
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a blocking password operation on the pool.
+        
+        Raises:
+            PasswordHashingOverloadedError: If the queue is full
+        """
+        with self._lock:
+            # Operations beyond the worker count will have to wait for a worker
+            queue_depth = max(0, self._in_flight - self.max_workers)
+            if self._in_flight - self.max_workers >= self.max_queue_depth:
+                self._rejected += 1
+                raise PasswordHashingOverloadedError(queue_depth, self.max_queue_depth)
+            self._in_flight += 1
+            self._peak_queue_depth = max(self._peak_queue_depth, self._in_flight - self.max_workers)
+        
+        submitted_at = time.perf_counter()
+        
+        def run_in_worker() -> Any:
+            started_at = time.perf_counter()
+            with self._lock:
+                self._active += 1
+                self._total_wait_seconds += started_at - submitted_at
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self._active -= 1
+                    self._in_flight -= 1
+                    self._completed += 1
+                    self._total_run_seconds += time.perf_counter() - started_at
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, run_in_worker)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get concurrency, queue depth and timing metrics."""
+        with self._lock:
+            completed = self._completed
+            return {
+                "max_workers": self.max_workers,
+                "max_queue_depth": self.max_queue_depth,
+                "active": self._active,
+                "queue_depth": self._in_flight - self._active,
+                "peak_queue_depth": self._peak_queue_depth,
+                "completed": completed,
+                "rejected": self._rejected,
+                "avg_wait_ms": (self._total_wait_seconds / completed * 1000) if completed else 0.0,
+                "avg_run_ms": (self._total_run_seconds / completed * 1000) if completed else 0.0,
+            }
+    
+    def shutdown(self) -> None:
+        """Stop worker threads after queued operations finish."""
+        self._executor.shutdown(wait=True)
+
+
 class PasswordHandler:
     """
     Password handler for secure password operations.
@@ -20,12 +136,17 @@ class PasswordHandler:
     comprehensive password strength validation with scoring.
     """
     
-    def __init__(self, bcrypt_rounds: int = 12):
+    def __init__(
+        self,
+        bcrypt_rounds: int = 12,
+        executor: Optional[PasswordHashingExecutor] = None
+    ):
         """
         Initialize password handler with bcrypt configuration.
         
         Args:
             bcrypt_rounds: Number of bcrypt rounds (default: 12 for security)
+            executor: Thread pool for the async hashing methods
         """
         self.bcrypt_rounds = bcrypt_rounds
         self.pwd_context = CryptContext(
@@ -33,6 +154,7 @@ class PasswordHandler:
             deprecated="auto",
             bcrypt__rounds=bcrypt_rounds
         )
+        self.executor = executor or PasswordHashingExecutor()
         
         logger.info(
             f"Password handler initialized with {bcrypt_rounds} bcrypt rounds",
@@ -124,6 +246,31 @@ class PasswordHandler:
             )
             return False
     
+    async def hash_password_async(self, password: str) -> str:
+        """
+        Hash password on the hashing executor without blocking the event loop.
+        
+        Raises:
+            ValueError: If password is empty or invalid
+            PasswordHashingOverloadedError: If the hashing queue is full
+        """
+        if not password or not password.strip():
+            raise ValueError("Password cannot be empty")
+        
+        return await self.executor.run(self.hash_password, password)
+    
+    async def verify_password_async(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify password on the hashing executor without blocking the event loop.
+        
+        Raises:
+            PasswordHashingOverloadedError: If the hashing queue is full
+        """
+        if not password or not hashed_password:
+            return self.verify_password(password, hashed_password)
+        
+        return await self.executor.run(self.verify_password, password, hashed_password)
+    
     def validate_password_strength(self, password: str) -> Dict[str, any]:
         """
         Validate password strength with detailed feedback.
@@ -288,12 +435,16 @@ _password_handler: Optional[PasswordHandler] = None
 def get_password_handler() -> PasswordHandler:
     """
     Get the global password handler instance.
-    Uses singleton pattern for consistency.
+    Uses singleton pattern for consistency; the hashing pool is sized from
+    settings when the handler is created.
     
     Returns:
         PasswordHandler instance
     """
     global _password_handler
     if _password_handler is None:
-        _password_handler = PasswordHandler()
+        hashing_settings = get_settings().get_password_hashing_settings()
+        _password_handler = PasswordHandler(
+            executor=PasswordHashingExecutor(**hashing_settings)
+        )
     return _password_handler 
\ No newline at end of file
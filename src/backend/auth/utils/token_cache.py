@@ -0,0 +1,183 @@
+"""
+Verified token cache for JWT-authenticated requests.
+Caches the user resolved for a verified token so protected endpoints skip
+JWT decoding and the user lookup on repeat requests.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from ...config.env import get_settings
+from ...config.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class VerifiedTokenCache:
+    """
+    LRU + TTL cache of verified token to user.
+
+    Entries are keyed by the SHA-256 of the token so raw tokens are never
+    held in memory, and indexed by user ID and token ID (jti) for
+    invalidation. An entry never outlives the token's own expiry.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 60.0):
+        """
+        Initialize verified token cache.
+
+        Args:
+            max_size: Maximum number of tokens held in the cache
+            ttl_seconds: Time after which a token is verified again
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # token hash -> (expires_at, user_id, jti, user)
+        self._entries: "OrderedDict[str, Tuple[float, str, Optional[str], Any]]" = OrderedDict()
+        self._by_user: Dict[str, Set[str]] = {}
+        self._by_jti: Dict[str, str] = {}
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def hash_token(token: str) -> str:
+        """Hash a raw token for use as a cache key."""
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[Any]:
+        """
+        Look up the user for a previously verified token.
+
+        Returns:
+            Cached user, or None if the token is not cached or has expired
+        """
+        token_hash = self.hash_token(token)
+        entry = self._entries.get(token_hash)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry[0] <= time.monotonic():
+            self._remove(token_hash)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(token_hash)
+        self.hits += 1
+        return entry[3]
+
+    def put(self, token: str, payload: Dict[str, Any], user: Any) -> None:
+        """
+        Cache the user for a verified token.
+
+        Args:
+            token: Raw JWT token
+            payload: Verified token payload (sub, jti, exp)
+            user: User resolved for the token
+        """
+        ttl = self.ttl_seconds
+        exp = payload.get("exp")
+        if exp:
+            ttl = min(ttl, exp - time.time())
+        if ttl <= 0:
+            return
+
+        token_hash = self.hash_token(token)
+        user_id = payload["sub"]
+        jti = payload.get("jti")
+
+        self._remove(token_hash)
+        self._entries[token_hash] = (time.monotonic() + ttl, user_id, jti, user)
+        self._by_user.setdefault(user_id, set()).add(token_hash)
+        if jti:
+            self._by_jti[jti] = token_hash
+
+        while len(self._entries) > self.max_size:
+            oldest_hash = next(iter(self._entries))
+            self._remove(oldest_hash)
+            self.evictions += 1
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached token of a user after the user changes."""
+        token_hashes = self._by_user.get(user_id)
+        if not token_hashes:
+            return
+
+        count = len(token_hashes)
+        for token_hash in list(token_hashes):
+            self._remove(token_hash)
+        self.invalidations += count
+        logger.debug(
+            f"Invalidated {count} cached tokens for user {user_id}",
+            extra={"user_id": user_id, "token_count": count}
+        )
+
+    def invalidate_token_id(self, jti: str) -> None:
+        """Drop a cached token by its token ID (jti)."""
+        token_hash = self._by_jti.get(jti)
+        if token_hash is not None:
+            self._remove(token_hash)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all cached tokens."""
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._by_user.clear()
+        self._by_jti.clear()
+
+    def _remove(self, token_hash: str) -> None:
+        entry = self._entries.pop(token_hash, None)
+        if entry is None:
+            return
+
+        _, user_id, jti, _ = entry
+        user_tokens = self._by_user.get(user_id)
+        if user_tokens is not None:
+            user_tokens.discard(token_hash)
+            if not user_tokens:
+                del self._by_user[user_id]
+        if jti and self._by_jti.get(jti) == token_hash:
+            del self._by_jti[jti]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+# Global verified token cache instance
+_token_cache: Optional[VerifiedTokenCache] = None
+
+
+def get_token_cache() -> VerifiedTokenCache:
+    """
+    Get the global verified token cache instance.
+    Shared by token verification and user update paths.
+
+    Returns:
+        VerifiedTokenCache instance
+    """
+    global _token_cache
+    if _token_cache is None:
+        settings = get_settings()
+        _token_cache = VerifiedTokenCache(
+            max_size=settings.jwt_cache_max_size,
+            ttl_seconds=settings.jwt_cache_ttl_seconds,
+        )
+    return _token_cache
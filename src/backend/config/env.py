@@ -41,6 +41,12 @@ class Settings(BaseSettings):
     )
     jwt_algorithm: str = Field(default="HS256", description="JWT signing algorithm")
     jwt_expiry_minutes: int = Field(default=60, description="JWT token expiry time in minutes")
+    jwt_cache_max_size: int = Field(default=10000, description="Maximum verified tokens held in the token cache")
+    jwt_cache_ttl_seconds: int = Field(default=60, description="Seconds a verified token is served from the token cache")
+    
+    # Password Hashing Configuration
+    password_hash_max_workers: Optional[int] = Field(default=None, description="Concurrent bcrypt operations (default: CPU count, at most 4)")
+    password_hash_max_queue_depth: int = Field(default=256, description="bcrypt operations allowed to wait for a worker before new ones are rejected")
     
     # Database Configuration
     mongodb_url: str = Field(
@@ -66,6 +72,12 @@ class Settings(BaseSettings):
         description="Maximum items allowed per test suite"
     )
     
+    # Execution Queue Configuration
+    execution_queue_change_stream_enabled: bool = Field(
+        default=False,
+        description="Wake the queue processor from a change stream (requires a replica set)"
+    )
+    
     # Logging Configuration
     log_level: str = Field(default="INFO", description="Console log level")
     log_to_file: bool = Field(default=True, description="Enable file logging")
@@ -175,6 +187,15 @@ class Settings(BaseSettings):
             "secret_key": self.jwt_secret_key,
             "algorithm": self.jwt_algorithm,
             "expiry_minutes": self.jwt_expiry_minutes,
+            "cache_max_size": self.jwt_cache_max_size,
+            "cache_ttl_seconds": self.jwt_cache_ttl_seconds,
+        }
+    
+    def get_password_hashing_settings(self) -> dict:
+        """Get password hashing thread pool parameters."""
+        return {
+            "max_workers": self.password_hash_max_workers,
+            "max_queue_depth": self.password_hash_max_queue_depth,
         }
     
     def get_cors_origins(self) -> List[str]:
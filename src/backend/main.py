@@ -111,7 +111,79 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"Failed to initialize test execution indexes: {e}")
             # Don't fail startup for index issues
-        
+
+        # Initialize execution queue indexes for claim and status queries
+        try:
+            from .testexecution.services.execution_queue_service import get_execution_queue_service
+            queue_service = get_execution_queue_service(
+                app.state.db,
+                enable_change_stream=settings.execution_queue_change_stream_enabled
+            )
+            await queue_service.ensure_indexes()
+            logger.info("Execution queue collection indexes initialized successfully")
+        except Exception as e:
+            logger.warning(f"Failed to initialize execution queue indexes: {e}")
+            # Don't fail startup for index issues
+
+        # Start flushing buffered execution queue metrics
+        try:
+            from .testexecution.services.execution_queue_service import get_execution_queue_service
+            queue_service = get_execution_queue_service(
+                app.state.db,
+                enable_change_stream=settings.execution_queue_change_stream_enabled
+            )
+            await queue_service.start_metrics_flush()
+            app.state.execution_queue_service = queue_service
+            logger.info("Execution queue metrics flush started")
+        except Exception as e:
+            logger.warning(f"Failed to start execution queue metrics flush: {e}")
+
+        # Start telemetry heartbeat rollups backing uptime calculation
+        try:
+            from .telemetry.services.heartbeat_rollup import HeartbeatRollupService
+            heartbeat_rollup = HeartbeatRollupService(app.state.db)
+            await heartbeat_rollup.ensure_collections()
+            await heartbeat_rollup.start()
+            app.state.heartbeat_rollup = heartbeat_rollup
+            logger.info("Telemetry heartbeat rollup job started")
+        except Exception as e:
+            logger.warning(f"Failed to start telemetry heartbeat rollups: {e}")
+
+        # Start flushing buffered telemetry heartbeats on a fixed interval
+        try:
+            from .telemetry.services.heartbeat_state import get_heartbeat_state_table
+            heartbeat_state = get_heartbeat_state_table()
+            await heartbeat_state.start(
+                app.state.db.telemetry_heartbeats_ts,
+                app.state.db.telemetry_uptime_logs
+            )
+            app.state.heartbeat_state = heartbeat_state
+            logger.info("Telemetry heartbeat flush task started")
+        except Exception as e:
+            logger.warning(f"Failed to start telemetry heartbeat flush task: {e}")
+
+        # Start periodic snapshots of metric series statistics used for outlier detection
+        try:
+            from .telemetry.services.metric_series_statistics import get_series_statistics_store
+            series_statistics = get_series_statistics_store(app.state.db.telemetry_series_statistics)
+            await series_statistics.start()
+            app.state.series_statistics = series_statistics
+            logger.info("Telemetry series statistics snapshots started")
+        except Exception as e:
+            logger.warning(f"Failed to start telemetry series statistics snapshots: {e}")
+
+        # Start the trigger engine shared by per-request scheduler services
+        try:
+            from .scheduler.services.trigger_engine_service import get_trigger_engine_service
+            trigger_engine = get_trigger_engine_service(app.state.db["scheduled_triggers"])
+            if await trigger_engine.initialize():
+                app.state.trigger_engine = trigger_engine
+                logger.info("Scheduler trigger engine started")
+            else:
+                logger.warning("Scheduler trigger engine failed to initialize")
+        except Exception as e:
+            logger.warning(f"Failed to start scheduler trigger engine: {e}")
+
         # Initialize notification indexes for optimal performance - PHASE 6 INTEGRATION
         try:
             from .notification.utils.mongodb_setup import ensure_notification_indexes
@@ -131,7 +203,46 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info(f"Shutting down {APP_NAME}")
-    
+
+    # Stop telemetry heartbeat rollups
+    heartbeat_rollup = getattr(app.state, "heartbeat_rollup", None)
+    if heartbeat_rollup:
+        await heartbeat_rollup.stop()
+
+    # Stop the scheduler trigger engine
+    trigger_engine = getattr(app.state, "trigger_engine", None)
+    if trigger_engine:
+        try:
+            await trigger_engine.shutdown()
+        except Exception as e:
+            logger.warning(f"Failed to stop scheduler trigger engine: {e}")
+
+    # Write buffered execution queue metrics before the connection closes
+    execution_queue_service = getattr(app.state, "execution_queue_service", None)
+    if execution_queue_service:
+        try:
+            await execution_queue_service.stop_metrics_flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush execution queue metrics: {e}")
+
+    # Snapshot metric series statistics so they survive the restart
+    series_statistics = getattr(app.state, "series_statistics", None)
+    if series_statistics:
+        try:
+            await series_statistics.stop()
+        except Exception as e:
+            logger.warning(f"Failed to snapshot metric series statistics: {e}")
+
+    # Write buffered telemetry heartbeats before the connection closes
+    heartbeat_state = getattr(app.state, "heartbeat_state", None)
+    if heartbeat_state:
+        await heartbeat_state.stop()
+    try:
+        from .telemetry.services.telemetry_service import TelemetryService
+        await TelemetryService(app.state.db).flush_heartbeats()
+    except Exception as e:
+        logger.warning(f"Failed to flush buffered heartbeats: {e}")
+
     # Close database connection
     try:
         db_service = get_database_service()
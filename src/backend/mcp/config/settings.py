@@ -76,6 +76,11 @@ class MCPSettings(BaseSettings):
     mcp_vector_similarity_threshold: float = Field(default=0.7, env="MCP_VECTOR_SIMILARITY_THRESHOLD", description="Default similarity threshold", ge=0.0, le=1.0)
     mcp_vector_enable_caching: bool = Field(default=True, env="MCP_VECTOR_ENABLE_CACHING", description="Enable result caching")
     mcp_vector_cache_ttl: int = Field(default=300, env="MCP_VECTOR_CACHE_TTL", description="Cache TTL in seconds", ge=0)
+    mcp_vector_executor_workers: int = Field(default=2, env="MCP_VECTOR_EXECUTOR_WORKERS", description="Worker threads for blocking ChromaDB and embedding calls", ge=1, le=32)
+    mcp_vector_query_batch_window_ms: float = Field(default=5.0, env="MCP_VECTOR_QUERY_BATCH_WINDOW_MS", description="Time concurrent queries wait to be coalesced into one ChromaDB query", ge=0.0, le=1000.0)
+    mcp_vector_query_max_batch: int = Field(default=32, env="MCP_VECTOR_QUERY_MAX_BATCH", description="Maximum queries coalesced into one ChromaDB query", ge=1, le=1000)
+    mcp_vector_embedding_cache_path: str = Field(default="", env="MCP_VECTOR_EMBEDDING_CACHE_PATH", description="SQLite embedding cache file (defaults to embedding_cache.sqlite3 under the persist path)")
+    mcp_vector_embedding_cache_entries: int = Field(default=20000, env="MCP_VECTOR_EMBEDDING_CACHE_ENTRIES", description="Embeddings kept in the in-memory LRU in front of the embedding cache", ge=0)
     
     # Legacy ChromaDB Configuration (deprecated - use mcp_vector_* settings)
     chroma_persist_path: str = Field(default="./chroma_db", description="ChromaDB persistent storage path")
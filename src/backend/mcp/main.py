@@ -26,6 +26,11 @@ try:
 except ImportError:
     # Fallback for when running directly from mcp directory
     from config.settings import MCPSettings
+try:
+    from services.vector_store_service import VectorStoreService
+except ImportError:
+    # Fallback for when running directly from mcp directory
+    from services.vector_store_service import VectorStoreService
 
 # Create app instance for external imports
 server = get_server()
@@ -114,7 +119,7 @@ def main():
         # Graceful cleanup
         if server:
             logger.info("Cleaning up server resources")
-            # Any additional cleanup logic would go here
+            VectorStoreService.close_instance()
         
         logger.info("Server shutdown complete")
 
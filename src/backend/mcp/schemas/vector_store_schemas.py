@@ -216,6 +216,8 @@ class VectorStoreMetrics(BaseModel):
     gherkin_steps_stored: int = Field(default=0, ge=0, description="Number of Gherkin steps stored")
     dom_queries_executed: int = Field(default=0, ge=0, description="Number of DOM queries executed")
     gherkin_queries_executed: int = Field(default=0, ge=0, description="Number of Gherkin queries executed")
+    query_batches_executed: int = Field(default=0, ge=0, description="Number of coalesced ChromaDB query calls")
+    batched_queries: int = Field(default=0, ge=0, description="Number of queries served through coalesced calls")
     last_dom_update: Optional[datetime] = Field(None, description="Last DOM update timestamp")
     last_gherkin_update: Optional[datetime] = Field(None, description="Last Gherkin update timestamp")
     average_query_time_ms: float = Field(default=0.0, ge=0, description="Average query time in milliseconds")
@@ -0,0 +1,186 @@
+"""
+Embedding Cache for IntelliBrowse MCP Vector Store
+
+Persistent cache of text embeddings keyed by (model, sha256(text)) so that
+re-captured DOM elements and repeated Gherkin step queries are not embedded
+again. Vectors are stored as float32 blobs in a local SQLite database with
+an in-memory LRU in front of it.
+
+Features:
+- Thread-safe: embedding runs on the vector store executor threads
+- Batched SQLite lookups and writes per embedding call
+- Per-model memory hit, disk hit and miss metrics
+- CachedEmbeddingFunction wrapper usable as a ChromaDB embedding function
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+from loguru import logger
+
+# SQLite limits the number of bound parameters per statement
+_SQLITE_LOOKUP_CHUNK = 500
+
+
+class EmbeddingCache:
+    """
+    Two-level embedding cache: an LRU of recent vectors backed by SQLite.
+
+    A path of None keeps the cache in memory only.
+    """
+
+    def __init__(self, path: Optional[str] = None, memory_entries: int = 20000) -> None:
+        self.path = path
+        self.memory_entries = memory_entries
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._connection: Optional[sqlite3.Connection] = None
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "model TEXT NOT NULL, "
+                "text_hash TEXT NOT NULL, "
+                "vector BLOB NOT NULL, "
+                "PRIMARY KEY (model, text_hash))"
+            )
+            self._connection.commit()
+            logger.info(f"Embedding cache opened at: {path}")
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _model_stats(self, model: str) -> Dict[str, int]:
+        stats = self._stats.get(model)
+        if stats is None:
+            stats = self._stats[model] = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        return stats
+
+    def get_many(self, model: str, text_hashes: Sequence[str]) -> Dict[str, List[float]]:
+        """Look up vectors for several text hashes; missing hashes are absent from the result."""
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            stats = self._model_stats(model)
+            missing = []
+            for text_hash in dict.fromkeys(text_hashes):
+                vector = self._memory.get((model, text_hash))
+                if vector is not None:
+                    self._memory.move_to_end((model, text_hash))
+                    found[text_hash] = vector
+                else:
+                    missing.append(text_hash)
+            stats["memory_hits"] += len(found)
+
+            if missing and self._connection is not None:
+                for start in range(0, len(missing), _SQLITE_LOOKUP_CHUNK):
+                    chunk = missing[start:start + _SQLITE_LOOKUP_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._connection.execute(
+                        f"SELECT text_hash, vector FROM embeddings "
+                        f"WHERE model = ? AND text_hash IN ({placeholders})",
+                        [model, *chunk]
+                    ).fetchall()
+                    for text_hash, blob in rows:
+                        vector = array("f", blob).tolist()
+                        found[text_hash] = vector
+                        self._remember(model, text_hash, vector)
+                        stats["disk_hits"] += 1
+
+            stats["misses"] += sum(1 for text_hash in missing if text_hash not in found)
+        return found
+
+    def put_many(self, model: str, entries: Sequence[Tuple[str, List[float]]]) -> None:
+        """Store vectors for several text hashes."""
+        if not entries:
+            return
+        with self._lock:
+            for text_hash, vector in entries:
+                self._remember(model, text_hash, vector)
+            if self._connection is not None:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, text_hash, vector) VALUES (?, ?, ?)",
+                    [(model, text_hash, array("f", vector).tobytes()) for text_hash, vector in entries]
+                )
+                self._connection.commit()
+
+    def _remember(self, model: str, text_hash: str, vector: List[float]) -> None:
+        self._memory[(model, text_hash)] = vector
+        self._memory.move_to_end((model, text_hash))
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-model hit rates and cache sizes."""
+        with self._lock:
+            models = {}
+            for model, stats in self._stats.items():
+                lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+                hits = stats["memory_hits"] + stats["disk_hits"]
+                models[model] = {**stats, "hit_rate": hits / lookups if lookups else 0.0}
+            return {
+                "path": self.path,
+                "memory_entries": len(self._memory),
+                "memory_capacity": self.memory_entries,
+                "models": models,
+            }
+
+    def hit_rate(self) -> float:
+        """Overall hit rate across all models."""
+        with self._lock:
+            hits = sum(s["memory_hits"] + s["disk_hits"] for s in self._stats.values())
+            lookups = hits + sum(s["misses"] for s in self._stats.values())
+            return hits / lookups if lookups else 0.0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class CachedEmbeddingFunction(EmbeddingFunction[Documents]):
+    """
+    ChromaDB embedding function that consults the embedding cache first and
+    only embeds texts it has not seen for this model.
+    """
+
+    def __init__(self, embedding_function: EmbeddingFunction, model_name: str, cache: EmbeddingCache) -> None:
+        self.embedding_function = embedding_function
+        self.model_name = model_name
+        self.cache = cache
+
+    def __call__(self, input: Documents) -> Embeddings:
+        text_hashes = [self.cache.hash_text(text) for text in input]
+        vectors = self.cache.get_many(self.model_name, text_hashes)
+
+        # Embed each distinct missing text once
+        missing: Dict[str, str] = {}
+        for text, text_hash in zip(input, text_hashes):
+            if text_hash not in vectors and text_hash not in missing:
+                missing[text_hash] = text
+
+        if missing:
+            embedded = self.embedding_function(list(missing.values()))
+            new_entries = [
+                (text_hash, [float(value) for value in vector])
+                for text_hash, vector in zip(missing.keys(), embedded)
+            ]
+            self.cache.put_many(self.model_name, new_entries)
+            vectors.update(new_entries)
+
+        return [vectors[text_hash] for text_hash in text_hashes]
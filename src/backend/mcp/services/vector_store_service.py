@@ -19,12 +19,14 @@ Features:
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
 import json
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol, Tuple, runtime_checkable
 
 import chromadb
 from chromadb.api.models.Collection import Collection
@@ -42,6 +44,11 @@ try:
 except ImportError:
     # Fallback for when running directly from mcp directory
     from core.exceptions import VectorStoreError, VectorStoreConnectionError
+try:
+    from services.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
+except ImportError:
+    # Fallback for when running directly from mcp directory
+    from services.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
 try:
     from schemas.vector_store_schemas import (
         DOMElementData,
@@ -70,6 +77,7 @@ except ImportError:
     
     from config.settings import settings
     from core.exceptions import VectorStoreError, VectorStoreConnectionError
+    from services.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
     from schemas.vector_store_schemas import (
         DOMElementData,
         GherkinStepData,
@@ -89,6 +97,122 @@ class ElementAnalysisLike(Protocol):
     def to_dict(self) -> Dict[str, Any]: ...
 
 
+class QueryMicroBatcher:
+    """
+    Coalesces concurrent similarity queries into one ChromaDB query call.
+    
+    Queries against the same collection with the same where clause that
+    arrive within the batch window are sent as a single
+    ``query(query_texts=[...])`` so their embeddings are computed in one
+    model call. Each caller receives the slice of the result for its own
+    text, truncated to its own n_results.
+    """
+    
+    RESULT_KEYS = ("ids", "distances", "metadatas", "documents")
+    
+    def __init__(
+        self,
+        execute: Callable[[Collection, List[str], int, Optional[Dict[str, Any]]], Awaitable[Dict[str, Any]]],
+        window_seconds: float,
+        max_batch_size: int,
+        metrics: Optional[VectorStoreMetrics] = None
+    ) -> None:
+        self._execute = execute
+        self._window_seconds = window_seconds
+        self._max_batch_size = max_batch_size
+        self._metrics = metrics
+        self._pending: Dict[Tuple[str, str], List[Tuple[str, int, asyncio.Future]]] = {}
+        self._collections: Dict[Tuple[str, str], Collection] = {}
+        self._wheres: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        self._timers: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+        self._tasks: set = set()
+    
+    async def query(
+        self,
+        collection: Collection,
+        query_text: str,
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Queue a query and wait for the result of its batch."""
+        key = (collection.name, json.dumps(where, sort_keys=True, default=str))
+        future = asyncio.get_running_loop().create_future()
+        
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = []
+            self._collections[key] = collection
+            self._wheres[key] = where
+            self._timers[key] = asyncio.get_running_loop().call_later(
+                self._window_seconds, self._dispatch, key
+            )
+        batch.append((query_text, n_results, future))
+        
+        if len(batch) >= self._max_batch_size:
+            self._dispatch(key)
+        
+        return await future
+    
+    def close(self) -> None:
+        """Cancel batch timers and the queries still waiting for their batch."""
+        for timer in self._timers.values():
+            timer.cancel()
+        for batch in self._pending.values():
+            for _, _, future in batch:
+                future.cancel()
+        self._timers.clear()
+        self._pending.clear()
+        self._collections.clear()
+        self._wheres.clear()
+    
+    def _dispatch(self, key: Tuple[str, str]) -> None:
+        # A batch filled before its window ends leaves a timer that would fire on a later batch
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        collection = self._collections.pop(key)
+        where = self._wheres.pop(key)
+        task = asyncio.ensure_future(self._run_batch(collection, where, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _run_batch(
+        self,
+        collection: Collection,
+        where: Optional[Dict[str, Any]],
+        batch: List[Tuple[str, int, asyncio.Future]]
+    ) -> None:
+        # Identical texts in a batch share one embedding and one result row
+        texts = list(dict.fromkeys(text for text, _, _ in batch))
+        row_by_text = {text: row for row, text in enumerate(texts)}
+        n_results = max(n for _, n, _ in batch)
+        
+        try:
+            results = await self._execute(collection, texts, n_results, where)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        if self._metrics is not None:
+            self._metrics.query_batches_executed += 1
+            self._metrics.batched_queries += len(batch)
+        
+        for text, n, future in batch:
+            if future.done():
+                continue
+            row = row_by_text[text]
+            future.set_result({
+                result_key: [results[result_key][row][:n]]
+                for result_key in self.RESULT_KEYS
+                if results.get(result_key) is not None
+            })
+
+
 class VectorStoreService:
     """
     Enterprise-grade vector store service providing comprehensive storage and retrieval
@@ -106,12 +230,26 @@ class VectorStoreService:
         
         self.client: Optional[chromadb.Client] = None
         self.embedding_function: Optional[Any] = None
+        self.embedding_cache: Optional[EmbeddingCache] = None
         self.dom_collection: Optional[Collection] = None
         self.gherkin_collection: Optional[Collection] = None
         
         # Metrics tracking
         self.metrics = VectorStoreMetrics()
         
+        # Dedicated threads for blocking ChromaDB and embedding calls
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.mcp_vector_executor_workers,
+            thread_name_prefix="vector-store"
+        )
+        self.upsert_batch_size = settings.mcp_vector_batch_size
+        self._query_batcher = QueryMicroBatcher(
+            execute=self._execute_query,
+            window_seconds=settings.mcp_vector_query_batch_window_ms / 1000,
+            max_batch_size=settings.mcp_vector_query_max_batch,
+            metrics=self.metrics
+        )
+        
         # Configuration
         self.dom_collection_name = settings.mcp_vector_dom_collection
         self.gherkin_collection_name = settings.mcp_vector_gherkin_collection
@@ -142,6 +280,30 @@ class VectorStoreService:
                     await cls._instance._initialize()
         return cls._instance
     
+    @classmethod
+    def close_instance(cls) -> None:
+        """Close the singleton instance, if one was created."""
+        if cls._instance is not None:
+            cls._instance.close()
+            cls._instance = None
+    
+    def close(self) -> None:
+        """Release the executor threads and the embedding cache connection."""
+        self._query_batcher.close()
+        self._executor.shutdown(wait=True)
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
+        self._initialized = False
+        
+        logger.info(
+            "VectorStoreService closed",
+            extra={
+                "service": "vector_store",
+                "action": "close",
+                "audit": True
+            }
+        )
+    
     async def _initialize(self) -> None:
         """Initialize ChromaDB client and collections with enterprise patterns."""
         if self._initialized:
@@ -202,18 +364,79 @@ class VectorStoreService:
             logger.error(f"Failed to initialize ChromaDB client: {e}")
             raise VectorStoreConnectionError(f"ChromaDB client initialization failed: {e}")
     
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking ChromaDB or embedding call on the vector store executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    async def _execute_query(
+        self,
+        collection: Collection,
+        query_texts: List[str],
+        n_results: int,
+        where: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Run one ChromaDB query for a batch of texts."""
+        return await self._run_blocking(
+            collection.query,
+            query_texts=query_texts,
+            n_results=n_results,
+            where=where,
+            include=['metadatas', 'documents', 'distances']
+        )
+    
+    async def _upsert_in_chunks(
+        self,
+        collection: Collection,
+        docs: List[str],
+        ids: List[str],
+        metadatas: List[Dict[str, Any]]
+    ) -> None:
+        """Upsert in chunks of upsert_batch_size so large snapshots do not embed in one call."""
+        for start in range(0, len(ids), self.upsert_batch_size):
+            end = start + self.upsert_batch_size
+            await self._run_blocking(
+                collection.upsert,
+                documents=docs[start:end],
+                ids=ids[start:end],
+                metadatas=metadatas[start:end]
+            )
+    
     async def _initialize_embedding_function(self) -> None:
         """Initialize embedding function with enterprise configuration."""
         try:
-            self.embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
+            # Loading the model is slow; keep it off the event loop
+            self.embedding_function = await self._run_blocking(
+                embedding_functions.SentenceTransformerEmbeddingFunction,
                 model_name=self.embedding_model
             )
             logger.info(f"Initialized embedding function with model: {self.embedding_model}")
             
+            if settings.mcp_vector_enable_caching:
+                # Skip re-embedding texts already embedded with this model
+                self.embedding_cache = await self._run_blocking(
+                    EmbeddingCache,
+                    path=self._embedding_cache_path(),
+                    memory_entries=settings.mcp_vector_embedding_cache_entries
+                )
+                self.embedding_function = CachedEmbeddingFunction(
+                    self.embedding_function,
+                    model_name=self.embedding_model,
+                    cache=self.embedding_cache
+                )
+            
         except Exception as e:
             logger.error(f"Failed to initialize embedding function: {e}")
             raise VectorStoreConnectionError(f"Embedding function initialization failed: {e}")
     
+    def _embedding_cache_path(self) -> Optional[str]:
+        """Embedding cache file, or None to keep the cache in memory."""
+        if settings.mcp_vector_embedding_cache_path:
+            return settings.mcp_vector_embedding_cache_path
+        if self.persist_path and self.persist_path.lower() != "memory":
+            return os.path.join(self.persist_path, "embedding_cache.sqlite3")
+        return None
+    
     async def _initialize_collections(self) -> None:
         """Initialize ChromaDB collections with error recovery."""
         try:
@@ -345,6 +568,78 @@ class VectorStoreService:
         hasher.update(clean_text.encode('utf-8'))
         return f"step_{hasher.hexdigest()[:12]}"
     
+    def _element_content_hash(self, metadata: Dict[str, Any]) -> str:
+        """Hash of the stored fields of an element, excluding timestamp and context."""
+        content = {
+            key: metadata.get(key)
+            for key in ("description", "locators", "tag", "role", "type", "element_id")
+        }
+        hasher = hashlib.sha1()
+        hasher.update(json.dumps(content, sort_keys=True, default=str).encode('utf-8'))
+        return hasher.hexdigest()[:16]
+    
+    def _prepare_element_batch(
+        self,
+        page_url: str,
+        element_analyses: List[ElementAnalysisLike],
+        context: Optional[Dict[str, Any]]
+    ) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
+        """Build documents, stable IDs and metadata for a page's elements."""
+        docs = []
+        ids = []
+        metadatas = []
+        
+        for element in element_analyses:
+            if not element.locators:
+                continue
+            
+            # Generate stable ID
+            element_dict = element.to_dict()
+            element_meta = element_dict.get("metadata", {})
+            element_locators = element_dict.get("locators", [])
+            elem_id = self._generate_stable_element_id(page_url, element_meta, element_locators)
+            
+            # Prepare document and metadata; Chroma metadata values must be scalars
+            element_description = element.get_description_string()
+            metadata = {
+                "page_url": page_url,
+                "description": element_description,
+                "locators": json.dumps(element_locators, sort_keys=True, default=str),
+                "timestamp": datetime.utcnow().isoformat(),
+                "context": json.dumps(context or {}, sort_keys=True, default=str)
+            }
+            
+            # Add element properties to metadata
+            for key in ["tag", "role", "type"]:
+                if element_meta.get(key) is not None:
+                    metadata[key] = element_meta[key]
+            
+            # Add element ID if available
+            element_id = element_meta.get("attributes", {}).get("id")
+            if element_id:
+                metadata["element_id"] = element_id
+            
+            metadata["content_hash"] = self._element_content_hash(metadata)
+            
+            docs.append(element_description)
+            ids.append(elem_id)
+            metadatas.append(metadata)
+        
+        return docs, ids, metadatas
+    
+    async def _get_page_elements(self, page_url: str, include_metadata: bool = False) -> Dict[str, Any]:
+        """Enumerate a page's stored elements by metadata filter, without embedding a query."""
+        return await self._run_blocking(
+            self.dom_collection.get,
+            where={"page_url": page_url},
+            include=['metadatas'] if include_metadata else []
+        )
+    
+    async def _delete_in_chunks(self, collection: Collection, ids: List[str]) -> None:
+        """Delete in chunks of upsert_batch_size."""
+        for start in range(0, len(ids), self.upsert_batch_size):
+            await self._run_blocking(collection.delete, ids=ids[start:start + self.upsert_batch_size])
+    
     async def add_or_update_elements(
         self, 
         page_url: str, 
@@ -374,54 +669,14 @@ class VectorStoreService:
         )
         
         try:
-            # Prepare batch data
-            docs = []
-            ids = []
-            metadatas = []
-            
-            for element in element_analyses:
-                if not element.locators:
-                    continue
-                
-                # Generate stable ID
-                element_dict = element.to_dict()
-                element_meta = element_dict.get("metadata", {})
-                elem_id = self._generate_stable_element_id(page_url, element_meta, element.locators)
-                
-                # Prepare document and metadata
-                element_description = element.get_description_string()
-                metadata = {
-                    "page_url": page_url,
-                    "description": element_description,
-                    "locators": element.locators,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "context": context or {}
-                }
-                
-                # Add element properties to metadata
-                for key in ["tag", "role", "type"]:
-                    if key in element_meta:
-                        metadata[key] = element_meta[key]
-                
-                # Add element ID if available
-                element_id = element_meta.get("attributes", {}).get("id")
-                if element_id:
-                    metadata["element_id"] = element_id
-                
-                docs.append(element_description)
-                ids.append(elem_id)
-                metadatas.append(metadata)
+            docs, ids, metadatas = self._prepare_element_batch(page_url, element_analyses, context)
             
             if not ids:
                 logger.warning("No valid elements to add to vector store")
                 return
             
-            # Execute batch upsert
-            self.dom_collection.upsert(
-                documents=docs,
-                ids=ids,
-                metadatas=metadatas
-            )
+            # Execute chunked upsert off the event loop
+            await self._upsert_in_chunks(self.dom_collection, docs, ids, metadatas)
             
             # Update metrics
             self.metrics.dom_elements_stored += len(ids)
@@ -491,12 +746,12 @@ class VectorStoreService:
             if filters:
                 where_clause.update(filters)
             
-            # Execute query
-            results = self.dom_collection.query(
-                query_texts=[query_description],
-                n_results=n_results,
-                where=where_clause if where_clause else None,
-                include=['metadatas', 'documents', 'distances']
+            # Execute query, coalesced with concurrent queries on the same filter
+            results = await self._query_batcher.query(
+                self.dom_collection,
+                query_description,
+                n_results,
+                where_clause if where_clause else None
             )
             
             # Process results
@@ -614,12 +869,8 @@ class VectorStoreService:
                 logger.warning("No valid Gherkin steps to add")
                 return
             
-            # Execute batch upsert
-            self.gherkin_collection.upsert(
-                documents=docs,
-                ids=ids,
-                metadatas=metadatas
-            )
+            # Execute chunked upsert off the event loop
+            await self._upsert_in_chunks(self.gherkin_collection, docs, ids, metadatas)
             
             # Update metrics
             self.metrics.gherkin_steps_stored += len(ids)
@@ -676,10 +927,10 @@ class VectorStoreService:
         )
         
         try:
-            results = self.gherkin_collection.query(
-                query_texts=[query_text],
-                n_results=n_results,
-                include=['metadatas', 'documents', 'distances']
+            results = await self._query_batcher.query(
+                self.gherkin_collection,
+                query_text,
+                n_results
             )
             
             processed_results = []
@@ -754,17 +1005,12 @@ class VectorStoreService:
         )
         
         try:
-            # Query elements for the page
-            results = self.dom_collection.query(
-                query_texts=[""],
-                n_results=1000,  # Large number to get all elements
-                where={"page_url": page_url},
-                include=['ids']
-            )
+            # Enumerate the page's elements by metadata filter
+            results = await self._get_page_elements(page_url)
             
-            if results and results.get('ids') and results['ids'][0]:
-                element_ids = results['ids'][0]
-                self.dom_collection.delete(ids=element_ids)
+            if results and results.get('ids'):
+                element_ids = results['ids']
+                await self._delete_in_chunks(self.dom_collection, element_ids)
                 
                 logger.info(
                     f"Cleared {len(element_ids)} elements for page: {page_url}",
@@ -793,10 +1039,110 @@ class VectorStoreService:
             )
             raise VectorStoreError(f"Failed to clear page elements: {e}")
     
+    async def sync_page_elements(
+        self,
+        page_url: str,
+        element_analyses: List[ElementAnalysisLike],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, int]:
+        """
+        Make the stored elements of a page match a new capture.
+        
+        Stored elements are compared with the capture by stable element ID and
+        content hash; only new or changed elements are embedded and upserted,
+        and elements no longer on the page are deleted.
+        
+        Returns:
+            Counts of added, updated, deleted and unchanged elements
+        """
+        if not self.dom_collection:
+            raise VectorStoreError("DOM collection not initialized")
+        
+        start_time = datetime.utcnow()
+        
+        try:
+            docs, ids, metadatas = self._prepare_element_batch(page_url, element_analyses, context)
+            
+            # Last occurrence wins for elements that resolve to the same stable ID
+            captured: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+            for doc, elem_id, metadata in zip(docs, ids, metadatas):
+                captured[elem_id] = (doc, metadata)
+            
+            stored = await self._get_page_elements(page_url, include_metadata=True)
+            stored_hashes = {
+                elem_id: (metadata or {}).get("content_hash")
+                for elem_id, metadata in zip(stored.get('ids') or [], stored.get('metadatas') or [])
+            }
+            
+            upsert_ids = []
+            added = 0
+            for elem_id, (_, metadata) in captured.items():
+                if elem_id not in stored_hashes:
+                    added += 1
+                    upsert_ids.append(elem_id)
+                elif stored_hashes[elem_id] != metadata["content_hash"]:
+                    upsert_ids.append(elem_id)
+            delete_ids = [elem_id for elem_id in stored_hashes if elem_id not in captured]
+            
+            if upsert_ids:
+                await self._upsert_in_chunks(
+                    self.dom_collection,
+                    [captured[elem_id][0] for elem_id in upsert_ids],
+                    upsert_ids,
+                    [captured[elem_id][1] for elem_id in upsert_ids]
+                )
+                self.metrics.dom_elements_stored += len(upsert_ids)
+                self.metrics.last_dom_update = datetime.utcnow()
+            if delete_ids:
+                await self._delete_in_chunks(self.dom_collection, delete_ids)
+            
+            summary = {
+                "added": added,
+                "updated": len(upsert_ids) - added,
+                "deleted": len(delete_ids),
+                "unchanged": len(captured) - len(upsert_ids)
+            }
+            duration = (datetime.utcnow() - start_time).total_seconds()
+            
+            logger.info(
+                f"Synced elements for page {page_url} in {duration:.2f}s",
+                extra={
+                    "service": "vector_store",
+                    "action": "sync_page_elements_complete",
+                    "page_url": page_url,
+                    "duration_seconds": duration,
+                    **summary,
+                    "audit": True
+                }
+            )
+            return summary
+            
+        except Exception as e:
+            logger.error(
+                f"Error syncing page elements: {e}",
+                extra={
+                    "service": "vector_store",
+                    "action": "sync_page_elements_error",
+                    "page_url": page_url,
+                    "error": str(e),
+                    "audit": True
+                },
+                exc_info=True
+            )
+            raise VectorStoreError(f"Failed to sync page elements: {e}")
+    
     async def get_metrics(self) -> VectorStoreMetrics:
         """Get current vector store metrics."""
+        if self.embedding_cache is not None:
+            self.metrics.cache_hit_rate = self.embedding_cache.hit_rate()
         return self.metrics
     
+    def get_embedding_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Get per-model embedding cache hit rates, or None if caching is disabled."""
+        if self.embedding_cache is None:
+            return None
+        return self.embedding_cache.get_stats()
+    
     async def health_check(self) -> Dict[str, Any]:
         """Perform health check on vector store service."""
         try:
@@ -807,13 +1153,14 @@ class VectorStoreService:
                 "dom_collection_ready": self.dom_collection is not None,
                 "gherkin_collection_ready": self.gherkin_collection is not None,
                 "embedding_model": self.embedding_model,
-                "metrics": self.metrics.dict()
+                "metrics": (await self.get_metrics()).dict(),
+                "embedding_cache": self.get_embedding_cache_stats()
             }
             
             # Test collections if available
             if self.dom_collection:
                 try:
-                    self.dom_collection.count()
+                    await self._run_blocking(self.dom_collection.count)
                     status["dom_collection_status"] = "operational"
                 except Exception as e:
                     status["dom_collection_status"] = f"error: {e}"
@@ -821,7 +1168,7 @@ class VectorStoreService:
             
             if self.gherkin_collection:
                 try:
-                    self.gherkin_collection.count()
+                    await self._run_blocking(self.gherkin_collection.count)
                     status["gherkin_collection_status"] = "operational"
                 except Exception as e:
                     status["gherkin_collection_status"] = f"error: {e}"
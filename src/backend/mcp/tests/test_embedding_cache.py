@@ -0,0 +1,150 @@
+"""
+Test suite for the embedding cache.
+
+Tests EmbeddingCache and CachedEmbeddingFunction with a fake embedding function:
+- get_many/put_many round trip through SQLite across cache instances
+- LRU eviction of the in-memory level
+- Per-model memory hit, disk hit and miss statistics
+- CachedEmbeddingFunction embedding only texts missing from the cache
+"""
+
+from typing import List
+
+import pytest
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+try:
+    from services.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
+except ImportError:
+    # Fallback for when running directly from mcp directory
+    from services.embedding_cache import CachedEmbeddingFunction, EmbeddingCache
+
+
+MODEL = "all-MiniLM-L6-v2"
+
+
+class FakeEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Embeds a text as [length, 0.5] and records every call."""
+
+    def __init__(self) -> None:
+        self.calls: List[List[str]] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [[float(len(text)), 0.5] for text in input]
+
+
+def as_lists(embeddings: Embeddings) -> List[List[float]]:
+    """ChromaDB returns embeddings as numpy arrays; compare them as plain lists."""
+    return [[float(value) for value in vector] for vector in embeddings]
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "cache" / "embeddings.sqlite3")
+
+
+class TestEmbeddingCacheStorage:
+    """Test cases for the two cache levels."""
+
+    def test_round_trip_through_sqlite(self, cache_path):
+        writer = EmbeddingCache(cache_path)
+        writer.put_many(MODEL, [("hash-a", [1.0, 0.5]), ("hash-b", [2.25, -3.0])])
+        writer.close()
+
+        reader = EmbeddingCache(cache_path)
+        found = reader.get_many(MODEL, ["hash-a", "hash-b", "hash-c"])
+        reader.close()
+
+        assert found == {"hash-a": [1.0, 0.5], "hash-b": [2.25, -3.0]}
+
+    def test_vectors_are_scoped_by_model(self, cache_path):
+        cache = EmbeddingCache(cache_path)
+        cache.put_many(MODEL, [("hash-a", [1.0])])
+
+        assert cache.get_many("other-model", ["hash-a"]) == {}
+        cache.close()
+
+    def test_memory_only_cache_without_path(self):
+        cache = EmbeddingCache()
+        cache.put_many(MODEL, [("hash-a", [1.0])])
+
+        assert cache.get_many(MODEL, ["hash-a"]) == {"hash-a": [1.0]}
+
+    def test_least_recently_used_vector_evicted_from_memory(self):
+        cache = EmbeddingCache(memory_entries=2)
+        cache.put_many(MODEL, [("hash-a", [1.0]), ("hash-b", [2.0])])
+        cache.get_many(MODEL, ["hash-a"])
+
+        cache.put_many(MODEL, [("hash-c", [3.0])])
+
+        assert cache.get_many(MODEL, ["hash-a", "hash-b", "hash-c"]) == {"hash-a": [1.0], "hash-c": [3.0]}
+
+    def test_evicted_vector_reloaded_from_disk(self, cache_path):
+        cache = EmbeddingCache(cache_path, memory_entries=1)
+        cache.put_many(MODEL, [("hash-a", [1.0]), ("hash-b", [2.0])])
+
+        assert cache.get_many(MODEL, ["hash-a"]) == {"hash-a": [1.0]}
+        assert cache.get_stats()["models"][MODEL]["disk_hits"] == 1
+        cache.close()
+
+
+class TestEmbeddingCacheStats:
+    """Test cases for per-model hit statistics."""
+
+    def test_memory_disk_and_miss_counts_per_model(self, cache_path):
+        writer = EmbeddingCache(cache_path)
+        writer.put_many(MODEL, [("hash-a", [1.0])])
+        writer.close()
+
+        cache = EmbeddingCache(cache_path)
+        cache.get_many(MODEL, ["hash-a", "hash-b"])
+        cache.get_many(MODEL, ["hash-a"])
+        cache.get_many("other-model", ["hash-a"])
+
+        stats = cache.get_stats()
+        cache.close()
+
+        assert stats["models"][MODEL] == {"memory_hits": 1, "disk_hits": 1, "misses": 1, "hit_rate": 2 / 3}
+        assert stats["models"]["other-model"] == {"memory_hits": 0, "disk_hits": 0, "misses": 1, "hit_rate": 0.0}
+        assert stats["memory_entries"] == 1
+        assert cache.hit_rate() == 0.5
+
+    def test_hit_rate_without_lookups(self):
+        assert EmbeddingCache().hit_rate() == 0.0
+
+
+class TestCachedEmbeddingFunction:
+    """Test cases for the caching ChromaDB embedding function wrapper."""
+
+    def test_embeds_only_cache_misses(self):
+        fake = FakeEmbeddingFunction()
+        cached = CachedEmbeddingFunction(fake, MODEL, EmbeddingCache())
+
+        cached(["save button", "cancel"])
+        embeddings = cached(["cancel", "email field", "save button"])
+
+        assert fake.calls == [["save button", "cancel"], ["email field"]]
+        assert as_lists(embeddings) == [[6.0, 0.5], [11.0, 0.5], [11.0, 0.5]]
+
+    def test_duplicate_texts_embedded_once(self):
+        fake = FakeEmbeddingFunction()
+        cached = CachedEmbeddingFunction(fake, MODEL, EmbeddingCache())
+
+        embeddings = cached(["cancel", "cancel", "save"])
+
+        assert fake.calls == [["cancel", "save"]]
+        assert as_lists(embeddings) == [[6.0, 0.5], [6.0, 0.5], [4.0, 0.5]]
+
+    def test_fully_cached_input_skips_embedding(self, cache_path):
+        fake = FakeEmbeddingFunction()
+        first = CachedEmbeddingFunction(fake, MODEL, EmbeddingCache(cache_path))
+        first(["cancel"])
+        first.cache.close()
+
+        restarted = CachedEmbeddingFunction(fake, MODEL, EmbeddingCache(cache_path))
+        embeddings = restarted(["cancel"])
+        restarted.cache.close()
+
+        assert fake.calls == [["cancel"]]
+        assert as_lists(embeddings) == [[6.0, 0.5]]
@@ -0,0 +1,278 @@
+"""
+Test suite for the vector store service.
+
+Tests VectorStoreService against an in-memory ChromaDB collection:
+- Page sync counting added, updated, deleted and unchanged elements
+- Only new or changed elements embedded on sync
+- Elements of other pages left untouched by a sync
+- Query micro-batching: coalescing, duplicate texts and per-caller n_results
+- Closing the executor and embedding cache
+"""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import chromadb
+import pytest
+from chromadb.api.types import Documents, EmbeddingFunction, Embeddings
+
+try:
+    from services.vector_store_service import QueryMicroBatcher, VectorStoreService
+except ImportError:
+    # Fallback for when running directly from mcp directory
+    from services.vector_store_service import QueryMicroBatcher, VectorStoreService
+try:
+    from services.embedding_cache import EmbeddingCache
+except ImportError:
+    # Fallback for when running directly from mcp directory
+    from services.embedding_cache import EmbeddingCache
+try:
+    from schemas.vector_store_schemas import ElementAnalysisData
+except ImportError:
+    # Fallback for when running directly from mcp directory
+    from schemas.vector_store_schemas import ElementAnalysisData
+
+
+PAGE_URL = "https://example.com/checkout"
+
+
+class RecordingEmbeddingFunction(EmbeddingFunction[Documents]):
+    """Deterministic embedding function that records every embedded document."""
+
+    def __init__(self) -> None:
+        self.embedded: List[str] = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.embedded.extend(input)
+        return [[float(len(text)), float(sum(map(ord, text)) % 97)] for text in input]
+
+
+def make_element(element_id: str, name: str) -> ElementAnalysisData:
+    """Create a button element analysis identified by its id attribute."""
+    return ElementAnalysisData(
+        metadata={"tag": "button", "attributes": {"id": element_id}, "accessible_name": name},
+        locators=[{"strategy": "css", "value": f"#{element_id}"}]
+    )
+
+
+class RecordingQueryExecutor:
+    """Query executor returning n_results ranked ids per text and recording each call."""
+
+    def __init__(self) -> None:
+        self.calls: List[Dict[str, Any]] = []
+
+    async def __call__(
+        self,
+        collection: Any,
+        texts: List[str],
+        n_results: int,
+        where: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        self.calls.append({"texts": list(texts), "n_results": n_results, "where": where})
+        return {
+            "ids": [[f"{text}-{rank}" for rank in range(n_results)] for text in texts],
+            "distances": [[float(rank) for rank in range(n_results)] for _ in texts],
+            "metadatas": None
+        }
+
+
+@pytest.fixture
+def embedding_function():
+    return RecordingEmbeddingFunction()
+
+
+@pytest.fixture
+def vector_store(embedding_function):
+    """Create a VectorStoreService backed by a fresh in-memory DOM collection."""
+    VectorStoreService._instance = None
+    service = VectorStoreService()
+    service.client = chromadb.EphemeralClient()
+    service.embedding_function = embedding_function
+    service.dom_collection = service.client.create_collection(
+        name=f"dom_{uuid.uuid4().hex}",
+        embedding_function=embedding_function
+    )
+    yield service
+    service.close()
+
+
+class TestSyncPageElements:
+    """Test cases for syncing a page capture into the DOM collection."""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_adds_all_elements(self, vector_store):
+        summary = await vector_store.sync_page_elements(
+            PAGE_URL, [make_element("save", "Save"), make_element("cancel", "Cancel")]
+        )
+
+        assert summary == {"added": 2, "updated": 0, "deleted": 0, "unchanged": 0}
+        assert vector_store.dom_collection.count() == 2
+
+    @pytest.mark.asyncio
+    async def test_resync_counts_each_change_kind(self, vector_store, embedding_function):
+        await vector_store.sync_page_elements(
+            PAGE_URL,
+            [make_element("save", "Save"), make_element("cancel", "Cancel"), make_element("help", "Help")]
+        )
+        embedding_function.embedded.clear()
+
+        # "save" unchanged, "cancel" renamed in place, "help" removed, "pay" new
+        cancel = make_element("cancel", "Cancel")
+        cancel.description = "Cancel order button"
+        summary = await vector_store.sync_page_elements(
+            PAGE_URL, [make_element("save", "Save"), cancel, make_element("pay", "Pay now")]
+        )
+
+        assert summary == {"added": 1, "updated": 1, "deleted": 1, "unchanged": 1}
+        assert sorted(embedding_function.embedded) == [
+            "Cancel order button",
+            "button element named 'Pay now' with id 'pay'"
+        ]
+        stored = vector_store.dom_collection.get(where={"page_url": PAGE_URL}, include=["documents"])
+        assert sorted(stored["documents"]) == [
+            "Cancel order button",
+            "button element named 'Pay now' with id 'pay'",
+            "button element named 'Save' with id 'save'"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_capture_embeds_nothing(self, vector_store, embedding_function):
+        elements = [make_element("save", "Save"), make_element("cancel", "Cancel")]
+        await vector_store.sync_page_elements(PAGE_URL, elements)
+        embedding_function.embedded.clear()
+
+        summary = await vector_store.sync_page_elements(PAGE_URL, elements)
+
+        assert summary == {"added": 0, "updated": 0, "deleted": 0, "unchanged": 2}
+        assert embedding_function.embedded == []
+
+    @pytest.mark.asyncio
+    async def test_sync_leaves_other_pages_untouched(self, vector_store):
+        await vector_store.sync_page_elements("https://example.com/cart", [make_element("save", "Save")])
+
+        summary = await vector_store.sync_page_elements(PAGE_URL, [make_element("pay", "Pay now")])
+
+        assert summary["deleted"] == 0
+        assert vector_store.dom_collection.count() == 2
+
+
+class TestQueryMicroBatcher:
+    """Test cases for coalescing concurrent similarity queries."""
+
+    COLLECTION = SimpleNamespace(name="dom_elements")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_share_one_call(self):
+        executor = RecordingQueryExecutor()
+        batcher = QueryMicroBatcher(executor, window_seconds=0.01, max_batch_size=32)
+
+        results = await asyncio.gather(
+            batcher.query(self.COLLECTION, "save button", 2),
+            batcher.query(self.COLLECTION, "cancel link", 2),
+            batcher.query(self.COLLECTION, "email field", 2)
+        )
+
+        assert executor.calls == [
+            {"texts": ["save button", "cancel link", "email field"], "n_results": 2, "where": None}
+        ]
+        assert [result["ids"] for result in results] == [
+            [["save button-0", "save button-1"]],
+            [["cancel link-0", "cancel link-1"]],
+            [["email field-0", "email field-1"]]
+        ]
+        assert "metadatas" not in results[0]
+
+    @pytest.mark.asyncio
+    async def test_different_where_clauses_are_not_coalesced(self):
+        executor = RecordingQueryExecutor()
+        batcher = QueryMicroBatcher(executor, window_seconds=0.01, max_batch_size=32)
+
+        await asyncio.gather(
+            batcher.query(self.COLLECTION, "save button", 1, where={"page_url": "a"}),
+            batcher.query(self.COLLECTION, "save button", 1, where={"page_url": "b"})
+        )
+
+        assert sorted(call["where"]["page_url"] for call in executor.calls) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_texts_embedded_once(self):
+        executor = RecordingQueryExecutor()
+        batcher = QueryMicroBatcher(executor, window_seconds=0.01, max_batch_size=32)
+
+        first, second = await asyncio.gather(
+            batcher.query(self.COLLECTION, "save button", 3),
+            batcher.query(self.COLLECTION, "save button", 3)
+        )
+
+        assert executor.calls[0]["texts"] == ["save button"]
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_results_trimmed_to_each_callers_n_results(self):
+        executor = RecordingQueryExecutor()
+        batcher = QueryMicroBatcher(executor, window_seconds=0.01, max_batch_size=32)
+
+        small, large = await asyncio.gather(
+            batcher.query(self.COLLECTION, "save button", 1),
+            batcher.query(self.COLLECTION, "save button", 4)
+        )
+
+        assert executor.calls[0]["n_results"] == 4
+        assert small["ids"] == [["save button-0"]]
+        assert small["distances"] == [[0.0]]
+        assert len(large["ids"][0]) == 4
+
+    @pytest.mark.asyncio
+    async def test_full_batch_dispatches_and_cancels_its_timer(self):
+        executor = RecordingQueryExecutor()
+        batcher = QueryMicroBatcher(executor, window_seconds=60, max_batch_size=2)
+
+        await asyncio.wait_for(asyncio.gather(
+            batcher.query(self.COLLECTION, "save button", 1),
+            batcher.query(self.COLLECTION, "cancel link", 1)
+        ), timeout=1)
+
+        assert len(executor.calls) == 1
+        assert batcher._timers == {}
+
+        # A following batch waits for its own window rather than the earlier timer
+        pending = asyncio.ensure_future(batcher.query(self.COLLECTION, "email field", 1))
+        await asyncio.sleep(0.05)
+        assert not pending.done()
+        batcher.close()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+
+    @pytest.mark.asyncio
+    async def test_execute_error_reaches_every_caller(self):
+        async def failing_execute(collection, texts, n_results, where):
+            raise RuntimeError("collection unavailable")
+
+        batcher = QueryMicroBatcher(failing_execute, window_seconds=0.01, max_batch_size=32)
+
+        results = await asyncio.gather(
+            batcher.query(self.COLLECTION, "save button", 1),
+            batcher.query(self.COLLECTION, "cancel link", 1),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+
+class TestVectorStoreClose:
+    """Test cases for releasing vector store resources."""
+
+    def test_close_releases_executor_and_embedding_cache(self, tmp_path):
+        VectorStoreService._instance = None
+        service = VectorStoreService()
+        service.embedding_cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"))
+        VectorStoreService._instance = service
+
+        VectorStoreService.close_instance()
+
+        assert VectorStoreService._instance is None
+        assert service.embedding_cache._connection is None
+        with pytest.raises(RuntimeError):
+            service._executor.submit(print)
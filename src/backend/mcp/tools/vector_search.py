@@ -416,7 +416,8 @@ async def search_gherkin_steps(
 async def add_dom_elements(
     page_url: str,
     elements: List[Dict[str, Any]],
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[Dict[str, Any]] = None,
+    sync_page: bool = False
 ) -> Dict[str, Any]:
     """
     Add DOM elements to the vector store for future search.
@@ -424,10 +425,15 @@ async def add_dom_elements(
     This tool stores DOM element analyses in the vector store, making them
     searchable via semantic queries. Elements are deduplicated by stable IDs.
     
+    With sync_page, the elements are treated as a full capture of the page:
+    only new or changed elements are embedded, and stored elements missing
+    from the capture are deleted.
+    
     Args:
         page_url: URL of the page containing the elements
         elements: List of element analysis data (from locator generator)
         context: Operation context information
+        sync_page: Replace the page's stored elements with this capture
     
     Returns:
         Dictionary containing operation results and performance info
@@ -494,11 +500,19 @@ async def add_dom_elements(
         vector_store = await VectorStoreService.get_instance()
         
         # Add elements to vector store
-        await vector_store.add_or_update_elements(
-            page_url=page_url.strip(),
-            element_analyses=parsed_elements,
-            context=operation_context.dict()
-        )
+        sync_summary = None
+        if sync_page:
+            sync_summary = await vector_store.sync_page_elements(
+                page_url=page_url.strip(),
+                element_analyses=parsed_elements,
+                context=operation_context.dict()
+            )
+        else:
+            await vector_store.add_or_update_elements(
+                page_url=page_url.strip(),
+                element_analyses=parsed_elements,
+                context=operation_context.dict()
+            )
         
         # Calculate execution time
         execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
@@ -515,6 +529,8 @@ async def add_dom_elements(
                 "context": operation_context.dict()
             }
         }
+        if sync_summary is not None:
+            response["sync"] = sync_summary
         
         logger.info(
             f"Successfully added {len(parsed_elements)} DOM elements in {execution_time:.2f}ms",
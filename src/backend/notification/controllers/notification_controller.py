@@ -202,7 +202,9 @@ class NotificationController:
         user: UserResponse,
         page: int = 1,
         page_size: int = 20,
-        filters: Optional[HistoryFilterRequest] = None
+        filters: Optional[HistoryFilterRequest] = None,
+        cursor: Optional[str] = None,
+        include_total: Optional[bool] = None
     ) -> SuccessResponse[NotificationHistoryListResponse]:
         """
         Fetch paginated notification history for authenticated user
@@ -212,6 +214,8 @@ class NotificationController:
             page: Page number (1-based)
             page_size: Items per page
             filters: Optional filters for history query
+            cursor: Continuation token from the previous page
+            include_total: Whether to count all matching notifications
             
         Returns:
             Paginated list of user's notification history
@@ -243,7 +247,9 @@ class NotificationController:
                 user_id=validated_user_id,
                 page=validated_page,
                 page_size=validated_page_size,
-                filters=filters
+                filters=filters,
+                cursor=cursor,
+                include_total=include_total
             )
             
             processing_time = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
@@ -252,14 +258,14 @@ class NotificationController:
                 "User notifications retrieved successfully",
                 request_id=request_id,
                 user_id=validated_user_id,
-                total_count=history_response.pagination.total_count,
-                returned_count=len(history_response.notifications),
+                total_count=history_response.pagination.total_items,
+                returned_count=len(history_response.items),
                 processing_time_ms=processing_time
             )
             
             return SuccessResponse(
                 data=history_response,
-                message=f"Retrieved {len(history_response.notifications)} notifications"
+                message=f"Retrieved {len(history_response.items)} notifications"
             )
             
         except ValidationError as e:
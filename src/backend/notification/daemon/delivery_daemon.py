@@ -46,6 +46,8 @@ from ..services.delivery_task_service import (
     NotificationQuery
 )
 from ..models.notification_model import NotificationModel
+from ..models.notification_preference_model import UserNotificationPreferencesModel
+from ..services.preference_cache import NotificationPreferenceCache, get_preference_cache
 from ..schemas.user_context import UserContext
 from ..utils.retry import (
     RetryPolicy,
@@ -364,7 +366,8 @@ class DeliveryDaemon:
         self,
         config: DaemonConfig,
         delivery_service: DeliveryTaskService,
-        collections: Dict[str, Collection]
+        collections: Dict[str, Collection],
+        preference_cache: Optional[NotificationPreferenceCache] = None
     ):
         """
         Initialize delivery daemon
@@ -373,10 +376,12 @@ class DeliveryDaemon:
             config: Daemon configuration
             delivery_service: Delivery task service
             collections: MongoDB collections for adapters
+            preference_cache: Preference cache (defaults to the shared instance)
         """
         self.config = config
         self.delivery_service = delivery_service
         self.collections = collections
+        self.preference_cache = preference_cache or get_preference_cache()
         
         # Daemon state
         self.state = DaemonState.STOPPED
@@ -575,7 +580,7 @@ class DeliveryDaemon:
         async with self._processing_semaphore:
             try:
                 # Determine delivery channel
-                channel_type = self._determine_delivery_channel(notification)
+                channel_type = await self._determine_delivery_channel(notification)
                 
                 if not channel_type:
                     self.logger.warning(
@@ -653,7 +658,7 @@ class DeliveryDaemon:
                 self.stats.failed_deliveries += 1
                 self.stats.total_notifications_processed += 1
     
-    def _determine_delivery_channel(self, notification: NotificationModel) -> Optional[ChannelType]:
+    async def _determine_delivery_channel(self, notification: NotificationModel) -> Optional[ChannelType]:
         """Determine appropriate delivery channel for notification"""
         # Check notification metadata for preferred channel
         preferred_channel = notification.metadata.get("preferred_channel")
@@ -665,6 +670,19 @@ class DeliveryDaemon:
             except ValueError:
                 pass
         
+        # Apply the user's channel preferences in priority order
+        preferences = await self._get_user_preferences(getattr(notification, "user_id", None))
+        if preferences:
+            if not preferences.global_enabled:
+                return None
+            for channel in preferences.get_ordered_channels():
+                try:
+                    channel_type = ChannelType(getattr(channel, "value", channel))
+                except ValueError:
+                    continue
+                if channel_type in self.config.enabled_channels:
+                    return channel_type
+        
         # Default channel selection based on priority
         if notification.priority == "critical":
             # Critical notifications prefer immediate channels
@@ -678,6 +696,29 @@ class DeliveryDaemon:
         
         return None
     
+    async def _get_user_preferences(self, user_id: Optional[str]) -> Optional[UserNotificationPreferencesModel]:
+        """Get user preferences through the shared preference cache"""
+        collection = self.collections.get("user_notification_preferences")
+        if not user_id or collection is None:
+            return None
+        
+        found, preferences = self.preference_cache.get(user_id)
+        if found:
+            return preferences
+        
+        try:
+            preferences_doc = await collection.find_one({"user_id": user_id})
+            preferences = UserNotificationPreferencesModel.from_mongo(preferences_doc) if preferences_doc else None
+            self.preference_cache.put(user_id, preferences)
+            return preferences
+        except Exception as e:
+            self.logger.warning(
+                "Failed to load user preferences for channel routing",
+                user_id=user_id,
+                error=str(e)
+            )
+            return None
+    
     async def _create_delivery_context(
         self,
         notification: NotificationModel,
@@ -866,6 +907,7 @@ class DeliveryDaemon:
                 "last_batch_processing_time_ms": self.stats.last_batch_processing_time_ms
             },
             "health": self.health_monitor.get_health_summary(),
+            "preference_cache": self.preference_cache.get_stats(),
             "configuration": {
                 "polling_interval_seconds": self.config.polling_interval_seconds,
                 "batch_size": self.config.batch_size,
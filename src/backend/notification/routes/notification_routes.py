@@ -34,11 +34,11 @@ from ..schemas.notification_schemas import (
     NotificationResponse,
     NotificationStatusResponse,
     NotificationListResponse,
-    NotificationHistoryListResponse,
-    NotificationHistoryDetailResponse,
     NotificationHealthResponse
 )
 from ..schemas.history_schemas import (
+    NotificationHistoryListResponse,
+    NotificationHistoryDetailResponse,
     HistoryFilterRequest
 )
 from ..schemas.preference_schemas import (
@@ -193,6 +193,15 @@ async def get_user_notifications(
         description="Search term for notification content",
         example="deployment"
     ),
+    cursor: Optional[str] = Query(
+        default=None,
+        max_length=512,
+        description="Continuation token from pagination.next_cursor of the previous page"
+    ),
+    include_total: Optional[bool] = Query(
+        default=None,
+        description="Count all matching notifications (defaults to the first page only)"
+    ),
     current_user: UserResponse = Depends(get_current_user),
     controller: NotificationController = Depends(get_notification_controller)
 ):
@@ -201,6 +210,7 @@ async def get_user_notifications(
     
     Supports advanced filtering by status, channel, date range, priority, type, and content search.
     Returns paginated results with metadata for efficient large dataset handling.
+    Pass pagination.next_cursor back as cursor to fetch the next page at constant cost.
     """
     try:
         # Create filter request if any filters are provided
@@ -221,7 +231,9 @@ async def get_user_notifications(
             user=current_user,
             page=page,
             page_size=page_size,
-            filters=filters
+            filters=filters,
+            cursor=cursor,
+            include_total=include_total
         )
         
         return response
@@ -26,7 +26,12 @@ from .history_schemas import (
     DeliveryAttemptResponseSchema,
     DeliveryMetricsResponseSchema,
     DeliveryAuditResponseSchema,
-    NotificationHistoryStatsSchema
+    NotificationHistoryStatsSchema,
+    PaginationMetadata,
+    HistoryFilterRequest,
+    NotificationHistoryResponse,
+    NotificationHistoryDetailResponse,
+    NotificationHistoryListResponse
 )
 
 __all__ = [
@@ -51,5 +56,10 @@ __all__ = [
     "DeliveryAttemptResponseSchema",
     "DeliveryMetricsResponseSchema",
     "DeliveryAuditResponseSchema",
-    "NotificationHistoryStatsSchema"
+    "NotificationHistoryStatsSchema",
+    "PaginationMetadata",
+    "HistoryFilterRequest",
+    "NotificationHistoryResponse",
+    "NotificationHistoryDetailResponse",
+    "NotificationHistoryListResponse"
 ] 
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Notification Module - Audit & Compliance Schemas
+
+Pydantic schemas used by NotificationAuditService for audit trail entries,
+detected security events, compliance reports, retention policies and
+sensitive data masking configuration.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Literal, Optional, Any
+from pydantic import BaseModel, Field
+
+
+class AuditLogEntry(BaseModel):
+    """Schema for one audit trail entry."""
+    id: str = Field(..., description="Audit entry ID")
+    user_id: str = Field(..., description="User the event relates to")
+    event_type: str = Field(..., description="Audit event type")
+    actor_id: str = Field(..., description="User or service that performed the action")
+    event_data: Optional[Dict[str, Any]] = Field(None, description="Masked event data")
+    context: Optional[Dict[str, Any]] = Field(None, description="Masked request context")
+    timestamp: datetime = Field(..., description="Event timestamp")
+    trace_id: Optional[str] = Field(None, description="Trace ID")
+    correlation_id: Optional[str] = Field(None, description="Correlation ID")
+
+
+class SecurityEvent(BaseModel):
+    """Schema for a security event detected from audit entries."""
+    event_id: str = Field(..., description="Security event ID")
+    user_id: str = Field(..., description="User the event relates to")
+    event_type: str = Field(..., description="Detected pattern")
+    severity: str = Field(..., description="Severity level")
+    description: str = Field(..., description="Human-readable description")
+    timestamp: datetime = Field(..., description="Detection timestamp")
+    related_audit_entries: List[str] = Field(
+        default_factory=list,
+        description="IDs of the audit entries behind the event"
+    )
+
+
+class ComplianceReport(BaseModel):
+    """Schema for an audit compliance report."""
+    report_id: str = Field(..., description="Report ID")
+    report_type: str = Field(..., description="Report type, e.g. gdpr or ccpa")
+    generated_at: datetime = Field(..., description="Generation timestamp")
+    user_id: Optional[str] = Field(None, description="User the report is scoped to")
+    date_range: Dict[str, Optional[datetime]] = Field(
+        default_factory=dict,
+        description="Start and end date of the reported period"
+    )
+    total_events: int = Field(..., ge=0, description="Number of audit events")
+    unique_users_affected: int = Field(..., ge=0, description="Number of distinct users")
+    event_summary: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Counts and time range per event type"
+    )
+    compliance_status: str = Field(..., description="Overall compliance status")
+
+
+class DataRetentionPolicy(BaseModel):
+    """Schema for an audit data retention policy."""
+    retention_days: int = Field(..., ge=1, description="Days to keep audit records")
+    action: Literal["delete", "anonymize"] = Field(
+        default="delete",
+        description="What to do with records past retention"
+    )
+
+
+class MaskingConfiguration(BaseModel):
+    """Schema for sensitive data masking configuration."""
+    pattern_strategies: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Masking strategy per sensitive pattern name"
+    )
@@ -490,4 +490,120 @@ class NotificationHistoryStatsSchema(BaseModel):
                 "manual_intervention_rate": 0.8
             }
         }
-    ) 
\ No newline at end of file
+    )
+
+
+class PaginationMetadata(BaseModel):
+    """Schema for history pagination metadata."""
+    current_page: int = Field(..., ge=1, description="Current page number (1-based)")
+    page_size: int = Field(..., ge=1, description="Items per page")
+    total_items: Optional[int] = Field(
+        None,
+        description="Total number of matching items, omitted when not counted"
+    )
+    total_pages: Optional[int] = Field(
+        None,
+        description="Total number of pages, omitted when not counted"
+    )
+    has_next: bool = Field(..., description="Whether there are more pages")
+    has_previous: bool = Field(..., description="Whether there are previous pages")
+    next_page: Optional[int] = Field(None, description="Next page number")
+    previous_page: Optional[int] = Field(None, description="Previous page number")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Continuation token for the next page"
+    )
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "current_page": 1,
+                "page_size": 20,
+                "total_items": 45,
+                "total_pages": 3,
+                "has_next": True,
+                "has_previous": False,
+                "next_page": 2,
+                "previous_page": None,
+                "next_cursor": "W3siJGRhdGUiOiAxNzM2MjQ1ODE1MDAwfSwgeyIkb2lkIjogIjY3N2QifV0"
+            }
+        }
+    )
+
+
+class HistoryFilterRequest(BaseModel):
+    """Schema for filtering a user's notification history."""
+    status: Optional[str] = Field(None, description="Filter by delivery status")
+    channel: Optional[str] = Field(None, description="Filter by notification channel")
+    date_from: Optional[datetime] = Field(None, description="Start date for date range filter")
+    date_to: Optional[datetime] = Field(None, description="End date for date range filter")
+    priority: Optional[str] = Field(None, description="Filter by notification priority")
+    notification_type: Optional[str] = Field(None, description="Filter by notification type")
+    sort_by: str = Field(default="created_desc", description="Sort option for results")
+    search_term: Optional[str] = Field(
+        None,
+        max_length=100,
+        description="Search term for notification content"
+    )
+
+
+class NotificationHistoryResponse(BaseModel):
+    """Schema for one notification history list item."""
+    id: str = Field(..., description="History record ID")
+    user_id: str = Field(..., description="Target user ID")
+    notification_type: str = Field(..., description="Notification type")
+    channel: str = Field(..., description="Delivery channel")
+    delivery_status: str = Field(..., description="Delivery status")
+    priority: str = Field(..., description="Notification priority")
+    subject: str = Field(default="", description="Notification subject")
+    created_at: datetime = Field(..., description="Record creation timestamp")
+    delivered_at: Optional[datetime] = Field(None, description="Delivery timestamp")
+    failed_at: Optional[datetime] = Field(None, description="Failure timestamp")
+    retry_count: int = Field(default=0, ge=0, description="Number of delivery retries")
+    error_message: Optional[str] = Field(None, description="Last error message")
+
+
+class NotificationHistoryDetailResponse(BaseModel):
+    """Schema for the detailed trace of one notification."""
+    id: str = Field(..., description="History record ID")
+    user_id: str = Field(..., description="Target user ID")
+    notification_type: str = Field(..., description="Notification type")
+    channel: str = Field(..., description="Delivery channel")
+    delivery_status: str = Field(..., description="Delivery status")
+    priority: str = Field(..., description="Notification priority")
+    notification_content: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Full notification content"
+    )
+    created_at: datetime = Field(..., description="Record creation timestamp")
+    delivered_at: Optional[datetime] = Field(None, description="Delivery timestamp")
+    failed_at: Optional[datetime] = Field(None, description="Failure timestamp")
+    retry_count: int = Field(default=0, ge=0, description="Number of delivery retries")
+    retry_history: List[Dict[str, Any]] = Field(
+        default_factory=list,
+        description="Previous delivery attempts"
+    )
+    error_details: Optional[Dict[str, Any]] = Field(None, description="Error details if delivery failed")
+    delivery_metadata: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Provider and delivery metadata"
+    )
+    trace_id: Optional[str] = Field(None, description="Trace ID")
+    correlation_id: Optional[str] = Field(None, description="Correlation ID")
+
+
+class NotificationHistoryListResponse(BaseModel):
+    """Schema for a page of notification history."""
+    items: List[NotificationHistoryResponse] = Field(
+        default_factory=list,
+        description="History items on this page"
+    )
+    pagination: PaginationMetadata = Field(..., description="Pagination metadata")
+    total_count: Optional[int] = Field(
+        None,
+        description="Total number of matching items, omitted when not counted"
+    )
+    applied_filters: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Filters applied to the query"
+    )
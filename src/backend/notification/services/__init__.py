@@ -77,6 +77,11 @@ from .notification_preference_sync_service import (
     PreferenceChangeType
 )
 
+from .preference_cache import (
+    NotificationPreferenceCache,
+    get_preference_cache
+)
+
 # Security & Compliance Services (Phase 3)
 from .notification_audit_service import (
     NotificationAuditService,
@@ -131,6 +136,8 @@ __all__ = [
     "PreferenceAuditor",
     "SyncStatus",
     "PreferenceChangeType",
+    "NotificationPreferenceCache",
+    "get_preference_cache",
     
     # Security & Compliance (Phase 3)
     "NotificationAuditService",
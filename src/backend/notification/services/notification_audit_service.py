@@ -20,7 +20,7 @@ import hashlib
 import json
 import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Set, Pattern
+from typing import Dict, List, Optional, Any, Set, Pattern, Tuple
 from enum import Enum
 
 from bson import ObjectId
@@ -28,6 +28,8 @@ from pydantic import BaseModel, Field
 from pymongo.collection import Collection
 from pymongo.errors import PyMongoError
 
+from ..utils.keyset_pagination import apply_keyset, encode_cursor
+
 from ..schemas.audit_schemas import (
     AuditLogEntry,
     SecurityEvent,
@@ -608,7 +610,8 @@ class NotificationAuditService:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         event_types: Optional[List[str]] = None,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[AuditLogEntry]:
         """
         Get audit trail for a specific user
@@ -619,10 +622,50 @@ class NotificationAuditService:
             end_date: Optional end date filter
             event_types: Optional event types filter
             limit: Maximum number of entries
+            cursor: Continuation token from get_user_audit_trail_page
             
         Returns:
             List of audit log entries for the user
         """
+        audit_entries, _ = await self.get_user_audit_trail_page(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            event_types=event_types,
+            limit=limit,
+            cursor=cursor
+        )
+        return audit_entries
+    
+    async def get_user_audit_trail_page(
+        self,
+        user_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        event_types: Optional[List[str]] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[AuditLogEntry], Optional[str]]:
+        """
+        Get one page of a user's audit trail, newest first
+        
+        Pages are resumed from the returned continuation token on
+        (timestamp, _id), so deep pages cost the same as the first.
+        
+        Args:
+            user_id: User ID for audit trail
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            event_types: Optional event types filter
+            limit: Maximum number of entries
+            cursor: Continuation token from the previous page
+            
+        Returns:
+            Tuple of (audit log entries, continuation token or None on the last page)
+        
+        Raises:
+            ValueError: If the cursor is invalid
+        """
         try:
             # Build query
             query = {"user_id": user_id}
@@ -638,9 +681,15 @@ class NotificationAuditService:
             if event_types:
                 query["event_type"] = {"$in": event_types}
             
-            # Execute query
-            cursor = self.audit_collection.find(query).sort("timestamp", -1).limit(limit)
-            entries = await cursor.to_list(length=limit)
+            sort_spec = [("timestamp", -1), ("_id", -1)]
+            if cursor:
+                query = apply_keyset(query, sort_spec, cursor)
+            
+            # Execute query, fetching one extra entry to detect a next page
+            db_cursor = self.audit_collection.find(query).sort(sort_spec).limit(limit + 1)
+            entries = await db_cursor.to_list(length=limit + 1)
+            next_cursor = encode_cursor(sort_spec, entries[limit - 1]) if 0 < limit < len(entries) else None
+            entries = entries[:limit]
             
             # Convert to response models
             audit_entries = []
@@ -660,8 +709,10 @@ class NotificationAuditService:
             
             logger.info(f"Retrieved {len(audit_entries)} audit entries for user {user_id}")
             
-            return audit_entries
+            return audit_entries, next_cursor
             
+        except ValueError:
+            raise
         except Exception as e:
             logger.error(f"Error getting audit trail for user {user_id}: {e}")
             raise RuntimeError(f"Failed to get audit trail: {str(e)}")
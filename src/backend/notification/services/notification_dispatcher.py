@@ -10,6 +10,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any, Tuple
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
 
 from ..models import (
     NotificationModel, UserNotificationPreferencesModel, NotificationDeliveryHistory,
@@ -22,6 +23,7 @@ from .channel_adapter_base import (
     NotificationChannelAdapter, NotificationPayload, NotificationResult,
     NotificationResultStatus
 )
+from .preference_cache import NotificationPreferenceCache, get_preference_cache
 from ...config.logging import get_logger
 
 logger = get_logger(__name__)
@@ -42,7 +44,9 @@ class NotificationDispatcherService:
     def __init__(
         self,
         database: AsyncIOMotorDatabase,
-        channel_adapters: Dict[str, NotificationChannelAdapter]
+        channel_adapters: Dict[str, NotificationChannelAdapter],
+        max_concurrent_recipients: int = 50,
+        preference_cache: Optional[NotificationPreferenceCache] = None
     ):
         """
         Initialize notification dispatcher.
@@ -50,10 +54,14 @@ class NotificationDispatcherService:
         Args:
             database: MongoDB database instance
             channel_adapters: Dictionary mapping channel names to adapter instances
+            max_concurrent_recipients: Upper bound on recipients dispatched in parallel
+            preference_cache: Preference cache (defaults to the shared instance)
         """
         self.database = database
         self.channel_adapters = channel_adapters
         self.logger = logger.bind(service="NotificationDispatcherService")
+        self.max_concurrent_recipients = max_concurrent_recipients
+        self.preference_cache = preference_cache or get_preference_cache()
         
         # Collections
         self.notifications_collection = self.database.notifications
@@ -90,18 +98,68 @@ class NotificationDispatcherService:
             # Prepare delivery results tracking
             all_results = {}
             
-            # Process each recipient
-            for recipient in notification.recipients:
-                recipient_results = await self._dispatch_to_recipient(
-                    notification, recipient, delivery_mode, dispatch_id
+            # Fetch preferences for all recipients in one query
+            recipient_ids = [self._get_recipient_id(recipient) for recipient in notification.recipients]
+            preferences_by_user = await self._get_user_preferences_bulk(recipient_ids)
+            
+            # Resolve target channels and delivery history records up front
+            planned = []
+            for recipient, recipient_id in zip(notification.recipients, recipient_ids):
+                target_channels = await self._determine_target_channels(
+                    notification, recipient, preferences_by_user.get(recipient_id)
                 )
+                if not target_channels:
+                    self.logger.warning(
+                        "No valid channels found for recipient",
+                        dispatch_id=dispatch_id,
+                        notification_id=notification.notification_id,
+                        recipient_id=recipient_id
+                    )
+                    continue
+                history = self._build_delivery_history(notification, recipient_id, target_channels)
+                planned.append((recipient, recipient_id, target_channels, history))
+            
+            await self._create_delivery_histories([history for _, _, _, history in planned])
+            
+            # Fan out to recipients with bounded concurrency
+            semaphore = asyncio.Semaphore(self.max_concurrent_recipients)
+            
+            async def dispatch_bounded(recipient, target_channels, history):
+                async with semaphore:
+                    return await self._dispatch_to_recipient(
+                        notification, recipient, target_channels, history, delivery_mode, dispatch_id
+                    )
+            
+            recipient_outcomes = await asyncio.gather(
+                *(
+                    dispatch_bounded(recipient, target_channels, history)
+                    for recipient, _, target_channels, history in planned
+                ),
+                return_exceptions=True
+            )
+            
+            # Merge results
+            completed_histories = []
+            for (_, recipient_id, _, history), outcome in zip(planned, recipient_outcomes):
+                if isinstance(outcome, Exception):
+                    self.logger.error(
+                        "Recipient dispatch failed",
+                        dispatch_id=dispatch_id,
+                        recipient_id=recipient_id,
+                        error=str(outcome)
+                    )
+                    continue
                 
-                # Merge results
-                for channel, result in recipient_results.items():
+                self._apply_delivery_results(history, outcome)
+                completed_histories.append(history)
+                
+                for channel, result in outcome.items():
                     if channel not in all_results:
                         all_results[channel] = []
                     all_results[channel].append(result)
             
+            await self._update_delivery_histories(completed_histories)
+            
             # Update notification status based on results
             await self._update_notification_status(notification, all_results)
             
@@ -132,119 +190,84 @@ class NotificationDispatcherService:
         self,
         notification: NotificationModel,
         recipient: Any,
+        target_channels: List[NotificationChannel],
+        history: NotificationDeliveryHistory,
         delivery_mode: str,
         dispatch_id: str
     ) -> Dict[str, NotificationResult]:
         """
-        Dispatch notification to a specific recipient based on their preferences.
+        Dispatch notification to a specific recipient through its resolved channels.
         
         Args:
             notification: Notification to dispatch
             recipient: Recipient information
+            target_channels: Channels to use, in priority order
+            history: Delivery history record for this recipient
             delivery_mode: Delivery mode for this dispatch
             dispatch_id: Unique dispatch identifier
             
         Returns:
             Dict mapping channel names to delivery results for this recipient
         """
-        recipient_id = recipient.user_id if hasattr(recipient, 'user_id') else recipient.get('user_id')
+        self.logger.debug(
+            "Processing recipient dispatch",
+            dispatch_id=dispatch_id,
+            notification_id=notification.notification_id,
+            recipient_id=history.user_id
+        )
         
-        try:
-            self.logger.debug(
-                "Processing recipient dispatch",
-                dispatch_id=dispatch_id,
-                notification_id=notification.notification_id,
-                recipient_id=recipient_id
-            )
-            
-            # Get user preferences
-            user_preferences = await self._get_user_preferences(recipient_id)
-            
-            # Determine channels to use for this recipient
-            target_channels = await self._determine_target_channels(
-                notification, recipient, user_preferences
-            )
-            
-            if not target_channels:
-                self.logger.warning(
-                    "No valid channels found for recipient",
-                    dispatch_id=dispatch_id,
-                    notification_id=notification.notification_id,
-                    recipient_id=recipient_id
+        results = {}
+        
+        if delivery_mode == "fire_and_forget":
+            # Async dispatch to all channels simultaneously
+            tasks = []
+            for channel in target_channels:
+                task = self._dispatch_to_channel(
+                    notification, recipient, channel, history, dispatch_id
                 )
-                return {}
-            
-            # Create delivery history record
-            history = await self._create_delivery_history(
-                notification, recipient_id, target_channels
-            )
-            
-            # Dispatch to each channel
-            results = {}
-            
-            if delivery_mode == "fire_and_forget":
-                # Async dispatch to all channels simultaneously
-                tasks = []
-                for channel in target_channels:
-                    task = self._dispatch_to_channel(
-                        notification, recipient, channel, history, dispatch_id
+                tasks.append(task)
+            
+            # Wait for all dispatches to complete
+            channel_results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Process results
+            for i, result in enumerate(channel_results):
+                channel = target_channels[i]
+                if isinstance(result, Exception):
+                    self.logger.error(
+                        "Channel dispatch failed",
+                        dispatch_id=dispatch_id,
+                        channel=channel.value,
+                        error=str(result)
                     )
-                    tasks.append(task)
-                
-                # Wait for all dispatches to complete
-                channel_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Process results
-                for i, result in enumerate(channel_results):
-                    channel = target_channels[i]
-                    if isinstance(result, Exception):
-                        self.logger.error(
-                            "Channel dispatch failed",
-                            dispatch_id=dispatch_id,
-                            channel=channel.value,
-                            error=str(result)
-                        )
-                        results[channel.value] = NotificationResult(
-                            status=NotificationResultStatus.FAILURE,
-                            success=False,
-                            error_code="DISPATCH_ERROR",
-                            error_message=str(result)
-                        )
-                    else:
-                        results[channel.value] = result
-                        
-            else:  # confirmed_delivery
-                # Sequential dispatch with confirmation
-                for channel in target_channels:
-                    result = await self._dispatch_to_channel(
-                        notification, recipient, channel, history, dispatch_id
+                    results[channel.value] = NotificationResult(
+                        status=NotificationResultStatus.FAILURE,
+                        success=False,
+                        error_code="DISPATCH_ERROR",
+                        error_message=str(result)
                     )
+                else:
                     results[channel.value] = result
                     
-                    # Stop on first successful delivery for confirmed mode
-                    if result.success:
-                        self.logger.info(
-                            "Confirmed delivery successful",
-                            dispatch_id=dispatch_id,
-                            channel=channel.value,
-                            notification_id=notification.notification_id
-                        )
-                        break
-            
-            # Update delivery history with results
-            await self._update_delivery_history(history, results)
-            
-            return results
-            
-        except Exception as e:
-            self.logger.error(
-                "Recipient dispatch failed",
-                dispatch_id=dispatch_id,
-                recipient_id=recipient_id,
-                error=str(e),
-                exc_info=True
-            )
-            raise
+        else:  # confirmed_delivery
+            # Sequential dispatch with confirmation
+            for channel in target_channels:
+                result = await self._dispatch_to_channel(
+                    notification, recipient, channel, history, dispatch_id
+                )
+                results[channel.value] = result
+                
+                # Stop on first successful delivery for confirmed mode
+                if result.success:
+                    self.logger.info(
+                        "Confirmed delivery successful",
+                        dispatch_id=dispatch_id,
+                        channel=channel.value,
+                        notification_id=notification.notification_id
+                    )
+                    break
+        
+        return results
     
     async def _dispatch_to_channel(
         self,
@@ -363,28 +386,61 @@ class NotificationDispatcherService:
             result.mark_completed(success=False)
             return result
     
+    def _get_recipient_id(self, recipient: Any) -> str:
+        """Extract the user id from a recipient model or dict."""
+        return recipient.user_id if hasattr(recipient, 'user_id') else recipient.get('user_id')
+    
     async def _get_user_preferences(
         self, 
         user_id: str
     ) -> Optional[UserNotificationPreferencesModel]:
         """Get user notification preferences from database."""
+        preferences = await self._get_user_preferences_bulk([user_id])
+        return preferences.get(user_id)
+    
+    async def _get_user_preferences_bulk(
+        self,
+        user_ids: List[str]
+    ) -> Dict[str, UserNotificationPreferencesModel]:
+        """
+        Get notification preferences for several users.
+        
+        Cached users are served from the preference cache; the rest are
+        loaded with a single $in query and cached, including users that
+        have no stored preferences.
+        """
+        unique_ids = list({user_id for user_id in user_ids if user_id})
+        if not unique_ids:
+            return {}
+        
+        cached, missing = self.preference_cache.get_many(unique_ids)
+        preferences = {
+            user_id: model for user_id, model in cached.items() if model is not None
+        }
+        if not missing:
+            return preferences
+        
         try:
-            preferences_doc = await self.preferences_collection.find_one({
-                "user_id": user_id
-            })
+            loaded = {}
+            cursor = self.preferences_collection.find({"user_id": {"$in": missing}})
+            async for preferences_doc in cursor:
+                model = UserNotificationPreferencesModel.from_mongo(preferences_doc)
+                if model:
+                    loaded[model.user_id] = model
             
-            if preferences_doc:
-                return UserNotificationPreferencesModel.from_mongo(preferences_doc)
+            for user_id in missing:
+                self.preference_cache.put(user_id, loaded.get(user_id))
             
-            return None
+            preferences.update(loaded)
+            return preferences
             
         except Exception as e:
             self.logger.error(
                 "Failed to get user preferences",
-                user_id=user_id,
+                user_count=len(missing),
                 error=str(e)
             )
-            return None
+            return preferences
     
     async def _determine_target_channels(
         self,
@@ -446,14 +502,14 @@ class NotificationDispatcherService:
         
         return valid_channels
     
-    async def _create_delivery_history(
+    def _build_delivery_history(
         self,
         notification: NotificationModel,
         recipient_id: str,
         target_channels: List[NotificationChannel]
     ) -> NotificationDeliveryHistory:
-        """Create delivery history record for tracking."""
-        history = NotificationDeliveryHistory(
+        """Build delivery history record for tracking."""
+        return NotificationDeliveryHistory(
             notification_id=notification.notification_id,
             user_id=recipient_id,
             notification_type=notification.type.value,
@@ -461,11 +517,19 @@ class NotificationDispatcherService:
             channels_attempted=[ch.value for ch in target_channels],
             source_service=notification.source_service
         )
+    
+    async def _create_delivery_histories(
+        self,
+        histories: List[NotificationDeliveryHistory]
+    ) -> None:
+        """Save delivery history records with a single insert_many."""
+        if not histories:
+            return
         
-        # Save to database
-        await self.history_collection.insert_one(history.to_mongo())
-        
-        return history
+        await self.history_collection.insert_many(
+            [history.to_mongo() for history in histories],
+            ordered=False
+        )
     
     async def _create_notification_payload(
         self,
@@ -528,7 +592,7 @@ class NotificationDispatcherService:
         
         return data
     
-    async def _update_delivery_history(
+    def _apply_delivery_results(
         self,
         history: NotificationDeliveryHistory,
         results: Dict[str, NotificationResult]
@@ -556,11 +620,24 @@ class NotificationDispatcherService:
             history.last_attempt_at = max(
                 attempt.started_at for attempt in history.delivery_attempts
             )
+    
+    async def _update_delivery_histories(
+        self,
+        histories: List[NotificationDeliveryHistory]
+    ) -> None:
+        """Save delivery history updates with a single bulk write."""
+        if not histories:
+            return
         
-        # Save updates
-        await self.history_collection.update_one(
-            {"notification_id": history.notification_id, "user_id": history.user_id},
-            {"$set": history.to_mongo()}
+        await self.history_collection.bulk_write(
+            [
+                UpdateOne(
+                    {"notification_id": history.notification_id, "user_id": history.user_id},
+                    {"$set": history.to_mongo()}
+                )
+                for history in histories
+            ],
+            ordered=False
         )
     
     async def _update_notification_status(
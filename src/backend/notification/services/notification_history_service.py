@@ -26,9 +26,10 @@ from pymongo import ASCENDING, DESCENDING
 from pymongo.collection import Collection
 from pymongo.errors import PyMongoError
 
-from ..models.notification_delivery_history import NotificationDeliveryHistory
-from ..models.user_notification_preferences import UserNotificationPreferencesModel
-from ..schemas.notification_history_schemas import (
+from ..models.notification_history_model import NotificationDeliveryHistory
+from ..models.notification_preference_model import UserNotificationPreferencesModel
+from ..utils.keyset_pagination import apply_keyset, encode_cursor, with_tiebreaker
+from ..schemas.history_schemas import (
     NotificationHistoryResponse,
     NotificationHistoryDetailResponse,
     NotificationHistoryListResponse,
@@ -200,23 +201,31 @@ class HistoryPaginator:
     
     @staticmethod
     def calculate_pagination(
-        total_count: int,
+        total_count: Optional[int],
         page: int,
-        page_size: int
+        page_size: int,
+        has_next: Optional[bool] = None,
+        next_cursor: Optional[str] = None
     ) -> PaginationMetadata:
         """
         Calculate pagination metadata from query results
         
         Args:
-            total_count: Total number of matching documents
+            total_count: Total number of matching documents, None if not counted
             page: Current page number (1-based)
             page_size: Number of items per page
+            has_next: Whether another page exists, derived from total_count if None
+            next_cursor: Continuation token for the next page
             
         Returns:
             Comprehensive pagination metadata
         """
-        total_pages = max(1, (total_count + page_size - 1) // page_size)
-        has_next = page < total_pages
+        total_pages = None
+        if total_count is not None:
+            total_pages = max(1, (total_count + page_size - 1) // page_size)
+            if has_next is None:
+                has_next = page < total_pages
+        has_next = bool(has_next)
         has_previous = page > 1
         
         return PaginationMetadata(
@@ -227,7 +236,8 @@ class HistoryPaginator:
             has_next=has_next,
             has_previous=has_previous,
             next_page=page + 1 if has_next else None,
-            previous_page=page - 1 if has_previous else None
+            previous_page=page - 1 if has_previous else None,
+            next_cursor=next_cursor
         )
     
     @staticmethod
@@ -272,7 +282,9 @@ class NotificationHistoryService:
         user_id: str,
         page: int = 1,
         page_size: int = 20,
-        filters: Optional[HistoryFilterRequest] = None
+        filters: Optional[HistoryFilterRequest] = None,
+        cursor: Optional[str] = None,
+        include_total: Optional[bool] = None
     ) -> NotificationHistoryListResponse:
         """
         Retrieve paginated notification history for a specific user
@@ -280,11 +292,18 @@ class NotificationHistoryService:
         Provides comprehensive history access with filtering, sorting, and
         pagination support. All results are scoped to the authenticated user.
         
+        Pages are resumed from the continuation token returned as
+        pagination.next_cursor, which seeks directly to the next page on the
+        sort index. Page numbers without a cursor fall back to skip/limit.
+        
         Args:
             user_id: User ID for scoping history queries
             page: Page number for pagination (1-based)
             page_size: Number of items per page
             filters: Optional filtering parameters
+            cursor: Continuation token from the previous page
+            include_total: Whether to count matching documents; by default
+                only the first page (no cursor) is counted
             
         Returns:
             Paginated list of notification history with metadata
@@ -302,19 +321,29 @@ class NotificationHistoryService:
                 **(filters.dict() if filters else {})
             )
             
-            # Build MongoDB query and sort
+            # Build MongoDB query and sort; _id makes the sort order total for keyset paging
             query = self.filter_builder.build_query(query_params)
-            sort_spec = self.filter_builder.build_sort(query_params.sort_by)
+            sort_spec = with_tiebreaker(self.filter_builder.build_sort(query_params.sort_by))
             
             # Calculate pagination
-            skip, limit = self.paginator.calculate_skip_limit(page, page_size)
+            if cursor:
+                page_query = apply_keyset(query, sort_spec, cursor)
+                skip, limit = 0, page_size
+            else:
+                page_query = query
+                skip, limit = self.paginator.calculate_skip_limit(page, page_size)
             
             # Execute count query for pagination metadata
-            total_count = await self._count_documents(query)
+            if include_total is None:
+                include_total = cursor is None
+            total_count = await self._count_documents(query) if include_total else None
             
-            # Execute main query with pagination and sorting
-            cursor = self.collection.find(query).sort(sort_spec).skip(skip).limit(limit)
-            documents = await cursor.to_list(length=limit)
+            # Fetch one extra document to detect a next page without counting
+            db_cursor = self.collection.find(page_query).sort(sort_spec).skip(skip).limit(limit + 1)
+            documents = await db_cursor.to_list(length=limit + 1)
+            has_next = len(documents) > limit
+            documents = documents[:limit]
+            next_cursor = encode_cursor(sort_spec, documents[-1]) if has_next else None
             
             # Convert documents to response models
             history_items = []
@@ -327,7 +356,9 @@ class NotificationHistoryService:
                     continue
             
             # Calculate pagination metadata
-            pagination = self.paginator.calculate_pagination(total_count, page, page_size)
+            pagination = self.paginator.calculate_pagination(
+                total_count, page, page_size, has_next=has_next, next_cursor=next_cursor
+            )
             
             # Build response
             response = NotificationHistoryListResponse(
@@ -339,7 +370,7 @@ class NotificationHistoryService:
             
             logger.info(
                 f"Retrieved {len(history_items)} history items for user {user_id} "
-                f"(page {page}/{pagination.total_pages})"
+                f"(page {page}/{pagination.total_pages or '?'})"
             )
             
             return response
@@ -40,6 +40,7 @@ from ..schemas.preference_sync_schemas import (
     OptInOutRequest,
     PreferenceImpactAnalysis
 )
+from .preference_cache import NotificationPreferenceCache, get_preference_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -562,7 +563,8 @@ class NotificationPreferenceSyncService:
         preferences_collection: Collection,
         sync_status_collection: Collection,
         audit_collection: Collection,
-        user_context_service=None
+        user_context_service=None,
+        preference_cache: Optional[NotificationPreferenceCache] = None
     ):
         """
         Initialize the preference sync service
@@ -572,9 +574,11 @@ class NotificationPreferenceSyncService:
             sync_status_collection: Collection for sync operation tracking
             audit_collection: Collection for audit trail
             user_context_service: External user context service (optional)
+            preference_cache: Routing preference cache to invalidate on changes
         """
         self.preferences_collection = preferences_collection
         self.user_context_service = user_context_service
+        self.preference_cache = preference_cache or get_preference_cache()
         
         self.validator = PreferenceValidator()
         self.sync_tracker = SyncStatusTracker(sync_status_collection)
@@ -905,6 +909,7 @@ class NotificationPreferenceSyncService:
                 
                 # Save default preferences
                 await self.preferences_collection.insert_one(default_preferences.dict())
+                self.preference_cache.invalidate(user_id)
                 return default_preferences
                 
         except Exception as e:
@@ -1004,6 +1009,7 @@ class NotificationPreferenceSyncService:
                 current_preferences.dict(),
                 upsert=True
             )
+            self.preference_cache.invalidate(user_id)
             
             return changes_applied
             
@@ -0,0 +1,143 @@
+"""
+IntelliBrowse Notification Engine - Preference Cache
+
+This module provides an in-process LRU + TTL cache for user notification
+preferences shared by the notification dispatcher and the delivery daemon.
+Entries are invalidated by the preference sync service whenever a user's
+preferences change, so the TTL only bounds staleness for writes made by
+other processes.
+
+Classes:
+    - NotificationPreferenceCache: LRU + TTL preference cache with hit/miss metrics
+
+Author: IntelliBrowse Team
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class NotificationPreferenceCache:
+    """
+    LRU + TTL cache of user notification preferences keyed by user ID
+
+    Users without stored preferences are cached as ``None`` so repeated
+    lookups for them do not reach MongoDB either.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 300.0):
+        """
+        Initialize preference cache
+
+        Args:
+            max_size: Maximum number of users held in the cache
+            ttl_seconds: Time after which an entry is reloaded
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, user_id: str) -> Tuple[bool, Any]:
+        """
+        Look up cached preferences
+
+        Returns:
+            Tuple of (found, preferences); preferences may be None for users
+            known to have no stored preferences
+        """
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        expires_at, preferences = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return True, preferences
+
+    def get_many(self, user_ids: Iterable[str]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Look up preferences for several users
+
+        Returns:
+            Tuple of (cached preferences by user ID, user IDs that missed)
+        """
+        cached: Dict[str, Any] = {}
+        missing: List[str] = []
+
+        for user_id in user_ids:
+            found, preferences = self.get(user_id)
+            if found:
+                cached[user_id] = preferences
+            else:
+                missing.append(user_id)
+
+        return cached, missing
+
+    def put(self, user_id: str, preferences: Any) -> None:
+        """Store preferences (or None for users without preferences)"""
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, preferences)
+        self._entries.move_to_end(user_id)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop cached preferences for a user after they change"""
+        if self._entries.pop(user_id, None) is not None:
+            self.invalidations += 1
+            logger.debug(f"Invalidated cached notification preferences for user {user_id}")
+
+    def clear(self) -> None:
+        """Drop all cached preferences"""
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit/miss metrics"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations
+        }
+
+
+# Global preference cache instance
+_preference_cache: Optional[NotificationPreferenceCache] = None
+
+
+def get_preference_cache() -> NotificationPreferenceCache:
+    """
+    Get the global preference cache instance.
+    Shared by the dispatcher, delivery daemon and preference sync service.
+
+    Returns:
+        NotificationPreferenceCache instance
+    """
+    global _preference_cache
+    if _preference_cache is None:
+        _preference_cache = NotificationPreferenceCache()
+    return _preference_cache
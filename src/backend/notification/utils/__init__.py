@@ -10,10 +10,24 @@ from .mongodb_setup import (
     create_notification_indexes,
     NotificationCollectionManager
 )
+from .keyset_pagination import (
+    with_tiebreaker,
+    encode_cursor,
+    decode_cursor,
+    build_keyset_filter,
+    apply_keyset
+)
 
 __all__ = [
     # MongoDB setup and management
     "setup_notification_collections",
     "create_notification_indexes", 
-    "NotificationCollectionManager"
+    "NotificationCollectionManager",
+    
+    # Keyset (cursor) pagination
+    "with_tiebreaker",
+    "encode_cursor",
+    "decode_cursor",
+    "build_keyset_filter",
+    "apply_keyset"
 ] 
\ No newline at end of file
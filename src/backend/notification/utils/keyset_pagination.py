@@ -0,0 +1,123 @@
+"""
+IntelliBrowse Notification Engine - Keyset Pagination Utilities
+
+This module provides cursor (keyset) pagination helpers for user-scoped
+history queries. Instead of skipping over earlier pages, each page resumes
+from the sort key of the last document returned, so a page costs the same
+index range scan regardless of its depth.
+
+Continuation tokens are opaque to clients: a URL-safe base64 encoding of the
+sort specification and the sort key values of the last returned document.
+
+Author: IntelliBrowse Team
+"""
+
+import base64
+import binascii
+from typing import Any, Dict, List, Mapping, Tuple
+
+from bson import json_util
+from pymongo import ASCENDING, DESCENDING
+
+SortSpec = List[Tuple[str, int]]
+
+
+def with_tiebreaker(sort_spec: SortSpec) -> SortSpec:
+    """
+    Append _id to a sort specification so the sort order is total
+
+    Args:
+        sort_spec: List of (field, direction) tuples
+
+    Returns:
+        Sort specification ending with _id in the direction of the last field
+    """
+    if any(field == "_id" for field, _ in sort_spec):
+        return list(sort_spec)
+    direction = sort_spec[-1][1] if sort_spec else DESCENDING
+    return list(sort_spec) + [("_id", direction)]
+
+
+def encode_cursor(sort_spec: SortSpec, document: Mapping[str, Any]) -> str:
+    """
+    Build the continuation token that resumes after a document
+
+    Args:
+        sort_spec: Sort specification including the _id tiebreaker
+        document: Last document of the current page
+
+    Returns:
+        Opaque URL-safe continuation token
+    """
+    payload = {
+        "s": [[field, direction] for field, direction in sort_spec],
+        "v": [document.get(field) for field, _ in sort_spec]
+    }
+    raw = json_util.dumps(payload).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, sort_spec: SortSpec) -> List[Any]:
+    """
+    Decode a continuation token issued for the same sort specification
+
+    Args:
+        token: Continuation token from a previous page
+        sort_spec: Sort specification of the current query
+
+    Returns:
+        Sort key values of the document to resume after
+
+    Raises:
+        ValueError: If the token is malformed or was issued for another sort
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json_util.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        token_sort = [(field, direction) for field, direction in payload["s"]]
+        values = payload["v"]
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {e}")
+
+    if token_sort != list(sort_spec) or len(values) != len(sort_spec):
+        raise ValueError("Pagination cursor does not match the requested sort order")
+    return values
+
+
+def build_keyset_filter(sort_spec: SortSpec, values: List[Any]) -> Dict[str, Any]:
+    """
+    Build the filter matching documents strictly after a sort key
+
+    For sort fields f1..fn the filter is
+    (f1 > v1) OR (f1 = v1 AND f2 > v2) OR ... with > replaced by < for
+    descending fields.
+
+    Args:
+        sort_spec: Sort specification including the _id tiebreaker
+        values: Sort key values decoded from the continuation token
+
+    Returns:
+        MongoDB filter for the next page
+    """
+    branches = []
+    for index, (field, direction) in enumerate(sort_spec):
+        branch = {prev_field: values[prev] for prev, (prev_field, _) in enumerate(sort_spec[:index])}
+        branch[field] = {"$gt" if direction == ASCENDING else "$lt": values[index]}
+        branches.append(branch)
+    return branches[0] if len(branches) == 1 else {"$or": branches}
+
+
+def apply_keyset(query: Dict[str, Any], sort_spec: SortSpec, token: str) -> Dict[str, Any]:
+    """
+    Restrict a query to the documents after a continuation token
+
+    Args:
+        query: Base MongoDB query
+        sort_spec: Sort specification including the _id tiebreaker
+        token: Continuation token from a previous page
+
+    Returns:
+        Query combining the base filter and the keyset filter
+    """
+    keyset_filter = build_keyset_filter(sort_spec, decode_cursor(token, sort_spec))
+    return {"$and": [query, keyset_filter]}
@@ -375,9 +375,10 @@ class NotificationCollectionManager:
                     [("user_id", ASCENDING), ("notification_type", ASCENDING)],
                     name="idx_user_id_type"
                 ),
+                # Serves keyset pagination of user history on (created_at, _id)
                 IndexModel(
-                    [("user_id", ASCENDING), ("created_at", DESCENDING)],
-                    name="idx_user_id_created_at"
+                    [("user_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                    name="idx_user_id_created_at_id"
                 ),
                 IndexModel(
                     [("notification_id", ASCENDING), ("user_id", ASCENDING)],
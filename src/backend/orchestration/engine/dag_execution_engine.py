@@ -9,7 +9,9 @@ This module implements the main DAG execution engine responsible for:
 """
 
 import asyncio
+import hashlib
 import logging
+from collections import Counter, OrderedDict, deque
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Set, Any, Tuple
 from dataclasses import dataclass, field
@@ -99,6 +101,14 @@ class NodeExecutionResult:
     retry_count: int = 0
 
 
+@dataclass(frozen=True)
+class DAGValidationResult:
+    """Outcome of DAG structure validation, cached per graph shape"""
+    graph_hash: str
+    topological_order: Tuple[str, ...]
+    critical_path_length: int  # Number of nodes on the longest dependency chain
+
+
 @dataclass
 class DAGExecutionGraph:
     """In-memory representation of DAG execution state"""
@@ -108,6 +118,11 @@ class DAGExecutionGraph:
     execution_results: Dict[str, NodeExecutionResult]
     ready_queue: asyncio.Queue
     semaphore: asyncio.Semaphore
+    dependents: Dict[str, List[str]] = field(default_factory=dict)  # node_id -> list of dependent node_ids
+    remaining_dependencies: Dict[str, int] = field(default_factory=dict)  # node_id -> unfinished dependency count
+    stage_counts: Counter = field(default_factory=Counter)  # ExecutionStage -> number of nodes in that stage
+    progress_event: asyncio.Event = field(default_factory=asyncio.Event)
+    validation: Optional[DAGValidationResult] = None
     
     def __post_init__(self):
         if not hasattr(self, 'ready_queue'):
@@ -140,6 +155,10 @@ class DAGExecutionEngine(BaseOrchestrationService):
         self.active_executions: Dict[str, DAGExecutionGraph] = {}
         self.execution_lock = asyncio.Lock()
         
+        # Validation results keyed by content hash of the node and edge set
+        self.validation_cache_size = 256
+        self._validation_cache: "OrderedDict[str, DAGValidationResult]" = OrderedDict()
+        
     async def execute_dag(
         self,
         job: OrchestrationJobModel,
@@ -229,9 +248,17 @@ class DAGExecutionEngine(BaseOrchestrationService):
             for node_data in job.execution_graph.get('nodes', []):
                 node = OrchestrationNodeModel(**node_data)
                 nodes[node.node_id] = node
-                dependencies[node.node_id] = node.depends_on or []
+                dependencies[node.node_id] = list(node.parent_nodes)
                 node_states[node.node_id] = ExecutionStage.PENDING
                 
+        # Reverse adjacency and in-degree counters for Kahn-style scheduling
+        dependents = {node_id: [] for node_id in nodes}
+        remaining_dependencies = {}
+        for node_id, deps in dependencies.items():
+            remaining_dependencies[node_id] = len(deps)
+            for dep in deps:
+                dependents.setdefault(dep, []).append(node_id)
+        
         # Create semaphore for parallel execution control
         semaphore = asyncio.Semaphore(context.max_parallel_nodes)
         ready_queue = asyncio.Queue()
@@ -242,7 +269,10 @@ class DAGExecutionEngine(BaseOrchestrationService):
             node_states=node_states,
             execution_results=execution_results,
             ready_queue=ready_queue,
-            semaphore=semaphore
+            semaphore=semaphore,
+            dependents=dependents,
+            remaining_dependencies=remaining_dependencies,
+            stage_counts=Counter({ExecutionStage.PENDING: len(nodes)})
         )
         
         # Find initially ready nodes (no dependencies)
@@ -250,38 +280,46 @@ class DAGExecutionEngine(BaseOrchestrationService):
         
         return dag_graph
     
-    async def _validate_dag_structure(self, dag_graph: DAGExecutionGraph) -> None:
-        """Validate DAG structure for cycles and consistency"""
+    async def _validate_dag_structure(self, dag_graph: DAGExecutionGraph) -> DAGValidationResult:
+        """Validate DAG structure for cycles and consistency, reusing cached results"""
         
-        # Cycle detection using DFS
-        visited = set()
-        rec_stack = set()
+        graph_hash = self._compute_graph_hash(dag_graph)
         
-        def has_cycle(node_id: str) -> bool:
-            if node_id in rec_stack:
-                return True
-            if node_id in visited:
-                return False
-                
-            visited.add(node_id)
-            rec_stack.add(node_id)
-            
-            for dep in dag_graph.dependencies.get(node_id, []):
-                if has_cycle(dep):
-                    return True
-            
-            rec_stack.remove(node_id)
-            return False
+        cached = self._validation_cache.get(graph_hash)
+        if cached is not None:
+            self._validation_cache.move_to_end(graph_hash)
+            dag_graph.validation = cached
+            self.logger.debug(f"DAG validation cache hit for {len(dag_graph.nodes)} nodes")
+            return cached
         
-        # Check for cycles
-        for node_id in dag_graph.nodes:
-            if node_id not in visited:
-                if has_cycle(node_id):
-                    raise GraphExecutionHalt(
-                        f"Cycle detected in DAG involving node {node_id}",
-                        "cycle_detected",
-                        [node_id]
-                    )
+        validation = self._topological_validate(dag_graph, graph_hash)
+        
+        self._validation_cache[graph_hash] = validation
+        if len(self._validation_cache) > self.validation_cache_size:
+            self._validation_cache.popitem(last=False)
+        
+        dag_graph.validation = validation
+        self.logger.info(
+            f"DAG validation passed for {len(dag_graph.nodes)} nodes "
+            f"(critical path: {validation.critical_path_length})"
+        )
+        return validation
+    
+    def _compute_graph_hash(self, dag_graph: DAGExecutionGraph) -> str:
+        """Content hash of the node and edge set, independent of ordering"""
+        
+        digest = hashlib.sha256()
+        for node_id in sorted(dag_graph.nodes):
+            digest.update(b"n\x00")
+            digest.update(node_id.encode("utf-8"))
+            for dep in sorted(dag_graph.dependencies.get(node_id, [])):
+                digest.update(b"\x00e\x00")
+                digest.update(dep.encode("utf-8"))
+            digest.update(b"\x01")
+        return digest.hexdigest()
+    
+    def _topological_validate(self, dag_graph: DAGExecutionGraph, graph_hash: str) -> DAGValidationResult:
+        """Iterative Kahn topological sort - detects cycles without recursion"""
         
         # Validate dependency references
         for node_id, deps in dag_graph.dependencies.items():
@@ -293,28 +331,84 @@ class DAGExecutionEngine(BaseOrchestrationService):
                         [node_id, dep]
                     )
         
-        self.logger.info(f"DAG validation passed for {len(dag_graph.nodes)} nodes")
+        in_degree = {node_id: 0 for node_id in dag_graph.nodes}
+        dependents: Dict[str, List[str]] = {node_id: [] for node_id in dag_graph.nodes}
+        for node_id in dag_graph.nodes:
+            for dep in dag_graph.dependencies.get(node_id, []):
+                in_degree[node_id] += 1
+                dependents[dep].append(node_id)
+        
+        # Longest chain (in nodes) ending at each node
+        depth = {node_id: 1 for node_id in dag_graph.nodes}
+        queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
+        order: List[str] = []
+        
+        while queue:
+            node_id = queue.popleft()
+            order.append(node_id)
+            for dependent_id in dependents[node_id]:
+                depth[dependent_id] = max(depth[dependent_id], depth[node_id] + 1)
+                in_degree[dependent_id] -= 1
+                if in_degree[dependent_id] == 0:
+                    queue.append(dependent_id)
+        
+        if len(order) < len(dag_graph.nodes):
+            cycle_nodes = sorted(node_id for node_id, degree in in_degree.items() if degree > 0)
+            raise GraphExecutionHalt(
+                f"Cycle detected in DAG involving node {cycle_nodes[0]}",
+                "cycle_detected",
+                cycle_nodes
+            )
+        
+        return DAGValidationResult(
+            graph_hash=graph_hash,
+            topological_order=tuple(order),
+            critical_path_length=max(depth.values(), default=0)
+        )
     
     async def _identify_ready_nodes(self, dag_graph: DAGExecutionGraph) -> None:
-        """Identify nodes that are ready for execution"""
-        
-        for node_id, node in dag_graph.nodes.items():
-            if dag_graph.node_states[node_id] == ExecutionStage.PENDING:
-                # Check if all dependencies are completed
-                deps_completed = True
-                for dep in dag_graph.dependencies.get(node_id, []):
-                    if dag_graph.node_states.get(dep) != ExecutionStage.COMPLETED:
-                        deps_completed = False
-                        break
-                
-                if deps_completed:
-                    dag_graph.node_states[node_id] = ExecutionStage.READY
-                    await dag_graph.ready_queue.put(node_id)
-                    
-                    self.logger.debug(
-                        f"Node {node_id} marked as ready for execution",
-                        extra={"node_id": node_id}
-                    )
+        """Queue the initial ready nodes - those without dependencies"""
+        
+        for node_id, remaining in dag_graph.remaining_dependencies.items():
+            if remaining == 0 and dag_graph.node_states[node_id] == ExecutionStage.PENDING:
+                await self._mark_node_ready(dag_graph, node_id)
+    
+    async def _release_dependents(self, dag_graph: DAGExecutionGraph, node_id: str) -> None:
+        """Decrement dependents' counters after a completion and queue those now ready"""
+        
+        for dependent_id in dag_graph.dependents.get(node_id, []):
+            dag_graph.remaining_dependencies[dependent_id] -= 1
+            if (
+                dag_graph.remaining_dependencies[dependent_id] == 0
+                and dag_graph.node_states[dependent_id] == ExecutionStage.PENDING
+            ):
+                await self._mark_node_ready(dag_graph, dependent_id)
+    
+    async def _mark_node_ready(self, dag_graph: DAGExecutionGraph, node_id: str) -> None:
+        """Move a node to READY and push it onto the ready queue"""
+        
+        self._set_node_state(dag_graph, node_id, ExecutionStage.READY)
+        await dag_graph.ready_queue.put(node_id)
+        
+        self.logger.debug(
+            f"Node {node_id} marked as ready for execution",
+            extra={"node_id": node_id}
+        )
+    
+    def _set_node_state(
+        self,
+        dag_graph: DAGExecutionGraph,
+        node_id: str,
+        stage: ExecutionStage
+    ) -> None:
+        """Update a node state, keep stage counters in step and wake the graph monitor"""
+        
+        previous = dag_graph.node_states.get(node_id)
+        if previous is not None:
+            dag_graph.stage_counts[previous] -= 1
+        dag_graph.stage_counts[stage] += 1
+        dag_graph.node_states[node_id] = stage
+        dag_graph.progress_event.set()
     
     async def _execute_graph(
         self,
@@ -324,8 +418,6 @@ class DAGExecutionEngine(BaseOrchestrationService):
         """Execute the DAG graph with parallel processing"""
         
         start_time = datetime.now(timezone.utc)
-        completed_nodes = 0
-        failed_nodes = 0
         total_nodes = len(dag_graph.nodes)
         
         # Worker tasks for parallel execution
@@ -339,41 +431,29 @@ class DAGExecutionEngine(BaseOrchestrationService):
                 )
                 workers.append(worker_task)
             
-            # Monitor execution progress
-            while completed_nodes + failed_nodes < total_nodes:
-                await asyncio.sleep(0.1)  # Small delay to prevent busy waiting
+            # Monitor execution progress - woken by node state changes
+            counts = dag_graph.stage_counts
+            while True:
+                dag_graph.progress_event.clear()
                 
-                # Count completed/failed nodes
-                completed_nodes = sum(
-                    1 for state in dag_graph.node_states.values()
-                    if state == ExecutionStage.COMPLETED
-                )
-                failed_nodes = sum(
-                    1 for state in dag_graph.node_states.values()
-                    if state == ExecutionStage.FAILED
-                )
+                completed_nodes = counts[ExecutionStage.COMPLETED]
+                failed_nodes = counts[ExecutionStage.FAILED]
+                if completed_nodes + failed_nodes >= total_nodes:
+                    break
                 
-                # Check for stall condition
-                running_nodes = sum(
-                    1 for state in dag_graph.node_states.values()
-                    if state == ExecutionStage.RUNNING
-                )
+                # Stall: nothing running or queued but nodes remain unfinished
+                if counts[ExecutionStage.RUNNING] == 0 and counts[ExecutionStage.READY] == 0:
+                    stalled_nodes = [
+                        node_id for node_id, state in dag_graph.node_states.items()
+                        if state == ExecutionStage.PENDING
+                    ]
+                    raise OrchestrationStallException(
+                        f"Execution stalled with {len(stalled_nodes)} pending nodes",
+                        stalled_nodes,
+                        {"completed": completed_nodes, "failed": failed_nodes}
+                    )
                 
-                if running_nodes == 0 and dag_graph.ready_queue.empty():
-                    # Check if there are pending nodes that should be ready
-                    await self._identify_ready_nodes(dag_graph)
-                    
-                    if dag_graph.ready_queue.empty() and completed_nodes + failed_nodes < total_nodes:
-                        # Stall detected
-                        stalled_nodes = [
-                            node_id for node_id, state in dag_graph.node_states.items()
-                            if state == ExecutionStage.PENDING
-                        ]
-                        raise OrchestrationStallException(
-                            f"Execution stalled with {len(stalled_nodes)} pending nodes",
-                            stalled_nodes,
-                            {"completed": completed_nodes, "failed": failed_nodes}
-                        )
+                await dag_graph.progress_event.wait()
             
             # Cancel workers
             for worker in workers:
@@ -401,6 +481,7 @@ class DAGExecutionEngine(BaseOrchestrationService):
                 "completed_nodes": completed_nodes,
                 "failed_nodes": failed_nodes,
                 "total_nodes": total_nodes,
+                "critical_path_length": dag_graph.validation.critical_path_length if dag_graph.validation else None,
                 "node_results": dict(dag_graph.execution_results)
             }
             
@@ -424,6 +505,7 @@ class DAGExecutionEngine(BaseOrchestrationService):
             # Handle execution failure
             for worker in workers:
                 worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
             
             self.logger.error(
                 f"Graph execution failed: {str(e)}",
@@ -460,9 +542,6 @@ class DAGExecutionEngine(BaseOrchestrationService):
                     # Mark task as done
                     dag_graph.ready_queue.task_done()
                     
-                    # Check for newly ready nodes
-                    await self._identify_ready_nodes(dag_graph)
-                    
                 except asyncio.TimeoutError:
                     # Timeout waiting for nodes - check if we should continue
                     continue
@@ -496,7 +575,7 @@ class DAGExecutionEngine(BaseOrchestrationService):
         async with dag_graph.semaphore:
             try:
                 # Update state to running
-                dag_graph.node_states[node_id] = ExecutionStage.RUNNING
+                self._set_node_state(dag_graph, node_id, ExecutionStage.RUNNING)
                 start_time = datetime.now(timezone.utc)
                 
                 await self.state_tracker.update_node_state(
@@ -527,9 +606,10 @@ class DAGExecutionEngine(BaseOrchestrationService):
                     result_data=result
                 )
                 
-                # Update states
-                dag_graph.node_states[node_id] = ExecutionStage.COMPLETED
+                # Update states and release dependents whose last dependency this was
                 dag_graph.execution_results[node_id] = execution_result
+                self._set_node_state(dag_graph, node_id, ExecutionStage.COMPLETED)
+                await self._release_dependents(dag_graph, node_id)
                 
                 await self.state_tracker.update_node_state(
                     context.job_id,
@@ -562,8 +642,8 @@ class DAGExecutionEngine(BaseOrchestrationService):
                 )
                 
                 # Update states
-                dag_graph.node_states[node_id] = ExecutionStage.FAILED
                 dag_graph.execution_results[node_id] = execution_result
+                self._set_node_state(dag_graph, node_id, ExecutionStage.FAILED)
                 
                 await self.state_tracker.update_node_state(
                     context.job_id,
@@ -604,9 +684,9 @@ class DAGExecutionEngine(BaseOrchestrationService):
         )
         
         # Update remaining running nodes to cancelled
-        for node_id, state in dag_graph.node_states.items():
+        for node_id, state in list(dag_graph.node_states.items()):
             if state == ExecutionStage.RUNNING:
-                dag_graph.node_states[node_id] = ExecutionStage.CANCELLED
+                self._set_node_state(dag_graph, node_id, ExecutionStage.CANCELLED)
                 
                 await self.state_tracker.update_node_state(
                     context.job_id,
@@ -10,12 +10,14 @@ This module implements the ExecutionStateTracker responsible for:
 
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Set, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import BulkWriteError
 from ..models.orchestration_models import (
     OrchestrationJobModel,
     OrchestrationNodeModel,
@@ -90,6 +92,93 @@ class NodeStateTransition:
     error_details: Optional[Dict[str, Any]] = None
 
 
+class CompactNodeTransition:
+    """Slotted in-memory transition record; the job id is implied by the owning buffer"""
+    
+    __slots__ = ("seq", "node_id", "from_state", "to_state", "timestamp", "duration_ms", "metadata")
+    
+    def __init__(
+        self,
+        seq: int,
+        node_id: str,
+        from_state: str,
+        to_state: str,
+        timestamp: datetime,
+        duration_ms: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        self.seq = seq
+        self.node_id = node_id
+        self.from_state = from_state
+        self.to_state = to_state
+        self.timestamp = timestamp
+        self.duration_ms = duration_ms
+        self.metadata = metadata or None  # Empty metadata is not stored
+    
+    def to_transition(self, job_id: str) -> NodeStateTransition:
+        """Expand into the public NodeStateTransition model"""
+        return NodeStateTransition(
+            job_id=job_id,
+            node_id=self.node_id,
+            from_state=self.from_state,
+            to_state=self.to_state,
+            timestamp=self.timestamp,
+            duration_ms=self.duration_ms,
+            metadata=dict(self.metadata) if self.metadata else {}
+        )
+    
+    def to_document(self, job_id: str) -> Dict[str, Any]:
+        """Convert to the spilled history document format"""
+        return {
+            "job_id": job_id,
+            "seq": self.seq,
+            "node_id": self.node_id,
+            "from_state": self.from_state,
+            "to_state": self.to_state,
+            "timestamp": self.timestamp,
+            "duration_ms": self.duration_ms,
+            "metadata": self.metadata or {}
+        }
+
+
+class TransitionHistoryBuffer:
+    """
+    Per-job ring buffer of transitions
+    
+    Holds at most `capacity` recent transitions. Older transitions are moved
+    to a spill list that the tracker writes to storage in batches.
+    """
+    
+    __slots__ = ("recent", "spill", "next_seq", "spilled_count")
+    
+    def __init__(self, capacity: int):
+        self.recent: deque = deque(maxlen=capacity)
+        self.spill: List[CompactNodeTransition] = []
+        self.next_seq = 0
+        self.spilled_count = 0  # Transitions already written to storage
+    
+    def append(
+        self,
+        node_id: str,
+        from_state: str,
+        to_state: str,
+        timestamp: datetime,
+        duration_ms: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Record a transition, evicting the oldest one into the spill list when full"""
+        if len(self.recent) == self.recent.maxlen:
+            self.spill.append(self.recent.popleft())
+        self.recent.append(CompactNodeTransition(
+            self.next_seq, node_id, from_state, to_state, timestamp, duration_ms, metadata
+        ))
+        self.next_seq += 1
+    
+    def in_memory(self) -> List[CompactNodeTransition]:
+        """Transitions not yet written to storage, oldest first"""
+        return self.spill + list(self.recent)
+
+
 class ExecutionStateTracker(BaseOrchestrationService):
     """
     Execution State Tracker - Manages persistent DAG state and transitions
@@ -106,6 +195,9 @@ class ExecutionStateTracker(BaseOrchestrationService):
         self,
         db_collection: AsyncIOMotorCollection,
         stall_detection_interval: int = 30,
+        persist_window_seconds: float = 0.25,
+        history_collection: Optional[AsyncIOMotorCollection] = None,
+        transition_history_limit: int = 1000,
         logger: Optional[logging.Logger] = None
     ):
         super().__init__(logger)
@@ -113,7 +205,26 @@ class ExecutionStateTracker(BaseOrchestrationService):
         self.stall_detection_interval = stall_detection_interval
         self.active_graphs: Dict[str, ExecutionGraphModel] = {}
         self.state_lock = asyncio.Lock()
-        self.transition_history: Dict[str, List[NodeStateTransition]] = {}
+        self.transition_history: Dict[str, TransitionHistoryBuffer] = {}
+        
+        # Transition history - bounded per job, evicted entries are spilled to
+        # history_collection in batches. Defaults to a sibling collection of
+        # db_collection so evicted transitions are kept without extra wiring.
+        if history_collection is None:
+            history_collection = db_collection.database.orchestration_transition_history
+        self.history_collection = history_collection
+        self.transition_history_limit = transition_history_limit
+        self.history_spill_batch_size = 200
+        self.max_pending_spill = self.history_spill_batch_size * 10
+        
+        # Write-behind persistence - node transitions are coalesced for
+        # persist_window_seconds and written as $set deltas. A window of 0
+        # writes every transition immediately.
+        self.persist_window_seconds = persist_window_seconds
+        self.synchronous_flush_states = {"completed", "failed", "cancelled", "skipped"}
+        self._dirty_nodes: Dict[str, Set[str]] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+        self._flush_locks: Dict[str, asyncio.Lock] = {}
         
         # Valid state transitions
         self.valid_transitions = {
@@ -126,6 +237,18 @@ class ExecutionStateTracker(BaseOrchestrationService):
             "skipped": []  # Terminal state
         }
     
+    async def _initialize_service(self) -> None:
+        """Create the indexes get_node_transition_history pages spilled transitions on"""
+        
+        await self.history_collection.create_index(
+            [("job_id", 1), ("seq", 1)],
+            name="idx_job_seq"
+        )
+        await self.history_collection.create_index(
+            [("job_id", 1), ("node_id", 1), ("seq", 1)],
+            name="idx_job_node_seq"
+        )
+    
     async def initialize_dag_state(
         self,
         job_id: str,
@@ -157,11 +280,12 @@ class ExecutionStateTracker(BaseOrchestrationService):
                 "dependency_count": sum(len(deps) for deps in dag_graph.dependencies.values())
             }
         )
+        self._update_node_counters(execution_graph)
         
         # Store in memory and database
         async with self.state_lock:
             self.active_graphs[job_id] = execution_graph
-            self.transition_history[job_id] = []
+            self.transition_history[job_id] = TransitionHistoryBuffer(self.transition_history_limit)
         
         # Persist to database
         await self._persist_graph_state(execution_graph)
@@ -214,15 +338,7 @@ class ExecutionStateTracker(BaseOrchestrationService):
                     new_state
                 )
             
-            # Record transition
-            transition = NodeStateTransition(
-                job_id=job_id,
-                node_id=node_id,
-                from_state=current_state,
-                to_state=new_state,
-                timestamp=datetime.now(timezone.utc),
-                metadata=metadata or {}
-            )
+            transition_time = datetime.now(timezone.utc)
             
             # Update state
             execution_graph.node_states[node_id] = new_state
@@ -235,12 +351,10 @@ class ExecutionStateTracker(BaseOrchestrationService):
                 execution_graph.node_results[node_id].update(metadata)
             
             # Update counters
-            self._update_node_counters(execution_graph)
+            self._apply_counter_transition(execution_graph, current_state, new_state)
             
-            # Store transition history
-            if job_id not in self.transition_history:
-                self.transition_history[job_id] = []
-            self.transition_history[job_id].append(transition)
+            # Mark node for the next delta write
+            self._dirty_nodes.setdefault(job_id, set()).add(node_id)
             
             # Handle specific state transitions
             if new_state == "running" and not execution_graph.start_time:
@@ -248,14 +362,27 @@ class ExecutionStateTracker(BaseOrchestrationService):
                 execution_graph.status = "running"
             
             # Calculate duration for completed/failed transitions
+            duration_ms = None
             if new_state in ["completed", "failed"] and "start_time" in (metadata or {}):
                 start_time = metadata["start_time"]
                 if isinstance(start_time, datetime):
                     duration_ms = int((datetime.now(timezone.utc) - start_time).total_seconds() * 1000)
-                    transition.duration_ms = duration_ms
+            
+            # Store transition history
+            history = self.transition_history.get(job_id)
+            if history is None:
+                history = self.transition_history[job_id] = TransitionHistoryBuffer(self.transition_history_limit)
+            history.append(node_id, current_state, new_state, transition_time, duration_ms, metadata)
+            spill_due = len(history.spill) >= self.history_spill_batch_size
         
-        # Persist updated state
-        await self._persist_graph_state(execution_graph)
+        if spill_due:
+            await self._spill_transition_history(job_id)
+        
+        # Persist updated state - terminal transitions flush synchronously
+        if self.persist_window_seconds <= 0 or new_state in self.synchronous_flush_states:
+            await self.flush_pending_state(job_id)
+        else:
+            self._schedule_flush(job_id)
         
         self.logger.info(
             f"Node state updated: {node_id} {current_state} -> {new_state}",
@@ -316,8 +443,9 @@ class ExecutionStateTracker(BaseOrchestrationService):
                 }
             })
         
-        # Persist final state
-        await self._persist_graph_state(execution_graph)
+        # Persist final state - the full document supersedes any pending deltas
+        await self._persist_full_state(job_id, execution_graph)
+        await self._spill_transition_history(job_id)
         
         self.logger.info(
             f"DAG execution finalized for job {job_id} - Status: {final_status}, "
@@ -367,8 +495,8 @@ class ExecutionStateTracker(BaseOrchestrationService):
                     (execution_graph.end_time - execution_graph.start_time).total_seconds() * 1000
                 )
         
-        # Persist failure state
-        await self._persist_graph_state(execution_graph)
+        # Persist failure state - the full document supersedes any pending deltas
+        await self._persist_full_state(job_id, execution_graph)
         
         self.logger.error(
             f"DAG execution failed for job {job_id}: {error_message}",
@@ -385,16 +513,111 @@ class ExecutionStateTracker(BaseOrchestrationService):
         async with self.state_lock:
             return self.active_graphs.get(job_id)
     
-    async def get_node_transition_history(self, job_id: str, node_id: str = None) -> List[NodeStateTransition]:
-        """Get node state transition history"""
+    async def get_node_transition_history(
+        self,
+        job_id: str,
+        node_id: str = None,
+        skip: int = 0,
+        limit: Optional[int] = None
+    ) -> List[NodeStateTransition]:
+        """
+        Get node state transition history, oldest first
         
-        transitions = self.transition_history.get(job_id, [])
+        Transitions spilled to storage and those still held in memory are
+        paged through as one sequence.
+        """
         
+        history = self.transition_history.get(job_id)
+        in_memory = history.in_memory() if history else []
         if node_id:
-            transitions = [t for t in transitions if t.node_id == node_id]
+            in_memory = [t for t in in_memory if t.node_id == node_id]
+        
+        transitions: List[NodeStateTransition] = []
+        stored_matches = 0
+        
+        if history is None or history.spilled_count > 0:
+            query: Dict[str, Any] = {"job_id": job_id}
+            if node_id:
+                query["node_id"] = node_id
+            if in_memory:
+                query["seq"] = {"$lt": in_memory[0].seq}
+            
+            try:
+                cursor = self.history_collection.find(query, {"_id": 0}).sort("seq", 1).skip(skip)
+                if limit is not None:
+                    cursor = cursor.limit(limit)
+                async for doc in cursor:
+                    transitions.append(NodeStateTransition(
+                        job_id=job_id,
+                        node_id=doc["node_id"],
+                        from_state=doc["from_state"],
+                        to_state=doc["to_state"],
+                        timestamp=doc["timestamp"],
+                        duration_ms=doc.get("duration_ms"),
+                        metadata=doc.get("metadata") or {}
+                    ))
+                
+                stored_matches = skip + len(transitions)
+                if not transitions and skip > 0:
+                    stored_matches = await self.history_collection.count_documents(query)
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to load spilled transition history for job {job_id}: {str(e)}",
+                    extra={"job_id": job_id}
+                )
+        
+        if limit is not None and len(transitions) >= limit:
+            return transitions
+        
+        memory_skip = max(skip - stored_matches, 0)
+        memory_limit = None if limit is None else limit - len(transitions)
+        page = in_memory[memory_skip:] if memory_limit is None else in_memory[memory_skip:memory_skip + memory_limit]
+        transitions.extend(t.to_transition(job_id) for t in page)
         
         return transitions
     
+    async def _spill_transition_history(self, job_id: str) -> None:
+        """Write evicted transitions for a job to storage in one batch"""
+        
+        history = self.transition_history.get(job_id)
+        if not history or not history.spill:
+            return
+        
+        batch, history.spill = history.spill, []
+        
+        try:
+            await self.history_collection.insert_many(
+                [t.to_document(job_id) for t in batch],
+                ordered=False
+            )
+            history.spilled_count += len(batch)
+        except BulkWriteError as e:
+            failed = sorted({error["index"] for error in e.details.get("writeErrors", [])})
+            history.spilled_count += len(batch) - len(failed)
+            self._restore_spill(job_id, history, [batch[index] for index in failed], e)
+        except Exception as e:
+            self._restore_spill(job_id, history, batch, e)
+    
+    def _restore_spill(
+        self,
+        job_id: str,
+        history: TransitionHistoryBuffer,
+        transitions: List[CompactNodeTransition],
+        error: Exception
+    ) -> None:
+        """Put unwritten transitions back so the next spill retries them"""
+        
+        # Ahead of anything evicted meanwhile, keeping sequence order
+        history.spill[:0] = transitions
+        dropped = len(history.spill) - self.max_pending_spill
+        if dropped > 0:
+            del history.spill[:dropped]
+        
+        self.logger.error(
+            f"Failed to spill transition history for job {job_id}: {str(error)}",
+            extra={"job_id": job_id, "transitions": len(transitions), "dropped": max(dropped, 0)}
+        )
+    
     def _is_valid_transition(self, current_state: str, new_state: str) -> bool:
         """Check if a state transition is valid"""
         
@@ -413,6 +636,120 @@ class ExecutionStateTracker(BaseOrchestrationService):
         execution_graph.running_nodes = state_counts.get("running", 0)
         execution_graph.pending_nodes = state_counts.get("pending", 0)
     
+    def _apply_counter_transition(
+        self,
+        execution_graph: ExecutionGraphModel,
+        from_state: str,
+        to_state: str
+    ) -> None:
+        """Adjust node state counters for a single transition"""
+        
+        if from_state == to_state:
+            return
+        
+        counter_fields = {
+            "completed": "completed_nodes",
+            "failed": "failed_nodes",
+            "running": "running_nodes",
+            "pending": "pending_nodes"
+        }
+        
+        from_field = counter_fields.get(from_state)
+        if from_field:
+            setattr(execution_graph, from_field, max(getattr(execution_graph, from_field) - 1, 0))
+        
+        to_field = counter_fields.get(to_state)
+        if to_field:
+            setattr(execution_graph, to_field, getattr(execution_graph, to_field) + 1)
+    
+    def _schedule_flush(self, job_id: str) -> None:
+        """Start the write-behind timer for a job unless one is already pending"""
+        
+        task = self._flush_tasks.get(job_id)
+        if task and not task.done():
+            return
+        
+        self._flush_tasks[job_id] = asyncio.create_task(self._delayed_flush(job_id))
+    
+    async def _delayed_flush(self, job_id: str) -> None:
+        """Flush pending node state deltas once the write-behind window elapses"""
+        
+        try:
+            await asyncio.sleep(self.persist_window_seconds)
+            self._flush_tasks.pop(job_id, None)
+            await self.flush_pending_state(job_id)
+        except asyncio.CancelledError:
+            pass
+    
+    def _discard_pending_state(self, job_id: str) -> None:
+        """Drop pending deltas and timers for a job about to be fully persisted"""
+        
+        task = self._flush_tasks.pop(job_id, None)
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+        self._dirty_nodes.pop(job_id, None)
+    
+    async def _persist_full_state(self, job_id: str, execution_graph: ExecutionGraphModel) -> None:
+        """Replace the whole document, ordered after any in-flight delta write"""
+        
+        flush_lock = self._flush_locks.setdefault(job_id, asyncio.Lock())
+        async with flush_lock:
+            self._discard_pending_state(job_id)
+            await self._persist_graph_state(execution_graph)
+    
+    async def flush_pending_state(self, job_id: str) -> None:
+        """
+        Write coalesced node state changes for a job
+        
+        Only the changed node_states and node_results entries plus the
+        graph-level counters are written, using $set on dotted paths.
+        """
+        flush_lock = self._flush_locks.setdefault(job_id, asyncio.Lock())
+        
+        async with flush_lock:
+            async with self.state_lock:
+                execution_graph = self.active_graphs.get(job_id)
+                dirty_nodes = self._dirty_nodes.pop(job_id, None)
+                if not execution_graph or not dirty_nodes:
+                    return
+                
+                # Dotted paths cannot address keys containing '.' or starting with '$'
+                if any("." in node_id or node_id.startswith("$") for node_id in dirty_nodes):
+                    update = None
+                else:
+                    update = {
+                        "status": execution_graph.status,
+                        "updated_at": execution_graph.updated_at,
+                        "start_time": execution_graph.start_time,
+                        "completed_nodes": execution_graph.completed_nodes,
+                        "failed_nodes": execution_graph.failed_nodes,
+                        "running_nodes": execution_graph.running_nodes,
+                        "pending_nodes": execution_graph.pending_nodes
+                    }
+                    for node_id in dirty_nodes:
+                        update[f"node_states.{node_id}"] = execution_graph.node_states.get(node_id)
+                        if node_id in execution_graph.node_results:
+                            update[f"node_results.{node_id}"] = dict(execution_graph.node_results[node_id])
+            
+            if update is None:
+                await self._persist_graph_state(execution_graph)
+                return
+            
+            try:
+                await self.db_collection.update_one(
+                    {"job_id": job_id},
+                    {"$set": update}
+                )
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to persist node state changes for job {job_id}: {str(e)}",
+                    extra={"job_id": job_id},
+                    exc_info=True
+                )
+                # Keep the changes pending so the next flush retries them
+                async with self.state_lock:
+                    self._dirty_nodes.setdefault(job_id, set()).update(dirty_nodes)
+    
     async def _check_stall_conditions(self, job_id: str) -> None:
         """Check for execution stall conditions"""
         
@@ -534,13 +871,17 @@ class ExecutionStateTracker(BaseOrchestrationService):
         """Clean up completed execution graphs older than retention period"""
         
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=retention_hours)
+        expired_query = {
+            "status": {"$in": ["completed", "failed", "cancelled"]},
+            "updated_at": {"$lt": cutoff_time}
+        }
         
         try:
-            # Remove from database
-            result = await self.db_collection.delete_many({
-                "status": {"$in": ["completed", "failed", "cancelled"]},
-                "updated_at": {"$lt": cutoff_time}
-            })
+            # Remove from database, along with the spilled transition history
+            expired_job_ids = await self.db_collection.distinct("job_id", expired_query)
+            result = await self.db_collection.delete_many(expired_query)
+            if expired_job_ids:
+                await self.history_collection.delete_many({"job_id": {"$in": expired_job_ids}})
             
             # Remove from memory
             async with self.state_lock:
@@ -553,6 +894,8 @@ class ExecutionStateTracker(BaseOrchestrationService):
                 for job_id in to_remove:
                     del self.active_graphs[job_id]
                     self.transition_history.pop(job_id, None)
+                    self._discard_pending_state(job_id)
+                    self._flush_locks.pop(job_id, None)
             
             self.logger.info(f"Cleaned up {result.deleted_count} completed execution graphs")
             return result.deleted_count
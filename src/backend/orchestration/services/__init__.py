@@ -13,6 +13,7 @@ from .base_orchestration_service import (
     ServiceLifecycle,
 )
 
+from .timer_service import TimerService, get_timer_service
 from .job_scheduler_service import JobSchedulerService
 from .retry_manager_service import RetryManagerService
 from .recovery_processor_service import RecoveryProcessorService
@@ -24,6 +25,10 @@ __all__ = [
     "ServiceConfiguration",
     "ServiceLifecycle",
     
+    # Shared timer service
+    "TimerService",
+    "get_timer_service",
+    
     # Core orchestration services
     "JobSchedulerService",
     "RetryManagerService", 
@@ -35,6 +35,7 @@ from ..schemas.orchestration_schemas import (
     JobStatusResponse,
     OrchestrationResponse
 )
+from .timer_service import TimerService, get_timer_service
 
 logger = get_logger(__name__)
 
@@ -51,10 +52,15 @@ class JobSchedulerService(BaseOrchestrationService[OrchestrationJobModel]):
     - Coordinate with RetryManagerService for failure handling
     """
     
+    # Timer kinds handled by this service
+    JOB_START_TIMER = "job_start"
+    JOB_TIMEOUT_TIMER = "job_timeout"
+    
     def __init__(
         self,
         database: AsyncIOMotorDatabase,
-        config: Optional[ServiceConfiguration] = None
+        config: Optional[ServiceConfiguration] = None,
+        timer_service: Optional[TimerService] = None
     ):
         """Initialize JobSchedulerService with database and configuration."""
         service_config = config or ServiceConfiguration(
@@ -73,7 +79,15 @@ class JobSchedulerService(BaseOrchestrationService[OrchestrationJobModel]):
         # Scheduling configuration
         self._scheduling_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
         self._active_jobs: Dict[str, OrchestrationJobModel] = {}
-        self._job_timers: Dict[str, asyncio.Task] = {}
+        
+        # Delayed starts and job timeouts share the process-wide timer service
+        self._timer_service = timer_service or get_timer_service(database)
+        self._timer_service.register_handler(self.JOB_START_TIMER, self._run_delayed_execution)
+        self._timer_service.register_handler(self.JOB_TIMEOUT_TIMER, self._on_job_timeout)
+        self.register_dependency(
+            ServiceDependency(name="timer_service", service_type=TimerService),
+            self._timer_service
+        )
         
         # Resource tracking
         self._resource_allocations: Dict[str, Dict[str, Any]] = {}
@@ -105,8 +119,8 @@ class JobSchedulerService(BaseOrchestrationService[OrchestrationJobModel]):
         # Start scheduling loop
         asyncio.create_task(self._scheduling_loop())
         
-        # Start job monitoring loop
-        asyncio.create_task(self._job_monitoring_loop())
+        # Delayed starts and job timeouts fire from the shared timer service
+        await self._timer_service.attach(self.service_name)
         
         self._logger.info("JobSchedulerService background tasks started")
     
@@ -114,15 +128,9 @@ class JobSchedulerService(BaseOrchestrationService[OrchestrationJobModel]):
         """Stop service and cleanup resources."""
         self._logger.info("Stopping JobSchedulerService")
         
-        # Cancel active job timers
-        for job_id, timer_task in self._job_timers.items():
-            timer_task.cancel()
-            try:
-                await timer_task
-            except asyncio.CancelledError:
-                pass
+        # Pending timers stay persisted and are restored on the next start
+        await self._timer_service.detach(self.service_name)
         
-        self._job_timers.clear()
         self._active_jobs.clear()
         
         self._logger.info("JobSchedulerService stopped")
@@ -289,6 +297,14 @@ class JobSchedulerService(BaseOrchestrationService[OrchestrationJobModel]):
             # Add to active jobs
             self._active_jobs[job_id] = job
             
+            # Arm the job timeout
+            if job.timeout_ms:
+                await self._timer_service.schedule(
+                    self.JOB_TIMEOUT_TIMER,
+                    job_id,
+                    job.started_at + timedelta(milliseconds=job.timeout_ms)
+                )
+            
             # Dispatch job stages
             await self._dispatch_job_stages(job)
             
@@ -385,33 +401,6 @@ class JobSchedulerService(BaseOrchestrationService[OrchestrationJobModel]):
                 self._logger.error(f"Error in scheduling loop: {e}")
                 await asyncio.sleep(1)
     
-    async def _job_monitoring_loop(self) -> None:
-        """Monitor active jobs for timeouts and state changes."""
-        self._logger.info("Starting job monitoring loop")
-        
-        while self.lifecycle_state in [ServiceLifecycle.RUNNING, ServiceLifecycle.READY]:
-            try:
-                current_time = datetime.now(timezone.utc)
-                jobs_to_timeout = []
-                
-                # Check for job timeouts
-                for job_id, job in self._active_jobs.items():
-                    if job.timeout_ms and job.started_at:
-                        timeout_threshold = job.started_at + timedelta(milliseconds=job.timeout_ms)
-                        if current_time > timeout_threshold:
-                            jobs_to_timeout.append(job_id)
-                
-                # Handle timed out jobs
-                for job_id in jobs_to_timeout:
-                    await self._handle_job_timeout(job_id)
-                
-                # Sleep before next check
-                await asyncio.sleep(30)
-                
-            except Exception as e:
-                self._logger.error(f"Error in job monitoring loop: {e}")
-                await asyncio.sleep(5)
-    
     async def _process_scheduled_job(self, job: OrchestrationJobModel) -> None:
         """Process a job from the scheduling queue."""
         bound_logger = self._bind_logger_context(job_id=job.job_id)
@@ -423,8 +412,7 @@ class JobSchedulerService(BaseOrchestrationService[OrchestrationJobModel]):
             if job.scheduled_at and job.scheduled_at > datetime.now(timezone.utc):
                 # Schedule for future execution
                 delay_seconds = (job.scheduled_at - datetime.now(timezone.utc)).total_seconds()
-                timer_task = asyncio.create_task(self._schedule_delayed_execution(job, delay_seconds))
-                self._job_timers[job.job_id] = timer_task
+                await self._schedule_delayed_execution(job)
                 bound_logger.info(f"Job scheduled for delayed execution in {delay_seconds} seconds")
             else:
                 # Execute immediately
@@ -434,16 +422,21 @@ class JobSchedulerService(BaseOrchestrationService[OrchestrationJobModel]):
             bound_logger.error(f"Failed to process scheduled job: {e}")
             await self._mark_job_failed(job.job_id, f"Scheduling failed: {e}")
     
-    async def _schedule_delayed_execution(self, job: OrchestrationJobModel, delay_seconds: float) -> None:
+    async def _schedule_delayed_execution(self, job: OrchestrationJobModel) -> None:
         """Schedule job for delayed execution."""
+        await self._timer_service.schedule(self.JOB_START_TIMER, job.job_id, job.scheduled_at)
+    
+    async def _run_delayed_execution(self, job_id: str, payload: Dict[str, Any]) -> None:
+        """Start a job whose delayed execution timer fired."""
         try:
-            await asyncio.sleep(delay_seconds)
-            await self.start_job_execution(job.job_id)
-        except asyncio.CancelledError:
-            self._logger.info(f"Delayed execution cancelled for job: {job.job_id}")
+            await self.start_job_execution(job_id)
         except Exception as e:
-            self._logger.error(f"Failed delayed execution for job {job.job_id}: {e}")
-            await self._mark_job_failed(job.job_id, f"Delayed execution failed: {e}")
+            self._logger.error(f"Failed delayed execution for job {job_id}: {e}")
+            await self._mark_job_failed(job_id, f"Delayed execution failed: {e}")
+    
+    async def _on_job_timeout(self, job_id: str, payload: Dict[str, Any]) -> None:
+        """Time out a job whose timeout timer fired."""
+        await self._handle_job_timeout(job_id)
     
     async def _dispatch_job_stages(self, job: OrchestrationJobModel) -> None:
         """Dispatch job stages for execution."""
@@ -529,6 +522,12 @@ class JobSchedulerService(BaseOrchestrationService[OrchestrationJobModel]):
             bound_logger.warning("Job execution timeout detected")
             
             job = self._active_jobs.get(job_id)
+            if not job:
+                # Timeout timers survive restarts; the job may not be loaded in memory
+                job_doc = await self.jobs_collection.find_one({"job_id": job_id})
+                if job_doc:
+                    job = OrchestrationJobModel.from_mongo(job_doc)
+            
             if job and job.can_transition_to(JobStatus.TIMEOUT):
                 job.transition_state(
                     JobStatus.TIMEOUT,
@@ -570,6 +569,7 @@ class JobSchedulerService(BaseOrchestrationService[OrchestrationJobModel]):
                 
                 self._active_jobs.pop(job_id, None)
                 self._execution_counters["jobs_completed"] += 1
+                await self._timer_service.cancel(self.JOB_TIMEOUT_TIMER, job_id)
                 
                 bound_logger.info("Job marked as completed")
         
@@ -598,6 +598,7 @@ class JobSchedulerService(BaseOrchestrationService[OrchestrationJobModel]):
                 
                 self._active_jobs.pop(job_id, None)
                 self._execution_counters["jobs_failed"] += 1
+                await self._timer_service.cancel(self.JOB_TIMEOUT_TIMER, job_id)
                 
                 bound_logger.info(f"Job marked as failed: {reason}")
         
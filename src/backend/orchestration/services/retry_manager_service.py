@@ -39,6 +39,7 @@ from ..schemas.orchestration_schemas import (
     CreateRetryPolicyRequest,
     UpdateRetryPolicyRequest
 )
+from .timer_service import TimerService, get_timer_service
 
 logger = get_logger(__name__)
 
@@ -55,10 +56,14 @@ class RetryManagerService(BaseOrchestrationService[RetryPolicyModel]):
     - Implement circuit breaker patterns for failure isolation
     """
     
+    # Timer kind handled by this service
+    RETRY_TIMER = "job_retry"
+    
     def __init__(
         self,
         database: AsyncIOMotorDatabase,
-        config: Optional[ServiceConfiguration] = None
+        config: Optional[ServiceConfiguration] = None,
+        timer_service: Optional[TimerService] = None
     ):
         """Initialize RetryManagerService with database and configuration."""
         service_config = config or ServiceConfiguration(
@@ -77,7 +82,14 @@ class RetryManagerService(BaseOrchestrationService[RetryPolicyModel]):
         # Retry tracking
         self._retry_queue: asyncio.Queue = asyncio.Queue(maxsize=2000)
         self._active_retries: Dict[str, Dict[str, Any]] = {}
-        self._retry_timers: Dict[str, asyncio.Task] = {}
+        
+        # Delayed retries share the process-wide timer service
+        self._timer_service = timer_service or get_timer_service(database)
+        self._timer_service.register_handler(self.RETRY_TIMER, self._run_delayed_retry)
+        self.register_dependency(
+            ServiceDependency(name="timer_service", service_type=TimerService),
+            self._timer_service
+        )
         
         # Circuit breaker tracking
         self._circuit_breakers: Dict[str, Dict[str, Any]] = {}
@@ -128,21 +140,18 @@ class RetryManagerService(BaseOrchestrationService[RetryPolicyModel]):
         # Start circuit breaker monitoring
         asyncio.create_task(self._circuit_breaker_monitoring_loop())
         
+        # Delayed retries fire from the shared timer service
+        await self._timer_service.attach(self.service_name)
+        
         self._logger.info("RetryManagerService background tasks started")
     
     async def _stop_service(self) -> None:
         """Stop service and cleanup resources."""
         self._logger.info("Stopping RetryManagerService")
         
-        # Cancel active retry timers
-        for job_id, timer_task in self._retry_timers.items():
-            timer_task.cancel()
-            try:
-                await timer_task
-            except asyncio.CancelledError:
-                pass
+        # Pending retry timers stay persisted and are restored on the next start
+        await self._timer_service.detach(self.service_name)
         
-        self._retry_timers.clear()
         self._active_retries.clear()
         
         self._logger.info("RetryManagerService stopped")
@@ -280,13 +289,7 @@ class RetryManagerService(BaseOrchestrationService[RetryPolicyModel]):
         
         try:
             # Cancel retry timer if exists
-            if job_id in self._retry_timers:
-                timer_task = self._retry_timers.pop(job_id)
-                timer_task.cancel()
-                try:
-                    await timer_task
-                except asyncio.CancelledError:
-                    pass
+            await self._timer_service.cancel(self.RETRY_TIMER, job_id)
             
             # Remove from active retries
             self._active_retries.pop(job_id, None)
@@ -441,9 +444,7 @@ class RetryManagerService(BaseOrchestrationService[RetryPolicyModel]):
             retry_time = retry_context["retry_time"]
             if retry_time > datetime.now(timezone.utc):
                 # Schedule for later
-                delay_seconds = (retry_time - datetime.now(timezone.utc)).total_seconds()
-                timer_task = asyncio.create_task(self._schedule_delayed_retry(retry_context, delay_seconds))
-                self._retry_timers[job_id] = timer_task
+                await self._schedule_delayed_retry(retry_context)
                 return
             
             # Execute retry
@@ -453,19 +454,19 @@ class RetryManagerService(BaseOrchestrationService[RetryPolicyModel]):
             bound_logger.error(f"Failed to process retry: {e}")
             await self._mark_job_aborted(job_id, f"Retry processing failed: {e}")
     
-    async def _schedule_delayed_retry(
-        self,
-        retry_context: Dict[str, Any],
-        delay_seconds: float
-    ) -> None:
+    async def _schedule_delayed_retry(self, retry_context: Dict[str, Any]) -> None:
         """Schedule retry for delayed execution."""
-        job_id = retry_context["job_id"]
-        
+        await self._timer_service.schedule(
+            self.RETRY_TIMER,
+            retry_context["job_id"],
+            retry_context["retry_time"],
+            payload=retry_context
+        )
+    
+    async def _run_delayed_retry(self, job_id: str, retry_context: Dict[str, Any]) -> None:
+        """Execute a retry whose timer fired."""
         try:
-            await asyncio.sleep(delay_seconds)
             await self._execute_retry(retry_context)
-        except asyncio.CancelledError:
-            self._logger.info(f"Delayed retry cancelled for job: {job_id}")
         except Exception as e:
             self._logger.error(f"Failed delayed retry for job {job_id}: {e}")
             await self._mark_job_aborted(job_id, f"Delayed retry failed: {e}")
@@ -507,7 +508,6 @@ class RetryManagerService(BaseOrchestrationService[RetryPolicyModel]):
             
             # Clean up retry tracking
             self._active_retries.pop(job_id, None)
-            self._retry_timers.pop(job_id, None)
             
             bound_logger.info("Retry executed successfully, job requeued")
             
@@ -0,0 +1,383 @@
+"""
+Timer Service
+
+Process-wide timer service shared by the orchestration services for delayed
+job starts, delayed retries and job timeouts:
+- One min-heap of pending timers driven by a single wakeup task
+- Constant-time cancellation through lazy invalidation of heap entries
+- Pending timers persisted in MongoDB and reloaded on startup
+- Due timers claimed atomically so one replica fires each timer
+- Named handlers registered per timer kind by the consuming services
+"""
+
+import asyncio
+import heapq
+import itertools
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from ...config.logging import get_logger
+from .base_orchestration_service import (
+    BaseOrchestrationService,
+    ServiceConfiguration,
+    ServiceLifecycle
+)
+
+logger = get_logger(__name__)
+
+TimerHandler = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+# Longest single sleep of the wakeup task; bounds the effect of clock adjustments
+MAX_WAKEUP_SECONDS = 60.0
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes read from MongoDB as UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class TimerService(BaseOrchestrationService[Dict[str, Any]]):
+    """
+    Timer Service for orchestration engine.
+
+    Responsibilities:
+    - Hold pending timers in one heap keyed by due time
+    - Fire due timers through the handler registered for their kind
+    - Persist pending timers so they survive a restart
+    - Share one wakeup task between all consuming services
+    """
+
+    def __init__(
+        self,
+        database: AsyncIOMotorDatabase,
+        config: Optional[ServiceConfiguration] = None
+    ):
+        """Initialize TimerService with database and configuration."""
+        service_config = config or ServiceConfiguration(
+            service_name="TimerService",
+            heartbeat_interval_seconds=60,
+            operation_timeout_seconds=60,
+            max_concurrent_operations=100
+        )
+
+        super().__init__(service_config)
+
+        self.database = database
+        self.timers_collection = database.orchestration_timers
+
+        # Heap entries are (due_at, sequence, timer_id); an entry is stale once
+        # the timer's current sequence no longer matches it
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._timers: Dict[str, Dict[str, Any]] = {}
+        self._sequence = itertools.count()
+        self._handlers: Dict[str, TimerHandler] = {}
+        self._consumers: Set[str] = set()
+
+        self._wakeup = asyncio.Event()
+        self._timer_task: Optional[asyncio.Task] = None
+        self._callback_tasks: Set[asyncio.Task] = set()
+
+        self._timer_counters: Dict[str, int] = {
+            "timers_scheduled": 0,
+            "timers_cancelled": 0,
+            "timers_fired": 0,
+            "timers_failed": 0,
+            "timers_restored": 0,
+            "timers_claimed_elsewhere": 0
+        }
+
+        self._logger.info("TimerService initialized with database connection")
+
+    async def initialize(self) -> None:
+        """Initialize once; consuming services each initialize their dependencies."""
+        if self.lifecycle_state in [ServiceLifecycle.READY, ServiceLifecycle.RUNNING]:
+            return
+        await super().initialize()
+
+    async def _initialize_service(self) -> None:
+        """Initialize service-specific components."""
+        self._logger.info("Initializing TimerService")
+
+        await self.timers_collection.create_index("timer_id", unique=True, name="idx_timer_id")
+        await self._load_persisted_timers()
+
+        self._logger.info("TimerService initialization complete")
+
+    async def _start_service(self) -> None:
+        """Start the wakeup task."""
+        self._timer_task = asyncio.create_task(self._timer_loop())
+        self._logger.info("TimerService wakeup task started")
+
+    async def _stop_service(self) -> None:
+        """Stop the wakeup task; pending timers stay persisted."""
+        self._logger.info("Stopping TimerService")
+
+        if self._timer_task:
+            self._timer_task.cancel()
+            try:
+                await self._timer_task
+            except asyncio.CancelledError:
+                pass
+            self._timer_task = None
+
+        if self._callback_tasks:
+            await asyncio.wait(set(self._callback_tasks), timeout=self._config.operation_timeout_seconds)
+
+        self._heap.clear()
+        self._timers.clear()
+
+        self._logger.info("TimerService stopped")
+
+    async def _health_check(self) -> Dict[str, Any]:
+        """Perform health check for timer service."""
+        next_due = self._peek_due_at()
+        return {
+            "pending_timers": len(self._timers),
+            "heap_entries": len(self._heap),
+            "running_callbacks": len(self._callback_tasks),
+            "next_due_at": next_due.isoformat() if next_due else None,
+            "timer_counters": self._timer_counters.copy(),
+            "healthy": self._timer_task is not None and not self._timer_task.done()
+        }
+
+    # Consumer Registration
+
+    def register_handler(self, kind: str, handler: TimerHandler) -> None:
+        """
+        Register the callback fired for timers of a kind.
+
+        Args:
+            kind: Timer kind, e.g. "job_start"
+            handler: Async callable receiving (key, payload)
+        """
+        self._handlers[kind] = handler
+
+    async def attach(self, consumer: str) -> None:
+        """Start the timer service on behalf of a consuming service."""
+        self._consumers.add(consumer)
+        if self.lifecycle_state == ServiceLifecycle.READY:
+            await self.start()
+
+    async def detach(self, consumer: str) -> None:
+        """Release a consuming service; the last one stops the timer service."""
+        self._consumers.discard(consumer)
+        if not self._consumers and self.lifecycle_state == ServiceLifecycle.RUNNING:
+            await self.stop()
+
+    # Core Timer Operations
+
+    async def schedule(
+        self,
+        kind: str,
+        key: str,
+        due_at: datetime,
+        payload: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Schedule or reschedule a timer.
+
+        A timer is identified by (kind, key); scheduling it again replaces the
+        pending timer.
+
+        Args:
+            kind: Timer kind selecting the registered handler
+            key: Timer key within its kind, e.g. a job ID
+            due_at: Time at which the timer fires
+            payload: Data passed to the handler
+
+        Returns:
+            str: Timer identifier
+        """
+        timer_id = f"{kind}:{key}"
+        timer = {
+            "timer_id": timer_id,
+            "kind": kind,
+            "key": key,
+            "due_at": _as_utc(due_at),
+            "payload": payload or {},
+            "token": str(uuid.uuid4())
+        }
+
+        await self.timers_collection.update_one(
+            {"timer_id": timer_id},
+            {"$set": {**timer, "updated_at": datetime.now(timezone.utc)}},
+            upsert=True
+        )
+
+        self._push(timer)
+        self._timer_counters["timers_scheduled"] += 1
+        return timer_id
+
+    async def cancel(self, kind: str, key: str) -> bool:
+        """
+        Cancel a pending timer.
+
+        Args:
+            kind: Timer kind
+            key: Timer key within its kind
+
+        Returns:
+            bool: True if a pending timer was cancelled
+        """
+        timer_id = f"{kind}:{key}"
+        timer = self._timers.pop(timer_id, None)
+        await self.timers_collection.delete_one({"timer_id": timer_id})
+
+        if timer is not None:
+            self._timer_counters["timers_cancelled"] += 1
+        return timer is not None
+
+    def is_scheduled(self, kind: str, key: str) -> bool:
+        """Check whether a timer is pending."""
+        return f"{kind}:{key}" in self._timers
+
+    # Internal Operations
+
+    def _push(self, timer: Dict[str, Any]) -> None:
+        """Queue a timer in memory, waking the loop if it is the new earliest."""
+        sequence = next(self._sequence)
+        timer["sequence"] = sequence
+        self._timers[timer["timer_id"]] = timer
+        heapq.heappush(self._heap, (timer["due_at"], sequence, timer["timer_id"]))
+
+        if self._heap[0][1] == sequence:
+            self._wakeup.set()
+        self._compact_heap()
+
+    def _peek_due_at(self) -> Optional[datetime]:
+        """Drop stale heap entries and return the earliest due time."""
+        while self._heap:
+            due_at, sequence, timer_id = self._heap[0]
+            timer = self._timers.get(timer_id)
+            if timer is not None and timer["sequence"] == sequence:
+                return due_at
+            heapq.heappop(self._heap)
+        return None
+
+    def _compact_heap(self) -> None:
+        """Rebuild the heap once cancelled entries dominate it."""
+        if len(self._heap) > 2 * len(self._timers) + 64:
+            self._heap = [
+                (timer["due_at"], timer["sequence"], timer_id)
+                for timer_id, timer in self._timers.items()
+            ]
+            heapq.heapify(self._heap)
+
+    async def _timer_loop(self) -> None:
+        """Single wakeup task firing due timers."""
+        self._logger.info("Starting timer loop")
+
+        while self.lifecycle_state in [ServiceLifecycle.RUNNING, ServiceLifecycle.READY]:
+            try:
+                self._wakeup.clear()
+                now = datetime.now(timezone.utc)
+
+                due_at = self._peek_due_at()
+                while due_at is not None and due_at <= now:
+                    _, _, timer_id = heapq.heappop(self._heap)
+                    timer = self._timers.pop(timer_id)
+                    task = asyncio.create_task(self._fire(timer))
+                    self._callback_tasks.add(task)
+                    task.add_done_callback(self._callback_tasks.discard)
+                    due_at = self._peek_due_at()
+
+                timeout = MAX_WAKEUP_SECONDS
+                if due_at is not None:
+                    timeout = min(timeout, max(0.0, (due_at - now).total_seconds()))
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.error(f"Error in timer loop: {e}")
+                await asyncio.sleep(1)
+
+    async def _fire(self, timer: Dict[str, Any]) -> None:
+        """
+        Claim a due timer and run its handler.
+
+        The persisted record is deleted by timer_id and token before the
+        handler runs. When several replicas hold the same timer, only the one
+        whose delete matches fires it. A timer rescheduled or cancelled in the
+        meantime no longer matches either. A timer is fired at most once: if
+        the process dies while the handler runs, it is not restored.
+        """
+        bound_logger = self._bind_logger_context(timer_id=timer["timer_id"])
+        handler = self._handlers.get(timer["kind"])
+        if handler is None:
+            # Left persisted and retried until the consuming service registers a handler
+            bound_logger.warning(f"No handler registered for timer kind: {timer['kind']}")
+            self._retry_later(timer)
+            return
+
+        try:
+            claimed = await self.timers_collection.find_one_and_delete({
+                "timer_id": timer["timer_id"],
+                "token": timer["token"]
+            })
+        except Exception as e:
+            bound_logger.error(f"Failed to claim due timer: {e}")
+            self._retry_later(timer)
+            return
+
+        if claimed is None:
+            self._timer_counters["timers_claimed_elsewhere"] += 1
+            return
+
+        try:
+            await handler(timer["key"], timer["payload"])
+            self._timer_counters["timers_fired"] += 1
+        except Exception as e:
+            self._timer_counters["timers_failed"] += 1
+            bound_logger.error(f"Timer handler failed: {e}")
+
+    def _retry_later(self, timer: Dict[str, Any]) -> None:
+        """Re-queue a due timer that could not be fired yet, unless it was rescheduled."""
+        if timer["timer_id"] in self._timers:
+            return
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=MAX_WAKEUP_SECONDS)
+        self._push({**timer, "due_at": retry_at})
+
+    async def _load_persisted_timers(self) -> None:
+        """Restore pending timers from the database on startup."""
+        cursor = self.timers_collection.find({})
+        restored = 0
+        async for document in cursor:
+            self._push({
+                "timer_id": document["timer_id"],
+                "kind": document["kind"],
+                "key": document["key"],
+                "due_at": _as_utc(document["due_at"]),
+                "payload": document.get("payload", {}),
+                "token": document.get("token")
+            })
+            restored += 1
+
+        self._timer_counters["timers_restored"] += restored
+        self._logger.info(f"Restored {restored} pending timers")
+
+
+_timer_service: Optional[TimerService] = None
+
+
+def get_timer_service(database: AsyncIOMotorDatabase) -> TimerService:
+    """
+    Get the process-wide timer service.
+
+    Args:
+        database: Database holding the orchestration collections
+
+    Returns:
+        TimerService: Shared timer service instance
+    """
+    global _timer_service
+    if _timer_service is None:
+        _timer_service = TimerService(database)
+    return _timer_service
@@ -19,6 +19,7 @@ from fastapi import HTTPException, status
 from ...config.logging import get_logger
 from ...auth.schemas.auth_responses import UserResponse
 from ..services.scheduler_service import SchedulerService, SchedulerServiceException
+from ..utils.cron_compiler import compile_cron
 from ..schemas.trigger_schemas import (
     CreateScheduledTriggerRequest,
     UpdateScheduledTriggerRequest,
@@ -575,7 +576,10 @@ class SchedulerController:
         # Validate cron expression for time-based triggers
         if (request.trigger_config.trigger_type.value == "time_based" and 
             request.trigger_config.cron_expression):
-            self._validate_cron_expression(request.trigger_config.cron_expression)
+            self._validate_cron_expression(
+                request.trigger_config.cron_expression,
+                request.trigger_config.timezone
+            )
         
         # Validate execution window times
         if (request.trigger_config.execution_window_start and 
@@ -609,24 +613,23 @@ class SchedulerController:
             request.trigger_config.trigger_type and
             request.trigger_config.trigger_type.value == "time_based" and 
             request.trigger_config.cron_expression):
-            self._validate_cron_expression(request.trigger_config.cron_expression)
+            self._validate_cron_expression(
+                request.trigger_config.cron_expression,
+                request.trigger_config.timezone
+            )
     
-    def _validate_cron_expression(self, cron_expression: str) -> None:
+    def _validate_cron_expression(self, cron_expression: str, timezone_name: str = "UTC") -> None:
         """
-        Validate cron expression format.
+        Validate cron expression syntax and timezone.
         
         Args:
             cron_expression: Cron expression to validate
+            timezone_name: Timezone the expression is evaluated in
             
         Raises:
-            ValueError: If cron expression is invalid
+            ValueError: If cron expression or timezone is invalid
         """
-        # Basic cron validation - Phase 3 TODO: Use croniter for full validation
-        parts = cron_expression.strip().split()
-        if len(parts) != 5:
-            raise ValueError("Cron expression must have exactly 5 parts")
-        
-        # Additional validation can be added here
+        compile_cron(cron_expression, timezone_name or "UTC")
         logger.debug(f"Cron expression validated: {cron_expression}")
     
     def _validate_execution_window(self, start_time: str, end_time: str) -> None:
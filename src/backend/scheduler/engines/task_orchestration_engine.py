@@ -22,9 +22,10 @@ Architecture Notes:
 
 import asyncio
 import heapq
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, Union, Tuple, Callable
+from typing import Dict, List, Optional, Any, Set, Union, Tuple, Callable
 from contextlib import asynccontextmanager
 import traceback
 
@@ -51,6 +52,7 @@ from ..services.base_scheduler_service import (
     TriggerResolutionError,
     LockManagerError
 )
+from ..utils.latency_histogram import LatencyHistogram
 
 logger = get_logger(__name__)
 
@@ -107,6 +109,7 @@ class TaskOrchestrationEngine:
         
         # Engine configuration
         self.max_concurrent_executions = self.config.get("max_concurrent_executions", 10)
+        self.tick_dispatch_concurrency = self.config.get("tick_dispatch_concurrency", 10)
         self.scheduler_tick_interval = self.config.get("scheduler_tick_interval", 5)  # seconds
         self.lock_timeout_seconds = self.config.get("lock_timeout_seconds", 300)  # 5 minutes
         self.max_retries = self.config.get("max_retries", 3)
@@ -117,6 +120,7 @@ class TaskOrchestrationEngine:
         self._running = False
         self._current_executions = 0
         self._scheduler_task = None
+        self._execution_tasks: Set[asyncio.Task] = set()
         self._job_handlers: Dict[str, Callable] = {}
         self._metrics = {
             "total_ticks": 0,
@@ -127,6 +131,13 @@ class TaskOrchestrationEngine:
             "locks_failed": 0,
             "retries_attempted": 0
         }
+        self._latency = {
+            "tick_duration": LatencyHistogram(),
+            "lock_acquisition": LatencyHistogram(),
+            "trigger_processing": LatencyHistogram(),
+            # Time from a trigger's scheduled fire time to its job being dispatched
+            "dispatch_lag": LatencyHistogram()
+        }
         
         # Logging context
         self.logger = get_logger(__name__).bind(
@@ -173,12 +184,10 @@ class TaskOrchestrationEngine:
         
         # Wait for current executions to complete (with timeout)
         timeout_seconds = 30
-        start_time = datetime.now(timezone.utc)
-        while self._current_executions > 0:
-            if (datetime.now(timezone.utc) - start_time).total_seconds() > timeout_seconds:
-                self.logger.warning(f"Timeout waiting for {self._current_executions} executions to complete")
-                break
-            await asyncio.sleep(1)
+        if self._execution_tasks:
+            _, pending = await asyncio.wait(set(self._execution_tasks), timeout=timeout_seconds)
+            if pending:
+                self.logger.warning(f"Timeout waiting for {len(pending)} executions to complete")
         
         self.logger.info("Task Orchestration Engine stopped", extra={
             "final_metrics": self._metrics
@@ -222,6 +231,8 @@ class TaskOrchestrationEngine:
         5. Marks job success or retry/failure via service methods
         """
         try:
+            tick_started = time.perf_counter()
+            
             # Check if we can handle more executions
             if self._current_executions >= self.max_concurrent_executions:
                 self.logger.debug("Max concurrent executions reached, skipping tick", extra={
@@ -245,24 +256,52 @@ class TaskOrchestrationEngine:
                 "available_slots": available_slots
             })
             
-            # Process each trigger
-            for trigger in due_triggers:
-                try:
-                    await self._process_trigger(trigger)
-                    self._metrics["triggers_processed"] += 1
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing trigger {trigger.trigger_id}: {e}", 
-                                    exc_info=True, extra={
-                                        "trigger_id": trigger.trigger_id,
-                                        "trigger_type": trigger.trigger_type,
-                                        "error_type": type(e).__name__
-                                    })
+            # Acquire execution locks for all executable triggers in one batch
+            lock_started = time.perf_counter()
+            locks = await self._acquire_execution_locks(due_triggers)
+            self._latency["lock_acquisition"].record((time.perf_counter() - lock_started) * 1000)
+            
+            # Process triggers concurrently, bounded so one tick cannot flood MongoDB
+            semaphore = asyncio.Semaphore(self.tick_dispatch_concurrency)
+            await asyncio.gather(*(
+                self._process_due_trigger(trigger, locks, semaphore)
+                for trigger in due_triggers
+                if not (trigger.trigger_id in locks and locks[trigger.trigger_id] is None)
+            ))
+            
+            self._latency["tick_duration"].record((time.perf_counter() - tick_started) * 1000)
             
         except Exception as e:
             self.logger.error(f"Error in scheduler tick: {e}", exc_info=True)
             raise
     
+    async def _process_due_trigger(self, trigger: ScheduledTriggerModel,
+                                   locks: Dict[str, Optional[ExecutionLockModel]],
+                                   semaphore: asyncio.Semaphore):
+        """
+        Process one due trigger of a tick under the tick's concurrency limit.
+        
+        Args:
+            trigger: The trigger to process
+            locks: Locks acquired for the tick's batch, keyed by trigger ID
+            semaphore: Limits concurrent trigger processing within the tick
+        """
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await self._process_trigger(trigger, locks.get(trigger.trigger_id))
+                self._metrics["triggers_processed"] += 1
+                
+            except Exception as e:
+                self.logger.error(f"Error processing trigger {trigger.trigger_id}: {e}", 
+                                exc_info=True, extra={
+                                    "trigger_id": trigger.trigger_id,
+                                    "trigger_type": trigger.trigger_type,
+                                    "error_type": type(e).__name__
+                                })
+            finally:
+                self._latency["trigger_processing"].record((time.perf_counter() - started) * 1000)
+    
     async def _fetch_due_triggers(self, max_count: int = 10) -> List[ScheduledTriggerModel]:
         """
         Fetch due triggers from the trigger service.
@@ -296,12 +335,14 @@ class TaskOrchestrationEngine:
             self.logger.error(f"Error fetching due triggers: {e}", exc_info=True)
             return []
     
-    async def _process_trigger(self, trigger: ScheduledTriggerModel):
+    async def _process_trigger(self, trigger: ScheduledTriggerModel,
+                               lock: Optional[ExecutionLockModel] = None):
         """
         Process a single trigger for execution.
         
         Args:
             trigger: The trigger to process
+            lock: Execution lock already acquired in the tick's batch, if any
         """
         trigger_logger = self.logger.bind(
             trigger_id=trigger.trigger_id,
@@ -318,10 +359,13 @@ class TaskOrchestrationEngine:
                     "max_concurrent": trigger.max_concurrent_executions,
                     "current_executions": trigger.current_executions
                 })
+                if lock:
+                    await self._release_unused_lock(lock)
                 return
             
             # Try to acquire execution lock
-            lock = await self._acquire_execution_lock(trigger)
+            if lock is None:
+                lock = await self._acquire_execution_lock(trigger)
             if not lock:
                 trigger_logger.warning("Failed to acquire execution lock")
                 self._metrics["locks_failed"] += 1
@@ -350,22 +394,9 @@ class TaskOrchestrationEngine:
             ExecutionLockModel if lock acquired, None otherwise
         """
         try:
-            # Create lock acquisition request
-            lock_request = LockAcquisitionRequest(
-                resource_type="scheduled_trigger",
-                resource_id=trigger.trigger_id,
-                lock_duration_seconds=self.lock_timeout_seconds,
-                execution_context={
-                    "trigger_id": trigger.trigger_id,
-                    "trigger_type": trigger.trigger_type,
-                    "task_type": trigger.task_type,
-                    "worker_instance": self.worker_instance_id
-                }
-            )
-            
             # Attempt lock acquisition
             lock = await self.lock_service.acquire_execution_lock(
-                request=lock_request,
+                request=self._build_lock_request(trigger),
                 worker_instance_id=self.worker_instance_id
             )
             
@@ -379,6 +410,63 @@ class TaskOrchestrationEngine:
             self.logger.error(f"Error acquiring lock for trigger {trigger.trigger_id}: {e}", exc_info=True)
             return None
     
+    async def _acquire_execution_locks(self, triggers: List[ScheduledTriggerModel]) -> Dict[str, Optional[ExecutionLockModel]]:
+        """
+        Acquire execution locks for a batch of triggers in one lock service call.
+        
+        Args:
+            triggers: Due triggers fetched in the current tick
+            
+        Returns:
+            Lock (or None if held elsewhere) keyed by trigger ID; triggers without
+            an entry fall back to per-trigger acquisition in _process_trigger
+        """
+        executable = [trigger for trigger in triggers if trigger.can_execute_now()]
+        if not executable:
+            return {}
+        
+        try:
+            locks = await self.lock_service.acquire_many(
+                requests=[self._build_lock_request(trigger) for trigger in executable],
+                worker_instance_id=self.worker_instance_id
+            )
+        except LockManagerError as e:
+            self.logger.warning(f"Batch lock acquisition failed, acquiring per trigger: {e}")
+            return {}
+        except Exception as e:
+            self.logger.error(f"Error acquiring batch locks: {e}", exc_info=True)
+            return {}
+        
+        for trigger, lock in zip(executable, locks):
+            if not lock:
+                self._metrics["locks_failed"] += 1
+                self.logger.debug(f"Execution lock held elsewhere for trigger {trigger.trigger_id}")
+        return {trigger.trigger_id: lock for trigger, lock in zip(executable, locks)}
+    
+    def _build_lock_request(self, trigger: ScheduledTriggerModel) -> LockAcquisitionRequest:
+        """Build the execution lock request for a trigger"""
+        return LockAcquisitionRequest(
+            resource_type="scheduled_trigger",
+            resource_id=trigger.trigger_id,
+            lock_duration_seconds=self.lock_timeout_seconds,
+            owner_context={
+                "trigger_id": trigger.trigger_id,
+                "trigger_type": trigger.trigger_type,
+                "task_type": trigger.task_type,
+                "worker_instance": self.worker_instance_id
+            }
+        )
+    
+    async def _release_unused_lock(self, lock: ExecutionLockModel) -> None:
+        """Release a batch-acquired lock that will not be used"""
+        try:
+            await self.lock_service.release_execution_lock(
+                lock_id=lock.lock_id,
+                worker_instance_id=self.worker_instance_id
+            )
+        except Exception as e:
+            self.logger.error(f"Error releasing unused lock {lock.lock_id}: {e}")
+    
     async def _dispatch_job_execution(self, trigger: ScheduledTriggerModel, lock: ExecutionLockModel):
         """
         Dispatch job execution for the trigger.
@@ -416,8 +504,17 @@ class TaskOrchestrationEngine:
             # Increment current executions counter
             self._current_executions += 1
             
-            # Dispatch execution asynchronously
-            asyncio.create_task(self._execute_job(job, trigger, lock))
+            # Dispatch execution asynchronously; tracked so shutdown can drain it
+            task = asyncio.create_task(self._execute_job(job, trigger, lock))
+            self._execution_tasks.add(task)
+            task.add_done_callback(self._execution_tasks.discard)
+            
+            if trigger.next_execution:
+                scheduled_at = trigger.next_execution
+                if scheduled_at.tzinfo is None:
+                    scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
+                lag = datetime.now(timezone.utc) - scheduled_at
+                self._latency["dispatch_lag"].record(lag.total_seconds() * 1000)
             
         except Exception as e:
             job_logger.error(f"Error dispatching job execution: {e}", exc_info=True)
@@ -646,8 +743,13 @@ class TaskOrchestrationEngine:
             "worker_instance_id": self.worker_instance_id,
             "current_executions": self._current_executions,
             "max_concurrent_executions": self.max_concurrent_executions,
+            "tick_dispatch_concurrency": self.tick_dispatch_concurrency,
+            "tracked_execution_tasks": len(self._execution_tasks),
             "is_running": self._running,
-            "registered_handlers": list(self._job_handlers.keys())
+            "registered_handlers": list(self._job_handlers.keys()),
+            "latency_histograms": {
+                name: histogram.snapshot() for name, histogram in self._latency.items()
+            }
         }
     
     async def health_check(self) -> Dict[str, Any]:
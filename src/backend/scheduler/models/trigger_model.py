@@ -26,6 +26,7 @@ from pydantic import BaseModel, Field, field_validator, model_validator, ConfigD
 
 from ...config.logging import get_logger
 from ...orchestration.models.orchestration_models import BaseMongoModel
+from ..utils.cron_compiler import compile_cron
 
 logger = get_logger(__name__)
 
@@ -188,12 +189,8 @@ class ScheduledTriggerModel(BaseMongoModel):
         if v is None:
             return v
         
-        # Basic cron validation - 5 or 6 fields
-        fields = v.strip().split()
-        if len(fields) not in [5, 6]:
-            raise ValueError("Cron expression must have 5 or 6 fields")
-        
-        # TODO: Add croniter validation for production
+        # Full syntax validation - 5 or 6 fields; compiled form is cached for scheduling
+        compile_cron(v)
         logger.debug(f"Cron expression validated: {v}")
         return v
     
@@ -661,10 +658,9 @@ class SchedulerModelOperations:
             
             # Lock management
             {"key": [("owner_instance_id", 1), ("is_active", 1)], "name": "owner_active"},
-            {"key": [("expires_at", 1)], "name": "expires_at"},
             {"key": [("is_active", 1), ("expires_at", 1)], "name": "active_expires"},
             
-            # TTL for automatic lock cleanup
+            # TTL for automatic lock cleanup (also serves expires_at range queries)
             {"key": [("expires_at", 1)], "expireAfterSeconds": 0, "name": "ttl_locks"},
             
             # Lock health monitoring
@@ -8,7 +8,9 @@ interface definitions and extension points for orchestration.
 Key Services:
 - BaseSchedulerService: Core scheduling service interface
 - TriggerEngineService: Trigger resolution and queue management  
+- MongoTriggerEngineService: Heap-backed trigger resolution over MongoDB
 - LockManagerService: Distributed locking coordination
+- MongoLockManagerService: TTL-based execution locks over MongoDB
 - JobExecutionService: Job lifecycle management
 - SchedulerService: Concrete business logic implementation
 """
@@ -22,6 +24,12 @@ from .base_scheduler_service import (
     TriggerResolutionError,
     LockManagerError
 )
+from .trigger_engine_service import (
+    MongoTriggerEngineService,
+    default_next_fire_time,
+    get_trigger_engine_service
+)
+from .lock_manager_service import MongoLockManagerService
 from .scheduler_service import (
     SchedulerService,
     SchedulerServiceFactory
@@ -35,6 +43,10 @@ __all__ = [
     "SchedulerServiceException",
     "TriggerResolutionError",
     "LockManagerError",
+    "MongoTriggerEngineService",
+    "default_next_fire_time",
+    "get_trigger_engine_service",
+    "MongoLockManagerService",
     "SchedulerService",
     "SchedulerServiceFactory"
 ] 
\ No newline at end of file
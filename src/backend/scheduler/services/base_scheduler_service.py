@@ -375,6 +375,30 @@ class TriggerEngineService(BaseSchedulerService):
     async def _update_trigger_execution_time(self, trigger_id: str, next_execution: datetime) -> bool:
         """Implementation-specific trigger schedule update logic"""
         pass
+    
+    async def refresh_trigger(self, trigger_id: str) -> bool:
+        """
+        Re-read a trigger after it was created or updated outside the engine.
+        
+        Args:
+            trigger_id: ID of the changed trigger
+            
+        Returns:
+            bool: True if the trigger is queued for execution
+        """
+        return False
+    
+    async def remove_trigger(self, trigger_id: str) -> bool:
+        """
+        Drop a deleted trigger from the execution queue.
+        
+        Args:
+            trigger_id: ID of the deleted trigger
+            
+        Returns:
+            bool: True if the trigger was queued
+        """
+        return False
 
 
 class LockManagerService(BaseSchedulerService):
@@ -465,6 +489,26 @@ class LockManagerService(BaseSchedulerService):
             self._failed_acquisitions += 1
             raise LockManagerError(f"Lock acquisition failed: {e}")
     
+    async def acquire_many(self, requests: List[LockAcquisitionRequest],
+                           worker_instance_id: str) -> List[Optional[ExecutionLockModel]]:
+        """
+        Acquire several distributed execution locks.
+        
+        Implementations should override this with a bulk round trip; the default
+        acquires the locks one at a time.
+        
+        Args:
+            requests: Lock acquisition requests, one per resource
+            worker_instance_id: ID of worker instance requesting the locks
+            
+        Returns:
+            Acquired lock or None for each request, in request order
+            
+        Raises:
+            LockManagerError: If lock acquisition process fails
+        """
+        return [await self.acquire_execution_lock(request, worker_instance_id) for request in requests]
+    
     @abstractmethod
     async def _attempt_lock_acquisition(self, request: LockAcquisitionRequest, 
                                       worker_instance_id: str) -> Optional[ExecutionLockModel]:
@@ -855,15 +899,36 @@ class SchedulerServiceFactory:
     
     async def create_trigger_engine_service(self) -> TriggerEngineService:
         """Create and configure trigger engine service instance"""
-        # Phase 2 TODO: Create concrete implementation with configuration
-        self.logger.info("Creating trigger engine service (placeholder)")
-        raise NotImplementedError("Phase 2 implementation required")
+        from .trigger_engine_service import MongoTriggerEngineService
+        
+        database = self.config.get("database")
+        if database is None:
+            raise ValueError("A database is required to create the trigger engine service")
+        
+        self.logger.info("Creating trigger engine service")
+        service = MongoTriggerEngineService(
+            collection=database["scheduled_triggers"],
+            look_ahead_seconds=self.config.get("trigger_look_ahead_seconds", 300),
+            reconcile_interval_seconds=self.config.get("trigger_reconcile_interval_seconds", 300)
+        )
+        await service.initialize()
+        return service
     
     async def create_lock_manager_service(self) -> LockManagerService:
         """Create and configure lock manager service instance"""
-        # Phase 2 TODO: Create concrete implementation with MongoDB TTL configuration
-        self.logger.info("Creating lock manager service (placeholder)")
-        raise NotImplementedError("Phase 2 implementation required")
+        from .lock_manager_service import MongoLockManagerService
+        
+        database = self.config.get("database")
+        if database is None:
+            raise ValueError("A database is required to create the lock manager service")
+        
+        self.logger.info("Creating lock manager service")
+        service = MongoLockManagerService(
+            collection=database["execution_locks"],
+            heartbeat_interval_seconds=self.config.get("lock_heartbeat_interval_seconds", 30)
+        )
+        await service.initialize()
+        return service
     
     async def create_job_execution_service(self) -> JobExecutionService:
         """Create and configure job execution service instance"""
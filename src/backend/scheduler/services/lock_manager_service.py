@@ -0,0 +1,381 @@
+"""
+Scheduled Task Runner Engine - Lock Manager Service
+
+Concrete LockManagerService implementing the creative phase decision:
+MongoDB TTL-Based Distributed Locking.
+
+Each lock is one document in execution_locks with a unique index on
+(resource_type, resource_id) and a TTL index on expires_at. A lock is
+acquired with a single upsert that only matches a free (expired or
+released) document; when another worker holds the resource the upsert
+collides with the unique index and the acquisition fails without further
+round trips. Locks are kept alive by a heartbeat that extends every lock
+held by this process with one update_many, so lock overhead per tick stays
+flat as the number of held locks grows.
+
+Key Components:
+- MongoLockManagerService: TTL lock manager over execution_locks
+"""
+
+import asyncio
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import IndexModel, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from ..models.trigger_model import ExecutionLockModel, SchedulerModelOperations
+from ..schemas.trigger_schemas import LockAcquisitionRequest
+from .base_scheduler_service import LockManagerError, LockManagerService
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive datetimes read from MongoDB as UTC"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _lock_from_mongo(document: Optional[Dict[str, Any]]) -> Optional[ExecutionLockModel]:
+    """Build a lock model from a stored document with UTC-aware lock timestamps"""
+    if not document:
+        return None
+    for field in ("acquired_at", "expires_at", "last_heartbeat"):
+        if field in document:
+            document[field] = _as_utc(document[field])
+    return ExecutionLockModel.from_mongo(document)
+
+
+class MongoLockManagerService(LockManagerService):
+    """
+    Distributed lock manager backed by the execution_locks collection.
+
+    Lock documents are never updated by workers that do not own them: a held
+    lock can only be taken over once it has expired or been released.
+    """
+
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection,
+        heartbeat_interval_seconds: int = 30,
+        ensure_indexes: bool = True
+    ):
+        """
+        Initialize the lock manager.
+
+        Args:
+            collection: execution_locks collection
+            heartbeat_interval_seconds: Interval between heartbeat renewals of held locks
+            ensure_indexes: Create the unique and TTL indexes on initialization
+        """
+        super().__init__()
+        self.collection = collection
+        self.heartbeat_interval_seconds = heartbeat_interval_seconds
+        self.ensure_indexes = ensure_indexes
+
+        self._process_id = str(os.getpid())
+        # Worker instances that acquired locks through this service
+        self._workers: Set[str] = set()
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+        self._metrics = {
+            "batch_acquisitions": 0,
+            "heartbeats": 0,
+            "heartbeat_failures": 0,
+            "locks_renewed": 0,
+            "contention_count": 0
+        }
+
+    async def _perform_initialization(self) -> bool:
+        """Ensure lock indexes and start the heartbeat renewer"""
+        try:
+            self.logger.info("Initializing lock manager components")
+            if self.ensure_indexes:
+                await self.collection.create_indexes([
+                    IndexModel(index.pop("key"), **index)
+                    for index in SchedulerModelOperations.get_execution_lock_indexes()
+                ])
+
+            self._active_locks = 0
+            self._failed_acquisitions = 0
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+            return True
+        except Exception as e:
+            self.logger.error(f"Lock manager initialization failed: {e}")
+            return False
+
+    async def _perform_shutdown(self) -> bool:
+        """Stop the heartbeat renewer and release all locks owned by this process"""
+        self.logger.info("Shutting down lock manager")
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+
+        if self._workers:
+            try:
+                result = await self.collection.delete_many({
+                    "owner_instance_id": {"$in": list(self._workers)},
+                    "owner_process_id": self._process_id
+                })
+                self.logger.info(f"Released {result.deleted_count} locks on shutdown")
+            except Exception as e:
+                self.logger.error(f"Failed to release locks on shutdown: {e}")
+                return False
+        self._active_locks = 0
+        return True
+
+    async def _check_detailed_health(self) -> Dict[str, Any]:
+        """Check lock manager specific health metrics"""
+        heartbeat_running = self._heartbeat_task is not None and not self._heartbeat_task.done()
+        return {
+            "active_locks": self._active_locks,
+            "failed_acquisitions": self._failed_acquisitions,
+            "ttl_cleanup": "healthy",
+            "heartbeat": "running" if heartbeat_running else "stopped",
+            **self._metrics
+        }
+
+    async def acquire_execution_lock(self, request: LockAcquisitionRequest,
+                                     worker_instance_id: str) -> Optional[ExecutionLockModel]:
+        return await super().acquire_execution_lock(request, worker_instance_id)
+
+    async def release_execution_lock(self, lock_id: str, worker_instance_id: str) -> bool:
+        return await super().release_execution_lock(lock_id, worker_instance_id)
+
+    async def extend_lock(self, lock_id: str, additional_seconds: int) -> bool:
+        return await super().extend_lock(lock_id, additional_seconds)
+
+    async def check_lock_health(self, lock_id: str) -> Dict[str, Any]:
+        return await super().check_lock_health(lock_id)
+
+    def _build_lock(
+        self,
+        request: LockAcquisitionRequest,
+        worker_instance_id: str,
+        now: datetime
+    ) -> ExecutionLockModel:
+        context = request.owner_context
+        return ExecutionLockModel(
+            lock_id=f"lock_{uuid.uuid4().hex}",
+            resource_type=request.resource_type,
+            resource_id=request.resource_id,
+            owner_instance_id=worker_instance_id,
+            owner_process_id=self._process_id,
+            acquired_at=now,
+            expires_at=now + timedelta(seconds=request.lock_duration_seconds),
+            lock_duration_seconds=request.lock_duration_seconds,
+            auto_extend=request.auto_extend,
+            max_extensions=request.max_extensions,
+            heartbeat_interval_seconds=self.heartbeat_interval_seconds,
+            last_heartbeat=now,
+            job_id=context.get("job_id"),
+            trigger_id=context.get("trigger_id"),
+            execution_context=context
+        )
+
+    def _acquire_operation(self, lock: ExecutionLockModel, now: datetime) -> Dict[str, Any]:
+        """Filter and update that take a free lock document or insert a new one"""
+        document = lock.to_mongo()
+        document.pop("_id", None)
+        created_at = document.pop("created_at")
+        document["updated_at"] = now
+        return {
+            "filter": {
+                "resource_type": lock.resource_type,
+                "resource_id": lock.resource_id,
+                "$or": [{"expires_at": {"$lte": now}}, {"is_active": False}]
+            },
+            "update": {"$set": document, "$setOnInsert": {"created_at": created_at}}
+        }
+
+    async def _attempt_lock_acquisition(self, request: LockAcquisitionRequest,
+                                        worker_instance_id: str) -> Optional[ExecutionLockModel]:
+        """Acquire a lock with one upsert; a held lock fails on the unique index"""
+        now = datetime.now(timezone.utc)
+        lock = self._build_lock(request, worker_instance_id, now)
+        operation = self._acquire_operation(lock, now)
+
+        try:
+            document = await self.collection.find_one_and_update(
+                operation["filter"],
+                operation["update"],
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        except DuplicateKeyError:
+            self._metrics["contention_count"] += 1
+            return None
+
+        self._workers.add(worker_instance_id)
+        acquired = _lock_from_mongo(document)
+        if acquired is not None:
+            acquired.acquisition_latency_ms = (datetime.now(timezone.utc) - now).total_seconds() * 1000
+        return acquired
+
+    async def acquire_many(
+        self,
+        requests: List[LockAcquisitionRequest],
+        worker_instance_id: str
+    ) -> List[Optional[ExecutionLockModel]]:
+        """
+        Acquire several locks with one bulk upsert and one read-back.
+
+        Args:
+            requests: Lock acquisition requests, one per resource
+            worker_instance_id: ID of worker instance requesting the locks
+
+        Returns:
+            Acquired lock or None for each request, in request order
+
+        Raises:
+            LockManagerError: If the bulk acquisition fails for reasons other than contention
+        """
+        if not requests:
+            return []
+
+        now = datetime.now(timezone.utc)
+        locks = [self._build_lock(request, worker_instance_id, now) for request in requests]
+        operations = [
+            UpdateOne(**self._acquire_operation(lock, now), upsert=True)
+            for lock in locks
+        ]
+
+        try:
+            await self.collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            if any(error.get("code") != DUPLICATE_KEY_ERROR for error in write_errors):
+                self.logger.error(f"Batch lock acquisition error: {e}")
+                self._failed_acquisitions += len(requests)
+                raise LockManagerError(f"Batch lock acquisition failed: {e}")
+            self._metrics["contention_count"] += len(write_errors)
+        except Exception as e:
+            self.logger.error(f"Batch lock acquisition error: {e}", exc_info=True)
+            self._failed_acquisitions += len(requests)
+            raise LockManagerError(f"Batch lock acquisition failed: {e}")
+
+        # Freshly generated lock ids identify the upserts that won
+        cursor = self.collection.find({"lock_id": {"$in": [lock.lock_id for lock in locks]}})
+        latency_ms = (datetime.now(timezone.utc) - now).total_seconds() * 1000
+        acquired: Dict[str, ExecutionLockModel] = {}
+        async for document in cursor:
+            lock = _lock_from_mongo(document)
+            if lock is not None:
+                lock.acquisition_latency_ms = latency_ms
+                acquired[lock.lock_id] = lock
+
+        if acquired:
+            self._workers.add(worker_instance_id)
+        self._active_locks += len(acquired)
+        self._failed_acquisitions += len(locks) - len(acquired)
+        self._metrics["batch_acquisitions"] += 1
+        self.logger.debug(f"Acquired {len(acquired)} of {len(locks)} locks in batch", extra={
+            "acquisition_latency_ms": latency_ms
+        })
+        return [acquired.get(lock.lock_id) for lock in locks]
+
+    async def _perform_lock_release(self, lock_id: str, worker_instance_id: str) -> bool:
+        """Delete the lock document if this worker still owns it"""
+        result = await self.collection.delete_one({
+            "lock_id": lock_id,
+            "owner_instance_id": worker_instance_id
+        })
+        return result.deleted_count == 1
+
+    async def _perform_lock_extension(self, lock_id: str, additional_seconds: int) -> bool:
+        """Push back the expiry of an unexpired lock"""
+        now = datetime.now(timezone.utc)
+        result = await self.collection.update_one(
+            {"lock_id": lock_id, "is_active": True, "expires_at": {"$gt": now}},
+            {
+                "$set": {
+                    "expires_at": now + timedelta(seconds=additional_seconds),
+                    "last_heartbeat": now,
+                    "updated_at": now
+                },
+                "$inc": {"current_extensions": 1}
+            }
+        )
+        return result.modified_count == 1
+
+    async def _check_lock_health_details(self, lock_id: str) -> Dict[str, Any]:
+        """Report expiry and heartbeat state of a stored lock"""
+        lock = _lock_from_mongo(await self.collection.find_one({"lock_id": lock_id}))
+        if lock is None:
+            return {
+                "lock_id": lock_id,
+                "status": "not_found",
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
+        return {
+            "lock_id": lock_id,
+            "status": "healthy" if lock.is_healthy() else ("expired" if lock.is_expired() else "stale"),
+            "owner_instance_id": lock.owner_instance_id,
+            "expires_at": lock.expires_at.isoformat(),
+            "time_until_expiry_seconds": lock.time_until_expiry(),
+            "last_heartbeat": lock.last_heartbeat.isoformat(),
+            "current_extensions": lock.current_extensions,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+
+    async def renew_worker_locks(self, worker_instance_id: Optional[str] = None) -> int:
+        """
+        Extend every unexpired lock held by a worker with one update_many.
+
+        Only locks that can_extend are renewed: auto_extend is set and
+        current_extensions is below max_extensions. Each renewed lock is
+        pushed back by its own lock_duration_seconds and counts one extension.
+
+        Args:
+            worker_instance_id: Worker to renew locks for (all workers of this service if omitted)
+
+        Returns:
+            Number of locks renewed
+        """
+        workers = [worker_instance_id] if worker_instance_id else list(self._workers)
+        if not workers:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        result = await self.collection.update_many(
+            {
+                "owner_instance_id": {"$in": workers},
+                "is_active": True,
+                "auto_extend": True,
+                "expires_at": {"$gt": now},
+                "$expr": {"$lt": ["$current_extensions", "$max_extensions"]}
+            },
+            [{
+                "$set": {
+                    "expires_at": {"$add": [now, {"$multiply": ["$lock_duration_seconds", 1000]}]},
+                    "current_extensions": {"$add": ["$current_extensions", 1]},
+                    "last_heartbeat": now,
+                    "heartbeat_failures": 0
+                }
+            }]
+        )
+        self._metrics["locks_renewed"] += result.modified_count
+        return result.modified_count
+
+    async def _heartbeat_loop(self) -> None:
+        """Renew held locks until the service shuts down"""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval_seconds)
+            try:
+                renewed = await self.renew_worker_locks()
+                self._metrics["heartbeats"] += 1
+                self.logger.debug(f"Heartbeat renewed {renewed} locks")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._metrics["heartbeat_failures"] += 1
+                self.logger.warning(f"Lock heartbeat failed: {e}")
@@ -37,6 +37,7 @@ from .base_scheduler_service import (
     LockManagerService,
     JobExecutionService
 )
+from .trigger_engine_service import get_trigger_engine_service
 
 logger = get_logger(__name__)
 
@@ -70,6 +71,27 @@ class SchedulerService:
         
         logger.info("SchedulerService initialized successfully")
     
+    async def _sync_trigger_queue(self, trigger_id: str, deleted: bool = False) -> None:
+        """
+        Refresh the trigger engine's in-memory queue after a trigger changed.
+        
+        Failures are logged only; the engine's periodic reconciliation with
+        MongoDB picks up any change missed here.
+        """
+        if self.trigger_engine_service is None:
+            return
+        
+        try:
+            if deleted:
+                await self.trigger_engine_service.remove_trigger(trigger_id)
+            else:
+                await self.trigger_engine_service.refresh_trigger(trigger_id)
+        except Exception as e:
+            logger.warning(
+                f"Failed to refresh trigger queue for {trigger_id}: {e}",
+                extra={"trigger_id": trigger_id, "deleted": deleted}
+            )
+    
     async def create_scheduled_trigger(
         self, 
         request: CreateScheduledTriggerRequest,
@@ -122,7 +144,7 @@ class SchedulerService:
             }
             
             # Schedule the trigger in the engine
-            # Phase 3 TODO: Implement actual scheduling
+            await self._sync_trigger_queue(trigger_id)
             logger.info(f"Scheduled trigger created successfully: {trigger_id}")
             
             return ScheduledTriggerResponse(
@@ -195,6 +217,7 @@ class SchedulerService:
                 "metadata": request.metadata or {}
             }
             
+            await self._sync_trigger_queue(trigger_id)
             logger.info(f"Scheduled trigger updated successfully: {trigger_id}")
             
             return ScheduledTriggerResponse(
@@ -249,6 +272,7 @@ class SchedulerService:
             # Phase 3 TODO: Implement trigger deletion logic
             # For now, return a placeholder response
             
+            await self._sync_trigger_queue(trigger_id, deleted=True)
             logger.info(f"Scheduled trigger deleted successfully: {trigger_id}")
             
             return BaseResponseSchema(
@@ -470,13 +494,13 @@ class SchedulerServiceFactory:
             SchedulerService: Configured service instance
             
         Note:
-            Phase 3 TODO: Replace with actual service implementations
+            The trigger engine is the process-wide instance started in the
+            application lifespan; it is None when the lifespan did not start it.
+            Phase 3 TODO: Replace the remaining placeholder services
         """
-        # Phase 3 TODO: Create actual service implementations
-        # For now, create placeholder services
+        trigger_engine_service = get_trigger_engine_service()
         
         # Placeholder implementations - will be replaced in Phase 3
-        trigger_engine_service = None  # TriggerEngineServiceImpl()
         lock_manager_service = None    # LockManagerServiceImpl()
         job_execution_service = None   # JobExecutionServiceImpl()
         
@@ -0,0 +1,447 @@
+"""
+Scheduled Task Runner Engine - Trigger Engine Service
+
+Concrete TriggerEngineService implementing the creative phase decision:
+Hybrid Priority Queue with Database Persistence.
+
+Triggers due within a look-ahead window are held in an in-memory min-heap
+keyed by (next_fire_time, priority). Each scheduler tick pops only the due
+triggers, so tick cost scales with the number of due triggers rather than the
+total trigger count. The window is extended with indexed range queries on
+(status, next_execution) and the heap is rebuilt from MongoDB on a slow
+reconcile cadence to pick up changes made by other instances.
+
+Key Components:
+- MongoTriggerEngineService: Heap-backed trigger resolution over scheduled_triggers
+- default_next_fire_time: Next fire time for cron and interval triggers
+"""
+
+import asyncio
+import heapq
+import itertools
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from ..models.trigger_model import ScheduledTriggerModel, TaskStatus
+from ..utils.cron_compiler import compile_cron
+from .base_scheduler_service import TriggerEngineService
+
+# Priority used when a trigger does not set metadata.priority (1 = highest)
+DEFAULT_TRIGGER_PRIORITY = 5
+
+NextFireTimeFunction = Callable[[ScheduledTriggerModel, datetime], Optional[datetime]]
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive datetimes read from MongoDB as UTC"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _to_bson_precision(value: datetime) -> datetime:
+    """Truncate to milliseconds so in-memory fire times match stored ones"""
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
+
+def default_next_fire_time(trigger: ScheduledTriggerModel, after: datetime) -> Optional[datetime]:
+    """
+    Compute the first fire time strictly after a moment.
+
+    Cron triggers use the compiled expression in the trigger's timezone.
+    Interval fire times stay aligned to the trigger's current next_execution,
+    so missed intervals are skipped rather than fired in a burst.
+
+    Args:
+        trigger: Trigger to compute the next fire time for
+        after: Moment the next fire time must follow
+
+    Returns:
+        Next fire time, or None if the trigger has no schedule
+    """
+    if trigger.cron_expression:
+        try:
+            return compile_cron(trigger.cron_expression, trigger.timezone).next_fire(after)
+        except ValueError:
+            return None
+
+    if not trigger.interval_seconds:
+        return None
+
+    interval = timedelta(seconds=trigger.interval_seconds)
+    anchor = _as_utc(trigger.next_execution)
+    if anchor is None:
+        return after + interval
+    if anchor > after:
+        return anchor
+
+    elapsed_intervals = (after - anchor) // interval + 1
+    return anchor + interval * elapsed_intervals
+
+
+def _trigger_priority(trigger: ScheduledTriggerModel) -> int:
+    try:
+        return int(trigger.metadata.get("priority", DEFAULT_TRIGGER_PRIORITY))
+    except (TypeError, ValueError):
+        return DEFAULT_TRIGGER_PRIORITY
+
+
+class MongoTriggerEngineService(TriggerEngineService):
+    """
+    Trigger engine backed by an in-memory heap over the scheduled_triggers collection.
+
+    Heap entries are invalidated lazily: each queued trigger has one current
+    (fire_time, priority, sequence) key and heap entries that no longer match
+    it are skipped when popped.
+    """
+
+    def __init__(
+        self,
+        collection: AsyncIOMotorCollection,
+        look_ahead_seconds: int = 300,
+        reconcile_interval_seconds: int = 300,
+        next_fire_time: Optional[NextFireTimeFunction] = None
+    ):
+        """
+        Initialize the trigger engine.
+
+        Args:
+            collection: scheduled_triggers collection
+            look_ahead_seconds: Triggers firing within this window are held in memory
+            reconcile_interval_seconds: Interval between full reloads of the window
+            next_fire_time: Function computing a trigger's next fire time after a moment
+        """
+        super().__init__()
+        self.collection = collection
+        self.look_ahead = timedelta(seconds=look_ahead_seconds)
+        self.reconcile_interval = timedelta(seconds=reconcile_interval_seconds)
+        self.next_fire_time = next_fire_time or default_next_fire_time
+
+        self._heap: List[Tuple[datetime, int, int, str]] = []
+        self._entries: Dict[str, Tuple[datetime, int, int]] = {}
+        self._triggers: Dict[str, ScheduledTriggerModel] = {}
+        # Fired triggers whose stored next_execution has not been advanced yet
+        self._dispatched: Dict[str, datetime] = {}
+        self._sequence = itertools.count()
+        self._loaded_until: Optional[datetime] = None
+        self._last_reconcile: Optional[datetime] = None
+        self._queue_lock = asyncio.Lock()
+
+        self._metrics = {
+            "triggers_fired": 0,
+            "window_loads": 0,
+            "reconciliations": 0,
+            "stale_entries_skipped": 0,
+            "persist_failures": 0,
+            "claims_lost": 0
+        }
+
+    async def _perform_initialization(self) -> bool:
+        """Load the initial look-ahead window"""
+        try:
+            self.logger.info("Initializing trigger engine components")
+            async with self._queue_lock:
+                await self._reconcile(datetime.now(timezone.utc))
+            return True
+        except Exception as e:
+            self.logger.error(f"Trigger engine initialization failed: {e}")
+            return False
+
+    async def _perform_shutdown(self) -> bool:
+        """Drop in-memory queue state; MongoDB remains the source of truth"""
+        self.logger.info("Shutting down trigger engine")
+        self._heap.clear()
+        self._entries.clear()
+        self._triggers.clear()
+        self._loaded_until = None
+        self._last_reconcile = None
+        return True
+
+    async def _check_detailed_health(self) -> Dict[str, Any]:
+        """Check trigger engine specific health metrics"""
+        return {
+            "priority_queue_size": len(self._entries),
+            "heap_entries": len(self._heap),
+            "dispatched_pending_schedule": len(self._dispatched),
+            "loaded_until": self._loaded_until.isoformat() if self._loaded_until else None,
+            "last_reconcile": self._last_reconcile.isoformat() if self._last_reconcile else None,
+            "queue_processing": "healthy",
+            **self._metrics
+        }
+
+    async def resolve_next_trigger(self, max_count: int = 10) -> List[ScheduledTriggerModel]:
+        return await super().resolve_next_trigger(max_count)
+
+    async def schedule_trigger(self, trigger: ScheduledTriggerModel) -> bool:
+        return await super().schedule_trigger(trigger)
+
+    async def update_trigger_schedule(self, trigger_id: str, next_execution: datetime) -> bool:
+        return await super().update_trigger_schedule(trigger_id, next_execution)
+
+    async def _resolve_triggers_from_queue(self, max_count: int) -> List[ScheduledTriggerModel]:
+        """Pop due triggers from the heap and advance their schedules"""
+        async with self._queue_lock:
+            now = datetime.now(timezone.utc)
+            if self._last_reconcile is None or now - self._last_reconcile >= self.reconcile_interval:
+                await self._reconcile(now)
+            else:
+                await self._extend_window(now)
+
+            due: List[Tuple[ScheduledTriggerModel, datetime]] = []
+            while self._heap and len(due) < max_count and self._heap[0][0] <= now:
+                fire_time, priority, sequence, trigger_id = heapq.heappop(self._heap)
+                if self._entries.get(trigger_id) != (fire_time, priority, sequence):
+                    self._metrics["stale_entries_skipped"] += 1
+                    continue
+                del self._entries[trigger_id]
+                due.append((self._triggers.pop(trigger_id), fire_time))
+
+            fired: List[ScheduledTriggerModel] = []
+            if due:
+                fired = await self._advance_fired_triggers(due, now)
+                self._metrics["triggers_fired"] += len(fired)
+
+            self._compact_heap()
+            self._priority_queue_size = len(self._entries)
+            return fired
+
+    async def _add_trigger_to_schedule(self, trigger: ScheduledTriggerModel) -> bool:
+        """Persist a trigger with its next execution time and queue it if it fires soon"""
+        now = datetime.now(timezone.utc)
+        if trigger.next_execution is None:
+            trigger.next_execution = self.next_fire_time(trigger, now)
+
+        document = trigger.to_mongo()
+        document.pop("_id", None)
+        await self.collection.update_one(
+            {"trigger_id": trigger.trigger_id},
+            {"$set": document},
+            upsert=True
+        )
+
+        async with self._queue_lock:
+            self._dispatched.pop(trigger.trigger_id, None)
+            self._queue(trigger)
+        return True
+
+    async def _update_trigger_execution_time(self, trigger_id: str, next_execution: datetime) -> bool:
+        """Store a new next execution time and re-queue the trigger"""
+        result = await self.collection.update_one(
+            {"trigger_id": trigger_id},
+            {"$set": {"next_execution": next_execution, "updated_at": datetime.now(timezone.utc)}}
+        )
+        if result.matched_count == 0:
+            return False
+
+        async with self._queue_lock:
+            self._dispatched.pop(trigger_id, None)
+        await self.refresh_trigger(trigger_id)
+        return True
+
+    async def refresh_trigger(self, trigger_id: str) -> bool:
+        """Re-read one trigger after it was created or updated and re-queue it"""
+        document = await self.collection.find_one({"trigger_id": trigger_id})
+        trigger = ScheduledTriggerModel.from_mongo(document) if document else None
+
+        async with self._queue_lock:
+            if trigger is None:
+                self._discard(trigger_id)
+                return False
+            return self._queue(trigger)
+
+    async def remove_trigger(self, trigger_id: str) -> bool:
+        """Drop a deleted trigger from the queue"""
+        async with self._queue_lock:
+            self._dispatched.pop(trigger_id, None)
+            return self._discard(trigger_id)
+
+    def _queue(self, trigger: ScheduledTriggerModel) -> bool:
+        """Queue or re-queue a trigger if it is active and fires within the loaded window"""
+        trigger_id = trigger.trigger_id
+        fire_time = _as_utc(trigger.next_execution)
+
+        if trigger.status != TaskStatus.ACTIVE or fire_time is None:
+            self._discard(trigger_id)
+            return False
+        fire_time = _to_bson_precision(fire_time)
+
+        dispatched_at = self._dispatched.get(trigger_id)
+        if dispatched_at is not None:
+            if fire_time <= dispatched_at:
+                # Already fired; the stored schedule has not been advanced yet
+                return False
+            del self._dispatched[trigger_id]
+
+        if self._loaded_until is not None and fire_time >= self._loaded_until:
+            # Picked up when the window is extended
+            self._discard(trigger_id)
+            return False
+
+        key = (fire_time, _trigger_priority(trigger), next(self._sequence))
+        self._entries[trigger_id] = key
+        self._triggers[trigger_id] = trigger
+        heapq.heappush(self._heap, (*key, trigger_id))
+        return True
+
+    def _discard(self, trigger_id: str) -> bool:
+        """Forget a queued trigger; its heap entry becomes stale"""
+        self._triggers.pop(trigger_id, None)
+        return self._entries.pop(trigger_id, None) is not None
+
+    def _compact_heap(self) -> None:
+        """Rebuild the heap once stale entries dominate it"""
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(*key, trigger_id) for trigger_id, key in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    async def _load_window(self, start: Optional[datetime], end: datetime) -> int:
+        """Queue active triggers with next_execution in [start, end)"""
+        next_execution: Dict[str, Any] = {"$lt": end}
+        if start is not None:
+            next_execution["$gte"] = start
+
+        loaded = 0
+        cursor = self.collection.find({"status": TaskStatus.ACTIVE.value, "next_execution": next_execution})
+        async for document in cursor:
+            trigger = ScheduledTriggerModel.from_mongo(document)
+            if trigger is not None and self._queue(trigger):
+                loaded += 1
+
+        self._metrics["window_loads"] += 1
+        return loaded
+
+    async def _extend_window(self, now: datetime) -> None:
+        """Load the next slice of the look-ahead window once half of it has elapsed"""
+        if self._loaded_until is not None and now + self.look_ahead / 2 < self._loaded_until:
+            return
+        start = self._loaded_until
+        self._loaded_until = now + self.look_ahead
+        await self._load_window(start, self._loaded_until)
+
+    async def _reconcile(self, now: datetime) -> None:
+        """Rebuild the heap from MongoDB, including overdue triggers"""
+        self._heap.clear()
+        self._entries.clear()
+        self._triggers.clear()
+        self._loaded_until = now + self.look_ahead
+        loaded = await self._load_window(None, self._loaded_until)
+        self._last_reconcile = now
+        self._metrics["reconciliations"] += 1
+        self.logger.debug(f"Reconciled trigger queue with {loaded} triggers", extra={
+            "queued_triggers": loaded,
+            "loaded_until": self._loaded_until.isoformat()
+        })
+
+    async def _advance_fired_triggers(
+        self,
+        due: List[Tuple[ScheduledTriggerModel, datetime]],
+        now: datetime
+    ) -> List[ScheduledTriggerModel]:
+        """
+        Claim fired triggers by advancing their stored schedule.
+
+        Each trigger is advanced with a compare-and-set on the fire time it was
+        queued for, so when several scheduler instances hold the same trigger
+        only the one whose update matches fires it.
+
+        Returns:
+            Triggers claimed by this instance
+        """
+        results = await asyncio.gather(
+            *(self._claim_fired_trigger(trigger, fire_time, now) for trigger, fire_time in due),
+            return_exceptions=True
+        )
+
+        claimed: List[ScheduledTriggerModel] = []
+        lost: List[str] = []
+        for (trigger, fire_time), result in zip(due, results):
+            if isinstance(result, Exception):
+                # Not claimed; retried on the next tick while still due
+                self._metrics["persist_failures"] += 1
+                self.logger.warning(f"Failed to advance fired trigger: {result}", extra={
+                    "trigger_id": trigger.trigger_id
+                })
+                self._queue(trigger)
+                continue
+
+            matched, next_fire = result
+            if not matched:
+                lost.append(trigger.trigger_id)
+                continue
+
+            claimed.append(trigger)
+            self._dispatched[trigger.trigger_id] = fire_time
+            if next_fire is None:
+                if not trigger.cron_expression:
+                    self._dispatched.pop(trigger.trigger_id, None)
+                continue
+            queued = trigger.model_copy(update={"next_execution": next_fire, "last_execution": fire_time})
+            self._queue(queued)
+
+        if lost:
+            # Advanced by another instance; queue the schedule it stored
+            self._metrics["claims_lost"] += len(lost)
+            try:
+                async for document in self.collection.find({"trigger_id": {"$in": lost}}):
+                    trigger = ScheduledTriggerModel.from_mongo(document)
+                    if trigger is not None:
+                        self._queue(trigger)
+            except Exception as e:
+                self.logger.warning(f"Failed to reload triggers fired elsewhere: {e}", extra={
+                    "trigger_count": len(lost)
+                })
+
+        return claimed
+
+    async def _claim_fired_trigger(
+        self,
+        trigger: ScheduledTriggerModel,
+        fire_time: datetime,
+        now: datetime
+    ) -> Tuple[bool, Optional[datetime]]:
+        """Advance one fired trigger if its stored schedule still matches the fire time"""
+        next_fire = self.next_fire_time(trigger, max(fire_time, now))
+
+        update: Dict[str, Any] = {"last_execution": fire_time}
+        if next_fire is not None or not trigger.cron_expression:
+            # One-shot triggers are cleared; cron triggers without a computed
+            # next time keep theirs until update_trigger_schedule is called
+            update["next_execution"] = next_fire
+
+        result = await self.collection.update_one(
+            {
+                "trigger_id": trigger.trigger_id,
+                "next_execution": fire_time,
+                "last_execution": {"$ne": fire_time}
+            },
+            {"$set": update}
+        )
+        return result.matched_count > 0, next_fire
+
+
+# Global trigger engine instance
+_trigger_engine_service: Optional[MongoTriggerEngineService] = None
+
+
+def get_trigger_engine_service(
+    collection: Optional[AsyncIOMotorCollection] = None
+) -> Optional[MongoTriggerEngineService]:
+    """
+    Get the process-wide trigger engine.
+
+    Shared so the in-memory trigger queue outlives the per-request scheduler
+    services that keep it in sync with trigger changes. The engine is created
+    by the first call that passes the scheduled_triggers collection.
+
+    Args:
+        collection: scheduled_triggers collection
+
+    Returns:
+        MongoTriggerEngineService instance, or None if not created yet
+    """
+    global _trigger_engine_service
+    if _trigger_engine_service is None and collection is not None:
+        _trigger_engine_service = MongoTriggerEngineService(collection)
+    return _trigger_engine_service
@@ -0,0 +1,25 @@
+"""
+Scheduled Task Runner Engine - Utilities Package
+
+Stateless helpers shared by the scheduler services, models and controllers.
+
+Key Utilities:
+- CompiledCron: Cron expression compiled into bitset field masks
+- compile_cron: Cached compilation per expression and timezone
+- next_fire_times: Bulk next fire time computation
+- LatencyHistogram: Fixed-bucket latency histogram for scheduler metrics
+"""
+
+from .cron_compiler import (
+    CompiledCron,
+    compile_cron,
+    next_fire_times
+)
+from .latency_histogram import LatencyHistogram
+
+__all__ = [
+    "CompiledCron",
+    "compile_cron",
+    "next_fire_times",
+    "LatencyHistogram"
+]
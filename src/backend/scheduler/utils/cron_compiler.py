@@ -0,0 +1,457 @@
+"""
+Scheduled Task Runner Engine - Cron Compiler
+
+Compiles cron expressions into per-field bitset masks once and computes next
+and previous fire times by scanning set bits instead of stepping through
+time. Compiled expressions are cached per (expression, timezone).
+
+Supported syntax:
+- Five fields (minute hour day-of-month month day-of-week) or six fields
+  with trailing seconds, as accepted by croniter
+- Lists (1,15), ranges (1-5), steps (*/10, 5-30/5, 7/15) and month/day names
+- Macros: @yearly, @annually, @monthly, @weekly, @daily, @midnight, @hourly
+- Day-of-month and day-of-week follow Vixie cron: when both are restricted a
+  day matches if either field matches
+
+Fire times are matched on wall-clock time in the trigger's timezone:
+- Wall-clock times skipped by a DST spring-forward fire at the transition
+- Wall-clock times repeated by a DST fall-back fire once, at their first occurrence
+"""
+
+import calendar
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+MONTH_NAMES = {
+    name: index for index, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1
+    )
+}
+WEEKDAY_NAMES = {
+    name: index for index, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])
+}
+
+# Years searched before an expression is considered to never fire (e.g. "0 0 30 2 *")
+MAX_SEARCH_YEARS = 200
+
+_ONE_SECOND = timedelta(seconds=1)
+_ONE_MINUTE = timedelta(minutes=1)
+
+
+def _next_bit(mask: int, start: int) -> Optional[int]:
+    """Lowest set bit at or above start"""
+    if start < 0:
+        start = 0
+    remaining = mask >> start
+    if not remaining:
+        return None
+    return start + (remaining & -remaining).bit_length() - 1
+
+
+def _prev_bit(mask: int, start: int) -> Optional[int]:
+    """Highest set bit at or below start"""
+    if start < 0:
+        return None
+    remaining = mask & ((2 << start) - 1)
+    if not remaining:
+        return None
+    return remaining.bit_length() - 1
+
+
+def _parse_value(text: str, names: Dict[str, int], field_name: str) -> int:
+    value = names.get(text)
+    if value is not None:
+        return value
+    if not text.isdigit():
+        raise ValueError(f"Invalid {field_name} value: {text!r}")
+    return int(text)
+
+
+def _parse_field(
+    text: str,
+    low: int,
+    high: int,
+    field_name: str,
+    names: Optional[Dict[str, int]] = None
+) -> int:
+    """Parse one cron field into a bitset with bit n set when value n matches"""
+    names = names or {}
+    mask = 0
+    for part in text.split(","):
+        step = 1
+        has_step = "/" in part
+        if has_step:
+            part, step_text = part.split("/", 1)
+            if not step_text.isdigit() or int(step_text) < 1:
+                raise ValueError(f"Invalid {field_name} step: {step_text!r}")
+            step = int(step_text)
+
+        if part in ("*", "?"):
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start = _parse_value(start_text, names, field_name)
+            end = _parse_value(end_text, names, field_name)
+        else:
+            start = _parse_value(part, names, field_name)
+            end = high if has_step else start
+
+        if not (low <= start <= high and low <= end <= high):
+            raise ValueError(f"{field_name} value out of range {low}-{high}: {part!r}")
+        if start > end:
+            raise ValueError(f"Invalid {field_name} range: {part!r}")
+
+        for value in range(start, end + 1, step):
+            mask |= 1 << value
+    return mask
+
+
+class CompiledCron:
+    """
+    A cron expression compiled into bitset masks for one timezone.
+
+    Instances are immutable and shared through compile_cron's cache.
+    """
+
+    __slots__ = (
+        "expression", "timezone_name", "tz", "has_seconds",
+        "second_mask", "minute_mask", "hour_mask", "day_mask", "month_mask", "weekday_mask",
+        "_day_wildcard", "_weekday_wildcard", "_weekday_day_masks", "_month_day_masks",
+    )
+
+    def __init__(self, expression: str, timezone_name: str = "UTC"):
+        """
+        Compile a cron expression.
+
+        Args:
+            expression: Cron expression (5 or 6 fields, or a macro)
+            timezone_name: IANA timezone the expression is evaluated in
+
+        Raises:
+            ValueError: If the expression or timezone is invalid
+        """
+        self.expression = expression
+        self.timezone_name = timezone_name
+        if timezone_name.upper() == "UTC":
+            self.tz = None
+        else:
+            try:
+                self.tz = ZoneInfo(timezone_name)
+            except (ZoneInfoNotFoundError, ValueError) as e:
+                raise ValueError(f"Invalid timezone: {timezone_name}") from e
+
+        fields = MACROS.get(expression, expression).split()
+        if len(fields) not in (5, 6):
+            raise ValueError("Cron expression must have 5 or 6 fields")
+
+        self.has_seconds = len(fields) == 6
+        self.second_mask = _parse_field(fields[5], 0, 59, "second") if self.has_seconds else 1
+        self.minute_mask = _parse_field(fields[0], 0, 59, "minute")
+        self.hour_mask = _parse_field(fields[1], 0, 23, "hour")
+        self.day_mask = _parse_field(fields[2], 1, 31, "day-of-month")
+        self.month_mask = _parse_field(fields[3], 1, 12, "month", MONTH_NAMES)
+        weekday_mask = _parse_field(fields[4], 0, 7, "day-of-week", WEEKDAY_NAMES)
+        # 7 is an alias for Sunday
+        self.weekday_mask = (weekday_mask | (weekday_mask >> 7)) & 0x7F
+
+        self._day_wildcard = fields[2] in ("*", "?")
+        self._weekday_wildcard = fields[4] in ("*", "?")
+        # Days of a month matching the weekday field, indexed by the weekday of the 1st
+        self._weekday_day_masks = [
+            sum(1 << day for day in range(1, 32) if self.weekday_mask >> ((first + day - 1) % 7) & 1)
+            for first in range(7)
+        ]
+        self._month_day_masks: Dict[Tuple[int, int], int] = {}
+
+        if not any(self._month_days(year, month) for year in (2023, 2024) for month in range(1, 13)
+                   if self.month_mask >> month & 1):
+            raise ValueError(f"Cron expression never fires: {expression}")
+
+    def __repr__(self) -> str:
+        return f"CompiledCron({self.expression!r}, {self.timezone_name!r})"
+
+    def _month_days(self, year: int, month: int) -> int:
+        """Bitset of the days of a month that match the day fields"""
+        key = (year, month)
+        mask = self._month_day_masks.get(key)
+        if mask is None:
+            first_weekday, days_in_month = calendar.monthrange(year, month)
+            weekday_days = self._weekday_day_masks[(first_weekday + 1) % 7]
+            if self._day_wildcard and self._weekday_wildcard:
+                mask = self.day_mask
+            elif self._day_wildcard:
+                mask = weekday_days
+            elif self._weekday_wildcard:
+                mask = self.day_mask
+            else:
+                mask = self.day_mask | weekday_days
+            mask &= (2 << days_in_month) - 2
+            if len(self._month_day_masks) >= 512:
+                self._month_day_masks.clear()
+            self._month_day_masks[key] = mask
+        return mask
+
+    def _next_local(self, wall: datetime, inclusive: bool) -> Optional[datetime]:
+        """First matching wall-clock time after (or at, if inclusive) a naive wall-clock time"""
+        if self.has_seconds:
+            start = wall.replace(microsecond=0)
+            resolution = _ONE_SECOND
+        else:
+            start = wall.replace(second=0, microsecond=0)
+            resolution = _ONE_MINUTE
+        if start < wall or not inclusive:
+            start += resolution
+
+        year, month, day = start.year, start.month, start.day
+        hour, minute, second = start.hour, start.minute, start.second
+        last_year = year + MAX_SEARCH_YEARS
+
+        while year <= last_year:
+            found = _next_bit(self.month_mask, month)
+            if found is None:
+                year, month, day, hour, minute, second = year + 1, 1, 1, 0, 0, 0
+                continue
+            if found != month:
+                month, day, hour, minute, second = found, 1, 0, 0, 0
+
+            found = _next_bit(self._month_days(year, month), day)
+            if found is None:
+                month, day, hour, minute, second = month + 1, 1, 0, 0, 0
+                continue
+            if found != day:
+                day, hour, minute, second = found, 0, 0, 0
+
+            found = _next_bit(self.hour_mask, hour)
+            if found is None:
+                day, hour, minute, second = day + 1, 0, 0, 0
+                continue
+            if found != hour:
+                hour, minute, second = found, 0, 0
+
+            found = _next_bit(self.minute_mask, minute)
+            if found is None:
+                hour, minute, second = hour + 1, 0, 0
+                continue
+            if found != minute:
+                minute, second = found, 0
+
+            found = _next_bit(self.second_mask, second)
+            if found is None:
+                minute, second = minute + 1, 0
+                continue
+
+            return datetime(year, month, day, hour, minute, found)
+        return None
+
+    def _prev_local(self, wall: datetime, inclusive: bool) -> Optional[datetime]:
+        """Last matching wall-clock time before (or at, if inclusive) a naive wall-clock time"""
+        if self.has_seconds:
+            start = wall.replace(microsecond=0)
+            resolution = _ONE_SECOND
+        else:
+            start = wall.replace(second=0, microsecond=0)
+            resolution = _ONE_MINUTE
+        if start == wall and not inclusive:
+            start -= resolution
+
+        year, month, day = start.year, start.month, start.day
+        hour, minute, second = start.hour, start.minute, start.second
+        top_second = 59 if self.has_seconds else 0
+        first_year = year - MAX_SEARCH_YEARS
+
+        while year >= first_year:
+            found = _prev_bit(self.month_mask, month)
+            if found is None:
+                year, month, day, hour, minute, second = year - 1, 12, 31, 23, 59, top_second
+                continue
+            if found != month:
+                month, day, hour, minute, second = found, 31, 23, 59, top_second
+
+            found = _prev_bit(self._month_days(year, month), day)
+            if found is None:
+                month, day, hour, minute, second = month - 1, 31, 23, 59, top_second
+                continue
+            if found != day:
+                day, hour, minute, second = found, 23, 59, top_second
+
+            found = _prev_bit(self.hour_mask, hour)
+            if found is None:
+                day, hour, minute, second = day - 1, 23, 59, top_second
+                continue
+            if found != hour:
+                hour, minute, second = found, 59, top_second
+
+            found = _prev_bit(self.minute_mask, minute)
+            if found is None:
+                hour, minute, second = hour - 1, 59, top_second
+                continue
+            if found != minute:
+                minute, second = found, top_second
+
+            found = _prev_bit(self.second_mask, second)
+            if found is None:
+                minute, second = minute - 1, top_second
+                continue
+
+            return datetime(year, month, day, hour, minute, found)
+        return None
+
+    def _to_utc(self, wall: datetime) -> datetime:
+        """Resolve a wall-clock time in the expression's timezone to a UTC instant"""
+        instant = wall.replace(tzinfo=self.tz, fold=0).astimezone(timezone.utc)
+        if instant.astimezone(self.tz).replace(tzinfo=None) == wall:
+            return instant
+
+        # Skipped by a spring-forward transition: fire at the transition instant
+        low = wall.replace(tzinfo=self.tz, fold=1).astimezone(timezone.utc)
+        high = instant
+        new_offset = high.astimezone(self.tz).utcoffset()
+        while high - low > _ONE_SECOND:
+            middle = low + (high - low) / 2
+            if middle.astimezone(self.tz).utcoffset() == new_offset:
+                high = middle
+            else:
+                low = middle
+        return high.replace(microsecond=0)
+
+    def next_fire(self, after: datetime) -> Optional[datetime]:
+        """
+        Get the first fire time strictly after a moment.
+
+        Args:
+            after: Moment to search from (naive datetimes are treated as UTC)
+
+        Returns:
+            UTC-aware fire time, or None if the expression never fires again
+        """
+        after = _as_utc(after)
+        if self.tz is None:
+            wall = self._next_local(after.replace(tzinfo=None), inclusive=False)
+            return wall.replace(tzinfo=timezone.utc) if wall is not None else None
+
+        wall = self._next_local(after.astimezone(self.tz).replace(tzinfo=None), inclusive=False)
+        while wall is not None:
+            instant = self._to_utc(wall)
+            if instant > after:
+                return instant
+            # A wall-clock time already passed during a fall-back repeat
+            wall = self._next_local(wall, inclusive=False)
+        return None
+
+    def prev_fire(self, before: datetime) -> Optional[datetime]:
+        """
+        Get the last fire time strictly before a moment.
+
+        Args:
+            before: Moment to search back from (naive datetimes are treated as UTC)
+
+        Returns:
+            UTC-aware fire time, or None if the expression never fired
+        """
+        before = _as_utc(before)
+        if self.tz is None:
+            wall = self._prev_local(before.replace(tzinfo=None), inclusive=False)
+            return wall.replace(tzinfo=timezone.utc) if wall is not None else None
+
+        local = before.astimezone(self.tz)
+        if local.fold:
+            # During a fall-back repeat, walls up to the first-pass offset fired before this moment
+            start = (before + local.replace(fold=0).utcoffset()).replace(tzinfo=None)
+        else:
+            start = local.replace(tzinfo=None)
+
+        wall = self._prev_local(start, inclusive=True)
+        while wall is not None:
+            instant = self._to_utc(wall)
+            if instant < before:
+                return instant
+            wall = self._prev_local(wall, inclusive=False)
+        return None
+
+    def fire_times(
+        self,
+        start: datetime,
+        end: datetime,
+        limit: Optional[int] = None
+    ) -> Iterator[datetime]:
+        """
+        Iterate all fire times in [start, end) for look-ahead scheduling and backfill.
+
+        Args:
+            start: Inclusive lower bound (naive datetimes are treated as UTC)
+            end: Exclusive upper bound (naive datetimes are treated as UTC)
+            limit: Maximum number of fire times to yield
+
+        Yields:
+            UTC-aware fire times in ascending order
+        """
+        end = _as_utc(end)
+        fire_time = self.next_fire(_as_utc(start) - timedelta(microseconds=1))
+        count = 0
+        while fire_time is not None and fire_time < end and (limit is None or count < limit):
+            yield fire_time
+            count += 1
+            fire_time = self.next_fire(fire_time)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _compile_cached(expression: str, timezone_name: str) -> CompiledCron:
+    return CompiledCron(expression, timezone_name)
+
+
+def compile_cron(expression: str, timezone_name: str = "UTC") -> CompiledCron:
+    """
+    Compile a cron expression, reusing the compiled form for repeated expressions.
+
+    Args:
+        expression: Cron expression (5 or 6 fields, or a macro)
+        timezone_name: IANA timezone the expression is evaluated in
+
+    Returns:
+        Cached CompiledCron instance
+
+    Raises:
+        ValueError: If the expression or timezone is invalid
+    """
+    normalized = " ".join(expression.strip().lower().split())
+    return _compile_cached(normalized, timezone_name or "UTC")
+
+
+def next_fire_times(
+    expressions: List[Tuple[str, str]],
+    after: Union[datetime, List[datetime]]
+) -> List[Optional[datetime]]:
+    """
+    Compute next fire times for many (expression, timezone) pairs.
+
+    Args:
+        expressions: (cron expression, timezone) pairs
+        after: One moment for all pairs, or one moment per pair
+
+    Returns:
+        Next fire time per pair (None for expressions that never fire again)
+    """
+    if isinstance(after, datetime):
+        return [compile_cron(expression, tz).next_fire(after) for expression, tz in expressions]
+    return [
+        compile_cron(expression, tz).next_fire(moment)
+        for (expression, tz), moment in zip(expressions, after)
+    ]
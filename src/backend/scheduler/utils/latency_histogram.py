@@ -0,0 +1,68 @@
+"""
+Scheduled Task Runner Engine - Latency Histogram
+
+Fixed-bucket latency histogram for scheduler metrics. Recording is O(number
+of buckets) with no per-sample storage, so histograms can stay attached to
+long-running engines. Percentiles are estimated as the upper bound of the
+bucket containing the requested rank.
+"""
+
+import bisect
+from typing import Any, Dict, Optional, Sequence
+
+# Bucket upper bounds in milliseconds; samples above the last bound go to the overflow bucket
+DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram with fixed millisecond buckets"""
+
+    def __init__(self, buckets_ms: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(sorted(buckets_ms))
+        self._counts = [0] * (len(self.buckets_ms) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Record one latency sample in milliseconds"""
+        value_ms = max(0.0, float(value_ms))
+        self._counts[bisect.bisect_left(self.buckets_ms, value_ms)] += 1
+        self._count += 1
+        self._sum_ms += value_ms
+        self._max_ms = max(self._max_ms, value_ms)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Estimate a percentile (0-1) as the upper bound of its bucket"""
+        if not self._count:
+            return None
+        rank = max(1, round(fraction * self._count))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                if index < len(self.buckets_ms):
+                    return float(min(self.buckets_ms[index], self._max_ms))
+                return self._max_ms
+        return self._max_ms
+
+    def reset(self) -> None:
+        """Drop all recorded samples"""
+        self._counts = [0] * (len(self.buckets_ms) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarize the histogram for metrics endpoints"""
+        buckets = {f"le_{bound:g}ms": count for bound, count in zip(self.buckets_ms, self._counts)}
+        buckets["overflow"] = self._counts[-1]
+        return {
+            "count": self._count,
+            "mean_ms": self._sum_ms / self._count if self._count else None,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self._max_ms if self._count else None,
+            "buckets": buckets
+        }
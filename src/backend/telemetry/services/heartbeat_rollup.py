@@ -0,0 +1,446 @@
+"""
+Heartbeat Rollup - Time-bucketed heartbeat aggregates for uptime queries
+
+Materialises per-agent minute, hour and day buckets from raw heartbeats so
+uptime calculation reads a bounded number of documents regardless of the
+length of the requested window.
+
+Each bucket stores the heartbeat count, the healthy heartbeat count, the
+first and last heartbeat timestamps and the total length of gaps longer than
+the downtime threshold between heartbeats inside the bucket. Because gaps
+crossing a bucket boundary are recovered from the first/last timestamps of
+neighbouring buckets, buckets compose exactly into coarser buckets and into
+arbitrary query windows.
+
+Key Components:
+- HeartbeatRollupService: Background rollup job and rollup-backed uptime totals
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, ReplaceOne
+from pymongo.errors import CollectionInvalid
+
+from ...config.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Rollup levels, coarsest first: (granularity, bucket size, $dateTrunc unit)
+ROLLUP_LEVELS: List[Tuple[str, timedelta, str]] = [
+    ("day", timedelta(days=1), "day"),
+    ("hour", timedelta(hours=1), "hour"),
+    ("minute", timedelta(minutes=1), "minute"),
+]
+
+HEALTHY_STATUSES = ["healthy", "degraded"]
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _floor(value: datetime, size: timedelta) -> datetime:
+    return value - ((value - EPOCH) % size)
+
+
+def _ceil(value: datetime, size: timedelta) -> datetime:
+    floored = _floor(value, size)
+    return floored if floored == value else floored + size
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class HeartbeatRollupService:
+    """
+    Background rollup of raw heartbeats into minute, hour and day buckets.
+
+    Minute buckets are built from raw heartbeats once they are older than
+    the allowed lateness; hour buckets from complete minute buckets and day
+    buckets from complete hour buckets. A watermark per granularity records
+    how far each level has been materialised.
+    """
+
+    def __init__(self, database: AsyncIOMotorDatabase, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize rollup service.
+
+        Args:
+            database: MongoDB async database client
+            config: Telemetry configuration dictionary
+        """
+        self.database = database
+        self.config = config or {}
+
+        self.heartbeats_collection = database.telemetry_heartbeats_ts
+        self.rollups_collection_name = self.config.get("heartbeat_rollup_collection", "telemetry_heartbeat_rollups")
+        self.rollups_collection = database[self.rollups_collection_name]
+        self.state_collection = database.telemetry_heartbeat_rollup_state
+
+        # Heartbeats may arrive up to 10 minutes late; leave them time to land before rolling up
+        self._lateness = timedelta(seconds=self.config.get("heartbeat_rollup_lateness_seconds", 660))
+        self._interval_seconds = self.config.get("heartbeat_rollup_interval_seconds", 60)
+        self._chunk = timedelta(hours=self.config.get("heartbeat_rollup_chunk_hours", 6))
+        self._gap_threshold_ms = self.config.get("uptime_gap_threshold_seconds", 120) * 1000
+        self._use_time_series = self.config.get("heartbeat_rollup_time_series", False)
+
+        self._rollup_task: Optional[asyncio.Task] = None
+        self._running = False
+
+    async def ensure_collections(self) -> None:
+        """Create the rollup collection (optionally as a time-series collection) and its index"""
+        if self._use_time_series:
+            try:
+                await self.database.create_collection(
+                    self.rollups_collection_name,
+                    timeseries={"timeField": "bucket_start", "metaField": "meta", "granularity": "minutes"}
+                )
+            except CollectionInvalid:
+                # Collection already exists
+                pass
+            await self.rollups_collection.create_index(
+                [("meta.agent_id", ASCENDING), ("meta.granularity", ASCENDING), ("bucket_start", ASCENDING)]
+            )
+        else:
+            # Unique so a rollup re-run after a crash cannot double count
+            await self.rollups_collection.create_index(
+                [("meta.agent_id", ASCENDING), ("meta.granularity", ASCENDING), ("bucket_start", ASCENDING)],
+                unique=True
+            )
+        await self.heartbeats_collection.create_index([("agent_id", ASCENDING), ("timestamp", ASCENDING)])
+
+    async def start(self) -> None:
+        """Start the background rollup job"""
+        if self._running:
+            return
+        self._running = True
+        self._rollup_task = asyncio.create_task(self._rollup_loop())
+        logger.info("Heartbeat rollup job started", extra={"interval_seconds": self._interval_seconds})
+
+    async def stop(self) -> None:
+        """Stop the background rollup job"""
+        self._running = False
+        if self._rollup_task:
+            self._rollup_task.cancel()
+            try:
+                await self._rollup_task
+            except asyncio.CancelledError:
+                pass
+            self._rollup_task = None
+        logger.info("Heartbeat rollup job stopped")
+
+    async def _rollup_loop(self) -> None:
+        while self._running:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Heartbeat rollup failed", extra={"error": str(e)})
+            await asyncio.sleep(self._interval_seconds)
+
+    async def run_once(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Advance every rollup level as far as its source data allows.
+
+        Returns:
+            Number of buckets written per granularity
+        """
+        now = now or datetime.now(timezone.utc)
+        watermarks = await self.get_watermarks()
+        written = {}
+
+        # Minute buckets from raw heartbeats, up to the last minute that can no longer change
+        minute_size = ROLLUP_LEVELS[-1][1]
+        minute_target = _floor(now - self._lateness, minute_size)
+        minute_start = watermarks.get("minute") or await self._earliest(
+            self.heartbeats_collection, {}, "timestamp", minute_size
+        )
+        written["minute"] = await self._advance(
+            "minute", minute_size, minute_start, minute_target, self._minute_pipeline
+        )
+
+        # Coarser buckets from the next finer level
+        source_watermark = max(minute_start, minute_target) if minute_start else None
+        for index in range(len(ROLLUP_LEVELS) - 2, -1, -1):
+            granularity, size, unit = ROLLUP_LEVELS[index]
+            source_granularity = ROLLUP_LEVELS[index + 1][0]
+            if source_watermark is None:
+                break
+            target = _floor(source_watermark, size)
+            start = watermarks.get(granularity) or await self._earliest(
+                self.rollups_collection, {"meta.granularity": source_granularity}, "bucket_start", size
+            )
+            written[granularity] = await self._advance(
+                granularity, size, start, target,
+                lambda range_start, range_end, src=source_granularity, u=unit: self._rollup_pipeline(
+                    src, u, range_start, range_end
+                )
+            )
+            source_watermark = max(start, target) if start else None
+
+        return written
+
+    async def _advance(
+        self,
+        granularity: str,
+        size: timedelta,
+        start: Optional[datetime],
+        target: datetime,
+        pipeline_factory
+    ) -> int:
+        """
+        Materialise buckets for [start, target) in chunks, saving the watermark after each chunk.
+
+        Chunks are whole multiples of the level's bucket size (at least one
+        bucket) so no bucket is split across two aggregations.
+        """
+        if start is None or start >= target:
+            return 0
+
+        chunk = max(size, self._chunk - self._chunk % size)
+        written = 0
+        # Re-aligns watermarks left mid-bucket by earlier runs
+        chunk_start = _floor(start, size)
+        while chunk_start < target:
+            chunk_end = min(chunk_start + chunk, target)
+            source = self.heartbeats_collection if granularity == "minute" else self.rollups_collection
+            results = await source.aggregate(pipeline_factory(chunk_start, chunk_end)).to_list(length=None)
+            written += await self._write_buckets(granularity, chunk_start, chunk_end, results)
+            await self.state_collection.update_one(
+                {"_id": granularity},
+                {"$set": {"watermark": chunk_end, "updated_at": datetime.now(timezone.utc)}},
+                upsert=True
+            )
+            chunk_start = chunk_end
+        return written
+
+    async def _write_buckets(
+        self,
+        granularity: str,
+        range_start: datetime,
+        range_end: datetime,
+        results: List[Dict[str, Any]]
+    ) -> int:
+        """Write the buckets aggregated for [range_start, range_end), replacing any written before"""
+        documents = [
+            {
+                "meta": {"agent_id": result["_id"]["agent_id"], "granularity": granularity},
+                "bucket_start": result["_id"]["bucket_start"],
+                "count": result["count"],
+                "healthy_count": result["healthy_count"],
+                "first_timestamp": result["first_timestamp"],
+                "last_timestamp": result["last_timestamp"],
+                "gap_minutes": result["gap_ms"] / 60000
+            }
+            for result in results
+        ]
+        if self._use_time_series:
+            # Time-series collections do not support upserts; clearing the chunk's
+            # range first keeps a re-run after a crash from double counting
+            await self.rollups_collection.delete_many({
+                "meta.granularity": granularity,
+                "bucket_start": {"$gte": range_start, "$lt": range_end}
+            })
+            if documents:
+                await self.rollups_collection.insert_many(documents, ordered=False)
+        elif documents:
+            # Upserts keep a re-run after a crash idempotent and replace buckets
+            # that earlier runs wrote from partial data
+            await self.rollups_collection.bulk_write([
+                ReplaceOne(
+                    {
+                        "meta.agent_id": document["meta"]["agent_id"],
+                        "meta.granularity": granularity,
+                        "bucket_start": document["bucket_start"]
+                    },
+                    document,
+                    upsert=True
+                )
+                for document in documents
+            ], ordered=False)
+        return len(documents)
+
+    async def _earliest(self, collection, query: Dict[str, Any], field: str, size: timedelta) -> Optional[datetime]:
+        """Start of the bucket holding the oldest document, for the first run of a level"""
+        document = await collection.find_one(query, {field: 1}, sort=[(field, ASCENDING)])
+        if not document:
+            return None
+        return _floor(_as_utc(document[field]), size)
+
+    def _minute_pipeline(self, range_start: datetime, range_end: datetime) -> List[Dict[str, Any]]:
+        """Minute buckets from raw heartbeats; gaps use the previous heartbeat within the same minute"""
+        gap = {"$subtract": ["$timestamp", "$previous_timestamp"]}
+        return [
+            {"$match": {"timestamp": {"$gte": range_start, "$lt": range_end}}},
+            {"$setWindowFields": {
+                "partitionBy": "$agent_id",
+                "sortBy": {"timestamp": 1},
+                "output": {"previous_timestamp": {"$shift": {"output": "$timestamp", "by": -1}}}
+            }},
+            {"$addFields": {"bucket_start": {"$dateTrunc": {"date": "$timestamp", "unit": "minute"}}}},
+            {"$group": {
+                "_id": {"agent_id": "$agent_id", "bucket_start": "$bucket_start"},
+                "count": {"$sum": 1},
+                "healthy_count": {"$sum": {"$cond": [{"$in": ["$health_status", HEALTHY_STATUSES]}, 1, 0]}},
+                "first_timestamp": {"$min": "$timestamp"},
+                "last_timestamp": {"$max": "$timestamp"},
+                "gap_ms": {"$sum": {"$cond": [
+                    {"$and": [
+                        {"$gte": ["$previous_timestamp", "$bucket_start"]},
+                        {"$gt": [gap, self._gap_threshold_ms]}
+                    ]},
+                    gap,
+                    0
+                ]}}
+            }}
+        ]
+
+    def _rollup_pipeline(
+        self,
+        source_granularity: str,
+        unit: str,
+        range_start: datetime,
+        range_end: datetime
+    ) -> List[Dict[str, Any]]:
+        """Coarser buckets from finer ones; adds gaps between consecutive finer buckets in the same bucket"""
+        boundary_gap = {"$subtract": ["$first_timestamp", "$previous_last_timestamp"]}
+        return [
+            {"$match": {
+                "meta.granularity": source_granularity,
+                "bucket_start": {"$gte": range_start, "$lt": range_end}
+            }},
+            {"$setWindowFields": {
+                "partitionBy": "$meta.agent_id",
+                "sortBy": {"bucket_start": 1},
+                "output": {"previous_last_timestamp": {"$shift": {"output": "$last_timestamp", "by": -1}}}
+            }},
+            {"$addFields": {"target_start": {"$dateTrunc": {"date": "$bucket_start", "unit": unit}}}},
+            {"$group": {
+                "_id": {"agent_id": "$meta.agent_id", "bucket_start": "$target_start"},
+                "count": {"$sum": "$count"},
+                "healthy_count": {"$sum": "$healthy_count"},
+                "first_timestamp": {"$min": "$first_timestamp"},
+                "last_timestamp": {"$max": "$last_timestamp"},
+                "gap_ms": {"$sum": {"$add": [
+                    {"$multiply": ["$gap_minutes", 60000]},
+                    {"$cond": [
+                        {"$and": [
+                            {"$gte": ["$previous_last_timestamp", "$target_start"]},
+                            {"$gt": [boundary_gap, self._gap_threshold_ms]}
+                        ]},
+                        boundary_gap,
+                        0
+                    ]}
+                ]}}
+            }}
+        ]
+
+    async def get_watermarks(self) -> Dict[str, datetime]:
+        """How far each granularity has been materialised"""
+        watermarks = {}
+        async for state in self.state_collection.find({}):
+            watermarks[state["_id"]] = _as_utc(state["watermark"])
+        return watermarks
+
+    async def get_uptime_totals(self, agent_id: str, start_time: datetime, end_time: datetime) -> Dict[str, Any]:
+        """
+        Heartbeat totals for an agent over [start_time, end_time].
+
+        The window is covered with the coarsest materialised buckets that fit
+        inside it; the sub-minute head and the not yet rolled up tail are read
+        from raw heartbeats. The number of documents read is bounded by the
+        number of days in the window plus a fixed number of edge buckets.
+
+        Returns:
+            Dictionary with count, healthy_count, gap_minutes, first_timestamp, last_timestamp
+        """
+        watermarks = await self.get_watermarks()
+        minute_size = ROLLUP_LEVELS[-1][1]
+        rolled_start = _ceil(start_time, minute_size)
+        rolled_end = min(_floor(end_time, minute_size), watermarks.get("minute", rolled_start))
+
+        if rolled_start >= rolled_end:
+            # Nothing rolled up inside the window; read it raw
+            raw_ranges = [(start_time, end_time)]
+            segments = []
+        else:
+            raw_ranges = [(start_time, rolled_start), (rolled_end, end_time)]
+            segments = self._decompose(rolled_start, rolled_end, ROLLUP_LEVELS, watermarks)
+
+        pieces = []
+        if segments:
+            bucket_query = {"meta.agent_id": agent_id, "$or": [
+                {"meta.granularity": granularity, "bucket_start": {"$gte": segment_start, "$lt": segment_end}}
+                for granularity, segment_start, segment_end in segments
+            ]}
+            async for bucket in self.rollups_collection.find(bucket_query, {"_id": 0, "meta": 0}):
+                pieces.append((
+                    _as_utc(bucket["first_timestamp"]), _as_utc(bucket["last_timestamp"]),
+                    bucket["count"], bucket["healthy_count"], bucket["gap_minutes"]
+                ))
+
+        raw_query = {"agent_id": agent_id, "$or": [
+            {"timestamp": {"$gte": range_start, "$lt": range_end}}
+            for range_start, range_end in raw_ranges if range_start < range_end
+        ] + [{"timestamp": end_time}]}
+        async for heartbeat in self.heartbeats_collection.find(raw_query, {"timestamp": 1, "health_status": 1}):
+            timestamp = _as_utc(heartbeat["timestamp"])
+            healthy = 1 if heartbeat.get("health_status") in HEALTHY_STATUSES else 0
+            pieces.append((timestamp, timestamp, 1, healthy, 0.0))
+
+        return self._combine(pieces)
+
+    def _decompose(
+        self,
+        start: datetime,
+        end: datetime,
+        levels: List[Tuple[str, timedelta, str]],
+        watermarks: Dict[str, datetime]
+    ) -> List[Tuple[str, datetime, datetime]]:
+        """Cover a minute-aligned range with the coarsest materialised buckets"""
+        if start >= end or not levels:
+            return []
+
+        granularity, size, _ = levels[0]
+        watermark = watermarks.get(granularity)
+        if watermark is None:
+            return self._decompose(start, end, levels[1:], watermarks)
+
+        aligned_start = _ceil(start, size)
+        aligned_end = _floor(min(end, watermark), size)
+        if aligned_start >= aligned_end:
+            return self._decompose(start, end, levels[1:], watermarks)
+
+        return (
+            self._decompose(start, aligned_start, levels[1:], watermarks)
+            + [(granularity, aligned_start, aligned_end)]
+            + self._decompose(aligned_end, end, levels[1:], watermarks)
+        )
+
+    def _combine(self, pieces: List[Tuple[datetime, datetime, int, int, float]]) -> Dict[str, Any]:
+        """Combine time-ordered buckets and heartbeats, adding gaps across their boundaries"""
+        pieces.sort(key=lambda piece: piece[0])
+        threshold_minutes = self._gap_threshold_ms / 60000
+
+        count = healthy_count = 0
+        gap_minutes = 0.0
+        previous_last = None
+        for first, last, piece_count, piece_healthy, piece_gap in pieces:
+            count += piece_count
+            healthy_count += piece_healthy
+            gap_minutes += piece_gap
+            if previous_last is not None:
+                boundary_gap = (first - previous_last).total_seconds() / 60
+                if boundary_gap > threshold_minutes:
+                    gap_minutes += boundary_gap
+            previous_last = last if previous_last is None else max(previous_last, last)
+
+        return {
+            "count": count,
+            "healthy_count": healthy_count,
+            "gap_minutes": gap_minutes,
+            "first_timestamp": pieces[0][0] if pieces else None,
+            "last_timestamp": previous_last
+        }
@@ -0,0 +1,283 @@
+"""
+Heartbeat State - Per-agent in-memory heartbeat state with write-behind persistence
+
+Keeps the data the heartbeat hot path needs for every agent in memory so that
+ingesting a heartbeat does not query MongoDB. Heartbeat documents and uptime
+session changes are buffered and written in batches.
+
+Key Components:
+- AgentHeartbeatState: Last sequence number, recent interval ring buffer and
+  the current uptime session for one agent
+- HeartbeatStateTable: LRU-bounded table of agent states shared by all
+  TelemetryService instances, plus the pending write buffers
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import BulkWriteError
+
+from ...config.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class AgentHeartbeatState:
+    """
+    Heartbeat state for one agent.
+
+    Intervals between consecutive heartbeats are held in a fixed-size ring
+    buffer so the adaptive timeout is computed without reading history.
+    """
+
+    __slots__ = ("agent_id", "last_sequence_number", "last_timestamp", "intervals", "session")
+
+    def __init__(self, agent_id: str, interval_window: int = 10):
+        self.agent_id = agent_id
+        self.last_sequence_number = 0
+        self.last_timestamp: Optional[datetime] = None
+        self.intervals: Deque[float] = deque(maxlen=interval_window)
+        # Active uptime session: uptime_session_id, session_type, session_start, environment
+        self.session: Optional[Dict[str, Any]] = None
+
+    def next_sequence_number(self) -> int:
+        """Allocate the next heartbeat sequence number"""
+        self.last_sequence_number += 1
+        return self.last_sequence_number
+
+    def record_timestamp(self, timestamp: datetime) -> None:
+        """Record a heartbeat timestamp, adding the interval since the previous one"""
+        if self.last_timestamp is not None and timestamp > self.last_timestamp:
+            self.intervals.append((timestamp - self.last_timestamp).total_seconds() * 1000)
+        if self.last_timestamp is None or timestamp > self.last_timestamp:
+            self.last_timestamp = timestamp
+
+    def adaptive_timeout_ms(self, current_interval_ms: int) -> int:
+        """Adaptive timeout (mean + 2 * std deviation of recent intervals), clamped to 2x-5x the interval"""
+        count = len(self.intervals)
+        if count == 0:
+            # Not enough history, use default multiplier
+            return int(current_interval_ms * 3)
+
+        mean_interval = sum(self.intervals) / count
+        if count > 1:
+            variance = sum((interval - mean_interval) ** 2 for interval in self.intervals) / (count - 1)
+            std_dev = variance ** 0.5
+        else:
+            std_dev = 0
+        adaptive_timeout = int(mean_interval + (2 * std_dev))
+
+        min_timeout = current_interval_ms * 2
+        max_timeout = current_interval_ms * 5
+        return max(min_timeout, min(adaptive_timeout, max_timeout))
+
+
+class HeartbeatStateTable:
+    """
+    Agent heartbeat states and pending heartbeat writes.
+
+    States are loaded from MongoDB once per agent and then kept current in
+    memory. Heartbeat inserts and uptime session operations are buffered and
+    flushed when the batch is full or the flush interval has elapsed.
+    """
+
+    def __init__(
+        self,
+        max_agents: int = 100000,
+        interval_window: int = 10,
+        flush_interval_seconds: float = 1.0,
+        flush_batch_size: int = 500
+    ):
+        self.max_agents = max_agents
+        self.interval_window = interval_window
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_batch_size = flush_batch_size
+
+        self._states: "OrderedDict[str, AgentHeartbeatState]" = OrderedDict()
+        self._load_locks: Dict[str, asyncio.Lock] = {}
+        self._flush_lock = asyncio.Lock()
+        self._pending_heartbeats: List[Dict[str, Any]] = []
+        self._pending_uptime_operations: List[Any] = []
+        self._last_flush = time.monotonic()
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.state_loads = 0
+        self.heartbeats_flushed = 0
+        self.flush_failures = 0
+
+    def get(self, agent_id: str) -> Optional[AgentHeartbeatState]:
+        """Get an agent's state, marking it recently used"""
+        state = self._states.get(agent_id)
+        if state is not None:
+            self._states.move_to_end(agent_id)
+        return state
+
+    def put(self, state: AgentHeartbeatState) -> None:
+        """Insert an agent's state, evicting the least recently used agents"""
+        self._states[state.agent_id] = state
+        self._states.move_to_end(state.agent_id)
+        while len(self._states) > self.max_agents:
+            self._states.popitem(last=False)
+
+    def load_lock(self, agent_id: str) -> asyncio.Lock:
+        """Lock serialising the initial state load for one agent"""
+        lock = self._load_locks.get(agent_id)
+        if lock is None:
+            lock = self._load_locks[agent_id] = asyncio.Lock()
+        return lock
+
+    def release_load_lock(self, agent_id: str) -> None:
+        lock = self._load_locks.get(agent_id)
+        if lock is not None and not lock.locked():
+            del self._load_locks[agent_id]
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending_heartbeats) + len(self._pending_uptime_operations)
+
+    def buffer_heartbeat(self, document: Dict[str, Any]) -> None:
+        self._pending_heartbeats.append(document)
+
+    def buffer_uptime_operation(self, operation: Any) -> None:
+        self._pending_uptime_operations.append(operation)
+
+    def flush_due(self) -> bool:
+        if not self.pending_count:
+            return False
+        return (
+            len(self._pending_heartbeats) >= self.flush_batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval_seconds
+        )
+
+    async def flush(
+        self,
+        heartbeats_collection: AsyncIOMotorCollection,
+        uptime_logs_collection: AsyncIOMotorCollection
+    ) -> int:
+        """
+        Write buffered heartbeats with one insert_many and buffered uptime
+        session changes with one ordered bulk_write.
+
+        Returns:
+            Number of heartbeats written
+        """
+        async with self._flush_lock:
+            self._last_flush = time.monotonic()
+            heartbeats, self._pending_heartbeats = self._pending_heartbeats, []
+            uptime_operations, self._pending_uptime_operations = self._pending_uptime_operations, []
+
+            written = 0
+            if heartbeats:
+                try:
+                    await heartbeats_collection.insert_many(heartbeats, ordered=False)
+                    written = len(heartbeats)
+                except BulkWriteError as e:
+                    # Successful inserts must not be retried; drop the rejected documents
+                    failed = len(e.details.get("writeErrors", []))
+                    written = len(heartbeats) - failed
+                    self.flush_failures += 1
+                    logger.warning("Failed to store some heartbeats", extra={"failed_count": failed})
+                except Exception as e:
+                    # Keep uptime changes queued behind the heartbeats they belong to
+                    self._pending_heartbeats[:0] = heartbeats
+                    self._pending_uptime_operations[:0] = uptime_operations
+                    self.flush_failures += 1
+                    logger.warning("Failed to flush heartbeats, will retry", extra={
+                        "pending_heartbeats": len(self._pending_heartbeats),
+                        "error": str(e)
+                    })
+                    return 0
+
+            if uptime_operations:
+                try:
+                    await uptime_logs_collection.bulk_write(uptime_operations, ordered=True)
+                except BulkWriteError as e:
+                    self.flush_failures += 1
+                    logger.warning("Failed to apply some uptime session changes", extra={
+                        "failed_count": len(e.details.get("writeErrors", []))
+                    })
+                except Exception as e:
+                    self._pending_uptime_operations[:0] = uptime_operations
+                    self.flush_failures += 1
+                    logger.warning("Failed to flush uptime session changes, will retry", extra={
+                        "error": str(e)
+                    })
+
+            self.heartbeats_flushed += written
+            return written
+
+    async def start(
+        self,
+        heartbeats_collection: AsyncIOMotorCollection,
+        uptime_logs_collection: AsyncIOMotorCollection
+    ) -> None:
+        """Start flushing buffered writes every flush interval, independent of new heartbeats"""
+        if self._flush_task and not self._flush_task.done():
+            return
+        self._flush_task = asyncio.create_task(
+            self._flush_loop(heartbeats_collection, uptime_logs_collection)
+        )
+        logger.info("Heartbeat flush task started", extra={
+            "interval_seconds": self.flush_interval_seconds
+        })
+
+    async def stop(self) -> None:
+        """Stop the periodic flush task"""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        logger.info("Heartbeat flush task stopped")
+
+    async def _flush_loop(
+        self,
+        heartbeats_collection: AsyncIOMotorCollection,
+        uptime_logs_collection: AsyncIOMotorCollection
+    ) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self.flush_interval_seconds)
+                if self.flush_due():
+                    await self.flush(heartbeats_collection, uptime_logs_collection)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Heartbeat flush task error", extra={"error": str(e)})
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get table size, buffer depth and flush metrics"""
+        return {
+            "agents": len(self._states),
+            "max_agents": self.max_agents,
+            "pending_heartbeats": len(self._pending_heartbeats),
+            "pending_uptime_operations": len(self._pending_uptime_operations),
+            "state_loads": self.state_loads,
+            "heartbeats_flushed": self.heartbeats_flushed,
+            "flush_failures": self.flush_failures
+        }
+
+
+# Global heartbeat state table
+_heartbeat_state_table: Optional[HeartbeatStateTable] = None
+
+
+def get_heartbeat_state_table() -> HeartbeatStateTable:
+    """
+    Get the global heartbeat state table.
+    Shared so agent state outlives individual TelemetryService instances.
+
+    Returns:
+        HeartbeatStateTable instance
+    """
+    global _heartbeat_state_table
+    if _heartbeat_state_table is None:
+        _heartbeat_state_table = HeartbeatStateTable()
+    return _heartbeat_state_table
@@ -0,0 +1,430 @@
+"""
+Metric Series Statistics - Streaming per-series estimators
+
+Maintains constant-size running statistics for every (system_id, metric_name)
+series so telemetry outlier detection is O(1) per sample instead of
+re-reading recent history from MongoDB.
+
+Key Components:
+- P2QuantileEstimator: P-square streaming quantile estimator (Jain & Chlamtac)
+- SeriesStatistics: Quartile estimators plus EWMA mean and variance for one series
+- MetricSeriesStatisticsStore: LRU-bounded store with idle eviction and
+  MongoDB snapshot persistence so statistics survive a restart, shared by all
+  TelemetryService instances
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ASCENDING, UpdateOne
+
+from ...config.logging import get_logger
+
+logger = get_logger(__name__)
+
+SeriesKey = Tuple[str, str]
+
+
+class P2QuantileEstimator:
+    """
+    Streaming estimate of a single quantile using five markers.
+
+    Memory is constant and each update is O(1). The first five samples are
+    kept verbatim to seed the markers.
+    """
+
+    __slots__ = ("p", "heights", "positions", "desired", "increments")
+
+    def __init__(self, p: float):
+        self.p = p
+        self.heights: List[float] = []
+        self.positions: List[float] = []
+        self.desired: List[float] = []
+        self.increments: List[float] = []
+
+    @property
+    def count(self) -> int:
+        return int(self.positions[4]) if self.positions else len(self.heights)
+
+    def add(self, value: float) -> None:
+        """Add a sample to the estimator"""
+        heights = self.heights
+
+        if not self.positions:
+            heights.append(value)
+            heights.sort()
+            if len(heights) == 5:
+                p = self.p
+                self.positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+                self.desired = [1.0, 1.0 + 2 * p, 1.0 + 4 * p, 3.0 + 2 * p, 5.0]
+                self.increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+            return
+
+        positions = self.positions
+
+        # Find the cell containing the sample, extending the extremes if needed
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        # Adjust the three middle markers towards their desired positions
+        for i in range(1, 4):
+            delta = self.desired[i] - positions[i]
+            if (delta >= 1 and positions[i + 1] - positions[i] > 1) or \
+               (delta <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if delta > 0 else -1
+                candidate = self._parabolic(i, step)
+                if heights[i - 1] < candidate < heights[i + 1]:
+                    heights[i] = candidate
+                else:
+                    heights[i] = self._linear(i, step)
+                positions[i] += step
+
+    def value(self) -> Optional[float]:
+        """Current quantile estimate, or None before any sample"""
+        if self.positions:
+            return self.heights[2]
+        if not self.heights:
+            return None
+        index = min(int(round(self.p * (len(self.heights) - 1))), len(self.heights) - 1)
+        return self.heights[index]
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        q, n = self.heights, self.positions
+        return q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "heights": list(self.heights),
+            "positions": list(self.positions),
+            "desired": list(self.desired)
+        }
+
+    @classmethod
+    def from_dict(cls, p: float, data: Dict[str, Any]) -> "P2QuantileEstimator":
+        estimator = cls(p)
+        estimator.heights = list(data.get("heights", []))
+        estimator.positions = list(data.get("positions", []))
+        estimator.desired = list(data.get("desired", []))
+        if estimator.positions:
+            estimator.increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+        return estimator
+
+
+class SeriesStatistics:
+    """
+    Running statistics for one metric series.
+
+    Quartiles give Tukey IQR fences; the EWMA mean and variance track the
+    recent level of the series so that values inside the long-run spread
+    after a level shift are not flagged forever.
+    """
+
+    __slots__ = ("q1", "q3", "ewma_mean", "ewma_variance", "count", "last_seen", "dirty")
+
+    def __init__(self):
+        self.q1 = P2QuantileEstimator(0.25)
+        self.q3 = P2QuantileEstimator(0.75)
+        self.ewma_mean: Optional[float] = None
+        self.ewma_variance = 0.0
+        self.count = 0
+        self.last_seen = time.monotonic()
+        self.dirty = False
+
+    def add(self, value: float, alpha: float) -> None:
+        """Add a sample to all estimators"""
+        self.q1.add(value)
+        self.q3.add(value)
+
+        if self.ewma_mean is None:
+            self.ewma_mean = value
+        else:
+            diff = value - self.ewma_mean
+            increment = alpha * diff
+            self.ewma_mean += increment
+            self.ewma_variance = (1 - alpha) * (self.ewma_variance + diff * increment)
+
+        self.count += 1
+        self.last_seen = time.monotonic()
+        self.dirty = True
+
+    def iqr_bounds(self) -> Optional[Tuple[float, float]]:
+        """Tukey fences from the current quartile estimates"""
+        q1, q3 = self.q1.value(), self.q3.value()
+        if q1 is None or q3 is None:
+            return None
+        iqr = q3 - q1
+        return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+    def is_outlier(self, value: float, min_samples: int, z_threshold: float) -> bool:
+        """
+        Check a value against the series statistics.
+
+        A value is an outlier when it lies outside the IQR fences and is
+        also more than z_threshold EWMA standard deviations from the EWMA mean.
+        """
+        if self.count < min_samples:
+            return False
+
+        bounds = self.iqr_bounds()
+        if not bounds or bounds[0] <= value <= bounds[1]:
+            return False
+
+        std = math.sqrt(self.ewma_variance)
+        if std == 0:
+            return value != self.ewma_mean
+        return abs(value - self.ewma_mean) / std > z_threshold
+
+    def to_document(self, key: SeriesKey) -> Dict[str, Any]:
+        return {
+            "system_id": key[0],
+            "metric_name": key[1],
+            "count": self.count,
+            "q1": self.q1.to_dict(),
+            "q3": self.q3.to_dict(),
+            "ewma_mean": self.ewma_mean,
+            "ewma_variance": self.ewma_variance,
+            "updated_at": datetime.now(timezone.utc)
+        }
+
+    @classmethod
+    def from_document(cls, doc: Dict[str, Any]) -> "SeriesStatistics":
+        stats = cls()
+        stats.q1 = P2QuantileEstimator.from_dict(0.25, doc.get("q1", {}))
+        stats.q3 = P2QuantileEstimator.from_dict(0.75, doc.get("q3", {}))
+        stats.ewma_mean = doc.get("ewma_mean")
+        stats.ewma_variance = doc.get("ewma_variance", 0.0)
+        stats.count = doc.get("count", 0)
+        return stats
+
+
+class MetricSeriesStatisticsStore:
+    """
+    Bounded in-memory store of SeriesStatistics keyed by (system_id, metric_name).
+
+    Least recently used series are evicted beyond max_series, and series idle
+    for longer than idle_ttl_seconds are dropped. Changed series are written
+    to the snapshot collection periodically and reloaded from it on a miss.
+    """
+
+    def __init__(
+        self,
+        snapshot_collection: Optional[AsyncIOMotorCollection] = None,
+        max_series: int = 50000,
+        idle_ttl_seconds: float = 6 * 3600,
+        ewma_alpha: float = 0.05,
+        snapshot_interval_seconds: float = 60.0
+    ):
+        self.snapshot_collection = snapshot_collection
+        self.max_series = max_series
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.ewma_alpha = ewma_alpha
+        self.snapshot_interval_seconds = snapshot_interval_seconds
+        self._series: "OrderedDict[SeriesKey, SeriesStatistics]" = OrderedDict()
+        self._last_snapshot = time.monotonic()
+        self._evicted_dirty: Dict[SeriesKey, SeriesStatistics] = {}
+        self._snapshot_task: Optional[asyncio.Task] = None
+        self._running = False
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def get(self, key: SeriesKey) -> Optional[SeriesStatistics]:
+        """Get statistics for a series, marking it recently used"""
+        stats = self._series.get(key)
+        if stats is not None:
+            self._series.move_to_end(key)
+        return stats
+
+    def put(self, key: SeriesKey, stats: SeriesStatistics) -> None:
+        """Insert statistics for a series, evicting the least recently used"""
+        self._series[key] = stats
+        self._series.move_to_end(key)
+        while len(self._series) > self.max_series:
+            evicted_key, evicted = self._series.popitem(last=False)
+            if evicted.dirty:
+                self._evicted_dirty[evicted_key] = evicted
+
+    def add(self, key: SeriesKey, value: float) -> None:
+        """Add a sample to an existing or new series"""
+        stats = self.get(key)
+        if stats is None:
+            stats = SeriesStatistics()
+            self.put(key, stats)
+        stats.add(value, self.ewma_alpha)
+
+    def missing(self, keys: Iterable[SeriesKey]) -> List[SeriesKey]:
+        """Keys with no statistics in memory"""
+        return [key for key in keys if key not in self._series]
+
+    def evict_idle(self) -> int:
+        """Drop series not updated within idle_ttl_seconds"""
+        cutoff = time.monotonic() - self.idle_ttl_seconds
+        idle = [key for key, stats in self._series.items() if stats.last_seen < cutoff]
+        for key in idle:
+            stats = self._series.pop(key)
+            if stats.dirty:
+                self._evicted_dirty[key] = stats
+        return len(idle)
+
+    async def load_snapshots(self, keys: List[SeriesKey]) -> List[SeriesKey]:
+        """
+        Restore series from snapshots with a single query.
+
+        Returns:
+            Keys that had no snapshot
+        """
+        if not keys or self.snapshot_collection is None:
+            return list(keys)
+
+        system_ids = list({key[0] for key in keys})
+        metric_names = list({key[1] for key in keys})
+        wanted = set(keys)
+
+        cursor = self.snapshot_collection.find({
+            "system_id": {"$in": system_ids},
+            "metric_name": {"$in": metric_names}
+        })
+        async for doc in cursor:
+            key = (doc["system_id"], doc["metric_name"])
+            if key in wanted and key not in self._series:
+                self.put(key, SeriesStatistics.from_document(doc))
+
+        return self.missing(keys)
+
+    def snapshot_due(self) -> bool:
+        return time.monotonic() - self._last_snapshot >= self.snapshot_interval_seconds
+
+    async def snapshot(self) -> int:
+        """
+        Write changed series to the snapshot collection in one bulk write.
+
+        Returns:
+            Number of series written
+        """
+        self._last_snapshot = time.monotonic()
+        self.evict_idle()
+
+        dirty = dict(self._evicted_dirty)
+        self._evicted_dirty.clear()
+        dirty.update((key, stats) for key, stats in self._series.items() if stats.dirty)
+        if not dirty or self.snapshot_collection is None:
+            return 0
+
+        operations = [
+            UpdateOne(
+                {"system_id": key[0], "metric_name": key[1]},
+                {"$set": stats.to_document(key)},
+                upsert=True
+            )
+            for key, stats in dirty.items()
+        ]
+        for stats in dirty.values():
+            stats.dirty = False
+
+        try:
+            await self.snapshot_collection.bulk_write(operations, ordered=False)
+        except Exception:
+            for key, stats in dirty.items():
+                stats.dirty = True
+                # Evicted series are only reachable through the evicted buffer
+                if self._series.get(key) is not stats:
+                    self._evicted_dirty.setdefault(key, stats)
+            raise
+
+        return len(operations)
+
+    async def start(self) -> None:
+        """Create the snapshot index and start the periodic snapshot task"""
+        if self._running:
+            return
+        if self.snapshot_collection is not None:
+            # Snapshot upserts and load_snapshots look series up by this key
+            await self.snapshot_collection.create_index(
+                [("system_id", ASCENDING), ("metric_name", ASCENDING)],
+                unique=True
+            )
+        self._running = True
+        self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+        logger.info("Metric series statistics snapshots started", extra={
+            "interval_seconds": self.snapshot_interval_seconds
+        })
+
+    async def stop(self) -> None:
+        """Stop the periodic snapshot task and write a final snapshot"""
+        self._running = False
+        if self._snapshot_task:
+            self._snapshot_task.cancel()
+            try:
+                await self._snapshot_task
+            except asyncio.CancelledError:
+                pass
+            self._snapshot_task = None
+        await self.snapshot()
+        logger.info("Metric series statistics snapshots stopped")
+
+    async def _snapshot_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.snapshot_interval_seconds)
+                await self.snapshot()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Failed to snapshot metric series statistics", extra={"error": str(e)})
+
+
+# Global metric series statistics store
+_series_statistics_store: Optional[MetricSeriesStatisticsStore] = None
+
+
+def get_series_statistics_store(
+    snapshot_collection: AsyncIOMotorCollection,
+    config: Optional[Dict[str, Any]] = None
+) -> MetricSeriesStatisticsStore:
+    """
+    Get the global metric series statistics store.
+    Shared so series statistics outlive individual TelemetryService instances.
+
+    Args:
+        snapshot_collection: Collection holding series snapshots
+        config: Telemetry configuration, applied when the store is created
+
+    Returns:
+        MetricSeriesStatisticsStore instance
+    """
+    global _series_statistics_store
+    if _series_statistics_store is None:
+        config = config or {}
+        _series_statistics_store = MetricSeriesStatisticsStore(
+            snapshot_collection=snapshot_collection,
+            max_series=config.get("series_statistics_max_series", 50000),
+            idle_ttl_seconds=config.get("series_statistics_idle_ttl_seconds", 6 * 3600),
+            ewma_alpha=config.get("series_statistics_ewma_alpha", 0.05),
+            snapshot_interval_seconds=config.get("series_statistics_snapshot_interval_seconds", 60)
+        )
+    return _series_statistics_store
@@ -26,6 +26,8 @@ import uuid
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any, Union
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from ...config.env import get_settings
 from ...config.logging import get_logger
@@ -52,6 +54,9 @@ from ..schemas.telemetry_schemas import (
     HealthAssessmentSchema,
     AlertInfoSchema
 )
+from .heartbeat_rollup import HeartbeatRollupService
+from .heartbeat_state import AgentHeartbeatState, HeartbeatStateTable, get_heartbeat_state_table
+from .metric_series_statistics import MetricSeriesStatisticsStore, SeriesStatistics, get_series_statistics_store
 
 logger = get_logger(__name__)
 
@@ -87,7 +92,9 @@ class TelemetryService:
     def __init__(
         self,
         database: AsyncIOMotorDatabase,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        heartbeat_state: Optional[HeartbeatStateTable] = None,
+        series_statistics: Optional[MetricSeriesStatisticsStore] = None
     ):
         """
         Initialize TelemetryService with database and configuration.
@@ -95,9 +102,12 @@ class TelemetryService:
         Args:
             database: MongoDB async database client
             config: Service configuration dictionary with thresholds and settings
+            heartbeat_state: Per-agent heartbeat state table (shared global table by default)
+            series_statistics: Per-series statistics store (shared global store by default)
         """
         self.database = database
         self.config = config or {}
+        self._heartbeat_state = heartbeat_state or get_heartbeat_state_table()
         self.logger = logger.bind(service="TelemetryService")
         
         # Collections
@@ -107,12 +117,23 @@ class TelemetryService:
         self.health_status_collection = database.telemetry_health_status
         self.uptime_logs_collection = database.telemetry_uptime_logs
         
+        # Minute/hour/day heartbeat buckets backing uptime calculation
+        self._heartbeat_rollups = HeartbeatRollupService(database, self.config)
+        
         # Service configuration
         self._heartbeat_timeout_ms = self.config.get("heartbeat_timeout_ms", 90000)
         self._metrics_batch_size = self.config.get("metrics_batch_size", 1000)
         self._health_check_window_minutes = self.config.get("health_check_window_minutes", 30)
         self._uptime_calculation_interval_hours = self.config.get("uptime_calculation_interval_hours", 1)
         
+        # Streaming per-series statistics for outlier detection, keyed by (system_id, metric_name)
+        self._outlier_bootstrap_size = self.config.get("outlier_window_size", 100)
+        self._outlier_min_samples = self.config.get("outlier_min_samples", 10)
+        self._outlier_z_threshold = self.config.get("outlier_z_threshold", 3.0)
+        self._series_statistics = series_statistics or get_series_statistics_store(
+            database.telemetry_series_statistics, self.config
+        )
+        
         # Default thresholds
         self._default_thresholds = {
             "cpu_usage_warning": 80.0,
@@ -169,12 +190,13 @@ class TelemetryService:
             # Validate heartbeat data
             await self._validate_heartbeat_data(data, bound_logger)
             
-            # Calculate adaptive timeout based on historical data
-            adaptive_timeout_ms = await self._calculate_adaptive_timeout(
-                data.agent_info.agent_id, 
-                data.heartbeat_interval_ms,
-                bound_logger
-            )
+            # Per-agent state replaces history queries for timeout and sequence number
+            agent_state = await self._get_agent_state(data.agent_info.agent_id, bound_logger)
+            
+            # Calculate adaptive timeout based on recent heartbeat intervals
+            adaptive_timeout_ms = agent_state.adaptive_timeout_ms(data.heartbeat_interval_ms)
+            sequence_number = agent_state.next_sequence_number()
+            agent_state.record_timestamp(data.timestamp)
             
             # Assess current health status
             calculated_health, health_score = await self._assess_agent_health(data, bound_logger)
@@ -186,7 +208,7 @@ class TelemetryService:
             heartbeat = AgentHeartbeatModel(
                 agent_id=data.agent_info.agent_id,
                 heartbeat_id=heartbeat_id,
-                sequence_number=await self._get_next_sequence_number(data.agent_info.agent_id),
+                sequence_number=sequence_number,
                 timestamp=data.timestamp,
                 agent_metadata={
                     "agent_id": data.agent_info.agent_id,
@@ -214,11 +236,11 @@ class TelemetryService:
                 timeout_threshold_ms=adaptive_timeout_ms
             )
             
-            # Store heartbeat in database
-            result = await self.heartbeats_collection.insert_one(heartbeat.model_dump())
-            
-            # Update uptime tracking
-            await self._update_uptime_tracking(data.agent_info.agent_id, calculated_health, data.timestamp, bound_logger)
+            # Buffer heartbeat and uptime changes for the next batched write
+            self._heartbeat_state.buffer_heartbeat(heartbeat.model_dump())
+            self._update_uptime_tracking(agent_state, calculated_health, data.timestamp, data.agent_info.environment)
+            if self._heartbeat_state.flush_due():
+                await self.flush_heartbeats()
             
             # Calculate processing metrics
             processing_end = datetime.now(timezone.utc)
@@ -316,7 +338,15 @@ class TelemetryService:
             thresholds_breached = []
             alerts_generated = []
             
-            # Process each metric
+            # Running statistics for every series in the payload
+            series_statistics = await self._get_series_statistics(
+                data.system_id,
+                {metric_data.metric_name for metric_data in data.metrics}
+            )
+            
+            # Validate, score and build documents for the whole batch in memory
+            metric_documents = []
+            document_metrics = []
             for metric_data in data.metrics:
                 try:
                     # Calculate data quality score
@@ -324,8 +354,10 @@ class TelemetryService:
                     data_quality_scores[metric_data.metric_name] = quality_score
                     
                     # Detect outliers
-                    is_outlier = await self._detect_metric_outlier(metric_data, data.system_id)
-                    if is_outlier:
+                    stats = series_statistics.get(metric_data.metric_name)
+                    if stats and stats.is_outlier(
+                        metric_data.value, self._outlier_min_samples, self._outlier_z_threshold
+                    ):
                         outliers_detected.append(metric_data.metric_name)
                     
                     # Check thresholds
@@ -365,9 +397,8 @@ class TelemetryService:
                         processing_status=TelemetryStatus.PROCESSED
                     )
                     
-                    # Store metric in database
-                    await self.metrics_collection.insert_one(metric.model_dump())
-                    processed_count += 1
+                    metric_documents.append(metric.model_dump())
+                    document_metrics.append(metric_data)
                     
                 except Exception as metric_error:
                     validation_errors.append(f"Metric {metric_data.metric_name}: {str(metric_error)}")
@@ -376,6 +407,34 @@ class TelemetryService:
                         "error": str(metric_error)
                     })
             
+            # Store all metrics in a single round trip
+            stored_metrics = document_metrics
+            if metric_documents:
+                try:
+                    await self.metrics_collection.insert_many(metric_documents, ordered=False)
+                except BulkWriteError as bulk_error:
+                    failed_indexes = set()
+                    for write_error in bulk_error.details.get("writeErrors", []):
+                        failed_indexes.add(write_error["index"])
+                        failed_metric = document_metrics[write_error["index"]]
+                        validation_errors.append(
+                            f"Metric {failed_metric.metric_name}: {write_error.get('errmsg', 'write failed')}"
+                        )
+                    stored_metrics = [
+                        metric_data for index, metric_data in enumerate(document_metrics)
+                        if index not in failed_indexes
+                    ]
+                    bound_logger.warning("Failed to store some metrics", extra={
+                        "failed_count": len(failed_indexes)
+                    })
+            processed_count = len(stored_metrics)
+            
+            # Feed stored values into the per-series statistics
+            for metric_data in stored_metrics:
+                self._series_statistics.add((data.system_id, metric_data.metric_name), metric_data.value)
+            if self._series_statistics.snapshot_due():
+                await self.snapshot_series_statistics()
+            
             # Calculate processing metrics
             processing_end = datetime.now(timezone.utc)
             processing_time_ms = (processing_end - processing_start).total_seconds() * 1000
@@ -458,15 +517,13 @@ class TelemetryService:
             end_time = calculation_start
             start_time = end_time - timedelta(hours=time_range_hours)
             
-            # Retrieve heartbeat history
-            heartbeat_cursor = self.heartbeats_collection.find({
-                "agent_id": agent_id,
-                "timestamp": {"$gte": start_time, "$lte": end_time}
-            }).sort("timestamp", 1)
+            # Make buffered heartbeats visible before reading history
+            await self.flush_heartbeats()
             
-            heartbeats = await heartbeat_cursor.to_list(length=None)
+            # Heartbeat totals from the coarsest rollups covering the window
+            heartbeat_totals = await self._heartbeat_rollups.get_uptime_totals(agent_id, start_time, end_time)
             
-            if not heartbeats:
+            if not heartbeat_totals["count"]:
                 raise HealthCheckFailedError(
                     f"No heartbeat data found for agent {agent_id} in the last {time_range_hours} hours",
                     target_id=agent_id,
@@ -474,7 +531,7 @@ class TelemetryService:
                 )
             
             # Calculate uptime metrics
-            uptime_analysis = await self._analyze_uptime_sessions(heartbeats, start_time, end_time, bound_logger)
+            uptime_analysis = await self._analyze_uptime_sessions(heartbeat_totals, start_time, end_time, bound_logger)
             
             # Determine overall health status
             overall_health = await self._determine_overall_health_status(agent_id, uptime_analysis, bound_logger)
@@ -586,41 +643,78 @@ class TelemetryService:
         
         logger.debug("Metrics data validation passed")
     
-    async def _calculate_adaptive_timeout(self, agent_id: str, current_interval_ms: int, logger) -> int:
-        """Calculate adaptive timeout based on historical heartbeat intervals"""
+    async def _get_agent_state(self, agent_id: str, logger) -> AgentHeartbeatState:
+        """
+        Get in-memory heartbeat state for an agent.
+        
+        Loaded from MongoDB only the first time an agent is seen by this
+        process (or after it was evicted); afterwards heartbeats for the
+        agent do not read from the database.
+        """
+        state = self._heartbeat_state.get(agent_id)
+        if state is not None:
+            return state
+        
         try:
-            # Get recent heartbeat intervals
-            recent_heartbeats = await self.heartbeats_collection.find({
-                "agent_id": agent_id
-            }).sort("timestamp", -1).limit(10).to_list(length=10)
-            
-            if len(recent_heartbeats) < 2:
-                # Not enough history, use default multiplier
-                return int(current_interval_ms * 3)
-            
-            # Calculate interval variations
-            intervals = []
-            for i in range(1, len(recent_heartbeats)):
-                prev_time = recent_heartbeats[i]["timestamp"]
-                curr_time = recent_heartbeats[i-1]["timestamp"]
-                interval_ms = (curr_time - prev_time).total_seconds() * 1000
-                intervals.append(interval_ms)
-            
-            # Calculate adaptive timeout (mean + 2 * std deviation)
-            import statistics
-            mean_interval = statistics.mean(intervals)
-            std_dev = statistics.stdev(intervals) if len(intervals) > 1 else 0
-            adaptive_timeout = int(mean_interval + (2 * std_dev))
-            
-            # Ensure minimum timeout
-            min_timeout = current_interval_ms * 2
-            max_timeout = current_interval_ms * 5
-            
-            return max(min_timeout, min(adaptive_timeout, max_timeout))
-            
-        except Exception as e:
-            logger.warning("Failed to calculate adaptive timeout, using default", extra={"error": str(e)})
-            return int(current_interval_ms * 3)
+            async with self._heartbeat_state.load_lock(agent_id):
+                state = self._heartbeat_state.get(agent_id)
+                if state is not None:
+                    return state
+                
+                # Buffered heartbeats of an evicted agent must be stored before reloading it
+                if self._heartbeat_state.pending_count:
+                    await self.flush_heartbeats()
+                
+                state = AgentHeartbeatState(agent_id, self._heartbeat_state.interval_window)
+                try:
+                    recent_heartbeats = await self.heartbeats_collection.find(
+                        {"agent_id": agent_id},
+                        {"timestamp": 1, "sequence_number": 1}
+                    ).sort("timestamp", -1).limit(state.intervals.maxlen + 1).to_list(length=None)
+                    
+                    last_sequence = await self.heartbeats_collection.find_one(
+                        {"agent_id": agent_id},
+                        {"sequence_number": 1},
+                        sort=[("sequence_number", -1)]
+                    )
+                    if last_sequence:
+                        state.last_sequence_number = last_sequence.get("sequence_number", 0)
+                    
+                    for heartbeat in reversed(recent_heartbeats):
+                        state.record_timestamp(heartbeat["timestamp"])
+                    
+                    current_session = await self.uptime_logs_collection.find_one({
+                        "target_id": agent_id,
+                        "is_active": True
+                    })
+                    if current_session:
+                        state.session = {
+                            "uptime_session_id": current_session["uptime_session_id"],
+                            "session_type": current_session["session_type"],
+                            "session_start": current_session["session_start"],
+                            "environment": current_session.get("environment", "unknown")
+                        }
+                except Exception as e:
+                    # Not cached, so the next heartbeat retries the load instead of restarting the sequence
+                    logger.error("Failed to load agent heartbeat state", extra={"error": str(e)})
+                    raise
+                
+                self._heartbeat_state.state_loads += 1
+                self._heartbeat_state.put(state)
+                return state
+        finally:
+            self._heartbeat_state.release_load_lock(agent_id)
+    
+    async def flush_heartbeats(self) -> int:
+        """
+        Write buffered heartbeats and uptime session changes.
+        
+        Returns:
+            Number of heartbeats written
+        """
+        if not self._heartbeat_state.pending_count:
+            return 0
+        return await self._heartbeat_state.flush(self.heartbeats_collection, self.uptime_logs_collection)
     
     async def _assess_agent_health(self, data: HeartbeatRequestSchema, logger) -> tuple[HealthStatus, float]:
         """Assess agent health based on heartbeat metrics"""
@@ -721,70 +815,52 @@ class TelemetryService:
         
         return alerts
     
-    async def _get_next_sequence_number(self, agent_id: str) -> int:
-        """Get next sequence number for agent heartbeat"""
-        last_heartbeat = await self.heartbeats_collection.find_one(
-            {"agent_id": agent_id},
-            sort=[("sequence_number", -1)]
+    def _update_uptime_tracking(
+        self,
+        agent_state: AgentHeartbeatState,
+        health_status: HealthStatus,
+        timestamp: datetime,
+        environment: str
+    ) -> None:
+        """Update the agent's uptime session, buffering any session change"""
+        is_healthy = health_status in [HealthStatus.HEALTHY, HealthStatus.DEGRADED]
+        session_type = "uptime" if is_healthy else "downtime"
+        current_session = agent_state.session
+        
+        if current_session:
+            if current_session["session_type"] == session_type:
+                return
+            
+            # End current session
+            self._heartbeat_state.buffer_uptime_operation(UpdateOne(
+                {"uptime_session_id": current_session["uptime_session_id"]},
+                {
+                    "$set": {
+                        "session_end": timestamp,
+                        "is_active": False,
+                        "duration": timestamp - current_session["session_start"]
+                    }
+                }
+            ))
+            environment = current_session.get("environment", environment)
+        
+        # Start new session
+        new_session = UptimeLogModel(
+            uptime_session_id=str(uuid.uuid4()),
+            target_id=agent_state.agent_id,
+            target_type="agent",
+            session_start=timestamp,
+            session_type=session_type,
+            environment=environment or "unknown"
         )
+        self._heartbeat_state.buffer_uptime_operation(InsertOne(new_session.model_dump()))
         
-        return (last_heartbeat.get("sequence_number", 0) + 1) if last_heartbeat else 1
-    
-    async def _update_uptime_tracking(self, agent_id: str, health_status: HealthStatus, timestamp: datetime, logger) -> None:
-        """Update uptime tracking based on current health status"""
-        try:
-            # Find current active uptime session
-            current_session = await self.uptime_logs_collection.find_one({
-                "target_id": agent_id,
-                "is_active": True
-            })
-            
-            is_healthy = health_status in [HealthStatus.HEALTHY, HealthStatus.DEGRADED]
-            
-            if current_session:
-                session_type = current_session["session_type"]
-                
-                # Check if we need to end current session
-                if (session_type == "uptime" and not is_healthy) or (session_type == "downtime" and is_healthy):
-                    # End current session
-                    await self.uptime_logs_collection.update_one(
-                        {"_id": current_session["_id"]},
-                        {
-                            "$set": {
-                                "session_end": timestamp,
-                                "is_active": False,
-                                "duration": timestamp - current_session["session_start"]
-                            }
-                        }
-                    )
-                    
-                    # Start new session
-                    new_session = UptimeLogModel(
-                        uptime_session_id=str(uuid.uuid4()),
-                        target_id=agent_id,
-                        target_type="agent",
-                        session_start=timestamp,
-                        session_type="uptime" if is_healthy else "downtime",
-                        environment=current_session.get("environment", "unknown")
-                    )
-                    
-                    await self.uptime_logs_collection.insert_one(new_session.model_dump())
-            
-            else:
-                # No active session, start new one
-                new_session = UptimeLogModel(
-                    uptime_session_id=str(uuid.uuid4()),
-                    target_id=agent_id,
-                    target_type="agent",
-                    session_start=timestamp,
-                    session_type="uptime" if is_healthy else "downtime",
-                    environment="unknown"
-                )
-                
-                await self.uptime_logs_collection.insert_one(new_session.model_dump())
-            
-        except Exception as e:
-            logger.warning("Failed to update uptime tracking", extra={"error": str(e)})
+        agent_state.session = {
+            "uptime_session_id": new_session.uptime_session_id,
+            "session_type": session_type,
+            "session_start": timestamp,
+            "environment": new_session.environment
+        }
     
     async def _calculate_data_quality_score(self, data: HeartbeatRequestSchema) -> float:
         """Calculate data quality score based on completeness and validity"""
@@ -844,33 +920,93 @@ class TelemetryService:
         return max(0.0, score)
     
     async def _detect_metric_outlier(self, metric_data, system_id: str) -> bool:
-        """Detect if metric value is an outlier based on historical data"""
+        """Detect if metric value is an outlier based on the series statistics"""
+        series_statistics = await self._get_series_statistics(system_id, {metric_data.metric_name})
+        stats = series_statistics.get(metric_data.metric_name)
+        if not stats:
+            return False  # Not enough data
+        
+        return stats.is_outlier(metric_data.value, self._outlier_min_samples, self._outlier_z_threshold)
+    
+    async def _get_series_statistics(
+        self,
+        system_id: str,
+        metric_names: set
+    ) -> Dict[str, SeriesStatistics]:
+        """
+        Get running statistics for a set of series on one system.
+        
+        Series not held in memory are restored from their last snapshot;
+        series without a snapshot are seeded from recent history with a
+        single aggregation.
+        """
+        keys = [(system_id, name) for name in metric_names]
+        missing = self._series_statistics.missing(keys)
+        if missing:
+            try:
+                missing = await self._series_statistics.load_snapshots(missing)
+            except Exception as e:
+                self.logger.warning("Failed to load metric series statistics", extra={
+                    "system_id": system_id,
+                    "error": str(e)
+                })
+        if missing:
+            await self._bootstrap_series_statistics(system_id, [key[1] for key in missing])
+        
+        series_statistics = {}
+        for name in metric_names:
+            stats = self._series_statistics.get((system_id, name))
+            if stats is not None:
+                series_statistics[name] = stats
+        return series_statistics
+    
+    async def _bootstrap_series_statistics(self, system_id: str, metric_names: List[str]) -> None:
+        """Seed statistics for several series from their most recent values in one aggregation"""
         try:
-            # Get recent values for this metric
-            recent_metrics = await self.metrics_collection.find({
+            pipeline = [
+                {"$match": {
+                    "system_id": system_id,
+                    "metric_name": {"$in": metric_names},
+                    "timestamp": {"$gte": datetime.now(timezone.utc) - timedelta(hours=24)}
+                }},
+                # $topN keeps only the newest values per series while grouping,
+                # so memory is bounded by the window rather than 24h of samples
+                {"$group": {"_id": "$metric_name", "values": {"$topN": {
+                    "n": self._outlier_bootstrap_size,
+                    "sortBy": {"timestamp": -1},
+                    "output": "$value"
+                }}}}
+            ]
+            results = await self.metrics_collection.aggregate(pipeline).to_list(length=None)
+        except Exception as e:
+            self.logger.warning("Failed to load metric series history", extra={
                 "system_id": system_id,
-                "metric_name": metric_data.metric_name,
-                "timestamp": {"$gte": datetime.now(timezone.utc) - timedelta(hours=24)}
-            }).limit(100).to_list(length=100)
-            
-            if len(recent_metrics) < 10:
-                return False  # Not enough data
-            
-            values = [m["value"] for m in recent_metrics]
-            
-            # Simple outlier detection using IQR
-            import statistics
-            q1 = statistics.quantiles(values, n=4)[0]
-            q3 = statistics.quantiles(values, n=4)[2]
-            iqr = q3 - q1
-            
-            lower_bound = q1 - 1.5 * iqr
-            upper_bound = q3 + 1.5 * iqr
-            
-            return metric_data.value < lower_bound or metric_data.value > upper_bound
-            
-        except Exception:
-            return False
+                "error": str(e)
+            })
+            return
+        
+        values_by_name = {result["_id"]: result["values"] for result in results}
+        for name in metric_names:
+            # Stored newest first; estimators are fed oldest first
+            stats = SeriesStatistics()
+            for value in reversed(values_by_name.get(name, [])):
+                stats.add(value, self._series_statistics.ewma_alpha)
+            self._series_statistics.put((system_id, name), stats)
+    
+    async def snapshot_series_statistics(self) -> int:
+        """
+        Persist changed per-series statistics so they survive a restart.
+        
+        Returns:
+            Number of series written
+        """
+        try:
+            return await self._series_statistics.snapshot()
+        except Exception as e:
+            self.logger.warning("Failed to snapshot metric series statistics", extra={
+                "error": str(e)
+            })
+            return 0
     
     async def _check_metric_thresholds(self, metric_data, system_id: str) -> Dict[str, Any]:
         """Check metric against thresholds and generate alerts if needed"""
@@ -912,22 +1048,13 @@ class TelemetryService:
         
         return result
     
-    async def _analyze_uptime_sessions(self, heartbeats: List[Dict], start_time: datetime, end_time: datetime, logger) -> Dict[str, Any]:
-        """Analyze heartbeat data to calculate uptime sessions and availability metrics"""
+    async def _analyze_uptime_sessions(self, heartbeat_totals: Dict[str, Any], start_time: datetime, end_time: datetime, logger) -> Dict[str, Any]:
+        """Analyze heartbeat totals to calculate uptime sessions and availability metrics"""
         total_period_minutes = (end_time - start_time).total_seconds() / 60
+        heartbeat_count = heartbeat_totals["count"]
         
-        # Simple uptime calculation based on heartbeat presence
-        heartbeat_timestamps = [hb["timestamp"] for hb in heartbeats]
-        heartbeat_timestamps.sort()
-        
-        # Calculate gaps between heartbeats
-        gaps = []
-        for i in range(1, len(heartbeat_timestamps)):
-            gap = (heartbeat_timestamps[i] - heartbeat_timestamps[i-1]).total_seconds()
-            gaps.append(gap)
-        
-        # Estimate downtime (gaps > 2 minutes indicate potential downtime)
-        downtime_seconds = sum(gap for gap in gaps if gap > 120)  # 2 minutes threshold
+        # Estimate downtime (gaps > 2 minutes between heartbeats indicate potential downtime)
+        downtime_seconds = heartbeat_totals["gap_minutes"] * 60
         uptime_seconds = (total_period_minutes * 60) - downtime_seconds
         
         uptime_percentage = (uptime_seconds / (total_period_minutes * 60)) * 100
@@ -939,8 +1066,8 @@ class TelemetryService:
             "total_downtime_minutes": downtime_seconds / 60,
             "uptime_sessions": [],  # Simplified for now
             "downtime_periods": [],  # Simplified for now
-            "data_quality_score": 1.0 if len(heartbeats) > 10 else 0.7,
-            "confidence_level": 1.0 if len(heartbeats) > 50 else 0.8
+            "data_quality_score": 1.0 if heartbeat_count > 10 else 0.7,
+            "confidence_level": 1.0 if heartbeat_count > 50 else 0.8
         }
     
     async def _determine_overall_health_status(self, agent_id: str, uptime_analysis: Dict, logger) -> HealthStatus:
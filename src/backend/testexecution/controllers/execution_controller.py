@@ -25,7 +25,7 @@ from ..services import (
     ExecutionStateService,
     ExecutionStateServiceFactory,
     ExecutionQueueService,
-    ExecutionQueueServiceFactory,
+    get_execution_queue_service,
     ExecutionMonitoringService,
     ExecutionMonitoringServiceFactory,
     ResultProcessorService,
@@ -636,7 +636,7 @@ class ExecutionControllerFactory:
         execution_service = ExecutionServiceFactory.create(database)
         orchestrator = ExecutionOrchestratorFactory.create(database)
         state_service = ExecutionStateServiceFactory.create(database)
-        queue_service = ExecutionQueueServiceFactory.create(database)
+        queue_service = get_execution_queue_service(database)
         monitoring_service = ExecutionMonitoringServiceFactory.create(database)
         result_processor = ResultProcessorServiceFactory.create(database)
         
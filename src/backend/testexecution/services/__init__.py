@@ -18,7 +18,11 @@ from .execution_orchestrator import ExecutionOrchestrator, ExecutionOrchestrator
 from .execution_state_service import ExecutionStateService, ExecutionStateServiceFactory
 from .test_runner_service import TestRunnerService, TestRunnerServiceFactory
 from .result_processor_service import ResultProcessorService, ResultProcessorServiceFactory
-from .execution_queue_service import ExecutionQueueService, ExecutionQueueServiceFactory
+from .execution_queue_service import (
+    ExecutionQueueService,
+    ExecutionQueueServiceFactory,
+    get_execution_queue_service
+)
 from .execution_monitoring_service import ExecutionMonitoringService, ExecutionMonitoringServiceFactory
 
 __all__ = [
@@ -38,5 +42,8 @@ __all__ = [
     "TestRunnerServiceFactory",
     "ResultProcessorServiceFactory",
     "ExecutionQueueServiceFactory",
-    "ExecutionMonitoringServiceFactory"
+    "ExecutionMonitoringServiceFactory",
+    
+    # Shared Instances
+    "get_execution_queue_service"
 ] 
\ No newline at end of file
@@ -13,12 +13,17 @@ Implements scalable queue architecture for high-volume execution processing.
 
 import logging
 import asyncio
+import os
+import socket
+from uuid import uuid4
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any, AsyncIterator
+from typing import Dict, List, Optional, Any, AsyncIterator, Tuple
 from enum import Enum
 import json
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from ..models.execution_trace_model import (
     ExecutionStatus,
@@ -68,6 +73,10 @@ class ExecutionQueueItem:
         self.retry_count = retry_count
         self.max_retries = max_retries
         self.processing_started_at: Optional[datetime] = None
+        self.lease_owner: Optional[str] = None
+        self.lease_expires_at: Optional[datetime] = None
+        # Identifies one claim; not part of to_dict so a requeue never carries it over
+        self.lease_token: Optional[str] = None
         self.last_error: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
@@ -82,6 +91,8 @@ class ExecutionQueueItem:
             "retry_count": self.retry_count,
             "max_retries": self.max_retries,
             "processing_started_at": self.processing_started_at.isoformat() if self.processing_started_at else None,
+            "lease_owner": self.lease_owner,
+            "lease_expires_at": self.lease_expires_at.isoformat() if self.lease_expires_at else None,
             "last_error": self.last_error
         }
     
@@ -100,10 +111,74 @@ class ExecutionQueueItem:
         item.queued_at = datetime.fromisoformat(data["queued_at"])
         if data.get("processing_started_at"):
             item.processing_started_at = datetime.fromisoformat(data["processing_started_at"])
+        item.lease_owner = data.get("lease_owner")
+        if data.get("lease_expires_at"):
+            item.lease_expires_at = datetime.fromisoformat(data["lease_expires_at"])
+        item.lease_token = data.get("lease_token")
         item.last_error = data.get("last_error")
         return item
 
 
+class QueueMetricsBuffer:
+    """
+    In-memory accumulator for queue operation counters.
+    
+    Counts are grouped by time bucket, operation, execution type and priority
+    and written out as pre-aggregated documents, so a burst of queue events
+    costs one bulk write per flush instead of one insert per event.
+    """
+    
+    def __init__(self, bucket_seconds: int = 60):
+        self.bucket_seconds = bucket_seconds
+        self._counters: Dict[Tuple[datetime, str, Any, Optional[int]], int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._counters)
+    
+    def record(
+        self,
+        operation: str,
+        execution_type: ExecutionType,
+        priority: Optional[QueuePriority] = None,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """Increment the counter for an operation in its time bucket."""
+        timestamp = timestamp or datetime.now(timezone.utc)
+        epoch_seconds = int(timestamp.timestamp())
+        bucket_start = datetime.fromtimestamp(
+            epoch_seconds - epoch_seconds % self.bucket_seconds, tz=timezone.utc
+        )
+        key = (bucket_start, operation, execution_type, priority.value if priority else None)
+        self._counters[key] = self._counters.get(key, 0) + 1
+    
+    def drain(self) -> Dict[Tuple[datetime, str, Any, Optional[int]], int]:
+        """Remove and return all buffered counters."""
+        counters, self._counters = self._counters, {}
+        return counters
+    
+    def restore(self, counters: Dict[Tuple[datetime, str, Any, Optional[int]], int]) -> None:
+        """Put back counters from a flush that failed to be written."""
+        for key, count in counters.items():
+            self._counters[key] = self._counters.get(key, 0) + count
+    
+    def to_operations(self, counters: Dict[Tuple[datetime, str, Any, Optional[int]], int]) -> List[UpdateOne]:
+        """Convert drained counters into $inc upserts on bucket documents."""
+        return [
+            UpdateOne(
+                {
+                    "bucket_start": bucket_start,
+                    "bucket_seconds": self.bucket_seconds,
+                    "operation": operation,
+                    "execution_type": execution_type,
+                    "priority": priority
+                },
+                {"$inc": {"count": count}},
+                upsert=True
+            )
+            for (bucket_start, operation, execution_type, priority), count in counters.items()
+        ]
+
+
 class ExecutionQueueService:
     """
     Service for managing execution queue with priority handling and background processing.
@@ -112,7 +187,7 @@ class ExecutionQueueService:
     retry logic, dead letter queue handling, and comprehensive monitoring.
     """
     
-    def __init__(self, database: AsyncIOMotorDatabase):
+    def __init__(self, database: AsyncIOMotorDatabase, enable_change_stream: bool = False):
         self.database = database
         self.queue_collection = database.execution_queue
         self.dead_letter_collection = database.execution_dead_letter_queue
@@ -122,11 +197,40 @@ class ExecutionQueueService:
         self.max_concurrent_executions = 10
         self.queue_status = QueueStatus.ACTIVE
         self.processing_timeout_minutes = 30
+        self.lease_renewal_interval_seconds = 300.0
+        self.max_claim_batch_size = 5
+        
+        # Lease ownership - identifies this worker when several replicas share one queue
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        
+        # Metrics buffering - counters are flushed as aggregated time buckets
+        self.metrics_flush_interval_seconds = 10.0
+        self.max_buffered_metric_keys = 500
+        self._metrics_buffer = QueueMetricsBuffer(bucket_seconds=60)
+        self._metrics_flush_task: Optional[asyncio.Task] = None
+        
+        # Status snapshot cache - refreshed after TTL, or sooner once a mutation marks it dirty
+        self.status_cache_ttl_seconds = 2.0
+        self.status_min_refresh_seconds = 0.25
+        self._status_snapshot: Optional[Dict[str, Any]] = None
+        self._status_snapshot_at = 0.0
+        self._status_snapshot_dirty = False
+        self._status_refresh_lock = asyncio.Lock()
+        
+        # Idle backoff - only applies while no ready items are found
+        self.min_idle_wait_seconds = 0.05
+        self.max_idle_wait_seconds = 5.0
+        self.timeout_check_interval_seconds = 5.0
         
         # Background processing
         self._processing_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
         
+        # Wakeup signalling - set by local queue mutations or the change stream watcher
+        self._wakeup_event = asyncio.Event()
+        self.enable_change_stream = enable_change_stream
+        self._change_stream_task: Optional[asyncio.Task] = None
+        
         logger.info("ExecutionQueueService initialized")
     
     async def enqueue_execution(
@@ -164,6 +268,7 @@ class ExecutionQueueService:
             
             # Store in queue collection
             await self.queue_collection.insert_one(queue_item.to_dict())
+            self._mark_queue_mutated()
             
             # Update queue metrics
             await self._update_queue_metrics("enqueued", execution_type, priority)
@@ -179,6 +284,11 @@ class ExecutionQueueService:
         """
         Dequeue next execution based on priority and schedule.
         
+        The claim is a single atomic find_one_and_update, so concurrent workers
+        never receive the same item. The claimed item carries a lease owned by
+        this worker that expires after processing_timeout_minutes unless renewed;
+        its lease_token must be passed back when completing or retrying it.
+        
         Returns:
             ExecutionQueueItem: Next execution to process or None if queue is empty
         """
@@ -186,29 +296,21 @@ class ExecutionQueueService:
             if self.queue_status != QueueStatus.ACTIVE:
                 return None
             
-            # Find next item to process (priority + scheduled time)
             current_time = datetime.now(timezone.utc)
             
-            # Query for ready items, ordered by priority then scheduled time
-            cursor = self.queue_collection.find({
-                "scheduled_at": {"$lte": current_time.isoformat()},
-                "processing_started_at": None
-            }).sort([("priority", 1), ("scheduled_at", 1)]).limit(1)
-            
-            doc = await cursor.to_list(length=1)
-            if not doc:
+            # Claim the highest priority ready item in one round trip
+            item_doc = await self.queue_collection.find_one_and_update(
+                self._claimable_query(current_time),
+                {"$set": self._lease_fields(current_time)},
+                sort=[("priority", 1), ("scheduled_at", 1)],
+                return_document=ReturnDocument.AFTER
+            )
+            if not item_doc:
                 return None
+            self._status_snapshot_dirty = True
             
-            item_doc = doc[0]
             queue_item = ExecutionQueueItem.from_dict(item_doc)
             
-            # Mark as processing
-            queue_item.processing_started_at = current_time
-            await self.queue_collection.update_one(
-                {"_id": item_doc["_id"]},
-                {"$set": {"processing_started_at": current_time.isoformat()}}
-            )
-            
             logger.debug(f"Dequeued execution: {queue_item.execution_id}")
             return queue_item
             
@@ -216,42 +318,138 @@ class ExecutionQueueService:
             logger.error(f"Failed to dequeue execution: {str(e)}")
             return None
     
-    async def complete_execution(self, execution_id: str, success: bool, error_message: Optional[str] = None) -> None:
+    async def claim_many(self, n: int) -> List[ExecutionQueueItem]:
+        """
+        Claim up to n ready executions for this worker.
+        
+        Candidates are selected by priority and schedule, then leased with a
+        single update_many guarded by processing_started_at, so items already
+        claimed by another worker are skipped rather than double-claimed.
+        The cost is three round trips regardless of n.
+        
+        Args:
+            n: Maximum number of executions to claim
+            
+        Returns:
+            List of claimed executions ordered by priority and schedule
+        """
+        if n <= 0:
+            return []
+        if n == 1:
+            queue_item = await self.dequeue_execution()
+            return [queue_item] if queue_item else []
+        
+        try:
+            if self.queue_status != QueueStatus.ACTIVE:
+                return []
+            
+            current_time = datetime.now(timezone.utc)
+            query = self._claimable_query(current_time)
+            
+            cursor = self.queue_collection.find(query, {"_id": 1}).sort(
+                [("priority", 1), ("scheduled_at", 1)]
+            ).limit(n)
+            candidate_ids = [doc["_id"] for doc in await cursor.to_list(length=n)]
+            if not candidate_ids:
+                return []
+            
+            # Lease candidates atomically per document; the token identifies this batch
+            lease_fields = self._lease_fields(current_time)
+            lease_token = lease_fields["lease_token"]
+            result = await self.queue_collection.update_many(
+                {**query, "_id": {"$in": candidate_ids}},
+                {"$set": lease_fields}
+            )
+            if result.modified_count == 0:
+                return []
+            self._status_snapshot_dirty = True
+            
+            cursor = self.queue_collection.find({"lease_token": lease_token}).sort(
+                [("priority", 1), ("scheduled_at", 1)]
+            )
+            claimed = [
+                ExecutionQueueItem.from_dict(doc)
+                for doc in await cursor.to_list(length=result.modified_count)
+            ]
+            
+            logger.debug(f"Claimed {len(claimed)} executions (requested {n})")
+            return claimed
+            
+        except Exception as e:
+            logger.error(f"Failed to claim executions: {str(e)}")
+            return []
+    
+    async def complete_execution(
+        self,
+        execution_id: str,
+        success: bool,
+        error_message: Optional[str] = None,
+        lease_token: Optional[str] = None
+    ) -> bool:
         """
         Mark execution as completed and remove from queue.
         
+        With a lease token the item is only completed while this worker still
+        holds that lease; once it expired and another worker reclaimed the
+        item, the stale completion is ignored.
+        
         Args:
             execution_id: Execution identifier
             success: Whether execution was successful
             error_message: Error message if execution failed
+            lease_token: Lease token of the claim being completed
+            
+        Returns:
+            bool: True if the queue item was completed, retried or dead-lettered
         """
         try:
             logger.debug(f"Completing execution: {execution_id} (success: {success})")
             
             # Find queue item
-            item_doc = await self.queue_collection.find_one({"execution_id": execution_id})
+            lease_query = self._lease_query(execution_id, lease_token)
+            item_doc = await self.queue_collection.find_one(lease_query)
             if not item_doc:
-                logger.warning(f"Queue item not found for completion: {execution_id}")
-                return
+                logger.warning(f"Queue item not found or lease lost for completion: {execution_id}")
+                return False
             
             if success:
                 # Remove from queue on success
-                await self.queue_collection.delete_one({"execution_id": execution_id})
-                await self._update_queue_metrics("completed", ExecutionType(item_doc["execution_type"]))
-            else:
-                # Handle failure - retry or move to dead letter queue
-                await self._handle_execution_failure(execution_id, error_message)
+                result = await self.queue_collection.delete_one(lease_query)
+                if result.deleted_count == 0:
+                    logger.warning(f"Lease lost before completion: {execution_id}")
+                    return False
+                self._mark_queue_mutated()  # A processing slot was freed
+                await self._update_queue_metrics(
+                    "completed",
+                    ExecutionType(item_doc["execution_type"]),
+                    QueuePriority(item_doc["priority"])
+                )
+                return True
+            
+            # Handle failure - retry or move to dead letter queue
+            return await self.retry_execution(execution_id, error_message, lease_token)
             
         except Exception as e:
             logger.error(f"Failed to complete execution: {execution_id} - {str(e)}")
+            return False
     
-    async def retry_execution(self, execution_id: str, error_message: Optional[str] = None) -> bool:
+    async def retry_execution(
+        self,
+        execution_id: str,
+        error_message: Optional[str] = None,
+        lease_token: Optional[str] = None
+    ) -> bool:
         """
         Retry failed execution if retry limit not exceeded.
         
+        The requeue is conditional on the claim and lease expiry that were read,
+        so it does not release an item another worker reclaimed, or whose owner
+        renewed its lease, in the meantime.
+        
         Args:
             execution_id: Execution identifier
             error_message: Error message from failed execution
+            lease_token: Lease token of the claim being retried
             
         Returns:
             bool: True if execution was queued for retry
@@ -260,32 +458,44 @@ class ExecutionQueueService:
             logger.info(f"Retrying execution: {execution_id}")
             
             # Find queue item
-            item_doc = await self.queue_collection.find_one({"execution_id": execution_id})
+            item_doc = await self.queue_collection.find_one(self._lease_query(execution_id, lease_token))
             if not item_doc:
-                logger.warning(f"Queue item not found for retry: {execution_id}")
+                logger.warning(f"Queue item not found or lease lost for retry: {execution_id}")
                 return False
             
             queue_item = ExecutionQueueItem.from_dict(item_doc)
+            claim_query = {
+                **self._lease_query(execution_id, lease_token),
+                "processing_started_at": item_doc.get("processing_started_at"),
+                "lease_expires_at": item_doc.get("lease_expires_at")
+            }
             
             # Check retry limit
             if queue_item.retry_count >= queue_item.max_retries:
                 logger.warning(f"Retry limit exceeded for execution: {execution_id}")
-                await self._move_to_dead_letter_queue(queue_item, "Retry limit exceeded")
+                reason = f"Retry limit exceeded: {error_message}" if error_message else "Retry limit exceeded"
+                await self._move_to_dead_letter_queue(queue_item, reason, claim_query)
                 return False
             
             # Increment retry count and reset processing state
             queue_item.retry_count += 1
             queue_item.processing_started_at = None
+            queue_item.lease_owner = None
+            queue_item.lease_expires_at = None
             queue_item.last_error = error_message
             queue_item.scheduled_at = datetime.now(timezone.utc) + timedelta(minutes=queue_item.retry_count * 2)  # Exponential backoff
             
             # Update in database
-            await self.queue_collection.update_one(
-                {"execution_id": execution_id},
-                {"$set": queue_item.to_dict()}
+            result = await self.queue_collection.update_one(
+                claim_query,
+                {"$set": queue_item.to_dict(), "$unset": {"lease_token": ""}}
             )
+            if result.matched_count == 0:
+                logger.warning(f"Lease lost before retry: {execution_id}")
+                return False
+            self._mark_queue_mutated()
             
-            await self._update_queue_metrics("retried", ExecutionType(item_doc["execution_type"]))
+            await self._update_queue_metrics("retried", queue_item.execution_type, queue_item.priority)
             
             logger.info(f"Execution queued for retry: {execution_id} (attempt {queue_item.retry_count})")
             return True
@@ -294,43 +504,45 @@ class ExecutionQueueService:
             logger.error(f"Failed to retry execution: {execution_id} - {str(e)}")
             return False
     
+    async def renew_lease(self, execution_id: str, lease_token: str) -> bool:
+        """
+        Extend this worker's lease on a claimed execution.
+        
+        Args:
+            execution_id: Execution identifier
+            lease_token: Lease token of the claim
+            
+        Returns:
+            bool: True if the lease is still held and was extended
+        """
+        try:
+            lease_expires_at = datetime.now(timezone.utc) + timedelta(minutes=self.processing_timeout_minutes)
+            result = await self.queue_collection.update_one(
+                self._lease_query(execution_id, lease_token),
+                {"$set": {"lease_expires_at": lease_expires_at.isoformat()}}
+            )
+            return result.matched_count == 1
+            
+        except Exception as e:
+            logger.error(f"Failed to renew lease: {execution_id} - {str(e)}")
+            return False
+    
     async def get_queue_status(self) -> Dict[str, Any]:
         """
         Get current queue status and metrics.
         
+        Counts come from a cached snapshot built by a single $facet
+        aggregation, so frequent polling does not scale with queue depth.
+        
         Returns:
             Queue status information
         """
         try:
-            # Count items by status
-            total_queued = await self.queue_collection.count_documents({})
-            processing = await self.queue_collection.count_documents({"processing_started_at": {"$ne": None}})
-            pending = total_queued - processing
-            
-            # Count by priority
-            priority_counts = {}
-            for priority in QueuePriority:
-                count = await self.queue_collection.count_documents({"priority": priority.value})
-                priority_counts[priority.name] = count
-            
-            # Get oldest queued item
-            oldest_cursor = self.queue_collection.find({}).sort("queued_at", 1).limit(1)
-            oldest_docs = await oldest_cursor.to_list(length=1)
-            oldest_queued_at = None
-            if oldest_docs:
-                oldest_queued_at = oldest_docs[0]["queued_at"]
-            
-            # Dead letter queue count
-            dead_letter_count = await self.dead_letter_collection.count_documents({})
+            snapshot = await self._get_status_snapshot()
             
             return {
                 "queue_status": self.queue_status,
-                "total_queued": total_queued,
-                "pending": pending,
-                "processing": processing,
-                "priority_distribution": priority_counts,
-                "oldest_queued_at": oldest_queued_at,
-                "dead_letter_count": dead_letter_count,
+                **snapshot,
                 "max_concurrent_executions": self.max_concurrent_executions,
                 "processing_timeout_minutes": self.processing_timeout_minutes,
                 "timestamp": datetime.now(timezone.utc).isoformat()
@@ -340,6 +552,59 @@ class ExecutionQueueService:
             logger.error(f"Failed to get queue status: {str(e)}")
             return {"error": str(e)}
     
+    async def ensure_indexes(self) -> None:
+        """
+        Ensure queue collection indexes are created for claim and status queries.
+        """
+        logger.info("Ensuring execution queue collection indexes")
+        
+        try:
+            await self.queue_collection.create_index(
+                [("processing_started_at", 1), ("priority", 1), ("scheduled_at", 1)],
+                name="claim_order_idx",
+                background=True
+            )
+            await self.queue_collection.create_index(
+                [("execution_id", 1)],
+                name="execution_id_idx",
+                background=True
+            )
+            await self.queue_collection.create_index(
+                [("lease_expires_at", 1)],
+                name="lease_expiry_idx",
+                background=True
+            )
+            await self.queue_collection.create_index(
+                [("lease_token", 1)],
+                name="lease_token_idx",
+                sparse=True,
+                background=True
+            )
+            await self.queue_collection.create_index(
+                [("queued_at", 1)],
+                name="queued_at_idx",
+                background=True
+            )
+            # One document per bucket key, so concurrent $inc upserts cannot fork a bucket
+            await self.queue_metrics_collection.create_index(
+                [
+                    ("bucket_start", 1),
+                    ("bucket_seconds", 1),
+                    ("operation", 1),
+                    ("execution_type", 1),
+                    ("priority", 1)
+                ],
+                name="metrics_bucket_key_idx",
+                unique=True,
+                background=True
+            )
+            
+            logger.info("Execution queue collection indexes initialized")
+            
+        except Exception as e:
+            logger.error(f"Failed to create execution queue indexes: {e}")
+            raise
+    
     async def start_background_processing(self) -> None:
         """Start background queue processing task."""
         if self._processing_task and not self._processing_task.done():
@@ -349,11 +614,25 @@ class ExecutionQueueService:
         logger.info("Starting background queue processing")
         self._shutdown_event.clear()
         self._processing_task = asyncio.create_task(self._background_processor())
+        
+        if self.enable_change_stream:
+            self._change_stream_task = asyncio.create_task(self._change_stream_watcher())
+        
+        await self.start_metrics_flush()
     
     async def stop_background_processing(self) -> None:
         """Stop background queue processing task."""
         logger.info("Stopping background queue processing")
         self._shutdown_event.set()
+        self._wakeup_event.set()
+        
+        if self._change_stream_task:
+            self._change_stream_task.cancel()
+            try:
+                await self._change_stream_task
+            except asyncio.CancelledError:
+                pass
+            self._change_stream_task = None
         
         if self._processing_task:
             try:
@@ -361,6 +640,54 @@ class ExecutionQueueService:
             except asyncio.TimeoutError:
                 logger.warning("Background processing task did not stop gracefully")
                 self._processing_task.cancel()
+        
+        await self.stop_metrics_flush()
+    
+    async def start_metrics_flush(self) -> None:
+        """Start the periodic queue metrics flush task."""
+        if self._metrics_flush_task and not self._metrics_flush_task.done():
+            return
+        
+        self._metrics_flush_task = asyncio.create_task(self._metrics_flush_loop())
+    
+    async def stop_metrics_flush(self) -> None:
+        """Stop the periodic flush task and write out any buffered metrics."""
+        if self._metrics_flush_task:
+            self._metrics_flush_task.cancel()
+            try:
+                await self._metrics_flush_task
+            except asyncio.CancelledError:
+                pass
+            self._metrics_flush_task = None
+        
+        await self.flush_queue_metrics()
+    
+    async def flush_queue_metrics(self) -> int:
+        """
+        Write buffered queue metrics as aggregated bucket documents.
+        
+        Returns:
+            Number of bucket documents written
+        """
+        counters = self._metrics_buffer.drain()
+        if not counters:
+            return 0
+        
+        keys = list(counters)
+        operations = self._metrics_buffer.to_operations(counters)
+        try:
+            await self.queue_metrics_collection.bulk_write(operations, ordered=False)
+            return len(operations)
+        except BulkWriteError as e:
+            # Only put back the buckets that were not written
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+            logger.error(f"Failed to flush {len(failed)} queue metric buckets")
+            self._metrics_buffer.restore({keys[index]: counters[keys[index]] for index in failed})
+            return len(operations) - len(failed)
+        except Exception as e:
+            logger.error(f"Failed to flush queue metrics: {str(e)}")
+            self._metrics_buffer.restore(counters)
+            return 0
     
     async def pause_queue(self) -> None:
         """Pause queue processing."""
@@ -371,6 +698,7 @@ class ExecutionQueueService:
         """Resume queue processing."""
         logger.info("Resuming queue processing")
         self.queue_status = QueueStatus.ACTIVE
+        self._wakeup_event.set()
     
     async def clear_queue(self, execution_type: Optional[ExecutionType] = None) -> int:
         """
@@ -389,6 +717,7 @@ class ExecutionQueueService:
             
             result = await self.queue_collection.delete_many(query)
             cleared_count = result.deleted_count
+            self._status_snapshot_dirty = True
             
             logger.info(f"Cleared {cleared_count} items from queue")
             return cleared_count
@@ -400,21 +729,43 @@ class ExecutionQueueService:
     # Private Helper Methods
     
     async def _background_processor(self) -> None:
-        """Background task for processing queue items."""
+        """
+        Background task for processing queue items.
+        
+        Claims work immediately after every wakeup signal. While the queue has
+        no ready items the idle wait backs off exponentially up to
+        max_idle_wait_seconds; any wakeup resets it.
+        """
         logger.info("Background queue processor started")
         
+        idle_wait = self.min_idle_wait_seconds
+        loop = asyncio.get_running_loop()
+        next_timeout_check = 0.0
+        
         try:
             while not self._shutdown_event.is_set():
                 try:
-                    # Check for timed out executions
-                    await self._handle_timed_out_executions()
+                    self._wakeup_event.clear()
+                    
+                    # Check for timed out executions on a fixed cadence
+                    if loop.time() >= next_timeout_check:
+                        await self._handle_timed_out_executions()
+                        next_timeout_check = loop.time() + self.timeout_check_interval_seconds
                     
                     # Process queue items if active
+                    claimed = 0
                     if self.queue_status == QueueStatus.ACTIVE:
-                        await self._process_queue_batch()
+                        claimed = await self._process_queue_batch()
+                    
+                    if claimed:
+                        idle_wait = self.min_idle_wait_seconds
+                        continue  # More ready items may be waiting
                     
-                    # Wait before next iteration
-                    await asyncio.sleep(5.0)  # 5 second polling interval
+                    woken = await self._wait_for_wakeup(idle_wait)
+                    if woken:
+                        idle_wait = self.min_idle_wait_seconds
+                    else:
+                        idle_wait = min(idle_wait * 2, self.max_idle_wait_seconds)
                     
                 except Exception as e:
                     logger.error(f"Error in background processor: {str(e)}")
@@ -427,27 +778,90 @@ class ExecutionQueueService:
         finally:
             logger.info("Background queue processor stopped")
     
-    async def _process_queue_batch(self) -> None:
-        """Process a batch of queue items."""
+    async def _wait_for_wakeup(self, timeout: float) -> bool:
+        """Wait for a queue mutation signal. Returns False if the wait timed out."""
+        try:
+            await asyncio.wait_for(self._wakeup_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def _change_stream_watcher(self) -> None:
+        """
+        Wake the processor on queue inserts and retries made by other processes.
+        
+        Requires a replica set or sharded cluster. If change streams are not
+        available the watcher stops and the processor keeps its idle polling.
+        """
+        pipeline = [
+            {"$match": {"$or": [
+                {"operationType": {"$in": ["insert", "replace"]}},
+                # Released for retry - the field is present and reset to null
+                {
+                    "operationType": "update",
+                    "updateDescription.updatedFields.processing_started_at": {"$exists": True, "$type": "null"}
+                }
+            ]}}
+        ]
+        
+        logger.info("Queue change stream watcher started")
+        try:
+            async with self.queue_collection.watch(pipeline) as stream:
+                async for _ in stream:
+                    self._mark_queue_mutated()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Queue change stream unavailable, falling back to polling: {str(e)}")
+        finally:
+            logger.info("Queue change stream watcher stopped")
+    
+    async def _metrics_flush_loop(self) -> None:
+        """Periodically flush buffered queue metrics until cancelled."""
+        while True:
+            try:
+                await asyncio.sleep(self.metrics_flush_interval_seconds)
+                await self.flush_queue_metrics()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in queue metrics flush loop: {str(e)}")
+    
+    async def _process_queue_batch(self) -> int:
+        """
+        Process a batch of queue items.
+        
+        Returns:
+            Number of items claimed
+        """
         # Check current processing count
         processing_count = await self.queue_collection.count_documents({"processing_started_at": {"$ne": None}})
         
         if processing_count >= self.max_concurrent_executions:
-            return  # At capacity
+            return 0  # At capacity
         
         # Process available slots
         available_slots = self.max_concurrent_executions - processing_count
         
-        for _ in range(min(available_slots, 5)):  # Process up to 5 items per batch
-            queue_item = await self.dequeue_execution()
-            if not queue_item:
-                break  # No more items to process
-            
+        claimed_items = await self.claim_many(min(available_slots, self.max_claim_batch_size))
+        
+        for queue_item in claimed_items:
             # Start execution processing (in real implementation, this would trigger actual execution)
             asyncio.create_task(self._simulate_execution_processing(queue_item))
+        
+        return len(claimed_items)
+    
+    async def _renew_lease_until_cancelled(self, queue_item: ExecutionQueueItem) -> None:
+        """Keep renewing a claimed item's lease while it is being processed."""
+        while True:
+            await asyncio.sleep(self.lease_renewal_interval_seconds)
+            if not await self.renew_lease(queue_item.execution_id, queue_item.lease_token):
+                logger.warning(f"Lease lost during processing: {queue_item.execution_id}")
+                return
     
     async def _simulate_execution_processing(self, queue_item: ExecutionQueueItem) -> None:
         """Simulate execution processing (placeholder for actual execution)."""
+        renewal_task = asyncio.create_task(self._renew_lease_until_cancelled(queue_item))
         try:
             logger.debug(f"Simulating execution processing: {queue_item.execution_id}")
             
@@ -459,21 +873,32 @@ class ExecutionQueueService:
             # Simulate success/failure (90% success rate)
             success = random.random() > 0.1
             
+            renewal_task.cancel()
             if success:
-                await self.complete_execution(queue_item.execution_id, True)
+                await self.complete_execution(queue_item.execution_id, True, lease_token=queue_item.lease_token)
             else:
-                await self.complete_execution(queue_item.execution_id, False, "Simulated execution failure")
+                await self.complete_execution(
+                    queue_item.execution_id, False, "Simulated execution failure", lease_token=queue_item.lease_token
+                )
             
         except Exception as e:
             logger.error(f"Execution processing failed: {queue_item.execution_id} - {str(e)}")
-            await self.complete_execution(queue_item.execution_id, False, str(e))
+            await self.complete_execution(queue_item.execution_id, False, str(e), lease_token=queue_item.lease_token)
+        finally:
+            renewal_task.cancel()
     
     async def _handle_timed_out_executions(self) -> None:
         """Handle executions that have timed out."""
-        timeout_threshold = datetime.now(timezone.utc) - timedelta(minutes=self.processing_timeout_minutes)
+        current_time = datetime.now(timezone.utc)
+        timeout_threshold = current_time - timedelta(minutes=self.processing_timeout_minutes)
         
         cursor = self.queue_collection.find({
-            "processing_started_at": {"$ne": None, "$lt": timeout_threshold.isoformat()}
+            "processing_started_at": {"$ne": None},
+            "$or": [
+                {"lease_expires_at": {"$lt": current_time.isoformat()}},
+                # Items claimed before leases were recorded
+                {"lease_expires_at": None, "processing_started_at": {"$lt": timeout_threshold.isoformat()}}
+            ]
         })
         
         async for doc in cursor:
@@ -481,23 +906,120 @@ class ExecutionQueueService:
             logger.warning(f"Execution timed out: {execution_id}")
             await self.retry_execution(execution_id, "Execution timed out")
     
-    async def _handle_execution_failure(self, execution_id: str, error_message: Optional[str]) -> None:
-        """Handle execution failure - retry or move to dead letter queue."""
-        item_doc = await self.queue_collection.find_one({"execution_id": execution_id})
-        if not item_doc:
-            return
+    def _mark_queue_mutated(self) -> None:
+        """Signal the processor and invalidate the status snapshot after a queue change."""
+        self._status_snapshot_dirty = True
+        self._wakeup_event.set()
+    
+    async def _get_status_snapshot(self) -> Dict[str, Any]:
+        """Return the cached status snapshot, rebuilding it when stale."""
+        loop = asyncio.get_running_loop()
         
-        queue_item = ExecutionQueueItem.from_dict(item_doc)
+        def is_fresh() -> bool:
+            if self._status_snapshot is None:
+                return False
+            age = loop.time() - self._status_snapshot_at
+            if self._status_snapshot_dirty:
+                return age < self.status_min_refresh_seconds
+            return age < self.status_cache_ttl_seconds
         
-        if queue_item.retry_count < queue_item.max_retries:
-            # Retry execution
-            await self.retry_execution(execution_id, error_message)
-        else:
-            # Move to dead letter queue
-            await self._move_to_dead_letter_queue(queue_item, error_message or "Execution failed")
+        if is_fresh():
+            return self._status_snapshot
+        
+        async with self._status_refresh_lock:
+            # Another request may have refreshed while we waited
+            if is_fresh():
+                return self._status_snapshot
+            
+            self._status_snapshot_dirty = False
+            snapshot = await self._build_status_snapshot()
+            self._status_snapshot = snapshot
+            self._status_snapshot_at = loop.time()
+            return snapshot
+    
+    async def _build_status_snapshot(self) -> Dict[str, Any]:
+        """Compute queue counts with one $facet aggregation and the oldest item off queued_at_idx."""
+        pipeline = [
+            {"$facet": {
+                "totals": [
+                    {"$group": {
+                        "_id": None,
+                        "total": {"$sum": 1},
+                        "processing": {"$sum": {"$cond": [
+                            {"$ne": [{"$ifNull": ["$processing_started_at", None]}, None]}, 1, 0
+                        ]}}
+                    }}
+                ],
+                "priorities": [
+                    {"$group": {"_id": "$priority", "count": {"$sum": 1}}}
+                ]
+            }}
+        ]
+        
+        results = await self.queue_collection.aggregate(pipeline).to_list(length=1)
+        facets = results[0] if results else {}
+        
+        totals = facets.get("totals") or [{}]
+        total_queued = totals[0].get("total", 0)
+        processing = totals[0].get("processing", 0)
+        
+        priority_counts = {priority.name: 0 for priority in QueuePriority}
+        for bucket in facets.get("priorities", []):
+            try:
+                priority_counts[QueuePriority(bucket["_id"]).name] = bucket["count"]
+            except ValueError:
+                continue
+        
+        # Outside $facet so the sort walks the queued_at index instead of sorting in memory
+        oldest = await self.queue_collection.find(
+            {}, {"_id": 0, "queued_at": 1}
+        ).sort("queued_at", 1).limit(1).to_list(length=1)
+        oldest_queued_at = oldest[0]["queued_at"] if oldest else None
+        
+        # Collection metadata count - does not scan the dead letter queue
+        dead_letter_count = await self.dead_letter_collection.estimated_document_count()
+        
+        return {
+            "total_queued": total_queued,
+            "pending": total_queued - processing,
+            "processing": processing,
+            "priority_distribution": priority_counts,
+            "oldest_queued_at": oldest_queued_at,
+            "dead_letter_count": dead_letter_count
+        }
+    
+    def _claimable_query(self, current_time: datetime) -> Dict[str, Any]:
+        """Build the filter matching queue items that are ready to be claimed."""
+        return {
+            "scheduled_at": {"$lte": current_time.isoformat()},
+            "processing_started_at": None
+        }
+    
+    def _lease_fields(self, current_time: datetime) -> Dict[str, Any]:
+        """Build the fields that mark a queue item as leased by this worker."""
+        lease_expires_at = current_time + timedelta(minutes=self.processing_timeout_minutes)
+        return {
+            "processing_started_at": current_time.isoformat(),
+            "lease_owner": self.worker_id,
+            "lease_expires_at": lease_expires_at.isoformat(),
+            "lease_token": uuid4().hex
+        }
+    
+    def _lease_query(self, execution_id: str, lease_token: Optional[str]) -> Dict[str, Any]:
+        """Build the filter matching a queue item, restricted to this worker's claim when a token is given."""
+        query: Dict[str, Any] = {"execution_id": execution_id}
+        if lease_token is not None:
+            query["lease_owner"] = self.worker_id
+            query["lease_token"] = lease_token
+        return query
     
-    async def _move_to_dead_letter_queue(self, queue_item: ExecutionQueueItem, reason: str) -> None:
-        """Move failed execution to dead letter queue."""
+    async def _move_to_dead_letter_queue(
+        self,
+        queue_item: ExecutionQueueItem,
+        reason: str,
+        claim_query: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Move failed execution to dead letter queue unless its claim changed meanwhile."""
         try:
             logger.warning(f"Moving execution to dead letter queue: {queue_item.execution_id} - {reason}")
             
@@ -506,12 +1028,20 @@ class ExecutionQueueService:
             dead_letter_item["moved_to_dlq_at"] = datetime.now(timezone.utc).isoformat()
             dead_letter_item["failure_reason"] = reason
             
-            await self.dead_letter_collection.insert_one(dead_letter_item)
+            inserted = await self.dead_letter_collection.insert_one(dead_letter_item)
             
             # Remove from main queue
-            await self.queue_collection.delete_one({"execution_id": queue_item.execution_id})
+            result = await self.queue_collection.delete_one(
+                claim_query or {"execution_id": queue_item.execution_id}
+            )
+            if result.deleted_count == 0:
+                # Reclaimed by another worker; it is no longer this claim's to dead-letter
+                await self.dead_letter_collection.delete_one({"_id": inserted.inserted_id})
+                logger.warning(f"Lease lost before dead-lettering: {queue_item.execution_id}")
+                return
+            self._status_snapshot_dirty = True
             
-            await self._update_queue_metrics("dead_lettered", queue_item.execution_type)
+            await self._update_queue_metrics("dead_lettered", queue_item.execution_type, queue_item.priority)
             
         except Exception as e:
             logger.error(f"Failed to move execution to dead letter queue: {queue_item.execution_id} - {str(e)}")
@@ -522,16 +1052,12 @@ class ExecutionQueueService:
         execution_type: ExecutionType,
         priority: Optional[QueuePriority] = None
     ) -> None:
-        """Update queue metrics for monitoring."""
+        """Record a queue operation in the metrics buffer."""
         try:
-            metric_doc = {
-                "operation": operation,
-                "execution_type": execution_type,
-                "priority": priority.value if priority else None,
-                "timestamp": datetime.now(timezone.utc)
-            }
+            self._metrics_buffer.record(operation, execution_type, priority)
             
-            await self.queue_metrics_collection.insert_one(metric_doc)
+            if len(self._metrics_buffer) >= self.max_buffered_metric_keys:
+                await self.flush_queue_metrics()
             
         except Exception as e:
             logger.error(f"Failed to update queue metrics: {str(e)}")
@@ -541,6 +1067,37 @@ class ExecutionQueueServiceFactory:
     """Factory for creating ExecutionQueueService instances."""
     
     @staticmethod
-    def create(database: AsyncIOMotorDatabase) -> ExecutionQueueService:
+    def create(database: AsyncIOMotorDatabase, enable_change_stream: bool = False) -> ExecutionQueueService:
         """Create ExecutionQueueService instance with database dependency."""
-        return ExecutionQueueService(database) 
\ No newline at end of file
+        return ExecutionQueueService(database, enable_change_stream=enable_change_stream)
+
+
+# Global execution queue service
+_execution_queue_service: Optional[ExecutionQueueService] = None
+
+
+def get_execution_queue_service(
+    database: AsyncIOMotorDatabase,
+    enable_change_stream: bool = False
+) -> ExecutionQueueService:
+    """
+    Get the process-wide execution queue service.
+    
+    Shared so the wakeup event, metrics buffer and status snapshot outlive
+    the per-request controllers that enqueue work.
+    
+    Args:
+        database: MongoDB database instance
+        enable_change_stream: Whether background processing watches the queue
+            for wakeups, applied when the service is created
+        
+    Returns:
+        ExecutionQueueService instance
+    """
+    global _execution_queue_service
+    if _execution_queue_service is None:
+        _execution_queue_service = ExecutionQueueServiceFactory.create(
+            database,
+            enable_change_stream=enable_change_stream
+        )
+    return _execution_queue_service 
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+Password Handler Unit Tests
+
+Tests the bounded bcrypt thread pool and its overload handling:
+- Blocking operations run on the pool with wait and run metrics
+- Operations rejected once max_queue_depth operations wait for a worker
+- Pool size and queue depth taken from settings by the global handler
+- AuthService answering overload with 503 and Retry-After on signup and login
+"""
+
+import asyncio
+import threading
+import pytest
+from fastapi import HTTPException
+from unittest.mock import AsyncMock, MagicMock
+
+from src.backend.auth.schemas.auth_requests import LoginRequest, SignupRequest
+from src.backend.auth.services import auth_service as auth_service_module
+from src.backend.auth.services.auth_service import AuthService
+from src.backend.auth.utils import password_handler as password_handler_module
+from src.backend.auth.utils.password_handler import (
+    PasswordHashingExecutor,
+    PasswordHashingOverloadedError,
+    get_password_handler
+)
+from src.backend.config.env import Settings
+
+PASSWORD = "Str0ng!Passw0rd#"
+
+
+@pytest.fixture(autouse=True)
+def reset_password_handler():
+    password_handler_module._password_handler = None
+    yield
+    password_handler_module._password_handler = None
+
+
+async def _wait_until(predicate) -> None:
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+class TestPasswordHashingExecutor:
+    """Test the bounded hashing pool."""
+
+    async def test_runs_operation_on_pool(self):
+        executor = PasswordHashingExecutor(max_workers=2)
+
+        result = await executor.run(threading.current_thread)
+
+        assert result.name.startswith("password-hash")
+        metrics = executor.get_metrics()
+        assert metrics["completed"] == 1
+        assert metrics["queue_depth"] == 0
+        executor.shutdown()
+
+    async def test_rejects_when_queue_full(self):
+        executor = PasswordHashingExecutor(max_workers=1, max_queue_depth=1)
+        release = threading.Event()
+
+        running = asyncio.ensure_future(executor.run(release.wait))
+        await _wait_until(lambda: executor.get_metrics()["active"] == 1)
+        queued = asyncio.ensure_future(executor.run(release.wait))
+        await _wait_until(lambda: executor.queue_depth == 1)
+
+        with pytest.raises(PasswordHashingOverloadedError) as exc_info:
+            await executor.run(release.wait)
+
+        assert exc_info.value.queue_depth == 1
+        assert exc_info.value.max_queue_depth == 1
+        assert executor.get_metrics()["rejected"] == 1
+        assert executor.get_metrics()["peak_queue_depth"] == 1
+
+        release.set()
+        await asyncio.gather(running, queued)
+        assert executor.get_metrics()["completed"] == 2
+        executor.shutdown()
+
+    async def test_zero_queue_depth_rejects_once_workers_busy(self):
+        executor = PasswordHashingExecutor(max_workers=1, max_queue_depth=0)
+        release = threading.Event()
+
+        running = asyncio.ensure_future(executor.run(release.wait))
+        await _wait_until(lambda: executor.get_metrics()["active"] == 1)
+
+        with pytest.raises(PasswordHashingOverloadedError):
+            await executor.run(release.wait)
+
+        release.set()
+        await running
+        executor.shutdown()
+
+
+class TestPasswordHashingSettings:
+    """Test sizing the global handler's pool from settings."""
+
+    def test_settings_exposed(self):
+        settings = Settings(password_hash_max_workers=3, password_hash_max_queue_depth=32)
+
+        assert settings.get_password_hashing_settings() == {"max_workers": 3, "max_queue_depth": 32}
+
+    def test_global_handler_sized_from_settings(self, monkeypatch):
+        settings = Settings(password_hash_max_workers=3, password_hash_max_queue_depth=32)
+        monkeypatch.setattr(password_handler_module, "get_settings", lambda: settings)
+
+        executor = get_password_handler().executor
+
+        assert executor.max_workers == 3
+        assert executor.max_queue_depth == 32
+        assert get_password_handler().executor is executor
+
+    def test_unset_workers_default_to_cpu_count(self, monkeypatch):
+        settings = Settings(password_hash_max_workers=None)
+        monkeypatch.setattr(password_handler_module, "get_settings", lambda: settings)
+
+        assert 1 <= get_password_handler().executor.max_workers <= 4
+
+
+@pytest.mark.asyncio
+class TestAuthServiceOverload:
+    """Test mapping hashing overload to 503 responses."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        password_handler = MagicMock()
+        password_handler.validate_password_strength.return_value = {"is_valid": True, "strength": "strong"}
+        overloaded = PasswordHashingOverloadedError(queue_depth=256, max_queue_depth=256)
+        password_handler.hash_password_async = AsyncMock(side_effect=overloaded)
+        password_handler.verify_password_async = AsyncMock(side_effect=overloaded)
+
+        db_service = MagicMock()
+        db_service.user_exists_by_email = AsyncMock(return_value=False)
+        db_service.get_user_by_email = AsyncMock(
+            return_value=MagicMock(id="user-1", is_active=True, hashed_password="$2b$12$hash")
+        )
+
+        monkeypatch.setattr(auth_service_module, "get_password_handler", lambda: password_handler)
+        monkeypatch.setattr(auth_service_module, "get_database_service", lambda: db_service)
+        monkeypatch.setattr(auth_service_module, "get_jwt_handler", MagicMock)
+        monkeypatch.setattr(auth_service_module, "get_token_cache", MagicMock)
+        return AuthService()
+
+    async def test_signup_returns_503_with_retry_after(self, service):
+        signup = SignupRequest(email="user@example.com", password=PASSWORD, confirm_password=PASSWORD)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.register_user(signup)
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "1"}
+        service.db_service.create_user.assert_not_called()
+
+    async def test_login_returns_503_with_retry_after(self, service):
+        login = LoginRequest(email="user@example.com", password=PASSWORD)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.authenticate_user(login)
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.headers == {"Retry-After": "1"}
+        service.db_service.update_user_login_info.assert_not_called()
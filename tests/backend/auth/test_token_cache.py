@@ -0,0 +1,189 @@
+"""
+Verified Token Cache Unit Tests
+
+Tests the LRU + TTL cache of verified JWTs:
+- Entry lifetime capped by the token's exp claim
+- Least recently used tokens evicted beyond max_size
+- Invalidation of all tokens of a user and of a single token ID
+- Raw tokens never used as cache keys
+- AuthService.verify_token skipping decoding and the user lookup on cache hits
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.backend.auth.services import auth_service as auth_service_module
+from src.backend.auth.services.auth_service import AuthService
+from src.backend.auth.utils import token_cache as token_cache_module
+from src.backend.auth.utils.token_cache import VerifiedTokenCache
+
+NOW = 1_700_000_000.0
+
+
+class _Clock:
+    """Stands in for the time module with a manually advanced clock."""
+
+    def __init__(self):
+        self.now = NOW
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(token_cache_module, "time", clock)
+    return clock
+
+
+def _payload(user_id: str, jti: str = None, expires_in: float = 3600) -> dict:
+    return {"sub": user_id, "jti": jti, "exp": NOW + expires_in}
+
+
+class TestTtl:
+    """Test entry lifetime."""
+
+    def test_entry_expires_after_ttl(self, clock):
+        cache = VerifiedTokenCache(ttl_seconds=60)
+        cache.put("token-a", _payload("user-1"), "user")
+
+        clock.advance(59)
+        assert cache.get("token-a") == "user"
+
+        clock.advance(1)
+        assert cache.get("token-a") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_ttl_capped_by_token_expiry(self, clock):
+        cache = VerifiedTokenCache(ttl_seconds=60)
+        cache.put("token-a", _payload("user-1", expires_in=10), "user")
+
+        clock.advance(9)
+        assert cache.get("token-a") == "user"
+
+        clock.advance(1)
+        assert cache.get("token-a") is None
+
+    def test_expired_token_not_cached(self, clock):
+        cache = VerifiedTokenCache(ttl_seconds=60)
+
+        cache.put("token-a", _payload("user-1", expires_in=0), "user")
+
+        assert cache.get_stats()["size"] == 0
+
+    def test_token_without_exp_uses_ttl(self, clock):
+        cache = VerifiedTokenCache(ttl_seconds=60)
+        cache.put("token-a", {"sub": "user-1"}, "user")
+
+        clock.advance(59)
+
+        assert cache.get("token-a") == "user"
+
+
+class TestLruEviction:
+    """Test the size bound of the cache."""
+
+    def test_least_recently_used_token_evicted(self, clock):
+        cache = VerifiedTokenCache(max_size=2)
+        cache.put("token-a", _payload("user-1", "jti-a"), "user-a")
+        cache.put("token-b", _payload("user-2", "jti-b"), "user-b")
+        cache.get("token-a")
+
+        cache.put("token-c", _payload("user-3", "jti-c"), "user-c")
+
+        assert cache.get("token-b") is None
+        assert cache.get("token-a") == "user-a"
+        assert cache.get("token-c") == "user-c"
+        assert cache.evictions == 1
+        # Indexes of the evicted token are dropped with it
+        assert "user-2" not in cache._by_user
+        assert "jti-b" not in cache._by_jti
+
+    def test_re_put_replaces_entry(self, clock):
+        cache = VerifiedTokenCache(max_size=2)
+        cache.put("token-a", _payload("user-1", "jti-a"), "old")
+        cache.put("token-a", _payload("user-1", "jti-a"), "new")
+
+        assert cache.get("token-a") == "new"
+        assert cache.get_stats()["size"] == 1
+        assert cache.evictions == 0
+
+
+class TestInvalidation:
+    """Test invalidation by user and token ID."""
+
+    def test_invalidate_user_drops_all_their_tokens(self, clock):
+        cache = VerifiedTokenCache()
+        cache.put("token-a", _payload("user-1", "jti-a"), "user-1")
+        cache.put("token-b", _payload("user-1", "jti-b"), "user-1")
+        cache.put("token-c", _payload("user-2", "jti-c"), "user-2")
+
+        cache.invalidate_user("user-1")
+
+        assert cache.get("token-a") is None
+        assert cache.get("token-b") is None
+        assert cache.get("token-c") == "user-2"
+        assert cache.invalidations == 2
+        assert "jti-a" not in cache._by_jti
+
+    def test_invalidate_unknown_user_is_noop(self, clock):
+        cache = VerifiedTokenCache()
+
+        cache.invalidate_user("user-1")
+
+        assert cache.invalidations == 0
+
+    def test_invalidate_token_id(self, clock):
+        cache = VerifiedTokenCache()
+        cache.put("token-a", _payload("user-1", "jti-a"), "user-1")
+        cache.put("token-b", _payload("user-1", "jti-b"), "user-1")
+
+        cache.invalidate_token_id("jti-a")
+        cache.invalidate_token_id("jti-unknown")
+
+        assert cache.get("token-a") is None
+        assert cache.get("token-b") == "user-1"
+        assert cache.invalidations == 1
+        assert cache._by_user["user-1"] == {VerifiedTokenCache.hash_token("token-b")}
+
+    def test_raw_tokens_not_held(self, clock):
+        cache = VerifiedTokenCache()
+        cache.put("token-a", _payload("user-1"), "user-1")
+
+        assert list(cache._entries) == [VerifiedTokenCache.hash_token("token-a")]
+
+
+@pytest.mark.asyncio
+class TestVerifyTokenCache:
+    """Test AuthService.verify_token served from the cache."""
+
+    async def test_repeat_verification_served_from_cache(self, monkeypatch):
+        user = MagicMock(id="user-1", email="user@example.com", is_active=True)
+        jwt_handler = MagicMock()
+        jwt_handler.verify_token.return_value = {"sub": "user-1", "jti": "jti-a", "exp": 4_000_000_000}
+        db_service = MagicMock()
+        db_service.get_user_by_id = AsyncMock(return_value=user)
+        cache = VerifiedTokenCache()
+
+        monkeypatch.setattr(auth_service_module, "get_password_handler", MagicMock)
+        monkeypatch.setattr(auth_service_module, "get_jwt_handler", lambda: jwt_handler)
+        monkeypatch.setattr(auth_service_module, "get_database_service", lambda: db_service)
+        monkeypatch.setattr(auth_service_module, "get_token_cache", lambda: cache)
+        service = AuthService()
+
+        assert await service.verify_token("token-a") is user
+        assert await service.verify_token("token-a") is user
+
+        jwt_handler.verify_token.assert_called_once()
+        db_service.get_user_by_id.assert_awaited_once()
+
+        cache.invalidate_user("user-1")
+        assert await service.verify_token("token-a") is user
+        assert db_service.get_user_by_id.await_count == 2
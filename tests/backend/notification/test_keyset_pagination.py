@@ -0,0 +1,125 @@
+"""
+Keyset Pagination Unit Tests
+
+Tests the cursor pagination helpers used by notification history and audit queries:
+- _id tiebreaker appended to sort specifications
+- Continuation tokens round-tripping datetimes and ObjectIds
+- Tokens rejected when malformed or issued for another sort order
+- Keyset filters selecting exactly the documents after the cursor
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
+
+from src.backend.notification.utils.keyset_pagination import (
+    apply_keyset,
+    build_keyset_filter,
+    decode_cursor,
+    encode_cursor,
+    with_tiebreaker
+)
+
+CREATED_DESC = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+
+def _matches(document, query):
+    """Evaluate the subset of query operators emitted by build_keyset_filter."""
+    if "$or" in query:
+        return any(_matches(document, branch) for branch in query["$or"])
+    if "$and" in query:
+        return all(_matches(document, branch) for branch in query["$and"])
+    for field, condition in query.items():
+        value = document[field]
+        if isinstance(condition, dict):
+            if "$gt" in condition and not value > condition["$gt"]:
+                return False
+            if "$lt" in condition and not value < condition["$lt"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+def _sorted(documents, sort_spec):
+    ordered = list(documents)
+    for field, direction in reversed(sort_spec):
+        ordered.sort(key=lambda document: document[field], reverse=direction == DESCENDING)
+    return ordered
+
+
+class TestTiebreaker:
+    """Test total ordering of sort specifications."""
+
+    def test_appends_id_in_last_direction(self):
+        assert with_tiebreaker([("created_at", DESCENDING)]) == CREATED_DESC
+        assert with_tiebreaker([("priority", ASCENDING)]) == [("priority", ASCENDING), ("_id", ASCENDING)]
+
+    def test_keeps_existing_id(self):
+        assert with_tiebreaker(CREATED_DESC) == CREATED_DESC
+
+
+class TestCursorEncoding:
+    """Test continuation token encoding and validation."""
+
+    def test_round_trip_preserves_bson_values(self):
+        """Datetimes and ObjectIds survive the token unchanged."""
+        document = {"_id": ObjectId(), "created_at": datetime(2024, 1, 1, 12, 30), "subject": "ignored"}
+
+        token = encode_cursor(CREATED_DESC, document)
+
+        assert "=" not in token
+        assert decode_cursor(token, CREATED_DESC) == [document["created_at"], document["_id"]]
+
+    def test_rejects_token_for_other_sort(self):
+        token = encode_cursor(CREATED_DESC, {"_id": ObjectId(), "created_at": datetime(2024, 1, 1)})
+
+        with pytest.raises(ValueError):
+            decode_cursor(token, [("created_at", ASCENDING), ("_id", ASCENDING)])
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", "", "e30"])
+    def test_rejects_malformed_token(self, token):
+        with pytest.raises(ValueError):
+            decode_cursor(token, CREATED_DESC)
+
+
+class TestKeysetFilter:
+    """Test the filter resuming after a sort key."""
+
+    def test_single_field_filter(self):
+        assert build_keyset_filter([("_id", ASCENDING)], [5]) == {"_id": {"$gt": 5}}
+
+    def test_compound_filter_branches(self):
+        created_at = datetime(2024, 1, 1)
+
+        assert build_keyset_filter(CREATED_DESC, [created_at, 7]) == {
+            "$or": [
+                {"created_at": {"$lt": created_at}},
+                {"created_at": created_at, "_id": {"$lt": 7}}
+            ]
+        }
+
+    @pytest.mark.parametrize("sort_spec", [
+        CREATED_DESC,
+        [("priority", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)]
+    ])
+    def test_pages_cover_every_document_once(self, sort_spec):
+        """Walking pages by cursor visits all documents in order, including equal sort keys."""
+        start = datetime(2024, 1, 1)
+        documents = [
+            {"_id": index, "created_at": start + timedelta(minutes=index // 3), "priority": index % 2}
+            for index in range(20)
+        ]
+        expected = _sorted(documents, sort_spec)
+
+        visited, token = [], None
+        while True:
+            query = apply_keyset({}, sort_spec, token) if token else {}
+            page = _sorted([d for d in documents if _matches(d, query)], sort_spec)[:6]
+            if not page:
+                break
+            visited.extend(page)
+            token = encode_cursor(sort_spec, page[-1])
+
+        assert [d["_id"] for d in visited] == [d["_id"] for d in expected]
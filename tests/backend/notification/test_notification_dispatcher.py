@@ -0,0 +1,180 @@
+"""
+Notification Dispatcher Unit Tests
+
+Tests recipient fan-out in the notification dispatcher:
+- Recipients dispatched concurrently, bounded by max_concurrent_recipients
+- A failing recipient not aborting delivery to the others
+- Delivery histories created with one insert_many and finalised with one bulk_write
+- Preferences for all recipients prefetched with a single $in query
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+from src.backend.notification.models import (
+    NotificationChannel,
+    NotificationPriority,
+    NotificationTypeCategory,
+    UserNotificationPreferencesModel
+)
+from src.backend.notification.services.channel_adapter_base import NotificationResult, NotificationResultStatus
+from src.backend.notification.services.notification_dispatcher import NotificationDispatcherService
+from src.backend.notification.services.preference_cache import NotificationPreferenceCache
+
+
+class _Cursor:
+    """Async cursor over a fixed list of documents."""
+
+    def __init__(self, documents: List[Dict[str, Any]]):
+        self.documents = documents
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+
+def _notification(*user_ids: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        notification_id="notif-0001",
+        type=NotificationTypeCategory.SYSTEM_ALERT,
+        priority=NotificationPriority.HIGH,
+        recipients=[SimpleNamespace(user_id=user_id) for user_id in user_ids],
+        channels=[NotificationChannel.EMAIL],
+        source_service="test_execution",
+        status=None,
+        delivered_at=None,
+        failed_at=None
+    )
+
+
+def _preferences_document(user_id: str) -> Dict[str, Any]:
+    return UserNotificationPreferencesModel(user_id=user_id, last_updated_by=user_id).to_mongo()
+
+
+def _create_dispatcher(preference_documents=(), **kwargs) -> NotificationDispatcherService:
+    database = MagicMock()
+    database.notifications.update_one = AsyncMock()
+    database.notification_delivery_history.insert_many = AsyncMock()
+    database.notification_delivery_history.bulk_write = AsyncMock()
+    database.user_notification_preferences.find = MagicMock(return_value=_Cursor(list(preference_documents)))
+
+    adapter = MagicMock()
+    adapter.is_enabled.return_value = True
+
+    return NotificationDispatcherService(
+        database, {"email": adapter}, preference_cache=NotificationPreferenceCache(), **kwargs
+    )
+
+
+def _delivered() -> Dict[str, NotificationResult]:
+    return {"email": NotificationResult(status=NotificationResultStatus.SUCCESS, success=True)}
+
+
+@pytest.mark.asyncio
+class TestRecipientFanOut:
+    """Test concurrent dispatch to recipients."""
+
+    async def test_concurrency_bounded_by_max_concurrent_recipients(self):
+        dispatcher = _create_dispatcher(max_concurrent_recipients=2)
+        in_flight, peak = 0, 0
+
+        async def dispatch_to_recipient(notification, recipient, target_channels, history, delivery_mode, dispatch_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _delivered()
+
+        dispatcher._dispatch_to_recipient = dispatch_to_recipient
+
+        results = await dispatcher.dispatch_notification_async(_notification(*(f"user-{i}" for i in range(5))))
+
+        assert peak == 2
+        assert len(results["email"]) == 5
+
+    async def test_failing_recipient_does_not_abort_others(self):
+        dispatcher = _create_dispatcher()
+
+        async def dispatch_to_recipient(notification, recipient, target_channels, history, delivery_mode, dispatch_id):
+            if recipient.user_id == "user-2":
+                raise ConnectionError("smtp relay unavailable")
+            return _delivered()
+
+        dispatcher._dispatch_to_recipient = dispatch_to_recipient
+
+        results = await dispatcher.dispatch_notification_async(_notification("user-1", "user-2", "user-3"))
+
+        assert len(results["email"]) == 2
+        operations = dispatcher.history_collection.bulk_write.await_args.args[0]
+        assert [operation._filter["user_id"] for operation in operations] == ["user-1", "user-3"]
+        update = dispatcher.notifications_collection.update_one.await_args.args[1]["$set"]
+        assert update["status"] == "delivered"
+
+    async def test_histories_written_in_bulk(self):
+        dispatcher = _create_dispatcher()
+        dispatcher._dispatch_to_recipient = AsyncMock(return_value=_delivered())
+
+        await dispatcher.dispatch_notification_async(_notification("user-1", "user-2", "user-3"))
+
+        dispatcher.history_collection.insert_many.assert_awaited_once()
+        inserted = dispatcher.history_collection.insert_many.await_args.args[0]
+        assert [history["user_id"] for history in inserted] == ["user-1", "user-2", "user-3"]
+        assert dispatcher.history_collection.insert_many.await_args.kwargs["ordered"] is False
+
+        dispatcher.history_collection.bulk_write.assert_awaited_once()
+        operations = dispatcher.history_collection.bulk_write.await_args.args[0]
+        assert all(operation._doc["$set"]["successful_channels"] == ["email"] for operation in operations)
+
+    async def test_recipient_without_channels_skipped(self):
+        dispatcher = _create_dispatcher()
+        dispatcher.channel_adapters["email"].is_enabled.return_value = False
+        dispatcher._dispatch_to_recipient = AsyncMock()
+
+        results = await dispatcher.dispatch_notification_async(_notification("user-1"))
+
+        assert results == {}
+        dispatcher._dispatch_to_recipient.assert_not_awaited()
+        dispatcher.history_collection.insert_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestPreferencePrefetch:
+    """Test loading recipient preferences in bulk."""
+
+    async def test_preferences_fetched_with_one_query(self):
+        dispatcher = _create_dispatcher([_preferences_document("user-1")])
+        dispatcher._dispatch_to_recipient = AsyncMock(return_value=_delivered())
+        received = {}
+
+        async def determine_target_channels(notification, recipient, user_preferences):
+            received[recipient.user_id] = user_preferences
+            return [NotificationChannel.EMAIL]
+
+        dispatcher._determine_target_channels = determine_target_channels
+
+        await dispatcher.dispatch_notification_async(_notification("user-1", "user-2", "user-1"))
+
+        dispatcher.preferences_collection.find.assert_called_once()
+        query = dispatcher.preferences_collection.find.call_args.args[0]
+        assert sorted(query["user_id"]["$in"]) == ["user-1", "user-2"]
+        assert received["user-1"].user_id == "user-1"
+        assert received["user-2"] is None
+
+    async def test_bulk_lookup_skips_empty_user_ids(self):
+        dispatcher = _create_dispatcher()
+
+        assert await dispatcher._get_user_preferences_bulk([None, ""]) == {}
+        dispatcher.preferences_collection.find.assert_not_called()
+
+    async def test_query_failure_returns_no_preferences(self):
+        dispatcher = _create_dispatcher()
+        dispatcher.preferences_collection.find.side_effect = ConnectionError("primary stepped down")
+
+        assert await dispatcher._get_user_preferences_bulk(["user-1"]) == {}
@@ -0,0 +1,184 @@
+"""
+Notification Preference Cache Unit Tests
+
+Tests the LRU + TTL cache shared by notification routing:
+- Least recently used users evicted beyond max_size
+- Entries expiring after ttl_seconds
+- Users without stored preferences cached as None
+- Invalidation, clearing and hit/miss statistics
+- Dispatcher preference lookups querying only users that miss the cache
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.backend.notification.services import preference_cache as preference_cache_module
+from src.backend.notification.services.notification_dispatcher import NotificationDispatcherService
+from src.backend.notification.services.preference_cache import NotificationPreferenceCache, get_preference_cache
+
+
+class _Cursor:
+    """Async cursor over a fixed list of documents."""
+
+    def __init__(self, documents):
+        self.documents = documents
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+
+@pytest.fixture(autouse=True)
+def reset_preference_cache():
+    preference_cache_module._preference_cache = None
+    yield
+    preference_cache_module._preference_cache = None
+
+
+class TestLruEviction:
+    """Test the size bound of the cache."""
+
+    def test_least_recently_used_user_evicted(self):
+        cache = NotificationPreferenceCache(max_size=2)
+        cache.put("user-1", {"global_enabled": True})
+        cache.put("user-2", {"global_enabled": False})
+        cache.get("user-1")
+
+        cache.put("user-3", None)
+
+        assert cache.get("user-2") == (False, None)
+        assert cache.get("user-1") == (True, {"global_enabled": True})
+        assert cache.get("user-3") == (True, None)
+        assert cache.evictions == 1
+
+    def test_put_refreshes_recency(self):
+        cache = NotificationPreferenceCache(max_size=2)
+        cache.put("user-1", "old")
+        cache.put("user-2", "other")
+        cache.put("user-1", "new")
+
+        cache.put("user-3", "latest")
+
+        assert cache.get("user-1") == (True, "new")
+        assert cache.get("user-2") == (False, None)
+
+
+class TestTtlExpiry:
+    """Test time-based expiry of cached preferences."""
+
+    def test_expired_entry_misses_and_is_dropped(self):
+        cache = NotificationPreferenceCache(ttl_seconds=0)
+        cache.put("user-1", {"global_enabled": True})
+
+        assert cache.get("user-1") == (False, None)
+        assert cache.get_stats()["size"] == 0
+
+    def test_unexpired_entry_hits(self):
+        cache = NotificationPreferenceCache(ttl_seconds=60)
+        cache.put("user-1", {"global_enabled": True})
+
+        assert cache.get("user-1") == (True, {"global_enabled": True})
+
+
+class TestInvalidationAndStats:
+    """Test invalidation and metrics."""
+
+    def test_get_many_splits_hits_and_misses(self):
+        cache = NotificationPreferenceCache()
+        cache.put("user-1", {"global_enabled": True})
+        cache.put("user-2", None)
+
+        cached, missing = cache.get_many(["user-1", "user-2", "user-3"])
+
+        assert cached == {"user-1": {"global_enabled": True}, "user-2": None}
+        assert missing == ["user-3"]
+
+    def test_invalidate_counts_only_cached_users(self):
+        cache = NotificationPreferenceCache()
+        cache.put("user-1", {"global_enabled": True})
+
+        cache.invalidate("user-1")
+        cache.invalidate("user-2")
+
+        assert cache.get("user-1") == (False, None)
+        assert cache.invalidations == 1
+
+    def test_clear_drops_every_entry(self):
+        cache = NotificationPreferenceCache()
+        cache.put("user-1", None)
+        cache.put("user-2", None)
+
+        cache.clear()
+
+        assert cache.get_stats()["size"] == 0
+        assert cache.invalidations == 2
+
+    def test_stats(self):
+        cache = NotificationPreferenceCache(max_size=10, ttl_seconds=30)
+        cache.put("user-1", None)
+        cache.get("user-1")
+        cache.get("user-2")
+        cache.get("user-1")
+
+        assert cache.get_stats() == {
+            "size": 1,
+            "max_size": 10,
+            "ttl_seconds": 30,
+            "hits": 2,
+            "misses": 1,
+            "hit_rate": 2 / 3,
+            "evictions": 0,
+            "invalidations": 0
+        }
+
+    def test_global_cache_shared(self):
+        assert get_preference_cache() is get_preference_cache()
+
+
+@pytest.mark.asyncio
+class TestDispatcherPreferenceCache:
+    """Test dispatcher preference lookups served from the cache."""
+
+    def _create_dispatcher(self, cache: NotificationPreferenceCache) -> NotificationDispatcherService:
+        database = MagicMock()
+        database.user_notification_preferences.find = MagicMock(side_effect=lambda query: _Cursor([]))
+        return NotificationDispatcherService(database, {}, preference_cache=cache)
+
+    async def test_only_missing_users_queried(self):
+        cache = NotificationPreferenceCache()
+        dispatcher = self._create_dispatcher(cache)
+
+        await dispatcher._get_user_preferences_bulk(["user-1", "user-2"])
+        await dispatcher._get_user_preferences_bulk(["user-1", "user-2", "user-3"])
+
+        queries = [call.args[0] for call in dispatcher.preferences_collection.find.call_args_list]
+        assert sorted(queries[0]["user_id"]["$in"]) == ["user-1", "user-2"]
+        assert queries[1] == {"user_id": {"$in": ["user-3"]}}
+
+    async def test_fully_cached_lookup_skips_query(self):
+        cache = NotificationPreferenceCache()
+        dispatcher = self._create_dispatcher(cache)
+        await dispatcher._get_user_preferences_bulk(["user-1"])
+
+        assert await dispatcher._get_user_preferences_bulk(["user-1"]) == {}
+
+        dispatcher.preferences_collection.find.assert_called_once()
+        assert cache.hits == 1
+
+    async def test_invalidated_user_reloaded(self):
+        cache = NotificationPreferenceCache()
+        dispatcher = self._create_dispatcher(cache)
+        await dispatcher._get_user_preferences_bulk(["user-1"])
+
+        cache.invalidate("user-1")
+        await dispatcher._get_user_preferences_bulk(["user-1"])
+
+        assert dispatcher.preferences_collection.find.call_count == 2
+
+    async def test_dispatcher_defaults_to_shared_cache(self):
+        dispatcher = NotificationDispatcherService(MagicMock(), {})
+
+        assert dispatcher.preference_cache is get_preference_cache()
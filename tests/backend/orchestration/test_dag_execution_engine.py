@@ -0,0 +1,165 @@
+"""
+DAG Execution Engine Unit Tests
+
+Tests in-degree based dependency release in the DAG execution engine:
+- Remaining dependency counters and reverse adjacency built from parent_nodes
+- Only dependency-free nodes queued initially
+- Dependents released once their last dependency completes
+- Full execution honouring dependency order
+- Stall detection when a failed dependency blocks its dependents
+"""
+
+import asyncio
+import logging
+import pytest
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock
+
+from src.backend.orchestration.engine.dag_execution_engine import (
+    DAGExecutionEngine,
+    ExecutionContext,
+    ExecutionStage,
+    OrchestrationStallException
+)
+from src.backend.orchestration.models.orchestration_models import JobStatus, NodeType
+
+
+class _TestDAGExecutionEngine(DAGExecutionEngine):
+    """Concrete engine for tests - service lifecycle hooks are not exercised."""
+
+    async def _initialize_service(self) -> None:
+        pass
+
+    async def _start_service(self) -> None:
+        pass
+
+    async def _stop_service(self) -> None:
+        pass
+
+    async def _health_check(self) -> Dict[str, Any]:
+        return {}
+
+
+class _RecordingNodeRunner:
+    """Node runner recording execution order, failing selected nodes."""
+
+    def __init__(self, failing_nodes: List[str] = None):
+        self.failing_nodes = set(failing_nodes or [])
+        self.started: List[str] = []
+
+    async def execute_node(self, node, context) -> Dict[str, Any]:
+        self.started.append(node.node_id)
+        await asyncio.sleep(0)
+        if node.node_id in self.failing_nodes:
+            raise RuntimeError(f"node {node.node_id} failed")
+        return {"node_id": node.node_id}
+
+
+class _Job:
+    """Minimal job carrying an execution graph definition."""
+
+    def __init__(self, edges: Dict[str, List[str]]):
+        self.job_id = "job-1"
+        self.execution_graph = {
+            "nodes": [
+                {
+                    "node_id": node_id,
+                    "job_id": self.job_id,
+                    "node_name": node_id,
+                    "node_type": NodeType.TEST_CASE,
+                    "node_order": order,
+                    "action_type": "run",
+                    "parent_nodes": parents
+                }
+                for order, (node_id, parents) in enumerate(edges.items())
+            ]
+        }
+
+
+# a -> (b, c) -> d
+DIAMOND = {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"]}
+
+
+def _create_engine(node_runner=None) -> _TestDAGExecutionEngine:
+    engine = _TestDAGExecutionEngine(node_runner or _RecordingNodeRunner(), AsyncMock())
+    engine.logger = logging.getLogger(__name__)
+    return engine
+
+
+def _context() -> ExecutionContext:
+    return ExecutionContext(job_id="job-1", trace_id="trace-1", max_parallel_nodes=4)
+
+
+def _drain(queue: asyncio.Queue) -> List[str]:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+@pytest.mark.asyncio
+class TestDependencyRelease:
+    """Test in-degree counters and dependent release."""
+
+    async def test_graph_counts_dependencies(self):
+        """Counters and reverse edges come from each node's parent_nodes."""
+        engine = _create_engine()
+
+        graph = await engine._build_execution_graph(_Job(DIAMOND), _context())
+
+        assert graph.remaining_dependencies == {"a": 0, "b": 1, "c": 1, "d": 2}
+        assert sorted(graph.dependents["a"]) == ["b", "c"]
+        assert graph.dependents["d"] == []
+        assert _drain(graph.ready_queue) == ["a"]
+        assert graph.stage_counts[ExecutionStage.READY] == 1
+        assert graph.stage_counts[ExecutionStage.PENDING] == 3
+
+    async def test_dependent_released_after_last_dependency(self):
+        """A join node becomes ready only when all of its parents complete."""
+        engine = _create_engine()
+        graph = await engine._build_execution_graph(_Job(DIAMOND), _context())
+        _drain(graph.ready_queue)
+
+        engine._set_node_state(graph, "a", ExecutionStage.COMPLETED)
+        await engine._release_dependents(graph, "a")
+        assert sorted(_drain(graph.ready_queue)) == ["b", "c"]
+
+        engine._set_node_state(graph, "b", ExecutionStage.COMPLETED)
+        await engine._release_dependents(graph, "b")
+        assert _drain(graph.ready_queue) == []
+        assert graph.remaining_dependencies["d"] == 1
+        assert graph.node_states["d"] == ExecutionStage.PENDING
+
+        engine._set_node_state(graph, "c", ExecutionStage.COMPLETED)
+        await engine._release_dependents(graph, "c")
+        assert _drain(graph.ready_queue) == ["d"]
+        assert graph.node_states["d"] == ExecutionStage.READY
+
+    async def test_execution_respects_dependency_order(self):
+        """Every node starts after all of its parents."""
+        runner = _RecordingNodeRunner()
+        engine = _create_engine(runner)
+        edges = {
+            "a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"],
+            "e": ["d"], "f": [], "g": ["f", "e"]
+        }
+
+        result = await engine.execute_dag(_Job(edges), _context())
+
+        assert result["status"] == JobStatus.COMPLETED
+        assert result["completed_nodes"] == len(edges)
+        position = {node_id: index for index, node_id in enumerate(runner.started)}
+        for node_id, parents in edges.items():
+            for parent in parents:
+                assert position[parent] < position[node_id]
+
+    async def test_failed_dependency_stalls_dependents(self):
+        """Dependents of a failed node are never released."""
+        runner = _RecordingNodeRunner(failing_nodes=["b"])
+        engine = _create_engine(runner)
+
+        with pytest.raises(OrchestrationStallException) as exc_info:
+            await engine.execute_dag(_Job(DIAMOND), _context())
+
+        assert exc_info.value.stalled_nodes == ["d"]
+        assert "d" not in runner.started
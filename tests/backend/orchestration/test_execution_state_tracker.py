@@ -0,0 +1,240 @@
+"""
+Execution State Tracker Unit Tests
+
+Tests write-behind persistence and bounded transition history:
+- Node transitions within the persist window coalesced into one $set delta
+- Terminal transitions flushed synchronously
+- Failed delta writes kept pending for the next flush
+- Full state writes superseding pending deltas
+- Ring buffer eviction spilled to the history collection in batches
+- Unwritten transitions restored to the spill list when a spill fails
+"""
+
+import asyncio
+import logging
+import pytest
+from types import SimpleNamespace
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock
+
+from pymongo.errors import BulkWriteError
+
+from src.backend.orchestration.engine.execution_state_tracker import ExecutionStateTracker
+
+
+class _TestExecutionStateTracker(ExecutionStateTracker):
+    """Concrete tracker for tests - service lifecycle hooks are not exercised."""
+
+    async def _start_service(self) -> None:
+        pass
+
+    async def _stop_service(self) -> None:
+        pass
+
+    async def _health_check(self) -> Dict[str, Any]:
+        return {}
+
+
+def _dag_graph(*node_ids: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        nodes={node_id: None for node_id in node_ids},
+        semaphore=asyncio.Semaphore(4),
+        dependencies={node_id: [] for node_id in node_ids}
+    )
+
+
+async def _create_tracker(*node_ids: str, **kwargs) -> _TestExecutionStateTracker:
+    tracker = _TestExecutionStateTracker(
+        MagicMock(update_one=AsyncMock(), replace_one=AsyncMock()),
+        history_collection=MagicMock(insert_many=AsyncMock()),
+        **kwargs
+    )
+    tracker.logger = logging.getLogger(__name__)
+    await tracker.initialize_dag_state("job-1", _dag_graph(*node_ids))
+    tracker.db_collection.replace_one.reset_mock()
+    return tracker
+
+
+def _set_documents(tracker: ExecutionStateTracker):
+    return [call.args[1]["$set"] for call in tracker.db_collection.update_one.await_args_list]
+
+
+@pytest.mark.asyncio
+class TestWriteBehindPersistence:
+    """Test coalesced node state deltas."""
+
+    async def test_transitions_within_window_coalesced(self):
+        tracker = await _create_tracker("a", "b", persist_window_seconds=0.05)
+
+        await tracker.update_node_state("job-1", "a", "ready")
+        await tracker.update_node_state("job-1", "b", "ready")
+        await tracker.update_node_state("job-1", "a", "running", {"worker": "w1"})
+
+        tracker.db_collection.update_one.assert_not_awaited()
+
+        await asyncio.sleep(0.1)
+
+        tracker.db_collection.update_one.assert_awaited_once()
+        assert tracker.db_collection.update_one.await_args.args[0] == {"job_id": "job-1"}
+        update = _set_documents(tracker)[0]
+        assert update["node_states.a"] == "running"
+        assert update["node_states.b"] == "ready"
+        assert update["node_results.a"] == {"worker": "w1"}
+        assert "node_results.b" not in update
+        assert update["running_nodes"] == 1
+        assert update["pending_nodes"] == 0
+        assert update["status"] == "running"
+        tracker.db_collection.replace_one.assert_not_awaited()
+
+    async def test_zero_window_writes_every_transition(self):
+        tracker = await _create_tracker("a", persist_window_seconds=0)
+
+        await tracker.update_node_state("job-1", "a", "ready")
+        await tracker.update_node_state("job-1", "a", "running")
+
+        assert [update["node_states.a"] for update in _set_documents(tracker)] == ["ready", "running"]
+
+    @pytest.mark.parametrize("terminal_state", ["completed", "failed", "cancelled"])
+    async def test_terminal_transition_flushed_synchronously(self, terminal_state):
+        tracker = await _create_tracker("a", "b", persist_window_seconds=60)
+
+        await tracker.update_node_state("job-1", "b", "ready")
+        await tracker.update_node_state("job-1", "a", "ready")
+        await tracker.update_node_state("job-1", "a", "running")
+        tracker.db_collection.update_one.assert_not_awaited()
+
+        await tracker.update_node_state("job-1", "a", terminal_state)
+
+        # The pending non-terminal change rides along with the terminal one
+        update = _set_documents(tracker)[0]
+        assert update["node_states.a"] == terminal_state
+        assert update["node_states.b"] == "ready"
+        assert tracker._dirty_nodes == {}
+
+        tracker._flush_tasks["job-1"].cancel()
+
+    async def test_failed_delta_write_retried_on_next_flush(self):
+        tracker = await _create_tracker("a", "b", persist_window_seconds=60)
+        tracker.db_collection.update_one.side_effect = [ConnectionError("primary stepped down"), None]
+
+        await tracker.update_node_state("job-1", "a", "ready")
+        await tracker.update_node_state("job-1", "a", "running")
+        await tracker.update_node_state("job-1", "a", "completed")
+        assert tracker._dirty_nodes == {"job-1": {"a"}}
+
+        await tracker.update_node_state("job-1", "b", "ready")
+        await tracker.flush_pending_state("job-1")
+
+        update = _set_documents(tracker)[1]
+        assert update["node_states.a"] == "completed"
+        assert update["node_states.b"] == "ready"
+
+        tracker._flush_tasks["job-1"].cancel()
+
+    async def test_node_ids_with_dots_persist_full_document(self):
+        tracker = await _create_tracker("step.1", persist_window_seconds=0)
+
+        await tracker.update_node_state("job-1", "step.1", "ready")
+
+        tracker.db_collection.update_one.assert_not_awaited()
+        document = tracker.db_collection.replace_one.await_args.args[1]
+        assert document["node_states"] == {"step.1": "ready"}
+
+    async def test_full_state_write_supersedes_pending_deltas(self):
+        tracker = await _create_tracker("a", persist_window_seconds=60)
+
+        await tracker.update_node_state("job-1", "a", "ready")
+        timer = tracker._flush_tasks["job-1"]
+
+        await tracker.record_dag_failure("job-1", "worker lost")
+        await asyncio.sleep(0)
+
+        assert timer.cancelled()
+        assert tracker._dirty_nodes == {}
+        tracker.db_collection.update_one.assert_not_awaited()
+        document = tracker.db_collection.replace_one.await_args.args[1]
+        assert document["status"] == "failed"
+        assert document["node_states"] == {"a": "ready"}
+
+
+@pytest.mark.asyncio
+class TestTransitionHistorySpill:
+    """Test the bounded transition history and its spill to storage."""
+
+    async def _record_transitions(self, tracker: ExecutionStateTracker) -> None:
+        for node_id in ("a", "b"):
+            await tracker.update_node_state("job-1", node_id, "ready")
+            await tracker.update_node_state("job-1", node_id, "running")
+
+    async def _create_spilling_tracker(self) -> _TestExecutionStateTracker:
+        tracker = await _create_tracker("a", "b", persist_window_seconds=0, transition_history_limit=2)
+        tracker.history_spill_batch_size = 2
+        return tracker
+
+    async def test_evicted_transitions_spilled_in_batch(self):
+        tracker = await self._create_spilling_tracker()
+
+        await self._record_transitions(tracker)
+
+        documents = tracker.history_collection.insert_many.await_args.args[0]
+        assert [(d["seq"], d["node_id"], d["to_state"]) for d in documents] == [(0, "a", "ready"), (1, "a", "running")]
+        assert all(d["job_id"] == "job-1" for d in documents)
+        history = tracker.transition_history["job-1"]
+        assert history.spilled_count == 2
+        assert history.spill == []
+        assert [t.seq for t in history.recent] == [2, 3]
+
+    async def test_failed_spill_restored_and_retried(self):
+        tracker = await self._create_spilling_tracker()
+        tracker.history_collection.insert_many.side_effect = [ConnectionError("primary stepped down"), None]
+
+        await self._record_transitions(tracker)
+
+        history = tracker.transition_history["job-1"]
+        assert [t.seq for t in history.spill] == [0, 1]
+        assert history.spilled_count == 0
+
+        await tracker.finalize_dag_execution("job-1", "completed", {})
+
+        documents = tracker.history_collection.insert_many.await_args.args[0]
+        assert [d["seq"] for d in documents] == [0, 1]
+        assert history.spilled_count == 2
+        assert history.spill == []
+
+    async def test_partial_spill_failure_restores_only_failed_documents(self):
+        tracker = await self._create_spilling_tracker()
+        tracker.history_collection.insert_many.side_effect = BulkWriteError({"writeErrors": [{"index": 1}]})
+
+        await self._record_transitions(tracker)
+
+        history = tracker.transition_history["job-1"]
+        assert history.spilled_count == 1
+        assert [t.seq for t in history.spill] == [1]
+
+    async def test_restored_spill_bounded_by_max_pending(self):
+        tracker = await self._create_spilling_tracker()
+        tracker.max_pending_spill = 1
+        tracker.history_collection.insert_many.side_effect = ConnectionError("primary stepped down")
+
+        await self._record_transitions(tracker)
+
+        # The oldest unwritten transition is dropped first
+        assert [t.seq for t in tracker.transition_history["job-1"].spill] == [1]
+
+    async def test_history_pages_across_spilled_and_in_memory_transitions(self):
+        tracker = await self._create_spilling_tracker()
+        await self._record_transitions(tracker)
+        spilled = tracker.history_collection.insert_many.await_args.args[0]
+
+        cursor = MagicMock()
+        cursor.sort.return_value = cursor
+        cursor.skip.return_value = cursor
+        cursor.__aiter__.return_value = iter(spilled)
+        tracker.history_collection.find = MagicMock(return_value=cursor)
+
+        transitions = await tracker.get_node_transition_history("job-1")
+
+        assert [(t.node_id, t.to_state) for t in transitions] == [
+            ("a", "ready"), ("a", "running"), ("b", "ready"), ("b", "running")
+        ]
+        assert tracker.history_collection.find.call_args.args[0] == {"job_id": "job-1", "seq": {"$lt": 2}}
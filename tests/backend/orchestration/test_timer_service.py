@@ -0,0 +1,114 @@
+"""
+Timer Service Unit Tests
+
+Tests firing of due timers shared between replicas:
+- A timer held by several replicas is claimed and fired by exactly one
+- Timers rescheduled since they were queued are not fired
+- Timers without a registered handler stay persisted and are retried
+- Failed claims retried instead of fired
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+from src.backend.orchestration.services.timer_service import MAX_WAKEUP_SECONDS, TimerService
+
+
+class _FakeTimersCollection:
+    """In-memory orchestration_timers collection shared by several replicas."""
+
+    def __init__(self):
+        self.documents: List[Dict[str, Any]] = []
+
+    async def update_one(self, query, update, upsert=False):
+        self.documents = [d for d in self.documents if d["timer_id"] != query["timer_id"]]
+        self.documents.append(dict(update["$set"]))
+
+    async def find_one_and_delete(self, query):
+        await asyncio.sleep(0)
+        for document in self.documents:
+            if all(document.get(field) == value for field, value in query.items()):
+                self.documents.remove(document)
+                return document
+        return None
+
+
+def _replica(collection) -> TimerService:
+    database = MagicMock()
+    database.orchestration_timers = collection
+    return TimerService(database)
+
+
+def _due_timer(service: TimerService, timer_id: str) -> Dict[str, Any]:
+    """Pop a queued timer the way the wakeup loop does."""
+    return service._timers.pop(timer_id)
+
+
+@pytest.mark.asyncio
+class TestTimerFiring:
+    """Test claiming and firing of due timers."""
+
+    async def test_timer_fired_by_one_replica(self):
+        """Replicas that restored the same timer fire it once between them."""
+        collection = _FakeTimersCollection()
+        replicas = [_replica(collection), _replica(collection)]
+        handler = AsyncMock()
+        due_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+
+        timer_id = await replicas[0].schedule("job_timeout", "job-1", due_at, {"attempt": 1})
+        replicas[1]._push(dict(replicas[0]._timers[timer_id]))
+        for replica in replicas:
+            replica.register_handler("job_timeout", handler)
+
+        await asyncio.gather(*(replica._fire(_due_timer(replica, timer_id)) for replica in replicas))
+
+        handler.assert_awaited_once_with("job-1", {"attempt": 1})
+        assert sorted(r._timer_counters["timers_claimed_elsewhere"] for r in replicas) == [0, 1]
+        assert collection.documents == []
+
+    async def test_rescheduled_timer_not_fired(self):
+        """A stale queued timer does not fire once its record was rescheduled."""
+        collection = _FakeTimersCollection()
+        service = _replica(collection)
+        handler = AsyncMock()
+        service.register_handler("job_start", handler)
+        now = datetime.now(timezone.utc)
+
+        timer_id = await service.schedule("job_start", "job-1", now)
+        stale = _due_timer(service, timer_id)
+        await service.schedule("job_start", "job-1", now + timedelta(hours=1))
+
+        await service._fire(stale)
+
+        handler.assert_not_awaited()
+        assert len(collection.documents) == 1
+
+    async def test_timer_without_handler_retried(self):
+        """An unhandled timer stays persisted and is queued again."""
+        collection = _FakeTimersCollection()
+        service = _replica(collection)
+        now = datetime.now(timezone.utc)
+
+        timer_id = await service.schedule("job_retry", "job-1", now)
+        await service._fire(_due_timer(service, timer_id))
+
+        assert len(collection.documents) == 1
+        assert service.is_scheduled("job_retry", "job-1")
+        assert service._timers[timer_id]["due_at"] >= now + timedelta(seconds=MAX_WAKEUP_SECONDS)
+
+    async def test_failed_claim_retried(self):
+        """A timer whose claim errors is not fired and is queued again."""
+        collection = _FakeTimersCollection()
+        collection.find_one_and_delete = AsyncMock(side_effect=RuntimeError("not primary"))
+        service = _replica(collection)
+        handler = AsyncMock()
+        service.register_handler("job_start", handler)
+
+        timer_id = await service.schedule("job_start", "job-1", datetime.now(timezone.utc))
+        await service._fire(_due_timer(service, timer_id))
+
+        handler.assert_not_awaited()
+        assert service.is_scheduled("job_start", "job-1")
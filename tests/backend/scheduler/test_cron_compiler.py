@@ -0,0 +1,184 @@
+"""
+Cron Compiler Unit Tests
+
+Tests the bitset cron compiler used for trigger scheduling:
+- Next and previous fire times, fire time ranges and limits
+- Six-field expressions, macros and month/day names
+- Vixie cron day-of-month OR day-of-week semantics
+- DST spring-forward gaps and fall-back repeats
+- Expressions that never fire and invalid input
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+from src.backend.scheduler.utils.cron_compiler import compile_cron, next_fire_times
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestNextAndPreviousFire:
+    """Test fire time lookups in UTC."""
+
+    def test_next_fire_is_strictly_after(self):
+        cron = compile_cron("*/15 * * * *")
+
+        assert cron.next_fire(_utc(2024, 5, 1, 10, 7)) == _utc(2024, 5, 1, 10, 15)
+        assert cron.next_fire(_utc(2024, 5, 1, 10, 15)) == _utc(2024, 5, 1, 10, 30)
+        assert cron.next_fire(_utc(2024, 5, 1, 23, 50)) == _utc(2024, 5, 2, 0, 0)
+
+    def test_prev_fire_is_strictly_before(self):
+        cron = compile_cron("*/15 * * * *")
+
+        assert cron.prev_fire(_utc(2024, 5, 1, 10, 15)) == _utc(2024, 5, 1, 10, 0)
+        assert cron.prev_fire(_utc(2024, 5, 1, 10, 15, 1)) == _utc(2024, 5, 1, 10, 15)
+        assert cron.prev_fire(_utc(2024, 5, 2, 0, 0)) == _utc(2024, 5, 1, 23, 45)
+
+    def test_naive_datetimes_treated_as_utc(self):
+        cron = compile_cron("0 9 * * *")
+
+        assert cron.next_fire(datetime(2024, 5, 1, 8, 0)) == _utc(2024, 5, 1, 9, 0)
+
+    def test_year_rollover(self):
+        cron = compile_cron("@yearly")
+
+        assert cron.next_fire(_utc(2024, 6, 1)) == _utc(2025, 1, 1)
+        assert cron.prev_fire(_utc(2024, 6, 1)) == _utc(2024, 1, 1)
+
+    def test_leap_day(self):
+        cron = compile_cron("0 0 29 2 *")
+
+        assert cron.next_fire(_utc(2025, 1, 1)) == _utc(2028, 2, 29)
+        assert cron.prev_fire(_utc(2027, 1, 1)) == _utc(2024, 2, 29)
+
+    def test_six_field_expression_matches_seconds(self):
+        cron = compile_cron("* * * * * 30")
+
+        assert cron.next_fire(_utc(2024, 5, 1, 10, 0, 0)) == _utc(2024, 5, 1, 10, 0, 30)
+        assert cron.next_fire(_utc(2024, 5, 1, 10, 0, 30)) == _utc(2024, 5, 1, 10, 1, 30)
+
+    def test_names_and_ranges(self):
+        cron = compile_cron("0 9 * jan-mar mon-fri")
+
+        # Friday 2024-03-29 is the last weekday in range; 2025-01-01 is a Wednesday
+        assert cron.next_fire(_utc(2024, 3, 29, 9, 0)) == _utc(2025, 1, 1, 9, 0)
+
+    def test_compiled_form_cached_for_equivalent_expressions(self):
+        assert compile_cron("0  0 * * *") is compile_cron("0 0 * * *")
+        assert compile_cron("@DAILY") is compile_cron("@daily")
+
+    def test_next_fire_times_for_many_expressions(self):
+        after = _utc(2024, 5, 1, 10, 7)
+
+        assert next_fire_times([("*/15 * * * *", "UTC"), ("0 12 * * *", "UTC")], after) == [
+            _utc(2024, 5, 1, 10, 15), _utc(2024, 5, 1, 12, 0)
+        ]
+
+
+class TestFireTimes:
+    """Test fire time ranges."""
+
+    def test_range_includes_start_and_excludes_end(self):
+        cron = compile_cron("0 * * * *")
+
+        times = list(cron.fire_times(_utc(2024, 5, 1, 0, 0), _utc(2024, 5, 1, 6, 0)))
+
+        assert times == [_utc(2024, 5, 1, hour, 0) for hour in range(6)]
+
+    def test_limit(self):
+        cron = compile_cron("0 * * * *")
+
+        times = list(cron.fire_times(_utc(2024, 5, 1), _utc(2024, 5, 2), limit=3))
+
+        assert times == [_utc(2024, 5, 1, hour, 0) for hour in range(3)]
+
+    def test_empty_range(self):
+        cron = compile_cron("0 0 1 * *")
+
+        assert list(cron.fire_times(_utc(2024, 5, 2), _utc(2024, 5, 31))) == []
+
+
+class TestVixieDaySemantics:
+    """Test day-of-month and day-of-week matching."""
+
+    def test_both_restricted_matches_either(self):
+        """The 13th or any Friday."""
+        cron = compile_cron("0 0 13 * 5")
+
+        days = [t.day for t in cron.fire_times(_utc(2024, 10, 1), _utc(2024, 11, 1))]
+
+        # October 2024: Fridays are 4, 11, 18, 25; the 13th is a Sunday
+        assert days == [4, 11, 13, 18, 25]
+
+    def test_only_day_of_month_restricted(self):
+        cron = compile_cron("0 0 13 * *")
+
+        assert [t.day for t in cron.fire_times(_utc(2024, 10, 1), _utc(2024, 11, 1))] == [13]
+
+    def test_only_day_of_week_restricted(self):
+        cron = compile_cron("0 0 * * 5")
+
+        assert [t.day for t in cron.fire_times(_utc(2024, 10, 1), _utc(2024, 11, 1))] == [4, 11, 18, 25]
+
+    def test_sunday_as_seven(self):
+        start, end = _utc(2024, 10, 1), _utc(2024, 11, 1)
+
+        assert list(compile_cron("0 0 * * 7").fire_times(start, end)) == list(
+            compile_cron("0 0 * * 0").fire_times(start, end)
+        )
+
+
+class TestDaylightSavingTime:
+    """Test wall-clock matching across America/New_York transitions."""
+
+    def test_spring_forward_gap_fires_at_transition(self):
+        """02:30 does not exist on 2024-03-10; the trigger fires when clocks jump to 03:00."""
+        cron = compile_cron("30 2 * * *", "America/New_York")
+
+        assert cron.next_fire(_utc(2024, 3, 9, 12, 0)) == _utc(2024, 3, 10, 7, 0)
+        assert cron.next_fire(_utc(2024, 3, 10, 7, 0)) == _utc(2024, 3, 11, 6, 30)
+
+    def test_fall_back_repeat_fires_once(self):
+        """01:30 occurs twice on 2024-11-03; only the first (EDT) occurrence fires."""
+        cron = compile_cron("30 1 * * *", "America/New_York")
+
+        first = cron.next_fire(_utc(2024, 11, 3, 0, 0))
+        assert first == _utc(2024, 11, 3, 5, 30)
+        assert cron.next_fire(first) == _utc(2024, 11, 4, 6, 30)
+
+    def test_fall_back_fire_times_skip_repeated_hour(self):
+        cron = compile_cron("*/30 * * * *", "America/New_York")
+
+        times = list(cron.fire_times(_utc(2024, 11, 3, 4, 0), _utc(2024, 11, 3, 8, 0)))
+
+        assert times == [
+            _utc(2024, 11, 3, 4, 0), _utc(2024, 11, 3, 4, 30),
+            _utc(2024, 11, 3, 5, 0), _utc(2024, 11, 3, 5, 30),
+            _utc(2024, 11, 3, 7, 0), _utc(2024, 11, 3, 7, 30)
+        ]
+
+    def test_prev_fire_across_fall_back(self):
+        cron = compile_cron("*/30 * * * *", "America/New_York")
+
+        assert cron.prev_fire(_utc(2024, 11, 3, 7, 0)) == _utc(2024, 11, 3, 5, 30)
+        assert cron.prev_fire(_utc(2024, 11, 3, 6, 45)) == _utc(2024, 11, 3, 5, 30)
+
+
+class TestInvalidExpressions:
+    """Test rejection of invalid and never-firing expressions."""
+
+    @pytest.mark.parametrize("expression", ["0 0 30 2 *", "0 0 31 4,6,9,11 *", "0 0 31 feb *"])
+    def test_never_fires(self, expression):
+        with pytest.raises(ValueError, match="never fires"):
+            compile_cron(expression)
+
+    @pytest.mark.parametrize("expression", ["61 * * * *", "* 24 * * *", "* * *", "*/0 * * * *", "0 0 * * fri-"])
+    def test_invalid_syntax(self, expression):
+        with pytest.raises(ValueError):
+            compile_cron(expression)
+
+    def test_invalid_timezone(self):
+        with pytest.raises(ValueError, match="Invalid timezone"):
+            compile_cron("0 0 * * *", "Mars/Olympus_Mons")
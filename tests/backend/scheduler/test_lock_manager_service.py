@@ -0,0 +1,50 @@
+"""
+Lock Manager Service Unit Tests
+
+Tests heartbeat renewal of worker locks:
+- Only auto-extending locks below max_extensions are renewed
+- Renewals push back expiry and count an extension
+- Factory rejecting configuration without a database
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.backend.scheduler.services.base_scheduler_service import SchedulerServiceFactory
+from src.backend.scheduler.services.lock_manager_service import MongoLockManagerService
+
+
+@pytest.mark.asyncio
+class TestRenewWorkerLocks:
+    """Test the heartbeat renewal update."""
+
+    async def test_renewal_respects_extension_limits(self):
+        collection = MagicMock()
+        collection.update_many = AsyncMock(return_value=MagicMock(modified_count=2))
+        service = MongoLockManagerService(collection)
+
+        renewed = await service.renew_worker_locks("worker-1")
+
+        query, pipeline = collection.update_many.call_args.args
+        assert renewed == 2
+        assert query["owner_instance_id"] == {"$in": ["worker-1"]}
+        assert query["auto_extend"] is True
+        assert query["$expr"] == {"$lt": ["$current_extensions", "$max_extensions"]}
+        assert pipeline[0]["$set"]["current_extensions"] == {"$add": ["$current_extensions", 1]}
+
+    async def test_no_workers_no_update(self):
+        collection = MagicMock()
+        collection.update_many = AsyncMock()
+        service = MongoLockManagerService(collection)
+
+        assert await service.renew_worker_locks() == 0
+        collection.update_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestLockManagerServiceFactory:
+    """Test creating the lock manager service from configuration."""
+
+    async def test_missing_database_rejected(self):
+        with pytest.raises(ValueError, match="database is required"):
+            await SchedulerServiceFactory({}).create_lock_manager_service()
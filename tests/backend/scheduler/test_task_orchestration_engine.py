@@ -0,0 +1,177 @@
+"""
+Task Orchestration Engine Unit Tests
+
+Tests trigger dispatch within a scheduler tick and engine shutdown:
+- Trigger processing capped at tick_dispatch_concurrency
+- Execution locks for a tick acquired in one batch call
+- Triggers whose lock is held elsewhere skipped
+- Per-trigger lock acquisition when the batch call fails
+- Stop waiting for in-flight job executions
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from src.backend.scheduler.engines.task_orchestration_engine import TaskOrchestrationEngine
+from src.backend.scheduler.services.base_scheduler_service import LockManagerError
+
+
+def _trigger(trigger_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        trigger_id=trigger_id,
+        trigger_type="cron",
+        task_type="http",
+        task_config={},
+        task_parameters={},
+        next_execution=None,
+        can_execute_now=lambda: True
+    )
+
+
+def _lock(trigger_id: str) -> SimpleNamespace:
+    return SimpleNamespace(lock_id=f"lock-{trigger_id}")
+
+
+def _create_engine(triggers, **config) -> TaskOrchestrationEngine:
+    trigger_service = MagicMock()
+    trigger_service.resolve_next_trigger = AsyncMock(return_value=triggers)
+
+    lock_service = MagicMock()
+    lock_service.acquire_many = AsyncMock(
+        side_effect=lambda requests, worker_instance_id: [_lock(r.resource_id) for r in requests]
+    )
+    lock_service.acquire_execution_lock = AsyncMock(
+        side_effect=lambda request, worker_instance_id: _lock(request.resource_id)
+    )
+    lock_service.release_execution_lock = AsyncMock()
+
+    job_service = MagicMock()
+    job_service.register_job_run = AsyncMock(
+        side_effect=lambda trigger, execution_context: MagicMock(job_id=f"job-{trigger.trigger_id}")
+    )
+    job_service.mark_job_complete = AsyncMock()
+
+    engine = TaskOrchestrationEngine(
+        trigger_service, lock_service, job_service, worker_instance_id="worker-1", config=config
+    )
+    engine.register_job_handler("http", AsyncMock(return_value={"status": 200}))
+    return engine
+
+
+async def _drain(engine: TaskOrchestrationEngine) -> None:
+    if engine._execution_tasks:
+        await asyncio.wait(set(engine._execution_tasks))
+
+
+@pytest.mark.asyncio
+class TestTickDispatch:
+    """Test trigger processing within a single scheduler tick."""
+
+    async def test_concurrent_dispatch_capped(self):
+        engine = _create_engine([_trigger(f"t{i}") for i in range(6)], tick_dispatch_concurrency=2)
+        in_flight, peak = 0, 0
+
+        async def register_job_run(trigger, execution_context):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(job_id=f"job-{trigger.trigger_id}")
+
+        engine.job_service.register_job_run.side_effect = register_job_run
+
+        await engine.run_scheduler_tick()
+        await _drain(engine)
+
+        assert peak == 2
+        assert engine.job_service.register_job_run.await_count == 6
+        assert engine._metrics["triggers_processed"] == 6
+
+    async def test_locks_acquired_in_one_batch(self):
+        engine = _create_engine([_trigger("t1"), _trigger("t2"), _trigger("t3")])
+
+        await engine.run_scheduler_tick()
+        await _drain(engine)
+
+        engine.lock_service.acquire_many.assert_awaited_once()
+        requests = engine.lock_service.acquire_many.await_args.kwargs["requests"]
+        assert [request.resource_id for request in requests] == ["t1", "t2", "t3"]
+        engine.lock_service.acquire_execution_lock.assert_not_awaited()
+        assert engine._metrics["locks_acquired"] == 3
+
+    async def test_trigger_locked_elsewhere_skipped(self):
+        engine = _create_engine([_trigger("t1"), _trigger("t2")])
+        engine.lock_service.acquire_many.side_effect = None
+        engine.lock_service.acquire_many.return_value = [_lock("t1"), None]
+
+        await engine.run_scheduler_tick()
+        await _drain(engine)
+
+        dispatched = [call.kwargs["trigger"].trigger_id for call in engine.job_service.register_job_run.await_args_list]
+        assert dispatched == ["t1"]
+        assert engine._metrics["locks_failed"] == 1
+        engine.lock_service.acquire_execution_lock.assert_not_awaited()
+
+    async def test_batch_failure_falls_back_to_per_trigger_locks(self):
+        engine = _create_engine([_trigger("t1"), _trigger("t2")])
+        engine.lock_service.acquire_many.side_effect = LockManagerError("batch acquisition unsupported")
+
+        await engine.run_scheduler_tick()
+        await _drain(engine)
+
+        assert engine.lock_service.acquire_execution_lock.await_count == 2
+        assert engine.job_service.register_job_run.await_count == 2
+
+    async def test_tick_skipped_at_max_concurrent_executions(self):
+        engine = _create_engine([_trigger("t1")], max_concurrent_executions=1)
+        engine._current_executions = 1
+
+        await engine.run_scheduler_tick()
+
+        engine.trigger_service.resolve_next_trigger.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+class TestStop:
+    """Test draining in-flight executions on shutdown."""
+
+    async def test_stop_waits_for_in_flight_executions(self):
+        engine = _create_engine([_trigger("t1")])
+        release = asyncio.Event()
+
+        async def handler(trigger, job, lock):
+            await release.wait()
+            return {"status": 200}
+
+        engine.register_job_handler("http", handler)
+        engine._running = True
+        await engine.run_scheduler_tick()
+        assert len(engine._execution_tasks) == 1
+
+        stopping = asyncio.create_task(engine.stop())
+        await asyncio.sleep(0.01)
+        assert not stopping.done()
+
+        release.set()
+        await asyncio.wait_for(stopping, timeout=1)
+
+        assert engine._execution_tasks == set()
+        assert engine._current_executions == 0
+        engine.job_service.mark_job_complete.assert_awaited_once()
+        engine.lock_service.release_execution_lock.assert_awaited_once_with(
+            lock_id="lock-t1", worker_instance_id="worker-1"
+        )
+
+    async def test_finished_executions_no_longer_tracked(self):
+        engine = _create_engine([_trigger("t1"), _trigger("t2")])
+
+        await engine.run_scheduler_tick()
+        await _drain(engine)
+        await asyncio.sleep(0)
+
+        assert engine._execution_tasks == set()
+        assert engine.get_metrics()["tracked_execution_tasks"] == 0
+        assert engine._metrics["jobs_executed"] == 2
@@ -0,0 +1,166 @@
+"""
+Trigger Engine Service Unit Tests
+
+Tests claiming of fired triggers across scheduler instances:
+- A trigger due on several instances is fired by exactly one
+- Instances that lose the claim queue the schedule stored by the winner
+- Failed claims retried on the next tick
+- Cron triggers without a next fire time not fired again elsewhere
+- Factory rejecting configuration without a database
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from src.backend.scheduler.models.trigger_model import ScheduledTriggerModel, TriggerType
+from src.backend.scheduler.services.base_scheduler_service import SchedulerServiceFactory
+from src.backend.scheduler.services.trigger_engine_service import MongoTriggerEngineService
+
+
+def _matches(document: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    for field, condition in query.items():
+        value = document.get(field)
+        if isinstance(condition, dict):
+            if "$in" in condition and value not in condition["$in"]:
+                return False
+            if "$ne" in condition and value == condition["$ne"]:
+                return False
+            if "$lt" in condition and (value is None or not value < condition["$lt"]):
+                return False
+            if "$gte" in condition and (value is None or not value >= condition["$gte"]):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class _UpdateResult:
+    def __init__(self, matched_count: int):
+        self.matched_count = matched_count
+
+
+class _Cursor:
+    def __init__(self, documents: List[Dict[str, Any]]):
+        self._iterator = iter(documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        try:
+            return dict(next(self._iterator))
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _FakeTriggerCollection:
+    """In-memory scheduled_triggers collection shared by several engines."""
+
+    def __init__(self, documents: List[Dict[str, Any]]):
+        self.documents = documents
+        self.fail_updates = 0
+
+    def find(self, query):
+        return _Cursor([document for document in self.documents if _matches(document, query)])
+
+    async def find_one(self, query):
+        return next((dict(d) for d in self.documents if _matches(d, query)), None)
+
+    async def update_one(self, query, update, upsert=False):
+        await asyncio.sleep(0)
+        if self.fail_updates:
+            self.fail_updates -= 1
+            raise RuntimeError("primary stepped down")
+        for document in self.documents:
+            if _matches(document, query):
+                document.update(update["$set"])
+                return _UpdateResult(1)
+        return _UpdateResult(0)
+
+
+def _trigger_document(**overrides) -> Dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    fields = {
+        "trigger_id": "trigger-1",
+        "name": "nightly",
+        "trigger_type": TriggerType.TIME_BASED,
+        "interval_seconds": 60,
+        "task_type": "test_suite",
+        "created_by": "user-1",
+        "organization_id": "org-1",
+        **overrides
+    }
+    document = ScheduledTriggerModel(**fields).to_mongo()
+    document["next_execution"] = (now - timedelta(seconds=1)).replace(microsecond=0)
+    return document
+
+
+async def _engines(collection, count: int = 2, **kwargs) -> List[MongoTriggerEngineService]:
+    engines = [MongoTriggerEngineService(collection, **kwargs) for _ in range(count)]
+    for engine in engines:
+        assert await engine.initialize()
+    return engines
+
+
+@pytest.mark.asyncio
+class TestFiredTriggerClaims:
+    """Test compare-and-set claiming of due triggers."""
+
+    async def test_shared_trigger_fired_once(self):
+        """Two instances holding the same due trigger fire it once between them."""
+        collection = _FakeTriggerCollection([_trigger_document()])
+        first, second = await _engines(collection)
+        fire_time = collection.documents[0]["next_execution"]
+
+        results = await asyncio.gather(first.resolve_next_trigger(), second.resolve_next_trigger())
+
+        assert sorted(len(fired) for fired in results) == [0, 1]
+        assert collection.documents[0]["last_execution"] == fire_time
+        assert collection.documents[0]["next_execution"] > fire_time
+
+    async def test_lost_claim_queues_stored_schedule(self):
+        """The losing instance queues the next fire time the winner stored."""
+        collection = _FakeTriggerCollection([_trigger_document()])
+        first, second = await _engines(collection)
+
+        assert len(await first.resolve_next_trigger()) == 1
+        assert await second.resolve_next_trigger() == []
+
+        stored = collection.documents[0]["next_execution"]
+        assert second._metrics["claims_lost"] == 1
+        assert second._entries["trigger-1"][0] == stored
+        assert second._metrics["triggers_fired"] == 0
+
+    async def test_failed_claim_retried_next_tick(self):
+        """A claim that errors is not fired and is retried while still due."""
+        collection = _FakeTriggerCollection([_trigger_document()])
+        engine, = await _engines(collection, count=1)
+        collection.fail_updates = 1
+
+        assert await engine.resolve_next_trigger() == []
+        assert engine._metrics["persist_failures"] == 1
+
+        fired = await engine.resolve_next_trigger()
+        assert [trigger.trigger_id for trigger in fired] == ["trigger-1"]
+
+    async def test_unadvanced_cron_trigger_not_fired_elsewhere(self):
+        """A cron trigger without a next fire time keeps its schedule but fires only once."""
+        collection = _FakeTriggerCollection([
+            _trigger_document(cron_expression="0 2 * * *", interval_seconds=None)
+        ])
+        first, second = await _engines(collection, next_fire_time=lambda trigger, after: None)
+
+        assert len(await first.resolve_next_trigger()) == 1
+        assert await second.resolve_next_trigger() == []
+        assert await first.resolve_next_trigger() == []
+
+
+@pytest.mark.asyncio
+class TestTriggerEngineServiceFactory:
+    """Test creating the trigger engine service from configuration."""
+
+    async def test_missing_database_rejected(self):
+        with pytest.raises(ValueError, match="database is required"):
+            await SchedulerServiceFactory({}).create_trigger_engine_service()
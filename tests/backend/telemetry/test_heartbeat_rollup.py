@@ -0,0 +1,259 @@
+"""
+Heartbeat Rollup Unit Tests
+
+Tests materialisation of minute, hour and day heartbeat buckets:
+- 24h of heartbeats rolled up into exactly one complete day bucket per agent
+- Bucket counts per level with chunks smaller than a day
+- Re-runs leaving buckets unchanged, including time-series re-runs after a crash
+- Uptime totals composed from rollups matching the raw heartbeats
+
+Collections are in-memory fakes that evaluate the two rollup pipelines
+(range $match, $dateTrunc bucketing and $group totals) in Python.
+"""
+
+import pytest
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+from src.backend.telemetry.services.heartbeat_rollup import HeartbeatRollupService
+
+DAY_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+UNIT_SIZES = {"minute": timedelta(minutes=1), "hour": timedelta(hours=1), "day": timedelta(days=1)}
+HEALTHY_STATUSES = ("healthy", "degraded")
+
+
+def _truncate(value: datetime, unit: str) -> datetime:
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return value - ((value - epoch) % UNIT_SIZES[unit])
+
+
+def _get(document: Dict[str, Any], path: str) -> Any:
+    for part in path.split("."):
+        document = document.get(part) if isinstance(document, dict) else None
+    return document
+
+
+def _matches(document: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    for field, condition in query.items():
+        value = _get(document, field)
+        if isinstance(condition, dict):
+            if "$gte" in condition and not value >= condition["$gte"]:
+                return False
+            if "$lt" in condition and not value < condition["$lt"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class _Cursor:
+    def __init__(self, documents: List[Dict[str, Any]]):
+        self._documents = documents
+
+    async def to_list(self, length=None) -> List[Dict[str, Any]]:
+        return list(self._documents)
+
+    def __aiter__(self):
+        self._iterator = iter(self._documents)
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _FakeCollection:
+    """In-memory collection supporting the operations used by the rollup service."""
+
+    def __init__(self, documents: List[Dict[str, Any]] = None):
+        self.documents = list(documents or [])
+
+    async def find_one(self, query, projection=None, sort=None):
+        matches = [document for document in self.documents if _matches(document, query)]
+        if sort:
+            field, _ = sort[0]
+            matches.sort(key=lambda document: _get(document, field))
+        return matches[0] if matches else None
+
+    def find(self, query, projection=None):
+        if "$or" in query:
+            base = {key: value for key, value in query.items() if key != "$or"}
+            return _Cursor([
+                document for document in self.documents
+                if _matches(document, base) and any(_matches(document, branch) for branch in query["$or"])
+            ])
+        return _Cursor([document for document in self.documents if _matches(document, query)])
+
+    async def insert_many(self, documents, ordered=True):
+        self.documents.extend(dict(document) for document in documents)
+
+    async def delete_many(self, query):
+        self.documents = [document for document in self.documents if not _matches(document, query)]
+
+    async def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            self.documents = [
+                document for document in self.documents if not _matches(document, operation._filter)
+            ]
+            self.documents.append(dict(operation._doc))
+
+    async def update_one(self, query, update, upsert=False):
+        for document in self.documents:
+            if _matches(document, query):
+                document.update(update["$set"])
+                return
+        self.documents.append({**query, **update["$set"]})
+
+    def aggregate(self, pipeline):
+        match = pipeline[0]["$match"]
+        unit = next(stage["$addFields"] for stage in pipeline if "$addFields" in stage)
+        unit = next(iter(unit.values()))["$dateTrunc"]["unit"]
+        raw = "timestamp" in match
+
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        for document in self.documents:
+            if not _matches(document, match):
+                continue
+            if raw:
+                agent_id, time_field = document["agent_id"], document["timestamp"]
+                count = 1
+                healthy = 1 if document["health_status"] in HEALTHY_STATUSES else 0
+                first = last = document["timestamp"]
+            else:
+                agent_id, time_field = document["meta"]["agent_id"], document["bucket_start"]
+                count, healthy = document["count"], document["healthy_count"]
+                first, last = document["first_timestamp"], document["last_timestamp"]
+
+            key = (agent_id, _truncate(time_field, unit))
+            group = groups.setdefault(key, {
+                "_id": {"agent_id": key[0], "bucket_start": key[1]},
+                "count": 0, "healthy_count": 0,
+                "first_timestamp": first, "last_timestamp": last, "gap_ms": 0
+            })
+            group["count"] += count
+            group["healthy_count"] += healthy
+            group["first_timestamp"] = min(group["first_timestamp"], first)
+            group["last_timestamp"] = max(group["last_timestamp"], last)
+        return _Cursor(list(groups.values()))
+
+
+class _FakeDatabase:
+    def __init__(self, heartbeats: List[Dict[str, Any]]):
+        self.telemetry_heartbeats_ts = _FakeCollection(heartbeats)
+        self.telemetry_heartbeat_rollup_state = _FakeCollection()
+        self._collections = {"telemetry_heartbeat_rollups": _FakeCollection()}
+
+    def __getitem__(self, name: str) -> _FakeCollection:
+        return self._collections[name]
+
+
+def _heartbeats(agent_ids: List[str], hours: int = 24) -> List[Dict[str, Any]]:
+    """One heartbeat per agent per minute starting at DAY_START."""
+    return [
+        {
+            "agent_id": agent_id,
+            "timestamp": DAY_START + timedelta(minutes=minute),
+            "health_status": "critical" if minute % 60 == 0 else "healthy"
+        }
+        for agent_id in agent_ids
+        for minute in range(hours * 60)
+    ]
+
+
+def _buckets(database: _FakeDatabase, granularity: str) -> List[Dict[str, Any]]:
+    return [
+        document for document in database["telemetry_heartbeat_rollups"].documents
+        if document["meta"]["granularity"] == granularity
+    ]
+
+
+@pytest.mark.asyncio
+class TestHeartbeatRollup:
+    """Test minute, hour and day rollups over a full day of heartbeats."""
+
+    @pytest.mark.parametrize("time_series", [False, True])
+    async def test_day_rolled_up_into_one_complete_bucket(self, time_series):
+        """Six-hour chunks must not split or truncate day buckets."""
+        database = _FakeDatabase(_heartbeats(["agent-a", "agent-b"]))
+        service = HeartbeatRollupService(database, {
+            "heartbeat_rollup_chunk_hours": 6,
+            "heartbeat_rollup_time_series": time_series
+        })
+
+        written = await service.run_once(now=DAY_START + timedelta(days=1, hours=1))
+
+        day_buckets = _buckets(database, "day")
+        assert written["day"] == 2
+        assert len(day_buckets) == 2
+        for bucket in day_buckets:
+            assert bucket["bucket_start"] == DAY_START
+            assert bucket["count"] == 24 * 60
+            assert bucket["healthy_count"] == 24 * 60 - 24
+        assert len(_buckets(database, "hour")) == 2 * 24
+        assert len(_buckets(database, "minute")) == 2 * 24 * 60
+
+    async def test_rerun_is_idempotent(self):
+        """Running again without new data writes no further buckets."""
+        database = _FakeDatabase(_heartbeats(["agent-a"]))
+        service = HeartbeatRollupService(database, {"heartbeat_rollup_chunk_hours": 6})
+        now = DAY_START + timedelta(days=1, hours=1)
+
+        await service.run_once(now=now)
+        written = await service.run_once(now=now)
+
+        assert written == {"minute": 0, "hour": 0, "day": 0}
+        assert len(_buckets(database, "day")) == 1
+
+    @pytest.mark.parametrize("time_series", [False, True])
+    async def test_rerun_after_lost_watermark_replaces_buckets(self, time_series):
+        """A crash between writing buckets and saving the watermark must not double count."""
+        database = _FakeDatabase(_heartbeats(["agent-a"]))
+        service = HeartbeatRollupService(database, {
+            "heartbeat_rollup_chunk_hours": 6,
+            "heartbeat_rollup_time_series": time_series
+        })
+        now = DAY_START + timedelta(days=1, hours=1)
+        await service.run_once(now=now)
+
+        database.telemetry_heartbeat_rollup_state.documents.clear()
+        await service.run_once(now=now)
+
+        assert len(_buckets(database, "minute")) == 24 * 60
+        assert len(_buckets(database, "hour")) == 24
+        day_buckets = _buckets(database, "day")
+        assert len(day_buckets) == 1
+        assert day_buckets[0]["count"] == 24 * 60
+
+    @pytest.mark.parametrize("time_series", [False, True])
+    async def test_unaligned_day_watermark_rebuilds_full_day(self, time_series):
+        """A day watermark left mid-day by an earlier run is realigned to the day start."""
+        database = _FakeDatabase(_heartbeats(["agent-a"]))
+        service = HeartbeatRollupService(database, {
+            "heartbeat_rollup_chunk_hours": 6,
+            "heartbeat_rollup_time_series": time_series
+        })
+        await database.telemetry_heartbeat_rollup_state.update_one(
+            {"_id": "day"}, {"$set": {"watermark": DAY_START + timedelta(hours=6)}}, upsert=True
+        )
+
+        await service.run_once(now=DAY_START + timedelta(days=1, hours=1))
+
+        day_buckets = _buckets(database, "day")
+        assert len(day_buckets) == 1
+        assert day_buckets[0]["count"] == 24 * 60
+
+    async def test_uptime_totals_match_raw_heartbeats(self):
+        """Totals over the rolled up day equal the raw heartbeat counts."""
+        database = _FakeDatabase(_heartbeats(["agent-a"]))
+        service = HeartbeatRollupService(database, {"heartbeat_rollup_chunk_hours": 6})
+        await service.run_once(now=DAY_START + timedelta(days=1, hours=1))
+
+        totals = await service.get_uptime_totals(
+            "agent-a", DAY_START, DAY_START + timedelta(days=1) - timedelta(seconds=1)
+        )
+
+        assert totals["count"] == 24 * 60
+        assert totals["healthy_count"] == 24 * 60 - 24
+        assert totals["gap_minutes"] == 0
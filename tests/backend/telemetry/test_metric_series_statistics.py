@@ -0,0 +1,154 @@
+"""
+Metric Series Statistics Unit Tests
+
+Tests the streaming per-series statistics behind telemetry outlier detection:
+- One store shared by all TelemetryService instances
+- Outlier checks against quartile fences and EWMA spread
+- Snapshots writing only changed series, including evicted ones
+- Unique series key index created when the store starts
+- Final snapshot when the periodic snapshot task stops
+"""
+
+import random
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from pymongo import ASCENDING
+
+from src.backend.telemetry.services import metric_series_statistics as statistics_module
+from src.backend.telemetry.services.metric_series_statistics import (
+    MetricSeriesStatisticsStore,
+    SeriesStatistics,
+    get_series_statistics_store
+)
+from src.backend.telemetry.services.telemetry_service import TelemetryService
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_store():
+    """Drop the global series statistics store between tests."""
+    statistics_module._series_statistics_store = None
+    yield
+    statistics_module._series_statistics_store = None
+
+
+def _snapshot_collection() -> MagicMock:
+    collection = MagicMock()
+    collection.bulk_write = AsyncMock()
+    collection.create_index = AsyncMock()
+    return collection
+
+
+def _written_keys(collection: MagicMock) -> set:
+    operations = collection.bulk_write.call_args.args[0]
+    return {(op._filter["system_id"], op._filter["metric_name"]) for op in operations}
+
+
+class TestSharedSeriesStatistics:
+    """Test the process-wide series statistics store."""
+
+    def test_store_shared_across_services(self):
+        """Per-request TelemetryService instances see the same statistics."""
+        database = MagicMock()
+
+        first = TelemetryService(database)
+        second = TelemetryService(database)
+
+        assert first._series_statistics is second._series_statistics
+        assert first._series_statistics is get_series_statistics_store(database.telemetry_series_statistics)
+
+    def test_config_applied_on_creation(self):
+        """The first caller's configuration sizes the store."""
+        store = get_series_statistics_store(MagicMock(), {"series_statistics_max_series": 10})
+
+        assert store.max_series == 10
+
+
+class TestSeriesStatistics:
+    """Test outlier detection on streaming statistics."""
+
+    def test_flags_spike_after_warmup(self):
+        """A far-off value is an outlier once enough samples are seen."""
+        rng = random.Random(7)
+        stats = SeriesStatistics()
+        for _ in range(200):
+            stats.add(50.0 + rng.uniform(-2.0, 2.0), 0.05)
+
+        assert stats.is_outlier(95.0, min_samples=10, z_threshold=3.0)
+        assert not stats.is_outlier(51.0, min_samples=10, z_threshold=3.0)
+
+    def test_no_outliers_before_min_samples(self):
+        """Values are never flagged while the series is warming up."""
+        stats = SeriesStatistics()
+        for value in (1.0, 2.0, 3.0):
+            stats.add(value, 0.05)
+
+        assert not stats.is_outlier(1000.0, min_samples=10, z_threshold=3.0)
+
+    def test_document_round_trip(self):
+        """Snapshots restore the same estimates."""
+        stats = SeriesStatistics()
+        for value in range(50):
+            stats.add(float(value), 0.05)
+
+        restored = SeriesStatistics.from_document(stats.to_document(("system", "cpu")))
+
+        assert restored.count == stats.count
+        assert restored.iqr_bounds() == stats.iqr_bounds()
+        assert restored.ewma_mean == stats.ewma_mean
+
+
+@pytest.mark.asyncio
+class TestSeriesStatisticsSnapshots:
+    """Test snapshot persistence of changed series."""
+
+    async def test_snapshot_writes_changed_series_once(self):
+        """Only series changed since the last snapshot are written."""
+        collection = _snapshot_collection()
+        store = MetricSeriesStatisticsStore(snapshot_collection=collection)
+        store.add(("system", "cpu"), 10.0)
+        store.add(("system", "memory"), 20.0)
+
+        assert await store.snapshot() == 2
+        assert await store.snapshot() == 0
+
+        store.add(("system", "cpu"), 11.0)
+        assert await store.snapshot() == 1
+        assert _written_keys(collection) == {("system", "cpu")}
+
+    async def test_failed_snapshot_keeps_evicted_series(self):
+        """Evicted series survive a failed snapshot and are written by the next one."""
+        collection = _snapshot_collection()
+        store = MetricSeriesStatisticsStore(snapshot_collection=collection, max_series=1)
+        store.add(("system", "cpu"), 10.0)
+        store.add(("system", "memory"), 20.0)  # evicts cpu
+
+        collection.bulk_write.side_effect = RuntimeError("unavailable")
+        with pytest.raises(RuntimeError):
+            await store.snapshot()
+
+        collection.bulk_write.side_effect = None
+        assert await store.snapshot() == 2
+        assert _written_keys(collection) == {("system", "cpu"), ("system", "memory")}
+
+    async def test_start_creates_unique_series_index(self):
+        collection = _snapshot_collection()
+        store = MetricSeriesStatisticsStore(snapshot_collection=collection, snapshot_interval_seconds=3600)
+
+        await store.start()
+        await store.stop()
+
+        collection.create_index.assert_awaited_once_with(
+            [("system_id", ASCENDING), ("metric_name", ASCENDING)], unique=True
+        )
+
+    async def test_stop_writes_final_snapshot(self):
+        """Stopping the snapshot task persists pending changes."""
+        collection = _snapshot_collection()
+        store = MetricSeriesStatisticsStore(snapshot_collection=collection, snapshot_interval_seconds=3600)
+        await store.start()
+        store.add(("system", "cpu"), 10.0)
+
+        await store.stop()
+
+        collection.bulk_write.assert_awaited_once()
+        assert _written_keys(collection) == {("system", "cpu")}
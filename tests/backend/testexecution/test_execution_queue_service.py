@@ -0,0 +1,417 @@
+"""
+Execution Queue Service Unit Tests
+
+Tests the shared queue service instance, its cached status snapshot and
+lease-based claiming:
+- One service instance per process across per-request controllers
+- Status requests within the cache TTL served without re-aggregating
+- Snapshot rebuilt once a queue mutation marks it dirty
+- Atomic single and batch claims leased to one worker
+- Completions and retries ignored once the lease was reclaimed elsewhere
+- Lease renewal for long-running executions
+- Queue metrics aggregated per time bucket and flushed in one bulk write,
+  with unwritten buckets restored after a failed or partial flush
+"""
+
+import asyncio
+import itertools
+import pytest
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock, Mock
+from pymongo.errors import BulkWriteError
+
+from src.backend.testexecution.models.execution_trace_model import ExecutionType
+from src.backend.testexecution.services import execution_queue_service as queue_module
+from src.backend.testexecution.services.execution_queue_service import (
+    ExecutionQueueService,
+    QueueMetricsBuffer,
+    QueuePriority,
+    get_execution_queue_service
+)
+
+
+def _matches(document: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    """Evaluate the query operators used by the queue service."""
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(_matches(document, branch) for branch in condition):
+                return False
+            continue
+        value = document.get(field)
+        if isinstance(condition, dict):
+            for operator, operand in condition.items():
+                if operator == "$in" and value not in operand:
+                    return False
+                if operator == "$ne" and value == operand:
+                    return False
+                if operator == "$lte" and (value is None or not value <= operand):
+                    return False
+                if operator == "$lt" and (value is None or not value < operand):
+                    return False
+        elif value != condition:
+            return False
+    return True
+
+
+class _Result:
+    def __init__(self, **counts):
+        self.__dict__.update(counts)
+
+
+class _Cursor:
+    def __init__(self, documents: List[Dict[str, Any]]):
+        self._documents = documents
+
+    def sort(self, keys, order=None):
+        if order is not None:
+            keys = [(keys, order)]
+        for field, direction in reversed(keys):
+            self._documents.sort(key=lambda d: d.get(field), reverse=direction < 0)
+        return self
+
+    def limit(self, count: int):
+        self._documents = self._documents[:count]
+        return self
+
+    async def to_list(self, length=None):
+        return [dict(d) for d in self._documents]
+
+    async def __aiter__(self):
+        for document in list(self._documents):
+            yield dict(document)
+
+
+class _FakeQueueCollection:
+    """In-memory execution_queue collection shared by several workers."""
+
+    def __init__(self):
+        self.documents: List[Dict[str, Any]] = []
+        self._ids = itertools.count(1)
+
+    async def insert_one(self, document):
+        document = {"_id": next(self._ids), **document}
+        self.documents.append(document)
+        return _Result(inserted_id=document["_id"])
+
+    async def find_one(self, query):
+        return next((dict(d) for d in self.documents if _matches(d, query)), None)
+
+    def find(self, query, projection=None):
+        return _Cursor([d for d in self.documents if _matches(d, query)])
+
+    async def count_documents(self, query):
+        return sum(1 for d in self.documents if _matches(d, query))
+
+    def _apply(self, document, update):
+        document.update(update.get("$set", {}))
+        for field in update.get("$unset", {}):
+            document.pop(field, None)
+
+    async def find_one_and_update(self, query, update, sort=None, return_document=None):
+        await asyncio.sleep(0)
+        matches = self.find(query).sort(sort or [])._documents
+        if not matches:
+            return None
+        self._apply(matches[0], update)
+        return dict(matches[0])
+
+    async def update_one(self, query, update):
+        for document in self.documents:
+            if _matches(document, query):
+                self._apply(document, update)
+                return _Result(matched_count=1, modified_count=1)
+        return _Result(matched_count=0, modified_count=0)
+
+    async def update_many(self, query, update):
+        await asyncio.sleep(0)
+        matches = [d for d in self.documents if _matches(d, query)]
+        for document in matches:
+            self._apply(document, update)
+        return _Result(matched_count=len(matches), modified_count=len(matches))
+
+    async def delete_one(self, query):
+        for document in self.documents:
+            if _matches(document, query):
+                self.documents.remove(document)
+                return _Result(deleted_count=1)
+        return _Result(deleted_count=0)
+
+
+def _queue_database(collection: _FakeQueueCollection) -> MagicMock:
+    database = MagicMock()
+    database.execution_queue = collection
+    database.execution_dead_letter_queue = _FakeQueueCollection()
+    return database
+
+
+async def _enqueue(service: ExecutionQueueService, *priorities: QueuePriority) -> None:
+    for index, priority in enumerate(priorities):
+        await service.enqueue_execution(f"exec-{index}", ExecutionType.TEST_CASE, {}, priority=priority)
+
+
+def _expire_leases(collection: _FakeQueueCollection) -> None:
+    expired = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+    for document in collection.documents:
+        if document.get("lease_expires_at"):
+            document["lease_expires_at"] = expired
+
+
+def _mock_database(total: int = 3, processing: int = 1) -> MagicMock:
+    """Create a database whose queue aggregation and oldest item lookup return fixed values."""
+    database = MagicMock()
+    cursor = Mock()
+    cursor.to_list = AsyncMock(return_value=[{
+        "totals": [{"total": total, "processing": processing}],
+        "priorities": [{"_id": 3, "count": total}]
+    }])
+    database.execution_queue.aggregate = Mock(return_value=cursor)
+    database.execution_queue.find = Mock(return_value=_Cursor([{"queued_at": "2024-01-01T00:00:00+00:00"}]))
+    database.execution_dead_letter_queue.estimated_document_count = AsyncMock(return_value=0)
+    return database
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_queue_service():
+    """Drop the process-wide queue service between tests."""
+    queue_module._execution_queue_service = None
+    yield
+    queue_module._execution_queue_service = None
+
+
+class TestSharedExecutionQueueService:
+    """Test the process-wide queue service accessor."""
+
+    def test_returns_same_instance(self):
+        """Controllers built per request share one queue service."""
+        database = _mock_database()
+
+        first = get_execution_queue_service(database)
+        second = get_execution_queue_service(database)
+
+        assert isinstance(first, ExecutionQueueService)
+        assert first is second
+        assert first._wakeup_event is second._wakeup_event
+
+    def test_change_stream_setting_applied_on_creation(self):
+        database = _mock_database()
+
+        first = get_execution_queue_service(database, enable_change_stream=True)
+        second = get_execution_queue_service(database)
+
+        assert first is second
+        assert first.enable_change_stream is True
+
+
+@pytest.mark.asyncio
+class TestQueueStatusSnapshot:
+    """Test the cached $facet status snapshot."""
+
+    async def test_repeated_status_served_from_cache(self):
+        """Status polls within the TTL run the aggregation once."""
+        database = _mock_database(total=3, processing=1)
+
+        first = await get_execution_queue_service(database).get_queue_status()
+        second = await get_execution_queue_service(database).get_queue_status()
+
+        assert database.execution_queue.aggregate.call_count == 1
+        assert first["total_queued"] == second["total_queued"] == 3
+        assert first["pending"] == 2
+        assert first["priority_distribution"]["NORMAL"] == 3
+        assert first["oldest_queued_at"] == "2024-01-01T00:00:00+00:00"
+
+    async def test_mutation_refreshes_snapshot(self):
+        """A queue mutation forces a rebuild after the minimum refresh interval."""
+        database = _mock_database()
+        service = get_execution_queue_service(database)
+        service.status_min_refresh_seconds = 0.0
+
+        await service.get_queue_status()
+        service._mark_queue_mutated()
+        await service.get_queue_status()
+
+        assert database.execution_queue.aggregate.call_count == 2
+
+
+@pytest.mark.asyncio
+class TestLeasedClaims:
+    """Test atomic claims and lease ownership checks."""
+
+    async def test_dequeue_claims_highest_priority_ready_item(self):
+        collection = _FakeQueueCollection()
+        worker = ExecutionQueueService(_queue_database(collection))
+        await _enqueue(worker, QueuePriority.LOW, QueuePriority.CRITICAL)
+        await worker.enqueue_execution(
+            "later", ExecutionType.TEST_CASE, {}, priority=QueuePriority.CRITICAL,
+            scheduled_at=datetime.now(timezone.utc) + timedelta(hours=1)
+        )
+
+        first = await worker.dequeue_execution()
+        second = await worker.dequeue_execution()
+
+        assert [first.execution_id, second.execution_id] == ["exec-1", "exec-0"]
+        assert first.lease_owner == worker.worker_id
+        assert first.lease_token and first.lease_token != second.lease_token
+        assert await worker.dequeue_execution() is None
+
+    async def test_concurrent_claim_many_is_disjoint(self):
+        collection = _FakeQueueCollection()
+        workers = [ExecutionQueueService(_queue_database(collection)) for _ in range(2)]
+        await _enqueue(workers[0], *[QueuePriority.NORMAL] * 6)
+
+        batches = await asyncio.gather(*(worker.claim_many(4) for worker in workers))
+
+        claimed = [item.execution_id for batch in batches for item in batch]
+        assert len(claimed) == len(set(claimed))
+        for worker, batch in zip(workers, batches):
+            assert all(item.lease_owner == worker.worker_id for item in batch)
+            assert len({item.lease_token for item in batch}) <= 1
+
+    async def test_stale_lease_completion_ignored(self):
+        """A worker whose lease expired cannot complete an item reclaimed by another."""
+        collection = _FakeQueueCollection()
+        first, second = (ExecutionQueueService(_queue_database(collection)) for _ in range(2))
+        await _enqueue(first, QueuePriority.NORMAL)
+        stale = await first.dequeue_execution()
+
+        _expire_leases(collection)
+        await second._handle_timed_out_executions()
+        collection.documents[0]["scheduled_at"] = datetime.now(timezone.utc).isoformat()
+        current = await second.dequeue_execution()
+
+        assert await first.complete_execution(stale.execution_id, True, lease_token=stale.lease_token) is False
+        assert await first.retry_execution(stale.execution_id, "late failure", stale.lease_token) is False
+        assert collection.documents[0]["lease_owner"] == second.worker_id
+
+        assert await second.complete_execution(current.execution_id, True, lease_token=current.lease_token)
+        assert collection.documents == []
+
+    async def test_renewed_lease_not_timed_out(self):
+        collection = _FakeQueueCollection()
+        owner, sweeper = (ExecutionQueueService(_queue_database(collection)) for _ in range(2))
+        await _enqueue(owner, QueuePriority.NORMAL)
+        item = await owner.dequeue_execution()
+
+        _expire_leases(collection)
+        assert await owner.renew_lease(item.execution_id, item.lease_token)
+        await sweeper._handle_timed_out_executions()
+
+        assert collection.documents[0]["lease_token"] == item.lease_token
+        assert await owner.renew_lease(item.execution_id, "stale-token") is False
+
+
+def _bucket_keys(operations) -> List[tuple]:
+    return [(op._filter["operation"], op._filter["priority"], op._doc["$inc"]["count"]) for op in operations]
+
+
+class TestQueueMetricsBuffer:
+    """Test in-memory aggregation of queue metric counters."""
+
+    def test_events_in_one_bucket_are_counted_together(self):
+        buffer = QueueMetricsBuffer(bucket_seconds=60)
+        start = datetime(2024, 1, 1, 12, 0, 5, tzinfo=timezone.utc)
+        for offset in (0, 20, 54):
+            buffer.record("enqueued", ExecutionType.TEST_CASE, QueuePriority.HIGH, start + timedelta(seconds=offset))
+
+        operations = buffer.to_operations(buffer.drain())
+
+        assert len(operations) == 1
+        assert operations[0]._filter["bucket_start"] == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        assert operations[0]._filter["bucket_seconds"] == 60
+        assert operations[0]._doc == {"$inc": {"count": 3}}
+        assert operations[0]._upsert is True
+
+    def test_buckets_split_by_time_operation_and_priority(self):
+        buffer = QueueMetricsBuffer(bucket_seconds=60)
+        start = datetime(2024, 1, 1, 12, 0, 30, tzinfo=timezone.utc)
+        buffer.record("enqueued", ExecutionType.TEST_CASE, QueuePriority.HIGH, start)
+        buffer.record("enqueued", ExecutionType.TEST_CASE, QueuePriority.HIGH, start + timedelta(seconds=30))
+        buffer.record("enqueued", ExecutionType.TEST_CASE, QueuePriority.LOW, start)
+        buffer.record("dequeued", ExecutionType.TEST_CASE, None, start)
+
+        assert len(buffer) == 4
+
+    def test_drain_empties_and_restore_merges(self):
+        buffer = QueueMetricsBuffer()
+        timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        buffer.record("enqueued", ExecutionType.TEST_CASE, QueuePriority.NORMAL, timestamp)
+        drained = buffer.drain()
+        assert len(buffer) == 0
+
+        buffer.record("enqueued", ExecutionType.TEST_CASE, QueuePriority.NORMAL, timestamp)
+        buffer.restore(drained)
+
+        assert list(buffer.drain().values()) == [2]
+
+
+@pytest.mark.asyncio
+class TestQueueMetricsFlush:
+    """Test writing buffered queue metrics."""
+
+    @staticmethod
+    def _service() -> ExecutionQueueService:
+        database = _mock_database()
+        database.queue_metrics.bulk_write = AsyncMock()
+        return ExecutionQueueService(database)
+
+    async def test_flush_writes_buckets_in_one_bulk_write(self):
+        service = self._service()
+        for _ in range(3):
+            await service._update_queue_metrics("enqueued", ExecutionType.TEST_CASE, QueuePriority.HIGH)
+        await service._update_queue_metrics("dequeued", ExecutionType.TEST_CASE)
+
+        assert await service.flush_queue_metrics() == 2
+
+        service.queue_metrics_collection.bulk_write.assert_awaited_once()
+        operations = service.queue_metrics_collection.bulk_write.call_args.args[0]
+        assert sorted(_bucket_keys(operations)) == [("dequeued", None, 1), ("enqueued", QueuePriority.HIGH.value, 3)]
+        assert await service.flush_queue_metrics() == 0
+
+    async def test_failed_flush_restores_all_counters(self):
+        service = self._service()
+        service.queue_metrics_collection.bulk_write.side_effect = RuntimeError("connection reset")
+        await service._update_queue_metrics("enqueued", ExecutionType.TEST_CASE, QueuePriority.HIGH)
+        await service._update_queue_metrics("dequeued", ExecutionType.TEST_CASE)
+
+        assert await service.flush_queue_metrics() == 0
+        assert len(service._metrics_buffer) == 2
+
+        service.queue_metrics_collection.bulk_write.side_effect = None
+        assert await service.flush_queue_metrics() == 2
+
+    async def test_partial_bulk_write_failure_restores_only_failed_buckets(self):
+        service = self._service()
+        await service._update_queue_metrics("enqueued", ExecutionType.TEST_CASE, QueuePriority.HIGH)
+        await service._update_queue_metrics("enqueued", ExecutionType.TEST_CASE, QueuePriority.HIGH)
+        await service._update_queue_metrics("dequeued", ExecutionType.TEST_CASE)
+        service.queue_metrics_collection.bulk_write.side_effect = BulkWriteError({
+            "writeErrors": [{"index": 0, "code": 11000, "errmsg": "duplicate key"}]
+        })
+
+        assert await service.flush_queue_metrics() == 1
+
+        service.queue_metrics_collection.bulk_write.side_effect = None
+        await service.flush_queue_metrics()
+        retried = service.queue_metrics_collection.bulk_write.call_args.args[0]
+        assert _bucket_keys(retried) == [("enqueued", QueuePriority.HIGH.value, 2)]
+
+    async def test_buffer_flushed_when_key_limit_reached(self):
+        service = self._service()
+        service.max_buffered_metric_keys = 2
+
+        await service._update_queue_metrics("enqueued", ExecutionType.TEST_CASE, QueuePriority.HIGH)
+        service.queue_metrics_collection.bulk_write.assert_not_awaited()
+        await service._update_queue_metrics("enqueued", ExecutionType.TEST_CASE, QueuePriority.LOW)
+
+        service.queue_metrics_collection.bulk_write.assert_awaited_once()
+        assert len(service._metrics_buffer) == 0
+
+    async def test_stop_metrics_flush_writes_remaining_counters(self):
+        service = self._service()
+        service.metrics_flush_interval_seconds = 3600
+        await service.start_metrics_flush()
+        await service._update_queue_metrics("enqueued", ExecutionType.TEST_CASE, QueuePriority.HIGH)
+
+        await service.stop_metrics_flush()
+
+        service.queue_metrics_collection.bulk_write.assert_awaited_once()
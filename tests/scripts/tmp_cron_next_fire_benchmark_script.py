@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Temporary script for benchmarking compiled cron next-fire-time calculation
+This script is for development/testing only and should not be used in production.
+
+Computes next fire times for a synthetic population of cron triggers spread
+over common expressions and timezones, and reports throughput for cold
+compilation, cached next-fire lookups and look-ahead window expansion.
+
+Usage:
+    PYTHONPATH=src python tests/scripts/tmp_cron_next_fire_benchmark_script.py [trigger_count]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from backend.scheduler.utils.cron_compiler import _compile_cached, compile_cron
+
+EXPRESSIONS = [
+    "* * * * *",
+    "*/5 * * * *",
+    "0 * * * *",
+    "30 2 * * *",
+    "0 9-17 * * mon-fri",
+    "15,45 8-18/2 * * 1-5",
+    "0 0 1 * *",
+    "0 0 29 2 *",
+    "0 12 13 * fri",
+    "*/10 * * * * 30",
+]
+TIMEZONES = ["UTC", "America/New_York", "Europe/London", "Asia/Kolkata", "Australia/Sydney"]
+
+
+def _timed(label: str, count: int, func) -> None:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {elapsed * 1000:9.1f} ms  {elapsed / count * 1e6:7.2f} us/op")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(42)
+    base = datetime(2024, 3, 9, tzinfo=timezone.utc)
+    triggers = [
+        (rng.choice(EXPRESSIONS), rng.choice(TIMEZONES), base + timedelta(seconds=rng.randrange(86400 * 3)))
+        for _ in range(count)
+    ]
+    pairs = {(expression, tz) for expression, tz, _ in triggers}
+    print(f"{count} triggers over {len(pairs)} distinct (expression, timezone) pairs")
+
+    _compile_cached.cache_clear()
+    _timed("compile distinct pairs", len(pairs), lambda: [compile_cron(e, tz) for e, tz in pairs])
+    _timed("next_fire (cached compile)", count, lambda: [compile_cron(e, tz).next_fire(t) for e, tz, t in triggers])
+    _timed("prev_fire (cached compile)", count, lambda: [compile_cron(e, tz).prev_fire(t) for e, tz, t in triggers])
+
+    window = timedelta(minutes=5)
+    fired = []
+    _timed("fire_times in 5 minute window", count, lambda: fired.extend(
+        fire for e, tz, t in triggers for fire in compile_cron(e, tz).fire_times(t, t + window)
+    ))
+    print(f"look-ahead window produced {len(fired)} fire times")
+
+
+if __name__ == "__main__":
+    main()